@@ -0,0 +1,144 @@
+# batch.py
+
+"""
+TraduzAI Batch
+==============
+
+Ponto de entrada de linha de comando para o processamento em lote de documentos, sem a interface
+gráfica. Recebe caminhos, diretórios ou padrões glob, os idiomas de destino e as mesmas opções de
+simplificação da aplicação `TranslationApp`, e grava os documentos traduzidos e um manifesto JSON
+com o resultado de cada documento. O progresso é registrado em `jobs.sqlite3` no diretório de saída:
+ao executar novamente o mesmo comando, as etapas e os blocos já concluídos são reaproveitados.
+Sem a opção de resumo, cada documento é simplificado à medida que seus parágrafos são extraídos
+(desativável com `--no-stream`).
+
+Exemplo de Uso:
+    $ python batch.py "test/scientific-papers/*.pdf" -t en -t es --model gpt-4o-mini \\
+          --area "Ciências Sociais" --estilo Informal --summarize --output-dir saida --format docx
+"""
+
+import argparse
+import os
+import sys
+
+from services.api.aws_translate_service import AwsTranslateService
+from services.api.openai_service import OpenAIService
+from services.api.quota_manager import LANE_BATCH, QuotaManager
+from services.language.bleu_score_service import BleuScoreService
+from services.language.readability_service import ReadabilityService
+from services.pipeline.batch_service import DEFAULT_MAX_DOCUMENTS, EXPORT_FORMATS, BatchService
+from services.pipeline.job_store import JobStore
+from services.pipeline.pipeline_service import PipelineService
+from services.pipeline.streaming_pipeline import StreamingPipelineService
+
+# Aspectos de foco aceitos, como na interface gráfica
+FOCUS_ASPECTS = ('clareza', 'concisão', 'formalidade')
+
+
+def parse_arguments(argv=None) -> argparse.Namespace:
+    """
+    Interpreta os argumentos da linha de comando.
+
+    Parâmetros:
+        argv (list, optional): Argumentos a interpretar. Por padrão, `sys.argv[1:]`.
+
+    Retorna:
+        argparse.Namespace: Os argumentos interpretados.
+    """
+    parser = argparse.ArgumentParser(description="Simplifica e traduz documentos em lote.")
+    parser.add_argument('inputs', nargs='+', help="Arquivos, diretórios ou padrões glob dos documentos.")
+    parser.add_argument('-t', '--target', dest='targets', action='append', required=True,
+                        help="Código do idioma de destino (pode ser repetido, e.g. -t en -t es).")
+    parser.add_argument('-o', '--output-dir', default='traduzai-output', help="Diretório dos documentos gerados.")
+    parser.add_argument('--format', choices=EXPORT_FORMATS, default='txt', help="Formato de exportação.")
+    parser.add_argument('--manifest', help="Caminho do manifesto JSON (padrão: <output-dir>/manifest.json).")
+    parser.add_argument('--area', default='Ciência da Computação', help="Área técnica do texto.")
+    parser.add_argument('--estilo', default='Informal', help="Estilo de escrita.")
+    parser.add_argument('--complexity', default='Intermediário', help="Nível de complexidade.")
+    parser.add_argument('--focus', action='append', choices=FOCUS_ASPECTS, default=[],
+                        help="Aspecto a ser priorizado (pode ser repetido).")
+    parser.add_argument('--summarize', action='store_true', help="Resume o texto além de simplificá-lo.")
+    parser.add_argument('--model', default='gpt-3.5-turbo-0125', help="Modelo da OpenAI.")
+    parser.add_argument('--temperature', type=float, default=0.8, help="Temperatura da geração.")
+    parser.add_argument('--max-tokens', type=int, default=1500, help="Número máximo de tokens da resposta.")
+    parser.add_argument('--processes', type=int, help="Processos das etapas de CPU (padrão: número de núcleos).")
+    parser.add_argument('--max-documents', type=int, default=DEFAULT_MAX_DOCUMENTS,
+                        help="Documentos processados simultaneamente nas etapas que dependem das APIs.")
+    parser.add_argument('--job-store', help="Banco do progresso do lote (padrão: <output-dir>/jobs.sqlite3).")
+    parser.add_argument('--no-resume', action='store_true',
+                        help="Não registra nem reaproveita o progresso de execuções anteriores.")
+    parser.add_argument('--no-stream', action='store_true',
+                        help="Extrai cada documento por completo antes de iniciar a simplificação.")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """
+    Executa o processamento em lote.
+
+    Parâmetros:
+        argv (list, optional): Argumentos da linha de comando.
+
+    Retorna:
+        int: Código de saída: 0 se todos os documentos foram processados, 1 caso contrário.
+    """
+    args = parse_arguments(argv)
+    files = BatchService.collect_inputs(args.inputs)
+    if not files:
+        print("Nenhum documento encontrado.", file=sys.stderr)
+        return 1
+
+    # As requisições do lote cedem a vez e a capacidade reservada às requisições interativas
+    aws_translate_service = AwsTranslateService(lane=LANE_BATCH)
+    services = (
+        OpenAIService(lane=LANE_BATCH),
+        aws_translate_service,
+        ReadabilityService(),
+        BleuScoreService(aws_translate_service)
+    )
+    pipeline_service = PipelineService(*services)
+    streaming_pipeline_service = None if args.no_stream else StreamingPipelineService(*services)
+
+    def report(entry: dict) -> None:
+        if entry['status'] == 'succeeded':
+            resumed = f", {len(entry['resumed_stages'])} etapa(s) reaproveitada(s)" if entry['resumed_stages'] else ''
+            print(f"[ok] {entry['input']} ({entry['elapsed']:.1f} s{resumed})")
+        else:
+            print(f"[erro] {entry['input']}: {entry['error']}", file=sys.stderr)
+
+    job_store = None
+    if not args.no_resume:
+        job_store = JobStore(args.job_store or os.path.join(args.output_dir, 'jobs.sqlite3'))
+
+    batch_service = BatchService(
+        pipeline_service,
+        processes=args.processes,
+        max_documents=args.max_documents,
+        on_document=report,
+        job_store=job_store,
+        streaming_pipeline_service=streaming_pipeline_service
+    )
+    options = dict(
+        area_tecnica=args.area,
+        estilo=args.estilo,
+        summarize=args.summarize,
+        model=args.model,
+        complexity_level=args.complexity,
+        focus_aspects=args.focus,
+        temperature=args.temperature,
+        max_tokens=args.max_tokens
+    )
+    print(f"Processando {len(files)} documento(s) para {', '.join(args.targets)}...")
+    manifest = batch_service.run(files, args.targets, options, args.output_dir, args.format, args.manifest)
+
+    summary = manifest['summary']
+    print(f"Concluído: {summary['succeeded']} de {summary['total']} documento(s) em {summary['elapsed']:.1f} s.")
+    lane = QuotaManager.get_shared().lane_stats()[LANE_BATCH]
+    if lane['acquired']:
+        print(f"Espera pela cota das APIs: média de {lane['mean_wait']:.2f} s, p95 de {lane['p95_wait']:.2f} s "
+              f"em {lane['acquired']} requisição(ões).")
+    return 0 if summary['failed'] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+# benchmark.py
+
+"""
+TraduzAI PDF Benchmark
+======================
+
+Ponto de entrada de linha de comando que compara os motores de extração de texto de PDFs disponíveis
+(`services.pdf_engines`). Cada motor extrai todas as páginas dos mesmos documentos em um interpretador
+novo, que carrega apenas os motores de extração (e não o pipeline), de modo que o pico de memória
+residente medido corresponda apenas a ele. O pico é informado pelo próprio processo do motor (VmHWM no
+Linux), sem a memória do processo que o iniciou. O resultado informa as páginas por segundo, o pico de
+memória, o total de caracteres extraídos e os documentos com erro de cada motor. O total de caracteres
+serve como indicador grosseiro de qualidade: um motor que extrai muito menos texto que os demais
+provavelmente perdeu conteúdo.
+
+Exemplo de Uso:
+    $ python benchmark.py
+    $ python benchmark.py "test/scientific-papers/*.pdf" --engine pypdf2 --engine pdfium --limit 20 \\
+          --json benchmark.json
+"""
+
+import argparse
+import glob
+import json
+import os
+import subprocess
+import sys
+
+from services.pdf_engines import available_engines
+
+# Documentos utilizados quando nenhum é informado
+DEFAULT_INPUTS = [os.path.join('test', 'scientific-papers')]
+
+# Diretório do projeto, a partir do qual os processos do benchmark importam os motores
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Programa executado em cada interpretador do benchmark: recebe os arquivos em JSON pela entrada padrão
+# e escreve o resultado do motor em JSON na saída padrão
+BENCHMARK_SCRIPT = (
+    "import json, sys\n"
+    "from services.pdf_engines import benchmark_engine\n"
+    "json.dump(benchmark_engine(sys.argv[1], json.load(sys.stdin)), sys.stdout)\n"
+)
+
+
+def parse_arguments(argv=None) -> argparse.Namespace:
+    """
+    Interpreta os argumentos da linha de comando.
+
+    Parâmetros:
+        argv (list, optional): Argumentos a interpretar. Por padrão, `sys.argv[1:]`.
+
+    Retorna:
+        argparse.Namespace: Os argumentos interpretados.
+    """
+    parser = argparse.ArgumentParser(description="Compara os motores de extração de texto de PDFs.")
+    parser.add_argument('inputs', nargs='*', default=DEFAULT_INPUTS,
+                        help="Arquivos, diretórios ou padrões glob dos PDFs (padrão: test/scientific-papers).")
+    parser.add_argument('--engine', dest='engines', action='append',
+                        help="Motor a comparar (pode ser repetido; padrão: todos os instalados).")
+    parser.add_argument('--limit', type=int, help="Número máximo de documentos utilizados.")
+    parser.add_argument('--json', dest='json_path', help="Grava os resultados em um arquivo JSON.")
+    return parser.parse_args(argv)
+
+
+def collect_pdfs(patterns: list) -> list:
+    """
+    Expande caminhos, diretórios (percorridos recursivamente) e padrões glob na lista de PDFs.
+
+    Equivalente a `BatchService.collect_inputs` restrito a PDFs, sem importar o pipeline.
+
+    Parâmetros:
+        patterns (list): Caminhos de arquivos, diretórios ou padrões glob.
+
+    Retorna:
+        list: Os caminhos dos PDFs encontrados, sem repetições e em ordem alfabética.
+    """
+    files = set()
+    for pattern in patterns:
+        for path in glob.glob(pattern, recursive=True) or [pattern]:
+            if os.path.isdir(path):
+                for directory, _, names in os.walk(path):
+                    files.update(os.path.join(directory, name) for name in names)
+            elif os.path.isfile(path):
+                files.add(path)
+    return sorted(path for path in files if path.lower().endswith('.pdf'))
+
+
+def run_benchmark(engines: list, files: list) -> list:
+    """
+    Executa o benchmark de cada motor em um interpretador novo, um motor por vez.
+
+    Parâmetros:
+        engines (list): Os nomes dos motores.
+        files (list): Os arquivos PDF.
+
+    Retorna:
+        list: O resultado de cada motor (ver `benchmark_engine`).
+
+    Exceções:
+        - Exception: se o processo de algum motor falhar.
+    """
+    files = [os.path.abspath(path) for path in files]
+    results = []
+    for engine in engines:
+        process = subprocess.run(
+            [sys.executable, '-c', BENCHMARK_SCRIPT, engine], input=json.dumps(files), capture_output=True,
+            text=True, cwd=PROJECT_DIR
+        )
+        if process.returncode != 0:
+            raise Exception(f"Erro ao executar o benchmark do motor {engine}: {process.stderr.strip()}")
+        results.append(json.loads(process.stdout))
+    return results
+
+
+def main(argv=None) -> int:
+    """
+    Executa o benchmark e apresenta os resultados.
+
+    Parâmetros:
+        argv (list, optional): Argumentos da linha de comando.
+
+    Retorna:
+        int: Código de saída: 0 em caso de sucesso, 1 se não houver documentos ou motores.
+    """
+    args = parse_arguments(argv)
+    files = collect_pdfs(args.inputs)
+    files = files[:args.limit] if args.limit else files
+    if not files:
+        print("Nenhum PDF encontrado.", file=sys.stderr)
+        return 1
+
+    installed = available_engines()
+    engines = args.engines or installed
+    missing = [engine for engine in engines if engine not in installed]
+    if missing:
+        print(f"Motor(es) indisponível(is): {', '.join(missing)}. Instalados: {', '.join(installed)}.",
+              file=sys.stderr)
+        return 1
+
+    print(f"Extraindo {len(files)} PDF(s) com {', '.join(engines)}...")
+    results = run_benchmark(engines, files)
+
+    print(f"{'Motor':<22} {'Páginas':>8} {'Tempo (s)':>10} {'Páginas/s':>10} {'Pico RSS (MB)':>14} "
+          f"{'Caracteres':>12} {'Erros':>6}")
+    for result in results:
+        peak_rss = '-' if result['peak_rss_mb'] is None else f"{result['peak_rss_mb']:.1f}"
+        print(f"{result['version']:<22} {result['pages']:>8} {result['elapsed']:>10.2f} "
+              f"{result['pages_per_second']:>10.2f} {peak_rss:>14} {result['characters']:>12} "
+              f"{len(result['failed']):>6}")
+        for failure in result['failed']:
+            print(f"    [erro] {failure['file']}: {failure['error']}", file=sys.stderr)
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump({'files': files, 'results': results}, f, ensure_ascii=False, indent=2)
+        print(f"Resultados gravados em {args.json_path}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
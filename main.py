@@ -1,11 +1,15 @@
 import os
 import tkinter as tk
-from tkinter import END, Tk, messagebox, filedialog
+from tkinter import END, Tk, messagebox, filedialog, ttk
 from services.api.aws_translate_service import AwsTranslateService
 from services.api.openai_service import OpenAIService
+from services.api.quota_manager import LANE_INTERACTIVE
 from services.document_service import DocumentService
 from services.language.readability_service import ReadabilityService
 from services.language.bleu_score_service import BleuScoreService
+from services.pipeline.pipeline_service import MultiPipelineResult, PipelineService
+from services.pipeline.streaming_pipeline import StreamingPipelineService
+from services.task_service import BackgroundTaskService
 
 # Constantes
 LANGUAGES = {
@@ -74,6 +78,21 @@ AVAILABLE_MODELS = [
     'gpt-4o'
 ]
 
+# Intervalo (em milissegundos) entre as leituras da fila de eventos das threads de trabalho (~60 fps)
+UI_POLL_INTERVAL_MS = 16
+
+# Descrição exibida durante cada etapa do pipeline
+STAGE_LABELS = {
+    'readability_original': 'Calculando métricas do texto original...',
+    'simplify': 'Simplificando o texto...',
+    'readability_simplified': 'Calculando métricas do texto simplificado...',
+    'translate': 'Traduzindo o texto simplificado...',
+    'bleu_score': 'Calculando o BLEU Score...'
+}
+
+# Número de colunas da janela de comparação de variantes
+VARIANT_COLUMNS = 3
+
 
 class TranslationApp:
     """
@@ -109,6 +128,9 @@ class TranslationApp:
         create_option_menus(parent) → None:
             Cria todos os menus de opções principais.
 
+        create_additional_languages_list(parent) → None:
+            Cria a lista de seleção dos idiomas de destino adicionais.
+
         create_complexity_option_menu(parent) → None:
             Cria o menu de seleção de nível de complexidade.
 
@@ -124,6 +146,9 @@ class TranslationApp:
         create_translate_button(parent) → None:
             Cria o botão para realizar a tradução e simplificação.
 
+        create_progress_display(parent) → None:
+            Cria o indicador de progresso e o botão de cancelamento.
+
         create_text_input(parent) → None:
             Cria a área de entrada de texto.
 
@@ -142,6 +167,27 @@ class TranslationApp:
         translate_text() → None:
             Realiza a simplificação e tradução do texto inserido.
 
+        start_translation(texto, opcoes, texto_simplificado=None) → None:
+            Inicia a tarefa do pipeline para os idiomas de destino selecionados.
+
+        run_translation(task, ...) → PipelineResult:
+            Executa o pipeline de simplificação e tradução em uma thread de trabalho.
+
+        open_variants_window() → None:
+            Abre a janela de comparação de variantes por nível de complexidade e estilo.
+
+        start_task(function, name, status, on_result, on_progress, steps, error_title) → None:
+            Executa uma operação em uma thread de trabalho, exibindo o progresso.
+
+        poll_tasks() → None:
+            Aplica na interface os eventos produzidos pelas threads de trabalho.
+
+        cancel_task() → None:
+            Cancela a operação em andamento.
+
+        append_output(texto: str) → None:
+            Acrescenta um trecho de texto à área de saída.
+
         metric_key_from_name(name) → str:
             Mapeia o nome da métrica para a chave no dicionário.
 
@@ -157,6 +203,9 @@ class TranslationApp:
         export_document() → None:
             Exporta o texto de saída para um documento.
 
+        export_all_languages(resultados, texto_principal, bleu_score_principal, file_path, format) → None:
+            Exporta um documento para cada idioma de destino da última tradução.
+
         on_language_change(*args) → None:
             Callback function when the target language changes.
 
@@ -180,14 +229,27 @@ class TranslationApp:
         self.area_option_menu = self.estilo_option_menu = self.complexity_option_menu = None
         self.bleu_score_label = None
         self.simplified_metric_labels = self.original_metric_labels = None
+        self.translate_button = self.import_button = self.export_button = self.cancel_button = None
+        self.variants_button = None
+        self.progress_bar = self.status_label = None
+        self.additional_languages_listbox = None
+
+        # Tarefas em threads de trabalho, cujos eventos são consumidos pela interface
+        self.task_service = BackgroundTaskService()
+        self.current_task = None
+        self.polling = False
+        self.completed_stages = set()
 
         # Inicializar variáveis e serviços
         self.aws_translate_service = self.openai_service = None
         self.document_service = self.readability_service = self.bleu_score_service = None
+        self.pipeline_service = None
+        self.streaming_pipeline_service = None
 
         # Inicializar variáveis de controle e configuração
         self.modelo_option_menu = None
         self.metrics_original = self.metrics_simplified = None
+        self.translation_results = None
         self.destino_var = tk.StringVar(value='Português')
         self.area_var = tk.StringVar(value='Ciência da Computação')
         self.estilo_var = tk.StringVar(value='Informal')
@@ -198,9 +260,8 @@ class TranslationApp:
         self.temperature_var = tk.DoubleVar(value=0.8)
         self.focus_clarity_var = self.focus_conciseness_var = self.focus_formality_var = tk.BooleanVar()
 
-        # Inicializar caches e mapeamento de idiomas
+        # Inicializar rótulos traduzíveis e mapeamento de idiomas
         self.label_texts = {}
-        self.translated_texts = {}
         self.language_codes = {name: code for name, code in LANGUAGES.items()}
         self.current_language_code = 'pt'  # Valor padrão
 
@@ -244,11 +305,24 @@ class TranslationApp:
               na inicialização dos serviços.
         """
         try:
-            self.aws_translate_service = AwsTranslateService()
-            self.openai_service = OpenAIService()
+            # As requisições da interface têm prioridade sobre o processamento em lote
+            self.aws_translate_service = AwsTranslateService(lane=LANE_INTERACTIVE)
+            self.openai_service = OpenAIService(lane=LANE_INTERACTIVE)
             self.document_service = DocumentService()
             self.readability_service = ReadabilityService()
-            self.bleu_score_service = BleuScoreService()
+            self.bleu_score_service = BleuScoreService(self.aws_translate_service)
+            self.pipeline_service = PipelineService(
+                self.openai_service,
+                self.aws_translate_service,
+                self.readability_service,
+                self.bleu_score_service
+            )
+            self.streaming_pipeline_service = StreamingPipelineService(
+                self.openai_service,
+                self.aws_translate_service,
+                self.readability_service,
+                self.bleu_score_service
+            )
         except Exception as e:
             messagebox.showerror("Erro ao Inicializar", str(e))
             self.root.destroy()
@@ -290,20 +364,32 @@ class TranslationApp:
             self.current_language_code = new_language_code
             self.update_interface_language()
 
-    def update_interface_language(self):
+    def update_interface_language(self) -> None:
+        """
+        Atualiza todos os rótulos e as opções dos menus para o idioma selecionado.
+
+        Os rótulos e as opções dos menus são traduzidos em um único lote com `translate_many`,
+        agrupando todos os textos em poucas requisições, e as traduções são aplicadas aos widgets.
+
+        Retorna:
+            None
+
+        Exceções:
+            - Os erros de tradução são apresentados em uma caixa de diálogo, sem interromper a aplicação.
+        """
         try:
-            # Obter todos os textos de rótulos para traduzir
-            texts_to_translate = list(self.label_texts.keys())
-            # Verificar se as traduções já estão em cache
-            translations = {}
-            for text in texts_to_translate:
-                translations[text] = self.cached_translate_text(
-                    text, self.current_language_code)
+            # Obter todos os textos de rótulos e opções para traduzir em um único lote
+            label_texts = list(self.label_texts.keys())
+            option_texts = (list(self.original_specialities) + list(self.original_styles)
+                            + list(self.original_complexity_levels))
+            texts = label_texts + option_texts
+            translations = dict(zip(texts, self.aws_translate_service.translate_many(
+                texts, self.current_language_code)))
             # Atualizar rótulos com o texto traduzido
             for text, widget in self.label_texts.items():
                 widget.config(text=translations[text])
-            # Atualizar os OptionMenus
-            self.translate_option_menus()
+            # Atualizar os OptionMenus com as opções traduzidas no mesmo lote
+            self.translate_option_menus(translations)
         except Exception as e:
             messagebox.showerror("Erro ao Traduzir Interface", str(e))
 
@@ -345,6 +431,7 @@ class TranslationApp:
         self.create_api_parameter_entries(left_frame)
         self.create_summarize_checkbox(left_frame)
         self.create_translate_button(left_frame)
+        self.create_progress_display(left_frame)
 
         # Criar widgets no middle_frame
         self.create_text_input(middle_frame)
@@ -354,12 +441,21 @@ class TranslationApp:
         # Criar widgets no right_frame
         self.create_readability_metrics_display(right_frame)
 
-    def translate_option_menus(self):
+    def translate_option_menus(self, translations: dict = None) -> None:
         """
         Traduz as opções dos menus de seleção e atualiza os OptionMenus correspondentes.
+
+        Parâmetros:
+            translations (dict, optional): Traduções já obtidas, indexadas pelo texto original. Por padrão,
+                as opções são traduzidas por `translate_options`.
         """
+        def translated(options_dict: dict) -> dict:
+            if translations is None:
+                return self.translate_options(options_dict)
+            return {option: translations.get(option, option) for option in options_dict}
+
         # Tradução das especialidades
-        self.translated_specialities = self.translate_options(self.original_specialities)
+        self.translated_specialities = translated(self.original_specialities)
 
         # Atualização do OptionMenu de especialidades
         self.update_option_menu(
@@ -369,7 +465,7 @@ class TranslationApp:
         )
 
         # Tradução dos estilos
-        self.translated_styles = self.translate_options(self.original_styles)
+        self.translated_styles = translated(self.original_styles)
 
         # Atualização do OptionMenu de estilos
         self.update_option_menu(
@@ -379,7 +475,7 @@ class TranslationApp:
         )
 
         # Tradução dos níveis de complexidade
-        self.translated_complexity_levels = self.translate_options(self.original_complexity_levels)
+        self.translated_complexity_levels = translated(self.original_complexity_levels)
 
         # Atualização do OptionMenu de níveis de complexidade
         self.update_option_menu(
@@ -398,17 +494,17 @@ class TranslationApp:
         Returns:
             dict: Dicionário com as opções originais e suas traduções.
         """
-        translated_options = {}
-        for original_text in options_dict.keys():
-            translated_text = self.cached_translate_text(
-                original_text, self.current_language_code)
-            translated_options[original_text] = translated_text
-        return translated_options
+        original_texts = list(options_dict.keys())
+        translated_texts = self.aws_translate_service.translate_many(original_texts, self.current_language_code)
+        return dict(zip(original_texts, translated_texts))
 
     def cached_translate_text(self, text, target_language_code):
         """
         Traduz o texto fornecido para o idioma de destino, utilizando cache.
 
+        O cache é persistente e mantido pelo AwsTranslateService, de modo que as traduções
+        da interface sobrevivem entre execuções da aplicação.
+
         Args:
             text (str): Texto a ser traduzido.
             target_language_code (str): Código do idioma de destino.
@@ -416,18 +512,8 @@ class TranslationApp:
         Returns:
             str: Texto traduzido.
         """
-        if target_language_code not in self.translated_texts:
-            self.translated_texts[target_language_code] = {}
-
-        language_cache = self.translated_texts[target_language_code]
-
-        if text in language_cache:
-            return language_cache[text]
-        else:
-            translated_text, _ = self.aws_translate_service.translate_text(
-                text, target_language_code)
-            language_cache[text] = translated_text
-            return translated_text
+        translated_text, _ = self.aws_translate_service.translate_text(text, target_language_code)
+        return translated_text
 
     @staticmethod
     def update_option_menu(option_menu, variable, translated_options):
@@ -522,6 +608,7 @@ class TranslationApp:
             self.destino_var,
             LANGUAGES.keys()
         )
+        self.create_additional_languages_list(parent)
 
         # Em seguida, criar os demais OptionMenus
         self.area_option_menu = self.create_option_menu(
@@ -543,6 +630,38 @@ class TranslationApp:
             AVAILABLE_MODELS
         )
 
+    def create_additional_languages_list(self, parent):
+        """
+        Cria a lista de seleção múltipla dos idiomas de destino adicionais dentro do frame fornecido.
+
+        O texto é simplificado uma única vez e traduzido simultaneamente para o idioma de destino e
+        para cada idioma adicional selecionado.
+
+        Args:
+            parent (tk.Widget): Frame onde a lista será adicionada.
+        """
+        label_text = "Idiomas adicionais:"
+        label = tk.Label(parent, text=label_text, font=("Helvetica", 12))
+        label.pack(pady=(10, 0))
+        self.label_texts[label_text] = label  # Armazenar para tradução
+
+        frame = tk.Frame(parent)
+        frame.pack(pady=(0, 5))
+        scrollbar = tk.Scrollbar(frame, orient='vertical')
+        self.additional_languages_listbox = tk.Listbox(
+            frame,
+            selectmode='multiple',
+            exportselection=False,
+            height=4,
+            font=("Helvetica", 11),
+            yscrollcommand=scrollbar.set
+        )
+        scrollbar.config(command=self.additional_languages_listbox.yview)
+        for name in LANGUAGES:
+            self.additional_languages_listbox.insert(END, name)
+        self.additional_languages_listbox.pack(side='left')
+        scrollbar.pack(side='right', fill='y')
+
     def create_complexity_option_menu(self, parent):
         """
         Cria o menu de seleção de nível de complexidade.
@@ -661,7 +780,7 @@ class TranslationApp:
             parent (tk.Widget): Frame onde o botão será adicionado.
         """
         text = "Simplificar Linguagem e Traduzir"
-        button = self.create_button(
+        self.translate_button = self.create_button(
             parent=parent,
             text=text,
             command=self.translate_text,
@@ -669,7 +788,46 @@ class TranslationApp:
             padx=20,
             pady=10
         )
-        self.label_texts[text] = button  # Armazenar para tradução
+        self.label_texts[text] = self.translate_button  # Armazenar para tradução
+
+        text = "Comparar Variantes"
+        self.variants_button = self.create_button(
+            parent=parent,
+            text=text,
+            command=self.open_variants_window,
+            bg_color="#9C27B0",
+            padx=20,
+            pady=(0, 10)
+        )
+        self.label_texts[text] = self.variants_button  # Armazenar para tradução
+
+    def create_progress_display(self, parent):
+        """
+        Cria o indicador de progresso e o botão de cancelamento dentro do frame fornecido.
+
+        O indicador mostra a etapa em andamento e a fração das etapas concluídas; o botão de
+        cancelamento fica habilitado apenas enquanto houver uma operação em andamento.
+
+        Args:
+            parent (tk.Widget): Frame onde os widgets serão adicionados.
+        """
+        self.status_label = tk.Label(parent, text="", font=("Helvetica", 10), wraplength=250)
+        self.status_label.pack(pady=(5, 0))
+
+        self.progress_bar = ttk.Progressbar(parent, orient='horizontal', mode='determinate', length=250)
+        self.progress_bar.pack(pady=(5, 5))
+
+        text = "Cancelar"
+        self.cancel_button = self.create_button(
+            parent=parent,
+            text=text,
+            command=self.cancel_task,
+            bg_color="#F44336",
+            padx=20,
+            pady=5
+        )
+        self.cancel_button.config(state='disabled')
+        self.label_texts[text] = self.cancel_button  # Armazenar para tradução
 
     @staticmethod
     def create_button(parent, text, command, bg_color, **pack_options):
@@ -727,14 +885,14 @@ class TranslationApp:
         button_frame.pack(pady=(5, 10))
 
         # Criar e armazenar o botão "Importar Documento"
-        button_import = self.create_button(button_frame, "Importar Documento", self.import_document, "#2196F3",
-                                           side=tk.LEFT, padx=5)
-        self.label_texts["Importar Documento"] = button_import  # Armazenar para tradução
+        self.import_button = self.create_button(button_frame, "Importar Documento", self.import_document, "#2196F3",
+                                                side=tk.LEFT, padx=5)
+        self.label_texts["Importar Documento"] = self.import_button  # Armazenar para tradução
 
         # Criar e armazenar o botão "Exportar Documento"
-        button_export = self.create_button(button_frame, "Exportar Documento", self.export_document, "#FF9800",
-                                           side=tk.LEFT, padx=5)
-        self.label_texts["Exportar Documento"] = button_export  # Armazenar para tradução
+        self.export_button = self.create_button(button_frame, "Exportar Documento", self.export_document, "#FF9800",
+                                                side=tk.LEFT, padx=5)
+        self.label_texts["Exportar Documento"] = self.export_button  # Armazenar para tradução
 
     def create_text_output(self, parent):
         """
@@ -846,27 +1004,32 @@ class TranslationApp:
         Este metodo executa os seguintes passos:
             1. Obtém o texto de entrada da interface.
             2. Coleta os parâmetros selecionados pelo usuário.
-            3. Utiliza o serviço OpenAI para simplificar o texto.
-            4. Calcula as métricas de legibilidade para o texto original e simplificado.
-            5. Traduz o texto simplificado para o idioma de destino.
-            6. Calcula o BLEU Score entre o texto simplificado e traduzido.
-            7. Atualiza a interface com as métricas calculadas e o texto traduzido.
+            3. Inicia uma tarefa em uma thread de trabalho que executa o pipeline (simplificação em
+               modo streaming, métricas, tradução e BLEU Score), com as etapas independentes em paralelo.
+            4. Exibe o texto simplificado à medida que é gerado, o progresso de cada etapa e, ao final,
+               o texto traduzido e as métricas. A operação pode ser interrompida pelo botão Cancelar.
 
         Exceções:
             - Exibe uma mensagem de erro se ocorrer qualquer problema durante o processo.
         """
+        if self.current_task is not None:
+            return
+
         texto = self.texto_entrada.get("1.0", END).strip()
         if not texto:
             messagebox.showwarning("Entrada Vazia", "Por favor, insira um texto para simplificar e traduzir.")
             return
 
-        codigo_idioma_destino = LANGUAGES.get(self.destino_var.get(), 'pt')
-        area_tecnica = self.get_original_option(self.area_var.get(), self.translated_specialities)
-        estilo = self.get_original_option(self.estilo_var.get(), self.translated_styles)
-        summarize = self.summarize_var.get()
-        modelo_selecionado = self.modelo_var.get()
-        complexity_level = self.get_original_option(self.complexity_var.get(), self.translated_complexity_levels)
+        self.start_translation(texto, self.get_simplification_options())
 
+    def get_simplification_options(self) -> dict:
+        """
+        Coleta os parâmetros de simplificação selecionados pelo usuário.
+
+        Returns:
+            dict: Os parâmetros de `OpenAIService.simplify_text`, exceto o texto, com as opções originais
+            (não traduzidas) da área técnica, do estilo e do nível de complexidade.
+        """
         focus_aspects = []
         if self.focus_clarity_var.get():
             focus_aspects.append('clareza')
@@ -875,49 +1038,380 @@ class TranslationApp:
         if self.focus_formality_var.get():
             focus_aspects.append('formalidade')
 
-        temperature = self.temperature_var.get()
-        max_tokens = self.max_tokens_var.get()
+        return dict(
+            area_tecnica=self.get_original_option(self.area_var.get(), self.translated_specialities),
+            estilo=self.get_original_option(self.estilo_var.get(), self.translated_styles),
+            summarize=self.summarize_var.get(),
+            model=self.modelo_var.get(),
+            complexity_level=self.get_original_option(self.complexity_var.get(), self.translated_complexity_levels),
+            focus_aspects=focus_aspects,
+            temperature=self.temperature_var.get(),
+            max_tokens=self.max_tokens_var.get()
+        )
+
+    def start_translation(self, texto, opcoes, texto_simplificado=None) -> None:
+        """
+        Inicia a tarefa do pipeline para o idioma de destino e os idiomas adicionais selecionados.
 
-        try:
-            # Simplifica o texto usando a API OpenAI com os novos parâmetros
-            texto_simplificado = self.openai_service.simplify_text(
-                text=texto,
-                area_tecnica=area_tecnica,
-                estilo=estilo,
-                summarize=summarize,
-                model=modelo_selecionado,
-                complexity_level=complexity_level,
-                focus_aspects=focus_aspects,
-                temperature=temperature,
-                max_tokens=max_tokens
-            )
+        Args:
+            texto (str): Texto original.
+            opcoes (dict): Parâmetros de simplificação (ver `get_simplification_options`).
+            texto_simplificado (str, optional): Texto já simplificado (por exemplo, uma variante escolhida
+                em "Comparar Variantes"); se informado, a simplificação não é executada novamente.
+        """
+        codigo_idioma_destino = LANGUAGES.get(self.destino_var.get(), 'pt')
+        idiomas_adicionais = [
+            LANGUAGES[self.additional_languages_listbox.get(index)]
+            for index in self.additional_languages_listbox.curselection()
+            if LANGUAGES[self.additional_languages_listbox.get(index)] != codigo_idioma_destino
+        ]
+
+        # Limpa a saída anterior e as etapas concluídas da execução anterior
+        self.show_results("")
+        self.completed_stages = set()
+
+        self.start_task(
+            lambda task: self.run_translation(
+                task,
+                texto=texto,
+                codigo_idioma_destino=codigo_idioma_destino,
+                opcoes=opcoes,
+                idiomas_adicionais=idiomas_adicionais,
+                texto_simplificado=texto_simplificado
+            ),
+            name='pipeline',
+            status=STAGE_LABELS['simplify' if texto_simplificado is None else 'translate'],
+            on_result=self.show_translation_result,
+            on_progress=self.on_translation_progress,
+            steps=len(STAGE_LABELS) + 2 * len(idiomas_adicionais)
+        )
+
+    def run_translation(self, task, texto, codigo_idioma_destino, opcoes, idiomas_adicionais=(),
+                        texto_simplificado=None):
+        """
+        Executa o pipeline de simplificação e tradução em uma thread de trabalho.
+
+        As etapas são executadas pelo `PipelineService`: as métricas do texto original são calculadas
+        durante a simplificação, e as métricas do texto simplificado durante a tradução. Documentos longos
+        (que não serão resumidos) são processados pelo `StreamingPipelineService`, que traduz cada
+        segmento assim que ele é simplificado e publica o texto traduzido na ordem do documento. Com idiomas
+        adicionais, o texto é simplificado uma única vez e traduzido para todos os idiomas simultaneamente.
+
+        Este metodo não acessa os widgets do Tkinter: cada trecho simplificado e o início e o fim de
+        cada etapa são publicados como progresso da tarefa, e o resultado é entregue por `poll_tasks`.
 
-            # Calcula as métricas de legibilidade para o texto original
-            metrics_original = self.readability_service.calculate_readability(texto)
+        Args:
+            task (BackgroundTask): Tarefa em execução, utilizada para publicar o progresso e verificar o cancelamento.
+            texto (str): Texto original.
+            codigo_idioma_destino (str): Código do idioma de destino.
+            opcoes (dict): Parâmetros de simplificação (área técnica, estilo, resumo, modelo, nível de
+                complexidade, aspectos priorizados, temperatura e número máximo de tokens).
+            idiomas_adicionais (list): Códigos dos idiomas de destino adicionais.
+            texto_simplificado (str, optional): Texto já simplificado, reutilizado sem nova chamada à OpenAI.
+
+        Returns:
+            PipelineResult | MultiPipelineResult: Resultado do pipeline, com um resultado por idioma se houver
+            idiomas adicionais.
+        """
+        if idiomas_adicionais:
+            return self.pipeline_service.run_multi(
+                texto,
+                [codigo_idioma_destino, *idiomas_adicionais],
+                opcoes,
+                on_token=lambda trecho: task.report(('token', trecho)),
+                on_stage=lambda etapa, evento: task.report(('stage', etapa, evento)),
+                cancellation_token=task.token,
+                simplified_text=texto_simplificado
+            )
+        if texto_simplificado is None and self.streaming_pipeline_service.is_suitable(texto, opcoes):
+            return self.streaming_pipeline_service.run(
+                texto,
+                codigo_idioma_destino,
+                opcoes,
+                on_segment=lambda segmento: task.report(
+                    ('segment', segmento.translated_text + segmento.separator)),
+                on_stage=lambda etapa, evento: task.report(('stage', etapa, evento)),
+                cancellation_token=task.token
+            )
+        return self.pipeline_service.run(
+            texto,
+            codigo_idioma_destino,
+            opcoes,
+            on_token=lambda trecho: task.report(('token', trecho)),
+            on_stage=lambda etapa, evento: task.report(('stage', etapa, evento)),
+            cancellation_token=task.token,
+            simplified_text=texto_simplificado
+        )
 
-            # Calcula as métricas de legibilidade para o texto simplificado
-            metrics_simplified = self.readability_service.calculate_readability(texto_simplificado)
+    def open_variants_window(self) -> None:
+        """
+        Abre a janela de comparação de variantes da simplificação.
 
-            # Armazena as métricas para exportação
-            self.metrics_original = metrics_original
-            self.metrics_simplified = metrics_simplified
+        O usuário escolhe os níveis de complexidade e os estilos de escrita; todas as combinações são
+        simplificadas simultaneamente, em uma thread de trabalho, e exibidas lado a lado com as suas
+        métricas de legibilidade, à medida que são concluídas. A variante escolhida é traduzida sem
+        uma nova chamada à OpenAI.
+        """
+        if self.current_task is not None:
+            return
 
-            # Traduz o texto simplificado
-            texto_traduzido, source_language_code = self.aws_translate_service.translate_text(
-                texto_simplificado, codigo_idioma_destino
+        window = tk.Toplevel(self.root)
+        window.title("Comparar Variantes")
+        window.geometry("1100x750")
+
+        selection_frame = tk.Frame(window)
+        selection_frame.pack(pady=(10, 5))
+        tk.Label(selection_frame, text="Nível de complexidade:", font=("Helvetica", 12)).grid(
+            row=0, column=0, sticky='w')
+        level_vars = {level: tk.BooleanVar(window, value=True) for level in self.original_complexity_levels}
+        for column, (level, variable) in enumerate(level_vars.items(), start=1):
+            tk.Checkbutton(selection_frame, text=self.translated_complexity_levels.get(level, level), variable=variable,
+                           font=("Helvetica", 12)).grid(row=0, column=column, sticky='w')
+
+        tk.Label(selection_frame, text="Estilo de escrita:", font=("Helvetica", 12)).grid(row=1, column=0, sticky='w')
+        estilo_atual = self.get_original_option(self.estilo_var.get(), self.translated_styles)
+        style_vars = {style: tk.BooleanVar(window, value=style == estilo_atual) for style in self.original_styles}
+        for column, (style, variable) in enumerate(style_vars.items(), start=1):
+            tk.Checkbutton(selection_frame, text=self.translated_styles.get(style, style), variable=variable,
+                           font=("Helvetica", 12)).grid(row=1, column=column, sticky='w')
+
+        results_frame = tk.Frame(window)
+
+        def generate():
+            texto = self.texto_entrada.get("1.0", END).strip()
+            if not texto:
+                messagebox.showwarning("Entrada Vazia", "Por favor, insira um texto para simplificar e traduzir.",
+                                       parent=window)
+                return
+            variantes = [
+                {'complexity_level': level, 'estilo': style}
+                for level, level_var in level_vars.items() if level_var.get()
+                for style, style_var in style_vars.items() if style_var.get()
+            ]
+            if not variantes or self.current_task is not None:
+                return
+
+            for child in results_frame.winfo_children():
+                child.destroy()
+            opcoes = self.get_simplification_options()
+            self.start_task(
+                lambda task: self.pipeline_service.compare_variants(
+                    texto, variantes, opcoes, on_variant=task.report, cancellation_token=task.token
+                ),
+                name='variants',
+                status=f"Gerando {len(variantes)} variantes...",
+                on_result=None,
+                on_progress=lambda variante: self.show_variant(window, results_frame, variante, texto),
+                steps=len(variantes)
             )
 
-            # Calcula o BLEU Score
-            bleu_score = self.bleu_score_service.compute_bleu_score(
-                texto_simplificado, texto_traduzido, source_language_code
+        self.create_button(window, "Gerar Variantes", generate, "#9C27B0", pady=(0, 10))
+        results_frame.pack(fill='both', expand=True, padx=10, pady=(0, 10))
+
+    def show_variant(self, window, parent, variante, texto) -> None:
+        """
+        Exibe uma variante concluída na janela de comparação, com as suas métricas de legibilidade.
+
+        Args:
+            window (tk.Toplevel): Janela de comparação (a variante é ignorada se a janela foi fechada).
+            parent (tk.Widget): Frame onde a variante será exibida.
+            variante (SimplificationVariant): A variante simplificada.
+            texto (str): Texto original, traduzido com a variante escolhida.
+        """
+        self.progress_bar.config(value=self.progress_bar['value'] + 1)
+        if not window.winfo_exists():
+            return
+
+        row, column = divmod(variante.index, VARIANT_COLUMNS)
+        parent.columnconfigure(column, weight=1, uniform='variant')
+        parent.rowconfigure(row, weight=1)
+        frame = tk.Frame(parent, bd=1, relief='groove')
+        frame.grid(row=row, column=column, sticky='nsew', padx=5, pady=5)
+
+        level, style = variante.options['complexity_level'], variante.options['estilo']
+        tk.Label(
+            frame,
+            text=f"{self.translated_complexity_levels.get(level, level)} · {self.translated_styles.get(style, style)}",
+            font=("Helvetica", 11, "bold")
+        ).pack(pady=(5, 0))
+
+        text_widget = tk.Text(frame, wrap='word', height=8, font=("Helvetica", 10))
+        text_widget.insert(END, variante.simplified_text)
+        text_widget.config(state='disabled')
+        text_widget.pack(fill='both', expand=True, padx=5, pady=5)
+
+        for name in ('Índice de Flesch Reading Ease', 'Grau de Flesch-Kincaid'):
+            value = variante.metrics.get(self.metric_key_from_name(name), 'N/A')
+            tk.Label(frame, text=f"{name}: {value:.2f}" if isinstance(value, float) else f"{name}: {value}",
+                     font=("Helvetica", 10)).pack()
+
+        self.create_button(frame, "Usar esta variante", lambda: self.use_variant(window, variante, texto), "#4CAF50",
+                           pady=(5, 5))
+
+    def use_variant(self, window, variante, texto) -> None:
+        """
+        Seleciona uma variante e traduz o texto simplificado correspondente.
+
+        O nível de complexidade e o estilo da variante passam a ser as opções selecionadas na janela
+        principal, e o pipeline é executado com o texto já simplificado.
+
+        Args:
+            window (tk.Toplevel): Janela de comparação, fechada ao selecionar a variante.
+            variante (SimplificationVariant): A variante escolhida.
+            texto (str): Texto original.
+        """
+        if self.current_task is not None:
+            return
+        level, style = variante.options['complexity_level'], variante.options['estilo']
+        self.complexity_var.set(self.translated_complexity_levels.get(level, level))
+        self.estilo_var.set(self.translated_styles.get(style, style))
+        window.destroy()
+        self.start_translation(texto, variante.options, variante.simplified_text)
+
+    def on_translation_progress(self, evento) -> None:
+        """
+        Aplica na interface o progresso do pipeline.
+
+        Args:
+            evento (tuple): ('token', trecho) para cada trecho simplificado, ('segment', trecho) para cada
+                segmento traduzido em streaming, ou ('stage', etapa, evento) no início ('started') e no
+                fim ('finished') de cada etapa.
+        """
+        if evento[0] in ('token', 'segment'):
+            self.append_output(evento[1])
+            return
+
+        _, etapa, estado = evento
+        if estado == 'finished':
+            self.completed_stages.add(etapa)
+            self.progress_bar.config(value=len(self.completed_stages))
+        elif etapa != 'readability_original':
+            # Etapas de um idioma específico são nomeadas como 'translate:en'
+            nome, _, idioma = etapa.partition(':')
+            rotulo = STAGE_LABELS.get(nome, nome)
+            self.status_label.config(text=f"{rotulo} ({idioma})" if idioma else rotulo)
+
+    def show_translation_result(self, resultado) -> None:
+        """
+        Exibe o texto traduzido e as métricas produzidas pelo pipeline.
+
+        Com vários idiomas de destino, exibe o resultado do idioma selecionado em "Idioma de destino" e
+        armazena os demais para a exportação.
+
+        Args:
+            resultado (PipelineResult | MultiPipelineResult): Resultado do pipeline.
+        """
+        if isinstance(resultado, MultiPipelineResult):
+            self.translation_results = resultado
+            idiomas = ', '.join(
+                f"{idioma}: {bleu_score:.2f}" for idioma, bleu_score in resultado.bleu_scores.items()
             )
+            resultado = resultado.result_for(resultado.target_language_codes[0])
+        else:
+            self.translation_results = None
+            idiomas = None
 
-            # Atualiza as métricas, incluindo o BLEU Score
-            self.update_readability_metrics(metrics_original, metrics_simplified, bleu_score)
+        # Armazena as métricas para exportação
+        self.metrics_original = resultado.metrics_original
+        self.metrics_simplified = resultado.metrics_simplified
 
-            self.show_results(texto_traduzido)
-        except Exception as e:
-            messagebox.showerror("Erro", str(e))
+        # Atualiza as métricas, incluindo o BLEU Score
+        self.update_readability_metrics(resultado.metrics_original, resultado.metrics_simplified, resultado.bleu_score)
+        self.show_results(resultado.translated_text)
+        if idiomas:
+            self.status_label.config(text=f"BLEU Score: {idiomas}")
+
+    def start_task(self, function, name, status, on_result, on_progress=None, steps=None, error_title="Erro") -> None:
+        """
+        Executa uma operação em uma thread de trabalho, exibindo o seu progresso.
+
+        Enquanto a operação estiver em andamento, os botões de ação ficam desabilitados e o botão
+        Cancelar fica habilitado. Os resultados e erros são aplicados na interface por `poll_tasks`.
+        Após o cancelamento, os botões permanecem desabilitados até que a thread de trabalho termine.
+
+        Args:
+            function (callable): Função executada na thread de trabalho; recebe a tarefa (BackgroundTask).
+            name (str): Nome da tarefa.
+            status (str): Descrição exibida durante a operação.
+            on_result (callable): Chamado na thread da interface com o resultado da operação.
+            on_progress (callable, optional): Chamado na thread da interface com cada evento de progresso.
+            steps (int, optional): Número de etapas da operação. Se ausente, o progresso é indeterminado.
+            error_title (str): Título da mensagem exibida se a operação falhar.
+        """
+        def finish_with(callback):
+            def handler(*args):
+                self.finish_task()
+                if callback is not None:
+                    callback(*args)
+            return handler
+
+        def show_cancelling():
+            if self.current_task is not None:
+                self.cancel_button.config(state='disabled')
+                self.status_label.config(text="Cancelando...")
+
+        def finish_cancelled():
+            # A interface só é liberada quando a thread da operação cancelada termina
+            if self.current_task is not None and self.current_task.token.is_cancelled():
+                self.finish_task()
+
+        for button in (self.translate_button, self.variants_button, self.import_button, self.export_button):
+            button.config(state='disabled')
+        self.cancel_button.config(state='normal')
+        self.status_label.config(text=status)
+        if steps:
+            self.progress_bar.config(mode='determinate', maximum=steps, value=0)
+        else:
+            self.progress_bar.config(mode='indeterminate')
+            self.progress_bar.start(UI_POLL_INTERVAL_MS)
+
+        self.current_task = self.task_service.submit(
+            function,
+            name=name,
+            on_result=finish_with(on_result),
+            on_error=finish_with(lambda e: messagebox.showerror(error_title, str(e))),
+            on_progress=on_progress,
+            on_cancelled=show_cancelling,
+            on_finished=finish_cancelled
+        )
+        if not self.polling:
+            self.polling = True
+            self.root.after(UI_POLL_INTERVAL_MS, self.poll_tasks)
+
+    def finish_task(self) -> None:
+        """
+        Restaura os controles da interface ao término (ou cancelamento) da operação em andamento.
+        """
+        self.current_task = None
+        self.progress_bar.stop()
+        self.progress_bar.config(mode='determinate', value=0)
+        self.status_label.config(text="")
+        self.cancel_button.config(state='disabled')
+        for button in (self.translate_button, self.variants_button, self.import_button, self.export_button):
+            button.config(state='normal')
+
+    def cancel_task(self) -> None:
+        """
+        Cancela a operação em andamento.
+
+        A thread de trabalho é interrompida na próxima verificação de cancelamento e o seu resultado é
+        descartado; a interface é liberada quando a thread termina (ver `start_task`).
+        """
+        if self.current_task is not None:
+            self.current_task.cancel()
+
+    def poll_tasks(self) -> None:
+        """
+        Aplica na interface os eventos produzidos pelas threads de trabalho.
+
+        Os eventos são entregues sem bloquear o loop do Tkinter, com um orçamento de tempo por leitura;
+        enquanto houver tarefas em execução ou eventos pendentes, uma nova leitura é agendada com `root.after`.
+        """
+        self.task_service.process_events()
+        if self.task_service.has_pending_work():
+            self.root.after(UI_POLL_INTERVAL_MS, self.poll_tasks)
+        else:
+            self.polling = False
 
     @staticmethod
     def metric_key_from_name(name):
@@ -979,12 +1473,25 @@ class TranslationApp:
         self.texto_saida.insert(END, texto)
         self.texto_saida.config(state='disabled')
 
+    def append_output(self, texto: str) -> None:
+        """
+        Acrescenta um trecho de texto ao final da área de saída.
+
+        Args:
+            texto (str): Trecho a ser acrescentado.
+        """
+        self.texto_saida.config(state='normal')
+        self.texto_saida.insert(END, texto)
+        self.texto_saida.see(END)
+        self.texto_saida.config(state='disabled')
+
     def import_document(self):
         """
         Importa texto de um documento selecionado pelo usuário.
 
         Permite ao usuário selecionar um arquivo de texto, PDF, Word ou eBook e
-        importa o conteúdo para a área de entrada de texto.
+        importa o conteúdo para a área de entrada de texto. A leitura do arquivo é feita
+        em uma thread de trabalho, sem bloquear a interface.
 
         Exceções:
             - Exibe uma mensagem de erro se ocorrer algum problema durante a importação.
@@ -999,13 +1506,18 @@ class TranslationApp:
                 ("eBooks", "*.epub")
             ]
         )
-        if file_path:
-            try:
-                text = self.document_service.import_document(file_path)
+        if file_path and self.current_task is None:
+            def show_imported_text(text):
                 self.texto_entrada.delete("1.0", END)
                 self.texto_entrada.insert(END, text)
-            except Exception as e:
-                messagebox.showerror("Erro ao Importar Documento", str(e))
+
+            self.start_task(
+                lambda task: self.document_service.import_document(file_path, cancellation_token=task.token),
+                name='import',
+                status=f"Importando {os.path.basename(file_path)}...",
+                on_result=show_imported_text,
+                error_title="Erro ao Importar Documento"
+            )
 
     def export_document(self):
         """
@@ -1013,6 +1525,9 @@ class TranslationApp:
 
         Permite ao usuário salvar o texto traduzido e simplificado em formatos
         como TXT, PDF ou DOCX, incluindo as métricas de legibilidade e o BLEU Score.
+        Se a última tradução produziu vários idiomas, todos são exportados de uma vez, um arquivo
+        por idioma (por exemplo, `artigo.en.pdf` e `artigo.es.pdf`), cada um com o seu BLEU Score.
+        A escrita dos arquivos é feita em uma thread de trabalho, sem bloquear a interface.
 
         Exceções:
             - Exibe uma mensagem de erro se não houver texto para exportar ou
@@ -1036,35 +1551,94 @@ class TranslationApp:
                 ("Documento Word", "*.docx")
             ]
         )
-        if file_path:
-            try:
-                ext = os.path.splitext(file_path)[1].lower()
-                format_map = {'.txt': 'txt', '.pdf': 'pdf', '.docx': 'docx'}
-                format = format_map.get(ext)
-                if not format:
-                    messagebox.showerror("Formato não suportado", f"Formato de arquivo não suportado: {ext}")
-                    return
-                text = self.texto_saida.get("1.0", END)
-
-                # Obter o BLEU Score a partir do label
-                bleu_score_text = self.bleu_score_label.cget("text")
-                bleu_score = float(bleu_score_text) if bleu_score_text else None
-
-                # Passar o BLEU Score para o método de exportação
-                self.document_service.export_document(
+        if file_path and self.current_task is None:
+            ext = os.path.splitext(file_path)[1].lower()
+            format_map = {'.txt': 'txt', '.pdf': 'pdf', '.docx': 'docx'}
+            format = format_map.get(ext)
+            if not format:
+                messagebox.showerror("Formato não suportado", f"Formato de arquivo não suportado: {ext}")
+                return
+            text = self.texto_saida.get("1.0", END)
+
+            # Obter o BLEU Score a partir do label
+            bleu_score_text = self.bleu_score_label.cget("text")
+            bleu_score = float(bleu_score_text) if bleu_score_text else None
+
+            # Passar o BLEU Score para o método de exportação, na thread de trabalho
+            metrics_original, metrics_simplified = self.metrics_original, self.metrics_simplified
+            if self.translation_results is not None:
+                self.export_all_languages(self.translation_results, text, bleu_score, file_path, format)
+                return
+            self.start_task(
+                lambda task: self.document_service.export_document(
                     text,
                     file_path,
                     format,
-                    self.metrics_original,
-                    self.metrics_simplified,
-                    bleu_score  # Passando o BLEU Score
+                    metrics_original,
+                    metrics_simplified,
+                    bleu_score,  # Passando o BLEU Score
+                    cancellation_token=task.token
+                ),
+                name='export',
+                status=f"Exportando {os.path.basename(file_path)}...",
+                on_result=lambda _: messagebox.showinfo(
+                    "Exportação bem-sucedida", f"Documento exportado com sucesso: {file_path}"),
+                error_title="Erro ao Exportar Documento"
+            )
+
+
+    def export_all_languages(self, resultados, texto_principal, bleu_score_principal, file_path, format) -> None:
+        """
+        Exporta, de uma vez, o resultado de cada idioma de destino da última tradução.
+
+        O idioma principal é exportado com o texto da área de saída; os demais, com as traduções do
+        pipeline. O código do idioma é acrescentado ao nome do arquivo escolhido.
+
+        Args:
+            resultados (MultiPipelineResult): Resultado do pipeline para vários idiomas.
+            texto_principal (str): Texto da área de saída, do idioma de destino principal.
+            bleu_score_principal (float): BLEU Score exibido para o idioma principal.
+            file_path (str): Caminho escolhido pelo usuário.
+            format (str): Formato de exportação.
+        """
+        raiz, ext = os.path.splitext(file_path)
+        principal = resultados.target_language_codes[0]
+        arquivos = {idioma: f"{raiz}.{idioma}{ext}" for idioma in resultados.target_language_codes}
+
+        def exportar(task):
+            for idioma, caminho in arquivos.items():
+                task.token.raise_if_cancelled()
+                task.report(idioma)
+                if idioma == principal:
+                    texto, bleu_score = texto_principal, bleu_score_principal
+                else:
+                    texto, bleu_score = resultados.translations[idioma][0], resultados.bleu_scores[idioma]
+                self.document_service.export_document(
+                    texto,
+                    caminho,
+                    format,
+                    resultados.metrics_original,
+                    resultados.metrics_simplified,
+                    bleu_score,
+                    cancellation_token=task.token
                 )
-                messagebox.showinfo("Exportação bem-sucedida", f"Documento exportado com sucesso: {file_path}")
-            except Exception as e:
-                messagebox.showerror("Erro ao Exportar Documento", str(e))
+            return list(arquivos.values())
+
+        self.start_task(
+            exportar,
+            name='export',
+            status=f"Exportando {len(arquivos)} documentos...",
+            on_result=lambda caminhos: messagebox.showinfo(
+                "Exportação bem-sucedida", "Documentos exportados com sucesso:\n" + "\n".join(caminhos)),
+            on_progress=lambda idioma: self.status_label.config(
+                text=f"Exportando {os.path.basename(arquivos[idioma])}..."),
+            error_title="Erro ao Exportar Documento"
+        )
 
 
 if __name__ == "__main__":
     root = tk.Tk()
     app = TranslationApp(root)
     root.mainloop()
+    # Encerra o pool de processos da extração de PDFs
+    app.document_service.close()
@@ -0,0 +1,436 @@
+# server.py
+
+"""
+TraduzAI Server
+===============
+
+Servidor HTTP local que expõe o pipeline de simplificação, tradução e métricas para outros serviços,
+sem a interface gráfica. Os trabalhos são submetidos a uma fila limitada (`JobQueueService`) e executados
+por um conjunto fixo de workers no mesmo processo, que mantém os clientes das APIs, os pools de conexões,
+os caches e o gerenciador de cotas aquecidos entre as requisições. O servidor utiliza apenas o asyncio da
+biblioteca padrão, com conexões persistentes (keep-alive) e respostas JSON.
+
+Endpoints:
+    POST   /jobs              Submete um trabalho: {"text": "...", "targets": ["en"], "options": {...}}.
+                              Retorna 202 com o identificador, 400 se o texto, os idiomas ou os tipos e
+                              intervalos das opções forem inválidos, ou 503 se a fila estiver cheia.
+                              No lugar do texto, {"document": "artigo.pdf", "first_page": 1, "last_page": 10}
+                              indica um documento do diretório de documentos (--documents-dir), lido e
+                              simplificado parágrafo a parágrafo; caminhos fora desse diretório retornam 400.
+    GET    /jobs/<id>         Estado do trabalho (na fila, em andamento, concluído) e etapas concluídas.
+    GET    /jobs/<id>/result  Resultado do trabalho concluído (409 enquanto ele não terminar).
+    GET    /jobs/<id>/stream  Eventos do trabalho em tempo real (NDJSON, transferência chunked): etapas,
+                              trechos simplificados, segmentos traduzidos e, ao final, o resultado. Os eventos
+                              mais antigos além do limite do trabalho são substituídos por um evento 'skipped'.
+    DELETE /jobs/<id>         Cancela o trabalho (um trabalho na fila libera a sua vaga imediatamente).
+    GET    /health            Estado da fila, utilização das cotas e espera das filas de prioridade.
+
+Para testes, as APIs podem ser substituídas por serviços locais compatíveis por meio das variáveis
+OPENAI_BASE_URL e AWS_TRANSLATE_ENDPOINT_URL.
+
+Exemplo de Uso:
+    $ python server.py --port 8080 --workers 4 --queue-size 100
+    $ curl -X POST localhost:8080/jobs -d '{"text": "...", "targets": ["en", "es"]}'
+    {"job_id": "3f2c...", "status": "queued", ...}
+    $ python server.py --documents-dir test/scientific-papers
+    $ curl -X POST localhost:8080/jobs -d '{"document": "artigo.pdf", "targets": ["en"], "last_page": 5}'
+    $ curl localhost:8080/jobs/3f2c.../stream
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from typing import Optional, Tuple
+from urllib.parse import urlsplit
+
+from services.api.aws_translate_service import AwsTranslateService
+from services.api.openai_service import OpenAIService
+from services.api.quota_manager import LANE_INTERACTIVE, LANES, QuotaManager
+from services.language.bleu_score_service import BleuScoreService
+from services.language.readability_service import ReadabilityService
+from services.pipeline.job_queue import (
+    DEFAULT_MAX_QUEUE_SIZE, DEFAULT_MAX_WORKERS, JOB_SUCCEEDED, JobQueueService, QueueFullError
+)
+from services.pipeline.pipeline_service import PipelineService
+from services.pipeline.streaming_pipeline import StreamingPipelineService
+
+# Tamanho máximo, em bytes, do corpo de uma requisição
+DEFAULT_MAX_BODY_BYTES = 10 * 1024 * 1024
+
+# Mensagens padrão dos códigos de status utilizados
+STATUS_REASONS = {
+    200: 'OK', 202: 'Accepted', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+    409: 'Conflict', 413: 'Payload Too Large', 431: 'Request Header Fields Too Large',
+    500: 'Internal Server Error', 503: 'Service Unavailable'
+}
+
+
+class HttpError(Exception):
+    """
+    Exceção convertida em uma resposta de erro HTTP.
+    """
+
+    def __init__(self, status: int, message: str, headers: Optional[dict] = None):
+        super().__init__(message)
+        self.status = status
+        self.headers = headers or {}
+
+
+class TraduzAIServer:
+    """
+    Servidor HTTP assíncrono dos trabalhos do pipeline.
+
+    Métodos:
+        serve_forever() ⇾ None:
+            Inicia a fila e o servidor e atende às requisições até ser cancelado.
+
+        handle_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) ⇾ None:
+            Atende às requisições de uma conexão, enquanto ela for mantida pelo cliente.
+    """
+
+    def __init__(self, job_queue: JobQueueService, host: str = '127.0.0.1', port: int = 8080,
+                 max_body_bytes: int = DEFAULT_MAX_BODY_BYTES, quota_manager: Optional[QuotaManager] = None):
+        """
+        Inicializa a instância do TraduzAIServer.
+
+        Parâmetros:
+            job_queue (JobQueueService): A fila de trabalhos do pipeline.
+            host (str): Endereço em que o servidor aceita conexões.
+            port (int): Porta do servidor.
+            max_body_bytes (int): Tamanho máximo, em bytes, do corpo de uma requisição.
+            quota_manager (QuotaManager, optional): Gerenciador de cotas informado em /health. Por padrão,
+                o gerenciador compartilhado pelo processo.
+        """
+        self.job_queue = job_queue
+        self.host = host
+        self.port = port
+        self.max_body_bytes = max_body_bytes
+        self.quota_manager = quota_manager or QuotaManager.get_shared()
+
+    async def serve_forever(self, on_ready=None) -> None:
+        """
+        Inicia a fila e o servidor e atende às requisições até ser cancelado.
+
+        Parâmetros:
+            on_ready (Callable[[int], None], optional): Função chamada com a porta do servidor, assim que ele
+                estiver aceitando conexões (útil com a porta 0, escolhida pelo sistema operacional).
+        """
+        await self.job_queue.start()
+        server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        try:
+            if on_ready is not None:
+                on_ready(server.sockets[0].getsockname()[1])
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.job_queue.stop()
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Atende às requisições de uma conexão, enquanto ela for mantida pelo cliente.
+
+        Parâmetros:
+            reader (asyncio.StreamReader): O fluxo de leitura da conexão.
+            writer (asyncio.StreamWriter): O fluxo de escrita da conexão.
+        """
+        try:
+            keep_alive = True
+            while keep_alive:
+                try:
+                    request = await self._read_request(reader)
+                except HttpError as e:
+                    await self._send_json(writer, e.status, {'error': str(e)}, e.headers, keep_alive=False)
+                    return
+                if request is None:
+                    return
+                method, path, version, headers, body = request
+                keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+                await self._dispatch(writer, method, path, body, keep_alive)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            # O cliente encerrou a conexão
+            pass
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[Tuple[str, str, str, dict, bytes]]:
+        """
+        Lê uma requisição HTTP da conexão.
+
+        Parâmetros:
+            reader (asyncio.StreamReader): O fluxo de leitura da conexão.
+
+        Retorna:
+            Optional[Tuple[str, str, str, dict, bytes]]: O método, o caminho, a versão, os cabeçalhos (com os
+            nomes em minúsculas) e o corpo da requisição, ou `None` se o cliente encerrou a conexão.
+
+        Exceções:
+            - HttpError: se a requisição for inválida ou exceder os limites de tamanho.
+        """
+        try:
+            head = await reader.readuntil(b'\r\n\r\n')
+        except asyncio.IncompleteReadError:
+            return None
+        except asyncio.LimitOverrunError:
+            raise HttpError(431, "Cabeçalhos da requisição muito grandes.")
+
+        lines = head.decode('iso-8859-1').split('\r\n')
+        try:
+            method, target, version = lines[0].split(' ', 2)
+        except ValueError:
+            raise HttpError(400, "Linha de requisição inválida.")
+        headers = {}
+        for line in lines[1:]:
+            if line:
+                name, _, value = line.partition(':')
+                headers[name.strip().lower()] = value.strip()
+
+        try:
+            length = int(headers.get('content-length') or 0)
+        except ValueError:
+            raise HttpError(400, "Cabeçalho Content-Length inválido.")
+        if length < 0:
+            raise HttpError(400, "Cabeçalho Content-Length inválido.")
+        if length > self.max_body_bytes:
+            raise HttpError(413, f"O corpo da requisição excede {self.max_body_bytes} bytes.")
+        body = await reader.readexactly(length) if length else b''
+        return method.upper(), urlsplit(target).path, version, headers, body
+
+    async def _dispatch(self, writer: asyncio.StreamWriter, method: str, path: str, body: bytes,
+                        keep_alive: bool) -> None:
+        """
+        Encaminha a requisição ao endpoint correspondente e envia a resposta.
+
+        Parâmetros:
+            writer (asyncio.StreamWriter): O fluxo de escrita da conexão.
+            method (str): O método HTTP.
+            path (str): O caminho da requisição.
+            body (bytes): O corpo da requisição.
+            keep_alive (bool): Indica se a conexão deve ser mantida após a resposta.
+        """
+        parts = [part for part in path.split('/') if part]
+        try:
+            if parts == ['health']:
+                self._require_method(method, 'GET')
+                await self._send_json(writer, 200, self._health(), keep_alive=keep_alive)
+            elif parts == ['jobs']:
+                self._require_method(method, 'POST')
+                job = self._submit(body)
+                await self._send_json(writer, 202, job.to_dict(), {'Location': f"/jobs/{job.job_id}"}, keep_alive)
+            elif len(parts) == 2 and parts[0] == 'jobs':
+                self._require_method(method, 'GET', 'DELETE')
+                job = self.job_queue.cancel(parts[1]) if method == 'DELETE' else self.job_queue.get(parts[1])
+                await self._send_json(writer, 200, self._require_job(job).to_dict(), keep_alive=keep_alive)
+            elif len(parts) == 3 and parts[0] == 'jobs' and parts[2] == 'result':
+                self._require_method(method, 'GET')
+                job = self._require_job(self.job_queue.get(parts[1]))
+                if not job.finished:
+                    raise HttpError(409, "O trabalho ainda não foi concluído.")
+                await self._send_json(writer, 200, {**job.to_dict(), 'result': job.result}, keep_alive=keep_alive)
+            elif len(parts) == 3 and parts[0] == 'jobs' and parts[2] == 'stream':
+                self._require_method(method, 'GET')
+                await self._send_stream(writer, self._require_job(self.job_queue.get(parts[1])), keep_alive)
+            else:
+                raise HttpError(404, f"Endpoint não encontrado: {path}")
+        except HttpError as e:
+            await self._send_json(writer, e.status, {'error': str(e)}, e.headers, keep_alive)
+        except ConnectionError:
+            raise
+        except Exception as e:
+            await self._send_json(writer, 500, {'error': f"Erro ao processar a requisição: {str(e)}"},
+                                  keep_alive=keep_alive)
+
+    @staticmethod
+    def _require_method(method: str, *allowed: str) -> None:
+        """
+        Verifica se o método HTTP é aceito pelo endpoint.
+
+        Exceções:
+            - HttpError: 405, se o método não for aceito.
+        """
+        if method not in allowed:
+            raise HttpError(405, f"Método não permitido: {method}", {'Allow': ', '.join(allowed)})
+
+    @staticmethod
+    def _require_job(job):
+        """
+        Verifica se o trabalho existe.
+
+        Exceções:
+            - HttpError: 404, se o trabalho não existir ou já tiver sido descartado.
+        """
+        if job is None:
+            raise HttpError(404, "Trabalho não encontrado.")
+        return job
+
+    def _submit(self, body: bytes):
+        """
+        Interpreta o corpo de uma submissão e enfileira o trabalho.
+
+        Parâmetros:
+            body (bytes): O corpo JSON da requisição, com 'text' (ou 'document' e, opcionalmente,
+                'first_page' e 'last_page'), 'targets' e, opcionalmente, 'options'.
+
+        Retorna:
+            Job: O trabalho enfileirado.
+
+        Exceções:
+            - HttpError: 400, se o corpo for inválido; 503, se a fila estiver cheia.
+        """
+        try:
+            payload = json.loads(body.decode('utf-8'))
+        except (UnicodeDecodeError, ValueError):
+            raise HttpError(400, "O corpo da requisição deve ser um objeto JSON.")
+        if not isinstance(payload, dict):
+            raise HttpError(400, "O corpo da requisição deve ser um objeto JSON.")
+        try:
+            if 'document' not in payload:
+                return self.job_queue.submit(payload.get('text'), payload.get('targets'), payload.get('options'))
+            if 'text' in payload:
+                raise ValueError("Informe o texto ou o documento, não ambos.")
+            return self.job_queue.submit_document(
+                payload['document'], payload.get('targets'), payload.get('options'),
+                payload.get('first_page', 1), payload.get('last_page')
+            )
+        except ValueError as e:
+            raise HttpError(400, str(e))
+        except QueueFullError as e:
+            raise HttpError(503, str(e), {'Retry-After': '1'})
+
+    def _health(self) -> dict:
+        """
+        Retorna o estado do servidor.
+
+        Retorna:
+            dict: O estado da fila de trabalhos, a utilização das cotas e a espera das filas de prioridade.
+        """
+        return {
+            'status': 'ok',
+            'queue': self.job_queue.stats(),
+            'quotas': self.quota_manager.utilization(),
+            'lanes': self.quota_manager.lane_stats()
+        }
+
+    @staticmethod
+    async def _send_json(writer: asyncio.StreamWriter, status: int, payload: dict, headers: Optional[dict] = None,
+                         keep_alive: bool = True) -> None:
+        """
+        Envia uma resposta JSON.
+
+        Parâmetros:
+            writer (asyncio.StreamWriter): O fluxo de escrita da conexão.
+            status (int): O código de status HTTP.
+            payload (dict): O corpo da resposta.
+            headers (dict, optional): Cabeçalhos adicionais.
+            keep_alive (bool): Indica se a conexão será mantida após a resposta.
+        """
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        head = {
+            'Content-Type': 'application/json; charset=utf-8',
+            'Content-Length': str(len(body)),
+            'Connection': 'keep-alive' if keep_alive else 'close',
+            **(headers or {})
+        }
+        writer.write(TraduzAIServer._status_line(status, head) + body)
+        await writer.drain()
+
+    async def _send_stream(self, writer: asyncio.StreamWriter, job, keep_alive: bool) -> None:
+        """
+        Envia os eventos do trabalho à medida que são publicados, um objeto JSON por linha, e, ao final,
+        o resultado do trabalho.
+
+        Parâmetros:
+            writer (asyncio.StreamWriter): O fluxo de escrita da conexão.
+            job (Job): O trabalho.
+            keep_alive (bool): Indica se a conexão será mantida após a resposta.
+        """
+        head = {
+            'Content-Type': 'application/x-ndjson; charset=utf-8',
+            'Transfer-Encoding': 'chunked',
+            'Cache-Control': 'no-cache',
+            'Connection': 'keep-alive' if keep_alive else 'close'
+        }
+        writer.write(self._status_line(200, head))
+
+        async def send(event: dict) -> None:
+            line = json.dumps(event, ensure_ascii=False).encode('utf-8') + b'\n'
+            writer.write(f"{len(line):x}\r\n".encode('ascii') + line + b'\r\n')
+            await writer.drain()
+
+        async for event in self.job_queue.events(job):
+            await send(event)
+        if job.status == JOB_SUCCEEDED:
+            await send({'type': 'result', 'result': job.result})
+        writer.write(b'0\r\n\r\n')
+        await writer.drain()
+
+    @staticmethod
+    def _status_line(status: int, headers: dict) -> bytes:
+        """
+        Monta a linha de status e os cabeçalhos de uma resposta.
+        """
+        lines = [f"HTTP/1.1 {status} {STATUS_REASONS.get(status, '')}"]
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode('iso-8859-1')
+
+
+def parse_arguments(argv=None) -> argparse.Namespace:
+    """
+    Interpreta os argumentos da linha de comando.
+
+    Parâmetros:
+        argv (list, optional): Argumentos a interpretar. Por padrão, `sys.argv[1:]`.
+
+    Retorna:
+        argparse.Namespace: Os argumentos interpretados.
+    """
+    parser = argparse.ArgumentParser(description="Servidor HTTP do pipeline de simplificação e tradução.")
+    parser.add_argument('--host', default='127.0.0.1', help="Endereço em que o servidor aceita conexões.")
+    parser.add_argument('--port', type=int, default=8080, help="Porta do servidor.")
+    parser.add_argument('--workers', type=int, default=DEFAULT_MAX_WORKERS,
+                        help="Número de trabalhos executados simultaneamente.")
+    parser.add_argument('--queue-size', type=int, default=DEFAULT_MAX_QUEUE_SIZE,
+                        help="Número máximo de trabalhos aguardando na fila.")
+    parser.add_argument('--lane', choices=LANES, default=LANE_INTERACTIVE,
+                        help="Fila de prioridade das requisições às APIs.")
+    parser.add_argument('--documents-dir',
+                        help="Diretório dos documentos que podem ser submetidos pelo caminho (padrão: nenhum).")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """
+    Inicia o servidor e o mantém em execução até ser interrompido.
+
+    Parâmetros:
+        argv (list, optional): Argumentos da linha de comando.
+
+    Retorna:
+        int: Código de saída.
+    """
+    args = parse_arguments(argv)
+
+    openai_service = OpenAIService(lane=args.lane)
+    aws_translate_service = AwsTranslateService(lane=args.lane)
+    readability_service = ReadabilityService()
+    bleu_score_service = BleuScoreService(aws_translate_service)
+    job_queue = JobQueueService(
+        PipelineService(openai_service, aws_translate_service, readability_service, bleu_score_service),
+        StreamingPipelineService(openai_service, aws_translate_service, readability_service, bleu_score_service),
+        max_workers=args.workers,
+        max_queue_size=args.queue_size,
+        documents_dir=args.documents_dir
+    )
+    server = TraduzAIServer(job_queue, args.host, args.port)
+
+    try:
+        asyncio.run(server.serve_forever(
+            on_ready=lambda port: print(f"Servidor TraduzAI em http://{args.host}:{port}")
+        ))
+    except KeyboardInterrupt:
+        print("Servidor encerrado.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
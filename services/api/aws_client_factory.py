@@ -0,0 +1,231 @@
+# services/api/aws_client_factory.py
+
+"""
+AWS Client Factory Module
+=========================
+
+Este módulo fornece uma fábrica de clientes AWS compartilhados pelo processo.
+Cada combinação de região e credenciais recebe um único cliente AWS Translate,
+com pool de conexões, keep-alive e política de retry configuráveis por meio do
+`botocore.config.Config`. Os clientes do boto3 são seguros para uso entre threads,
+de modo que todos os serviços (tradução, back-translation do BLEU Score e tradução
+em blocos paralelos) reutilizam as mesmas conexões. Da mesma forma, cada conta e
+região recebe um único limitador de taxa adaptativo, compartilhado por todos os
+serviços que consomem a mesma cota.
+
+Classes:
+    AwsClientFactory: Classe responsável pela criação e reutilização dos clientes AWS.
+
+Dependências:
+    - boto3: biblioteca da AWS para interagir com os serviços da AWS.
+    - botocore: biblioteca base do boto3, utilizada para a configuração dos clientes.
+    - dotenv: biblioteca para carregar variáveis de ambiente a partir de um arquivo .env.
+    - os: biblioteca padrão para interagir com o sistema operacional.
+    - threading: biblioteca padrão para sincronização entre threads.
+    - typing: para anotações de tipagem.
+
+Variáveis de Ambiente (opcionais):
+    - AWS_MAX_POOL_CONNECTIONS: número máximo de conexões mantidas por cliente (padrão: 32).
+    - AWS_CONNECT_TIMEOUT: tempo limite de conexão, em segundos (padrão: 5).
+    - AWS_READ_TIMEOUT: tempo limite de leitura, em segundos (padrão: 60).
+    - AWS_MAX_ATTEMPTS: número total de tentativas por chamada feitas pelo botocore (padrão: 1, pois os
+      retries são feitos pelo AwsTranslateService, com controle adaptativo de taxa).
+    - AWS_RETRY_MODE: modo de retry do botocore, 'legacy', 'standard' ou 'adaptive' (padrão: 'standard').
+    - AWS_TRANSLATE_ENDPOINT_URL: URL do serviço AWS Translate (por exemplo, um serviço local compatível,
+      utilizado em testes). Por padrão, o endpoint oficial da região.
+
+Exemplo de Uso:
+    >>> from services.api.aws_client_factory import AwsClientFactory
+    >>> client = AwsClientFactory.get_translate_client()
+    >>> client is AwsClientFactory.get_translate_client()
+    True
+"""
+
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+import boto3
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
+from dotenv import load_dotenv
+
+from services.api.rate_limiter import AdaptiveRateLimiter
+
+# Valores padrão da configuração dos clientes
+DEFAULT_MAX_POOL_CONNECTIONS = 32
+DEFAULT_CONNECT_TIMEOUT = 5
+DEFAULT_READ_TIMEOUT = 60
+DEFAULT_MAX_ATTEMPTS = 1
+DEFAULT_RETRY_MODE = 'standard'
+
+
+class AwsClientFactory:
+    """
+    Fábrica de clientes AWS compartilhados pelo processo.
+
+    Métodos:
+        load_credentials() ⇾ Tuple[str, str, str]:
+            Carrega as credenciais AWS do arquivo .env (apenas uma vez por processo).
+
+        build_config(**overrides) ⇾ Config:
+            Cria a configuração do botocore a partir das variáveis de ambiente.
+
+        get_translate_client(access_key, secret_key, region, config) ⇾ BaseClient:
+            Retorna o cliente AWS Translate compartilhado para a região e as credenciais informadas.
+
+        get_rate_limiter(region, access_key) ⇾ AdaptiveRateLimiter:
+            Retorna o limitador de taxa compartilhado para a região e a conta informadas.
+
+        clear() ⇾ None:
+            Descarta os clientes e limitadores armazenados.
+    """
+
+    _clients: Dict[Tuple[str, str, str, Optional[str]], object] = {}
+    _rate_limiters: Dict[Tuple[str, str], AdaptiveRateLimiter] = {}
+    _lock = threading.Lock()
+    _environment_loaded = False
+
+    @classmethod
+    def load_credentials(cls) -> Tuple[str, str, str]:
+        """
+        Carrega as credenciais AWS do arquivo .env.
+
+        O arquivo .env é lido apenas na primeira chamada; as chamadas seguintes reutilizam
+        as variáveis de ambiente já carregadas.
+
+        Retorna:
+            Tuple[str, str, str]: Tupla (ACCESS_KEY_ID, SECRET_ACCESS_KEY, REGION).
+
+        Exceções:
+            - ValueError: se alguma das credenciais da AWS estiver faltando no arquivo .env.
+        """
+        with cls._lock:
+            if not cls._environment_loaded:
+                load_dotenv()
+                cls._environment_loaded = True
+
+        access_key = os.getenv('AWS_ACCESS_KEY_ID', '')
+        secret_key = os.getenv('AWS_SECRET_ACCESS_KEY', '')
+        region = os.getenv('AWS_REGION', '')
+
+        # Verifica se todas as credenciais estão presentes
+        if not all([access_key, secret_key, region]):
+            raise ValueError("Credenciais AWS faltando. Por favor, verifique o arquivo .env.")
+        return access_key, secret_key, region
+
+    @staticmethod
+    def build_config(**overrides) -> Config:
+        """
+        Cria a configuração do botocore a partir das variáveis de ambiente.
+
+        Parâmetros:
+            **overrides: opções do `botocore.config.Config` que substituem os valores padrão.
+
+        Retorna:
+            Config: Configuração com pool de conexões, keep-alive TCP, tempos limite e política de retry.
+        """
+        options = {
+            'max_pool_connections': int(os.getenv('AWS_MAX_POOL_CONNECTIONS', DEFAULT_MAX_POOL_CONNECTIONS)),
+            'connect_timeout': float(os.getenv('AWS_CONNECT_TIMEOUT', DEFAULT_CONNECT_TIMEOUT)),
+            'read_timeout': float(os.getenv('AWS_READ_TIMEOUT', DEFAULT_READ_TIMEOUT)),
+            'tcp_keepalive': True,
+            'retries': {
+                'total_max_attempts': int(os.getenv('AWS_MAX_ATTEMPTS', DEFAULT_MAX_ATTEMPTS)),
+                'mode': os.getenv('AWS_RETRY_MODE', DEFAULT_RETRY_MODE)
+            }
+        }
+        options.update(overrides)
+        return Config(**options)
+
+    @classmethod
+    def get_translate_client(cls, access_key: Optional[str] = None, secret_key: Optional[str] = None,
+                             region: Optional[str] = None, config: Optional[Config] = None):
+        """
+        Retorna o cliente AWS Translate compartilhado para a região e as credenciais informadas.
+
+        Se as credenciais não forem informadas, são carregadas do arquivo .env. O cliente é criado
+        na primeira chamada para cada combinação (região, credenciais, endpoint e opções da configuração)
+        e reutilizado nas seguintes; uma configuração diferente (por exemplo, com outros tempos limite)
+        recebe o seu próprio cliente.
+
+        Parâmetros:
+            access_key (str, optional): AWS_ACCESS_KEY_ID.
+            secret_key (str, optional): AWS_SECRET_ACCESS_KEY.
+            region (str, optional): Região AWS.
+            config (Config, optional): Configuração do botocore utilizada na criação do cliente.
+                Por padrão, a configuração de `build_config`.
+
+        Retorna:
+            BaseClient: O cliente AWS Translate, seguro para uso entre threads.
+
+        Exceções:
+            - ValueError: se alguma das credenciais da AWS estiver faltando.
+            - ConnectionError: se houver falha ao inicializar o cliente AWS Translate.
+        """
+        if not all([access_key, secret_key, region]):
+            access_key, secret_key, region = cls.load_credentials()
+
+        endpoint_url = os.getenv('AWS_TRANSLATE_ENDPOINT_URL') or None
+        config = config or cls.build_config()
+        key = (region, access_key, secret_key, endpoint_url, cls._config_key(config))
+        with cls._lock:
+            client = cls._clients.get(key)
+            if client is None:
+                try:
+                    # Sessões do boto3 não são seguras entre threads; a criação ocorre sob o lock
+                    session = boto3.Session(
+                        aws_access_key_id=access_key,
+                        aws_secret_access_key=secret_key,
+                        region_name=region
+                    )
+                    client = session.client('translate', config=config, endpoint_url=endpoint_url)
+                except (BotoCoreError, ClientError) as e:
+                    raise ConnectionError(f"Falha ao inicializar o cliente AWS Translate: {str(e)}") from e
+                cls._clients[key] = client
+            return client
+
+    @staticmethod
+    def _config_key(config: Config) -> tuple:
+        """
+        Retorna uma chave que identifica as opções de uma configuração do botocore.
+
+        Parâmetros:
+            config (Config): A configuração.
+
+        Retorna:
+            tuple: O valor de cada opção do `botocore.config.Config`, na ordem de `Config.OPTION_DEFAULTS`.
+        """
+        return tuple((name, repr(getattr(config, name, None))) for name in Config.OPTION_DEFAULTS)
+
+    @classmethod
+    def get_rate_limiter(cls, region: str, access_key: str) -> AdaptiveRateLimiter:
+        """
+        Retorna o limitador de taxa compartilhado para a região e a conta informadas.
+
+        As cotas do AWS Translate são definidas por conta e por região; por isso, todos os
+        serviços que utilizam as mesmas credenciais na mesma região compartilham o limitador.
+
+        Parâmetros:
+            region (str): Região AWS.
+            access_key (str): AWS_ACCESS_KEY_ID da conta.
+
+        Retorna:
+            AdaptiveRateLimiter: O limitador de taxa compartilhado.
+        """
+        key = (region, access_key)
+        with cls._lock:
+            rate_limiter = cls._rate_limiters.get(key)
+            if rate_limiter is None:
+                rate_limiter = AdaptiveRateLimiter()
+                cls._rate_limiters[key] = rate_limiter
+            return rate_limiter
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Descarta os clientes e limitadores armazenados, forçando a criação de novos nas próximas chamadas.
+        """
+        with cls._lock:
+            cls._clients.clear()
+            cls._rate_limiters.clear()
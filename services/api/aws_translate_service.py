@@ -6,15 +6,29 @@ AWS Translate Service Module
 
 Este módulo fornece serviços para traduzir textos utilizando a API AWS Translate.
 Ele gerencia a autenticação com a AWS, inicializa o cliente de tradução e executa
-a tradução de textos para o idioma de destino especificado.
+a tradução de textos para o idioma de destino especificado. Textos maiores que o
+limite por requisição do AWS Translate são divididos em blocos, traduzidos em
+paralelo e remontados na ordem original. As traduções são armazenadas em um cache
+persistente, de modo que textos repetidos não geram novas chamadas à API. Lotes
+de textos curtos (como os rótulos da interface) são agrupados em poucos documentos
+HTML traduzidos com TranslateDocument. Todas as chamadas passam por um limitador de
+taxa adaptativo e são repetidas, com backoff exponencial e jitter, em caso de erros
+transitórios ou de throttling, respeitando um prazo máximo por chamada. Os caracteres
+enviados são reservados no gerenciador de cotas compartilhado, que mantém o consumo abaixo
+do limite de caracteres por segundo configurado, na fila de prioridade do serviço.
 
 Classes:
     AwsTranslateService: Classe responsável pela tradução de textos usando AWS Translate.
 
 Dependências:
     - boto3: biblioteca da AWS para interagir com os serviços da AWS.
-    - dotenv: biblioteca para carregar variáveis de ambiente a partir de um arquivo .env.
-    - os: biblioteca padrão para interagir com o sistema operacional.
+    - services.api.aws_client_factory: Para obter o cliente AWS Translate compartilhado pelo processo.
+    - services.api.rate_limiter: Para o controle adaptativo da taxa de requisições.
+    - services.api.quota_manager: Para respeitar o limite de caracteres por segundo.
+    - random, time: bibliotecas padrão para o backoff com jitter entre tentativas.
+    - concurrent.futures: biblioteca padrão para execução concorrente dos blocos.
+    - services.cache.translation_cache: Para o cache persistente de traduções.
+    - html: biblioteca padrão para o enquadramento e a leitura dos lotes em HTML.
     - typing: para anotações de tipagem.
 
 Exemplo de Uso:
@@ -24,14 +38,95 @@ Exemplo de Uso:
     >>> texto_traduzido, idioma_origem = translator.translate_text(texto, 'pt')
     >>> print(texto_traduzido)
     "Olá, como você está?"
+    >>> print(translator.translate_many(["Hello", "Goodbye", "Hello"], 'pt'))
+    ['Olá', 'Adeus', 'Olá']
 """
 
-import boto3
-import os
-from dotenv import load_dotenv
-from typing import Tuple
-import boto3.exceptions
-from botocore.exceptions import BotoCoreError, ClientError
+import html
+import random
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from typing import Callable, Dict, List, Optional, Tuple
+from botocore.exceptions import (
+    BotoCoreError, ClientError, ConnectionClosedError, ConnectTimeoutError, EndpointConnectionError,
+    ReadTimeoutError
+)
+
+from services.api.aws_client_factory import AwsClientFactory
+from services.api.quota_manager import (
+    DIMENSION_CHARACTERS, LANE_INTERACTIVE, LANES, PROVIDER_AWS_TRANSLATE, QuotaManager
+)
+from services.api.rate_limiter import AdaptiveRateLimiter
+from services.cache.translation_cache import TranslationCache
+from services.language.text_segmentation_service import TextSegmentationService
+
+# Limite de tamanho (em bytes UTF-8) de uma requisição TranslateText do AWS Translate
+MAX_REQUEST_BYTES = 10000
+# Tamanho padrão dos blocos, com margem de segurança em relação ao limite
+DEFAULT_MAX_CHUNK_BYTES = 9000
+# Número padrão de requisições simultâneas no modo em blocos
+DEFAULT_MAX_WORKERS = 8
+# Limite de tamanho (em bytes) de um documento enviado ao TranslateDocument
+MAX_DOCUMENT_BYTES = 100 * 1024
+# Tamanho padrão dos lotes de textos curtos, com margem para as marcações adicionadas na tradução
+DEFAULT_MAX_BATCH_BYTES = 50000
+# Política padrão de retry: número total de tentativas e prazo máximo (em segundos) por chamada
+DEFAULT_MAX_ATTEMPTS = 6
+DEFAULT_CALL_TIMEOUT = 120.0
+# Intervalos base e máximo (em segundos) do backoff exponencial entre tentativas
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 20.0
+
+# Códigos de erro que indicam throttling: a taxa é reduzida e a chamada é repetida
+THROTTLING_ERROR_CODES = {
+    'ThrottlingException', 'TooManyRequestsException', 'LimitExceededException',
+    'ProvisionedThroughputExceededException', 'RequestLimitExceeded', 'SlowDown'
+}
+# Códigos de erro transitórios: a chamada é repetida sem alterar a taxa
+TRANSIENT_ERROR_CODES = {
+    'ServiceUnavailableException', 'InternalServerException', 'InternalFailure', 'ServiceUnavailable',
+    'RequestTimeout', 'RequestTimeoutException'
+}
+# Erros de rede do botocore que justificam uma nova tentativa
+TRANSIENT_BOTOCORE_ERRORS = (
+    EndpointConnectionError, ConnectionClosedError, ConnectTimeoutError, ReadTimeoutError
+)
+
+
+class _FramedDocumentParser(HTMLParser):
+    """
+    Extrai o texto de cada segmento `<p id="sN">` de um lote traduzido pelo TranslateDocument.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.segments = {}
+        self._current_id = None
+        self._depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if self._current_id is not None:
+            self._depth += 1
+            return
+        segment_id = dict(attrs).get('id') or ''
+        if tag == 'p' and segment_id.startswith('s') and segment_id[1:].isdigit():
+            self._current_id = int(segment_id[1:])
+            self._depth = 0
+            self.segments[self._current_id] = ''
+
+    def handle_endtag(self, tag):
+        if self._current_id is None:
+            return
+        if self._depth == 0:
+            self._current_id = None
+        else:
+            self._depth -= 1
+
+    def handle_data(self, data):
+        if self._current_id is not None:
+            self.segments[self._current_id] += data
 
 
 class AwsTranslateService:
@@ -44,77 +139,123 @@ class AwsTranslateService:
     Métodos:
         translate_text(text: str, target_language_code: str) ⇾ Tuple[str, str]:
             Traduz o texto fornecido para o idioma de destino especificado e retorna o texto traduzido com o código do idioma de origem detectado.
+
+        translate_many(texts: List[str], target_language_code: str) ⇾ List[str]:
+            Traduz uma lista de textos curtos agrupando-os no menor número possível de requisições.
+
+        reconcile_source_language(chunks: List[str], language_codes: List[str]) ⇾ str:
+            Determina o idioma de origem predominante entre blocos traduzidos separadamente.
     """
 
-    def __init__(self):
+    def __init__(self, max_chunk_bytes: int = DEFAULT_MAX_CHUNK_BYTES, max_workers: int = DEFAULT_MAX_WORKERS,
+                 cache: Optional[TranslationCache] = None, use_cache: bool = True,
+                 max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES, translate_client=None,
+                 rate_limiter: Optional[AdaptiveRateLimiter] = None, max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+                 call_timeout: float = DEFAULT_CALL_TIMEOUT, quota_manager: Optional[QuotaManager] = None,
+                 lane: str = LANE_INTERACTIVE):
         """
         Inicializa a instância do AwsTranslateService.
 
         Este metodo realiza os seguintes passos:
             1. Carrega as credenciais da AWS a partir do arquivo .env.
-            2. Inicializa o cliente AWS Translate usando as credenciais carregadas.
+            2. Obtém o cliente AWS Translate compartilhado para as credenciais carregadas.
+
+        Se um cliente for injetado por `translate_client`, os dois passos são ignorados.
+
+        Parâmetros:
+            max_chunk_bytes (int): Tamanho máximo, em bytes UTF-8, de cada bloco enviado ao AWS Translate.
+            max_workers (int): Número máximo de blocos traduzidos simultaneamente.
+            cache (TranslationCache, optional): Cache de traduções a ser utilizado. Por padrão, o cache
+                persistente da aplicação.
+            use_cache (bool): Indica se as traduções devem ser consultadas e armazenadas no cache.
+            max_batch_bytes (int): Tamanho máximo, em bytes, de cada lote enviado por `translate_many`.
+            translate_client (BaseClient, optional): Cliente AWS Translate a ser utilizado. Por padrão,
+                o cliente compartilhado fornecido pelo AwsClientFactory.
+            rate_limiter (AdaptiveRateLimiter, optional): Limitador de taxa das chamadas. Por padrão, o
+                limitador compartilhado pela conta e região, fornecido pelo AwsClientFactory.
+            max_attempts (int): Número total de tentativas por chamada, incluindo a primeira.
+            call_timeout (float): Prazo máximo, em segundos, de cada chamada, incluindo esperas e novas tentativas.
+            quota_manager (QuotaManager, optional): Gerenciador da cota de caracteres. Por padrão, o
+                gerenciador compartilhado pelo processo.
+            lane (str): Fila de prioridade das chamadas no gerenciador de cotas: 'interactive' (padrão) ou 'batch'.
 
         Exceções:
-            - ValueError: Se alguma das credenciais da AWS estiver faltando no arquivo .env.
+            - ValueError: Se alguma das credenciais da AWS estiver faltando no arquivo .env,
+              se `max_chunk_bytes` ou `max_batch_bytes` estiverem fora do intervalo aceito pelo AWS Translate,
+              ou se a fila de prioridade for inválida.
             - ConnectionError: Se houver falha ao inicializar o cliente AWS Translate.
         """
-        self.translate_client = None
+        if not 0 < max_chunk_bytes <= MAX_REQUEST_BYTES:
+            raise ValueError(f"O tamanho dos blocos deve estar entre 1 e {MAX_REQUEST_BYTES} bytes.")
+        if not 0 < max_batch_bytes <= MAX_DOCUMENT_BYTES:
+            raise ValueError(f"O tamanho dos lotes deve estar entre 1 e {MAX_DOCUMENT_BYTES} bytes.")
+        if lane not in LANES:
+            raise ValueError(f"Fila de prioridade inválida: {lane}")
+
+        self.translate_client = translate_client
         self.ACCESS_KEY = None
         self.SECRET_KEY = None
         self.REGION = None
+        self.max_chunk_bytes = max_chunk_bytes
+        self.max_workers = max(1, max_workers)
+        self.max_batch_bytes = max_batch_bytes
+        self.rate_limiter = rate_limiter
+        self.max_attempts = max(1, max_attempts)
+        self.call_timeout = call_timeout
+        self.quota_manager = quota_manager or QuotaManager.get_shared()
+        self.lane = lane
+        self.cache = (cache or TranslationCache()) if use_cache else None
+
+        if self.translate_client is None:
+            # Carrega as credenciais AWS
+            self.load_credentials()
 
-        # Carrega as credenciais AWS
-        self.load_credentials()
+            # Obtém o cliente AWS Translate compartilhado
+            self.init_translate_client()
 
-        # Inicializa o cliente AWS Translate
-        self.init_translate_client()
+        if self.rate_limiter is None:
+            self.rate_limiter = (
+                AwsClientFactory.get_rate_limiter(self.REGION, self.ACCESS_KEY) if self.REGION
+                else AdaptiveRateLimiter()
+            )
 
     def load_credentials(self) -> None:
         """
         Carrega as credenciais AWS do arquivo .env.
 
         Este metodo realiza os seguintes passos:
-            1. Carrega as variáveis de ambiente a partir do arquivo .env.
+            1. Carrega as variáveis de ambiente a partir do arquivo .env (apenas uma vez por processo).
             2. Obtém as credenciais AWS (ACCESS_KEY_ID, SECRET_ACCESS_KEY, REGION) das variáveis de ambiente.
             3. Verifica se todas as credenciais estão presentes; caso contrário, lança uma exceção.
 
         Exceções:
             - ValueError: se alguma das credenciais da AWS estiver faltando no arquivo .env.
         """
-        load_dotenv()
-        self.ACCESS_KEY = os.getenv('AWS_ACCESS_KEY_ID', '')
-        self.SECRET_KEY = os.getenv('AWS_SECRET_ACCESS_KEY', '')
-        self.REGION = os.getenv('AWS_REGION', '')
-
-        # Verifica se todas as credenciais estão presentes
-        if not all([self.ACCESS_KEY, self.SECRET_KEY, self.REGION]):
-            raise ValueError("Credenciais AWS faltando. Por favor, verifique o arquivo .env.")
+        self.ACCESS_KEY, self.SECRET_KEY, self.REGION = AwsClientFactory.load_credentials()
 
     def init_translate_client(self):
         """
         Inicializa o cliente AWS Translate.
 
-        Este metodo utiliza as credenciais carregadas para criar um cliente AWS Translate
-        que será utilizado para realizar as traduções de textos.
+        Este metodo obtém, a partir das credenciais carregadas, o cliente AWS Translate compartilhado
+        pelo processo, que mantém um pool de conexões reutilizado por todos os serviços.
 
         Exceções:
             - ConnectionError: se houver falha ao inicializar o cliente AWS Translate devido a credenciais inválidas
               ou problemas de rede.
         """
-        try:
-            session = boto3.Session(
-                aws_access_key_id=self.ACCESS_KEY,
-                aws_secret_access_key=self.SECRET_KEY,
-                region_name=self.REGION
-            )
-            self.translate_client = session.client('translate')
-        except (BotoCoreError, ClientError) as e:
-            raise ConnectionError(f"Falha ao inicializar o cliente AWS Translate: {str(e)}") from e
+        self.translate_client = AwsClientFactory.get_translate_client(
+            self.ACCESS_KEY, self.SECRET_KEY, self.REGION
+        )
 
     def translate_text(self, text: str, target_language_code: str) -> Tuple[str, str]:
         """
         Traduz o texto fornecido para o idioma de destino especificado e retorna o código do idioma de origem detectado.
 
+        Textos que cabem em uma única requisição são enviados diretamente. Textos maiores são
+        divididos em blocos nos limites de parágrafos e frases, respeitando `max_chunk_bytes`;
+        os blocos são traduzidos em paralelo e remontados na ordem original.
+
         Parâmetros:
             text (str): O texto a ser traduzido.
             target_language_code (str): Código do idioma de destino.
@@ -125,12 +266,320 @@ class AwsTranslateService:
         Exceções:
             - Exception: Se ocorrer um erro durante a tradução.
         """
+        if TextSegmentationService.utf8_length(text) <= self.max_chunk_bytes:
+            return self._translate_request(text, target_language_code)
+        return self._translate_chunked(text, target_language_code)
+
+    def _translate_request(self, text: str, target_language_code: str) -> Tuple[str, str]:
+        """
+        Envia uma única requisição TranslateText ao AWS Translate.
+
+        A tradução é consultada no cache antes da requisição e armazenada nele após uma
+        resposta bem-sucedida.
+
+        Parâmetros:
+            text (str): O texto a ser traduzido (dentro do limite de tamanho por requisição).
+            target_language_code (str): Código do idioma de destino.
+
+        Retorna:
+            Tuple[str, str]: Uma tupla contendo o texto traduzido e o código do idioma de origem detectado.
+
+        Exceções:
+            - Exception: Se ocorrer um erro durante a tradução.
+        """
+        if self.cache is not None:
+            cached = self.cache.get_translation(text, 'auto', target_language_code)
+            if cached is not None:
+                return cached
+
         try:
-            response = self.translate_client.translate_text(
+            response = self._call_api(
+                self.translate_client.translate_text,
                 Text=text,
                 SourceLanguageCode='auto',  # Detecta automaticamente o idioma do texto de origem
                 TargetLanguageCode=target_language_code
             )
-            return response['TranslatedText'], response['SourceLanguageCode']
-        except (BotoCoreError, ClientError) as e:
+        except (BotoCoreError, ClientError, TimeoutError) as e:
             raise Exception(f"Erro na tradução: {str(e)}") from e
+
+        translated_text, source_language_code = response['TranslatedText'], response['SourceLanguageCode']
+        if self.cache is not None:
+            self.cache.set_translation(text, 'auto', target_language_code, translated_text, source_language_code)
+        return translated_text, source_language_code
+
+    def _call_api(self, operation: Callable, **kwargs) -> dict:
+        """
+        Executa uma operação do cliente AWS Translate com controle de taxa e retries.
+
+        Este metodo realiza os seguintes passos:
+            1. Aguarda um token do limitador de taxa e a cota dos caracteres enviados, sem ultrapassar o prazo
+               da chamada.
+            2. Executa a operação; em caso de sucesso, sinaliza o limitador para aumentar a taxa.
+            3. Em caso de throttling, sinaliza o limitador para reduzir a taxa e tenta novamente.
+            4. Em caso de erro transitório (indisponibilidade, erro interno, falha de rede), tenta novamente.
+            5. Demais erros (requisição inválida, idioma não suportado, credenciais) são propagados imediatamente.
+
+        Entre as tentativas é aplicado um backoff exponencial com jitter completo, limitado ao
+        prazo restante da chamada.
+
+        Parâmetros:
+            operation (Callable): Metodo do cliente boto3 a ser executado.
+            **kwargs: Parâmetros da operação.
+
+        Retorna:
+            dict: A resposta da operação.
+
+        Exceções:
+            - ClientError, BotoCoreError: se o erro não for recuperável ou as tentativas se esgotarem.
+            - TimeoutError: se o prazo da chamada se esgotar antes de uma resposta bem-sucedida.
+        """
+        if 'Text' in kwargs:
+            characters = len(kwargs['Text'])
+        else:
+            characters = len(kwargs.get('Document', {}).get('Content', b''))
+        costs = {DIMENSION_CHARACTERS: characters}
+
+        deadline = time.monotonic() + self.call_timeout
+        attempt = 0
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self.rate_limiter.acquire(timeout=remaining):
+                raise TimeoutError(f"Prazo de {self.call_timeout:.0f}s excedido aguardando o AWS Translate.")
+            remaining = deadline - time.monotonic()
+            if not self.quota_manager.acquire(PROVIDER_AWS_TRANSLATE, costs, timeout=remaining, lane=self.lane):
+                raise TimeoutError(f"Prazo de {self.call_timeout:.0f}s excedido aguardando a cota do AWS Translate.")
+
+            try:
+                response = operation(**kwargs)
+                self.rate_limiter.on_success()
+                return response
+            except ClientError as e:
+                error_code = e.response.get('Error', {}).get('Code', '')
+                if error_code in THROTTLING_ERROR_CODES:
+                    self.rate_limiter.on_throttle()
+                    self.quota_manager.on_throttle(PROVIDER_AWS_TRANSLATE)
+                elif error_code not in TRANSIENT_ERROR_CODES:
+                    raise
+                last_error = e
+            except TRANSIENT_BOTOCORE_ERRORS as e:
+                last_error = e
+
+            attempt += 1
+            if attempt >= self.max_attempts:
+                raise last_error
+
+            # Backoff exponencial com jitter completo, sem ultrapassar o prazo da chamada
+            delay = random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+            if delay >= deadline - time.monotonic():
+                raise TimeoutError(
+                    f"Prazo de {self.call_timeout:.0f}s excedido após {attempt} tentativa(s): {str(last_error)}"
+                ) from last_error
+            time.sleep(delay)
+
+    def _translate_chunked(self, text: str, target_language_code: str) -> Tuple[str, str]:
+        """
+        Traduz um texto longo dividindo-o em blocos traduzidos em paralelo.
+
+        Este metodo realiza os seguintes passos:
+            1. Divide o texto em blocos de até `max_chunk_bytes` bytes, nos limites de parágrafos e frases.
+            2. Traduz os blocos simultaneamente em um pool de threads limitado a `max_workers`.
+            3. Remonta as traduções na ordem original, preservando os separadores entre blocos.
+            4. Reconcilia o idioma de origem detectado em cada bloco.
+
+        Parâmetros:
+            text (str): O texto a ser traduzido.
+            target_language_code (str): Código do idioma de destino.
+
+        Retorna:
+            Tuple[str, str]: Uma tupla contendo o texto traduzido e o código do idioma de origem predominante.
+
+        Exceções:
+            - Exception: Se ocorrer um erro durante a tradução de algum dos blocos.
+        """
+        chunks = TextSegmentationService.split_text(
+            text, self.max_chunk_bytes, TextSegmentationService.utf8_length
+        )
+        workers = min(self.max_workers, len(chunks))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # `map` preserva a ordem dos blocos, independentemente da ordem de conclusão
+            results = list(executor.map(
+                lambda chunk: self._translate_request(chunk[0], target_language_code), chunks
+            ))
+
+        translated_chunks = [
+            (translated_text, separator)
+            for (translated_text, _), (_, separator) in zip(results, chunks)
+        ]
+        source_language_code = self.reconcile_source_language(
+            [chunk for chunk, _ in chunks], [language for _, language in results]
+        )
+        return TextSegmentationService.join_chunks(translated_chunks), source_language_code
+
+    @staticmethod
+    def reconcile_source_language(chunks: List[str], language_codes: List[str]) -> str:
+        """
+        Determina o idioma de origem predominante entre os blocos traduzidos.
+
+        Cada bloco vota no idioma detectado com peso proporcional ao seu tamanho em bytes, de modo
+        que trechos curtos (referências, fórmulas, citações) não definam o idioma do documento.
+
+        Parâmetros:
+            chunks (List[str]): Os blocos do texto original.
+            language_codes (List[str]): O idioma detectado para cada bloco.
+
+        Retorna:
+            str: O código do idioma de origem predominante.
+        """
+        votes = Counter()
+        for chunk, language_code in zip(chunks, language_codes):
+            votes[language_code] += TextSegmentationService.utf8_length(chunk)
+        return votes.most_common(1)[0][0]
+
+    def translate_many(self, texts: List[str], target_language_code: str) -> List[str]:
+        """
+        Traduz uma lista de textos curtos agrupando-os no menor número possível de requisições.
+
+        Este metodo realiza os seguintes passos:
+            1. Remove textos duplicados e consulta o cache para cada texto distinto.
+            2. Agrupa os textos restantes em lotes de até `max_batch_bytes` bytes, cada texto
+               enquadrado em um parágrafo HTML identificado (`<p id="sN">`).
+            3. Traduz os lotes em paralelo com TranslateDocument, que preserva as marcações.
+            4. Separa as traduções pelos identificadores e armazena cada uma no cache.
+
+        Textos com quebras de linha ou tabulações, que não sobrevivem ao enquadramento em HTML,
+        e segmentos que não puderem ser recuperados de um lote são traduzidos individualmente, por
+        `translate_text`, que divide em blocos os que excederem o limite de uma requisição TranslateText.
+
+        Parâmetros:
+            texts (List[str]): Os textos a serem traduzidos.
+            target_language_code (str): Código do idioma de destino.
+
+        Retorna:
+            List[str]: As traduções, na mesma ordem (e com as mesmas repetições) da entrada.
+
+        Exceções:
+            - Exception: Se ocorrer um erro durante a tradução.
+        """
+        translations = {}
+        pending = []
+        for text in dict.fromkeys(texts):
+            if not text.strip():
+                translations[text] = text
+                continue
+            cached = self.cache.get_translation(text, 'auto', target_language_code) if self.cache else None
+            if cached is not None:
+                translations[text] = cached[0]
+            else:
+                pending.append(text)
+
+        framable = [
+            text for text in pending
+            if '\n' not in text and '\t' not in text
+            and self._framed_length(text) <= self.max_batch_bytes
+        ]
+        framable_set = set(framable)
+        individual = [text for text in pending if text not in framable_set]
+
+        batches = self._pack_batches(framable)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            batch_futures = [
+                executor.submit(self._translate_batch, batch, target_language_code) for batch in batches
+            ]
+            individual_futures = {
+                text: executor.submit(self.translate_text, text, target_language_code) for text in individual
+            }
+            for batch, future in zip(batches, batch_futures):
+                batch_translations, missing = future.result()
+                translations.update(batch_translations)
+                individual_futures.update({
+                    text: executor.submit(self.translate_text, text, target_language_code) for text in missing
+                })
+            for text, future in individual_futures.items():
+                translations[text] = future.result()[0]
+
+        return [translations[text] for text in texts]
+
+    @staticmethod
+    def _framed_length(text: str) -> int:
+        """
+        Retorna o tamanho, em bytes, do texto enquadrado como parágrafo HTML de um lote.
+
+        Parâmetros:
+            text (str): O texto a ser enquadrado.
+
+        Retorna:
+            int: Tamanho estimado do parágrafo em bytes UTF-8.
+        """
+        # Reserva espaço para o identificador do parágrafo (`<p id="sNNNNN">...</p>`)
+        return TextSegmentationService.utf8_length(html.escape(text)) + 24
+
+    def _pack_batches(self, texts: List[str]) -> List[List[str]]:
+        """
+        Agrupa os textos em lotes cujo documento HTML não ultrapassa `max_batch_bytes`.
+
+        Parâmetros:
+            texts (List[str]): Os textos a serem agrupados.
+
+        Retorna:
+            List[List[str]]: Os lotes, preservando a ordem dos textos.
+        """
+        batches = []
+        current = []
+        current_size = 0
+        for text in texts:
+            size = self._framed_length(text)
+            if current and current_size + size > self.max_batch_bytes:
+                batches.append(current)
+                current, current_size = [], 0
+            current.append(text)
+            current_size += size
+        if current:
+            batches.append(current)
+        return batches
+
+    def _translate_batch(self, texts: List[str], target_language_code: str) -> Tuple[Dict[str, str], List[str]]:
+        """
+        Traduz um lote de textos curtos em uma única requisição TranslateDocument.
+
+        Parâmetros:
+            texts (List[str]): Os textos do lote.
+            target_language_code (str): Código do idioma de destino.
+
+        Retorna:
+            Tuple[Dict[str, str], List[str]]: As traduções recuperadas, indexadas pelo texto original,
+            e a lista de textos cujo segmento não pôde ser recuperado da resposta.
+
+        Exceções:
+            - Exception: Se ocorrer um erro durante a tradução.
+        """
+        body = ''.join(f'<p id="s{i}">{html.escape(text)}</p>' for i, text in enumerate(texts))
+        document = f'<!DOCTYPE html><html><head><meta charset="utf-8"></head><body>{body}</body></html>'
+
+        try:
+            response = self._call_api(
+                self.translate_client.translate_document,
+                Document={'Content': document.encode('utf-8'), 'ContentType': 'text/html'},
+                SourceLanguageCode='auto',
+                TargetLanguageCode=target_language_code
+            )
+        except (BotoCoreError, ClientError, TimeoutError) as e:
+            raise Exception(f"Erro na tradução: {str(e)}") from e
+
+        parser = _FramedDocumentParser()
+        parser.feed(response['TranslatedDocument']['Content'].decode('utf-8'))
+        parser.close()
+
+        translations = {}
+        missing = []
+        for i, text in enumerate(texts):
+            # Os textos enquadrados não têm quebras de linha; o espaçamento do HTML é normalizado
+            translated_text = ' '.join(parser.segments.get(i, '').split())
+            if not translated_text:
+                missing.append(text)
+                continue
+            translations[text] = translated_text
+            if self.cache is not None:
+                self.cache.set_translation(
+                    text, 'auto', target_language_code, translated_text, response['SourceLanguageCode']
+                )
+        return translations, missing
@@ -0,0 +1,202 @@
+# services/api/circuit_breaker.py
+
+"""
+Circuit Breaker Module
+======================
+
+Este módulo fornece um disjuntor (circuit breaker) para chamadas a APIs externas. Após uma
+sequência de falhas consecutivas do servidor, o disjuntor se abre e as chamadas seguintes
+falham imediatamente, sem consumir conexões nem tempo de espera, até que o intervalo de
+recuperação termine. Nesse momento, uma única chamada de teste é permitida (estado
+semiaberto): se ela for bem-sucedida, o disjuntor se fecha; caso contrário, volta a se abrir.
+Respostas de erro do cliente (por exemplo, requisição inválida ou limite de taxa) não indicam nem a
+recuperação nem a indisponibilidade do servidor: são registradas como neutras, sem alterar o estado.
+
+Classes:
+    CircuitOpenError: Exceção lançada quando uma chamada é bloqueada pelo disjuntor.
+    CircuitBreaker: Classe responsável pelo controle do estado do disjuntor.
+
+Dependências:
+    - threading: biblioteca padrão para sincronização entre threads.
+    - time: biblioteca padrão para manipulação de tempo.
+    - typing: biblioteca padrão para anotações de tipos.
+
+Exemplo de Uso:
+    >>> from services.api.circuit_breaker import CircuitBreaker
+    >>> breaker = CircuitBreaker.get_shared('openai')
+    >>> breaker.before_call()  # Lança CircuitOpenError se o disjuntor estiver aberto
+    >>> try:
+    ...     resposta = chamar_api()
+    ...     breaker.record_success()
+    ... except ServerError:
+    ...     breaker.record_failure()
+    ... except ClientError:
+    ...     breaker.record_neutral()
+"""
+
+import threading
+import time
+from typing import Dict
+
+# Estados do disjuntor
+STATE_CLOSED = 'closed'
+STATE_OPEN = 'open'
+STATE_HALF_OPEN = 'half_open'
+
+# Configuração padrão do disjuntor
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT = 30.0
+
+
+class CircuitOpenError(Exception):
+    """
+    Exceção lançada quando uma chamada é bloqueada porque o disjuntor está aberto.
+
+    Atributos:
+        retry_after (float): Tempo, em segundos, até que uma nova chamada seja permitida.
+    """
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(
+            f"Serviço '{name}' indisponível no momento. Nova tentativa permitida em {retry_after:.0f} s."
+        )
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Disjuntor com os estados fechado, aberto e semiaberto.
+
+    Métodos:
+        before_call() ⇾ None:
+            Verifica se uma chamada é permitida; caso contrário, lança CircuitOpenError.
+
+        record_success() ⇾ None:
+            Registra uma chamada bem-sucedida, fechando o disjuntor.
+
+        record_failure() ⇾ None:
+            Registra uma falha do servidor, abrindo o disjuntor ao atingir o limite.
+
+        record_neutral() ⇾ None:
+            Registra uma chamada cujo resultado não indica o estado do servidor, sem alterar o estado.
+
+        is_open() ⇾ bool:
+            Indica se o disjuntor está bloqueando as chamadas.
+
+        get_shared(name: str) ⇾ CircuitBreaker:
+            Retorna o disjuntor compartilhado pelo processo para o nome informado.
+    """
+
+    _shared: Dict[str, 'CircuitBreaker'] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, name: str = 'api', failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+                 reset_timeout: float = DEFAULT_RESET_TIMEOUT):
+        """
+        Inicializa a instância do CircuitBreaker.
+
+        Parâmetros:
+            name (str): Nome do serviço protegido, utilizado nas mensagens de erro.
+            failure_threshold (int): Número de falhas consecutivas que abre o disjuntor.
+            reset_timeout (float): Tempo, em segundos, que o disjuntor permanece aberto antes da chamada de teste.
+
+        Exceções:
+            - ValueError: se o limite de falhas ou o intervalo de recuperação forem inválidos.
+        """
+        if failure_threshold < 1 or reset_timeout <= 0:
+            raise ValueError("O limite de falhas deve ser positivo e o intervalo de recuperação maior que zero.")
+
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = STATE_CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False  # Indica se a chamada de teste do estado semiaberto está em andamento
+        self._lock = threading.Lock()
+
+    def before_call(self) -> None:
+        """
+        Verifica se uma chamada é permitida.
+
+        Com o disjuntor aberto, as chamadas são bloqueadas até o fim do intervalo de recuperação;
+        em seguida, apenas uma chamada de teste é permitida até que seu resultado seja registrado.
+
+        Exceções:
+            - CircuitOpenError: se a chamada for bloqueada.
+        """
+        with self._lock:
+            if self.state == STATE_CLOSED:
+                return
+
+            remaining = self._opened_at + self.reset_timeout - time.monotonic()
+            if self.state == STATE_OPEN and remaining <= 0:
+                self.state = STATE_HALF_OPEN
+            if self.state == STATE_HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return
+            raise CircuitOpenError(self.name, max(remaining, 0.0) if self.state == STATE_OPEN else self.reset_timeout)
+
+    def record_success(self) -> None:
+        """
+        Registra uma chamada bem-sucedida, fechando o disjuntor e zerando o contador de falhas.
+        """
+        with self._lock:
+            self.state = STATE_CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """
+        Registra uma falha do servidor.
+
+        O disjuntor se abre ao atingir o limite de falhas consecutivas, ou imediatamente se a
+        chamada de teste do estado semiaberto falhar.
+        """
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if self.state == STATE_HALF_OPEN or self._failures >= self.failure_threshold:
+                self.state = STATE_OPEN
+                self._opened_at = time.monotonic()
+
+    def record_neutral(self) -> None:
+        """
+        Registra uma chamada cujo resultado não indica o estado do servidor (por exemplo, um erro do cliente).
+
+        O estado e o contador de falhas são mantidos; no estado semiaberto, apenas a chamada de teste é
+        liberada, de modo que a próxima chamada seja o novo teste.
+        """
+        with self._lock:
+            self._probe_in_flight = False
+
+    def is_open(self) -> bool:
+        """
+        Indica se o disjuntor está aberto, ou seja, se as novas chamadas estão sendo bloqueadas.
+
+        Retorna:
+            bool: `True` se o disjuntor estiver aberto e o intervalo de recuperação ainda não tiver terminado.
+        """
+        with self._lock:
+            return self.state == STATE_OPEN and time.monotonic() < self._opened_at + self.reset_timeout
+
+    @classmethod
+    def get_shared(cls, name: str) -> 'CircuitBreaker':
+        """
+        Retorna o disjuntor compartilhado pelo processo para o nome informado.
+
+        Todos os serviços que acessam o mesmo endpoint devem compartilhar o disjuntor, de modo
+        que as falhas observadas por um deles protejam também os demais.
+
+        Parâmetros:
+            name (str): Nome do serviço protegido (por exemplo, a URL base da API).
+
+        Retorna:
+            CircuitBreaker: O disjuntor compartilhado.
+        """
+        with cls._shared_lock:
+            breaker = cls._shared.get(name)
+            if breaker is None:
+                breaker = cls(name)
+                cls._shared[name] = breaker
+            return breaker
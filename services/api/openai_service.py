@@ -6,7 +6,23 @@ OpenAI Service Module
 
 Este módulo fornece serviços para simplificar e, opcionalmente, resumir textos utilizando a API da OpenAI.
 Ele gerencia a autenticação com a OpenAI, inicializa o cliente de tradução e executa a simplificação de textos
-com base nos parâmetros fornecidos.
+com base nos parâmetros fornecidos. A simplificação pode ser obtida de uma só vez ou em modo
+streaming, trecho a trecho, à medida que o modelo gera a resposta. Documentos longos, que não
+cabem no orçamento de tokens do modelo, são divididos em blocos simplificados em paralelo
+(map) e, quando solicitado um resumo, consolidados em uma etapa final (reduce). Opcionalmente,
+as respostas podem ser armazenadas em um cache persistente, indexado pela requisição completa.
+O serviço mantém clientes explícitos (síncrono e assíncrono) da OpenAI, com um pool de conexões
+httpx configurável, o que permite executar várias simplificações simultâneas a partir de um
+único event loop com `simplify_text_async`. As falhas são classificadas por tipo: erros que não
+podem ser resolvidos com uma nova tentativa (autenticação, requisição inválida, modelo inexistente
+ou prompt maior que a janela de contexto) falham imediatamente; erros de limite de taxa e do
+servidor são repetidos respeitando o cabeçalho Retry-After e um prazo total, e um disjuntor
+compartilhado bloqueia as chamadas enquanto a API estiver indisponível. Várias variantes do mesmo
+texto (por exemplo, em níveis de complexidade ou estilos diferentes) podem ser geradas de uma vez
+com `simplify_variants`, em requisições simultâneas. Antes de cada requisição, o custo estimado
+(uma requisição e os tokens do prompt e da resposta) é reservado no gerenciador de cotas
+compartilhado, que mantém o consumo de cada modelo abaixo dos limites de RPM e TPM configurados,
+na fila de prioridade do serviço ('interactive' para a interface gráfica, 'batch' para o lote).
 
 Classes:
     OpenAIService: Classe responsável pela interação com a API da OpenAI para simplificação de textos.
@@ -15,9 +31,18 @@ Dependências:
     - boto3: biblioteca da AWS para interagir com os serviços da AWS.
     - dotenv: biblioteca para carregar variáveis de ambiente a partir de um arquivo .env.
     - openai: biblioteca oficial da OpenAI para interagir com a API OpenAI.
+    - httpx: biblioteca HTTP utilizada pelos clientes da OpenAI, com pool de conexões configurável.
+    - asyncio: biblioteca padrão para a simplificação assíncrona.
+    - email.utils: biblioteca padrão para interpretar o cabeçalho Retry-After em formato de data.
+    - json: biblioteca padrão para agrupar variantes com parâmetros idênticos.
+    - services.api.circuit_breaker: Para bloquear as chamadas enquanto a API estiver indisponível.
+    - services.api.quota_manager: Para respeitar os limites de requisições e tokens por minuto.
     - os: biblioteca padrão para interagir com o sistema operacional.
     - time: biblioteca padrão para manipulação de tempo.
     - random: biblioteca padrão para geração de números aleatórios.
+    - concurrent.futures: biblioteca padrão para a simplificação concorrente dos blocos.
+    - services.cache.completion_cache: Para o cache persistente (opcional) das respostas.
+    - tiktoken (opcional): biblioteca para a contagem exata de tokens. Na sua ausência, os tokens são estimados.
     - typing: biblioteca padrão para anotações de tipos.
 
 Exemplo de Uso:
@@ -33,14 +58,81 @@ Exemplo de Uso:
     ... )
     >>> print(texto_simplificado)
     "This is a simplified version of the original technical document, making it easier to understand for non-experts."
+
+Variáveis de Ambiente (opcionais):
+    - OPENAI_BASE_URL: URL base da API (por exemplo, um proxy ou um servidor local compatível).
+    - OPENAI_TIMEOUT: tempo limite de cada requisição, em segundos (padrão: 120).
+    - OPENAI_CONNECT_TIMEOUT: tempo limite de conexão, em segundos (padrão: 10).
+    - OPENAI_MAX_CONNECTIONS: número máximo de conexões simultâneas do pool (padrão: 20).
+    - OPENAI_MAX_KEEPALIVE_CONNECTIONS: número máximo de conexões ociosas mantidas abertas (padrão: 10).
+    - OPENAI_MAX_ATTEMPTS: número máximo de tentativas por requisição (padrão: 5).
+    - OPENAI_RETRY_DEADLINE: tempo total máximo, em segundos, das tentativas de uma requisição (padrão: 60).
+    - OPENAI_RPM / OPENAI_TPM: limites de requisições e de tokens por minuto de cada modelo (padrão: 500 e 30000,
+      ver QuotaManager).
 """
 
+import asyncio
+import email.utils
+import json
+import logging
+import math
 import os
 import time
 import random
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
+import httpx
 import openai
-from typing import List, Optional
+from typing import Callable, Dict, Iterator, List, Optional
+
+from services.api.circuit_breaker import CircuitBreaker, CircuitOpenError
+from services.api.quota_manager import (
+    DIMENSION_REQUESTS, DIMENSION_TOKENS, LANE_INTERACTIVE, LANES, PROVIDER_OPENAI, QuotaManager
+)
+from services.cache.completion_cache import CACHE_POLICIES, CACHE_POLICY_DETERMINISTIC, CompletionCache
+from services.language.text_segmentation_service import TextSegmentationService
+
+try:
+    import tiktoken
+except ImportError:  # Dependência opcional: sem ela, o número de tokens é estimado
+    tiktoken = None
+
+# Parâmetros de amostragem de `simplify_text` enviados em cada requisição
+REQUEST_PARAMS = ('max_tokens', 'temperature', 'top_p', 'frequency_penalty', 'presence_penalty')
+
+# Janela de contexto (em tokens) de cada modelo suportado
+MODEL_CONTEXT_WINDOWS = {
+    'gpt-3.5-turbo-0125': 16385,
+    'gpt-4-turbo': 128000,
+    'gpt-4o-mini': 128000,
+    'gpt-4o': 128000
+}
+DEFAULT_CONTEXT_WINDOW = 8192
+# Tokens reservados para as instruções do prompt (mensagens system e user, sem o texto)
+PROMPT_OVERHEAD_TOKENS = 300
+# Proporção entre o texto de entrada e a resposta: sem resumo, a reescrita tende a ter tamanho
+# semelhante ao original, então cada bloco deve caber com folga em `max_tokens`
+SIMPLIFICATION_INPUT_RATIO = 0.75
+# Número padrão de blocos simplificados simultaneamente
+DEFAULT_MAX_WORKERS = 4
+# Número máximo de etapas de consolidação (reduce) de resumos
+MAX_REDUCE_DEPTH = 3
+# Menor número de tokens de cada bloco no resumo final, quando os resumos parciais não convergem
+MIN_REDUCE_SHARE_TOKENS = 100
+
+logger = logging.getLogger(__name__)
+# Configuração padrão do pool de conexões HTTP dos clientes OpenAI
+DEFAULT_TIMEOUT = 120.0
+DEFAULT_CONNECT_TIMEOUT = 10.0
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 10
+# Política padrão de retry
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_RETRY_DEADLINE = 60.0
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 20.0
+# Códigos de status HTTP que justificam uma nova tentativa
+RETRYABLE_STATUS_CODES = {408, 409, 429}
 
 
 class OpenAIService:
@@ -53,9 +145,41 @@ class OpenAIService:
     Métodos:
         simplify_text(text: str, area_tecnica: str, estilo: str, summarize: bool, model: str) ⇾ str:
             Simplifica (e opcionalmente resume) o texto fornecido utilizando o modelo especificado da OpenAI.
+
+        simplify_text_stream(text: str, area_tecnica: str, estilo: str, summarize: bool, model: str) ⇾ Iterator[str]:
+            Simplifica o texto fornecido, produzindo o resultado à medida que é gerado pelo modelo.
+
+        simplify_text_async(text: str, area_tecnica: str, estilo: str, summarize: bool, model: str) ⇾ str:
+            Versão assíncrona de `simplify_text`, para uso concorrente em um único event loop.
+
+        retry_delay(error: Exception, attempt: int) ⇾ Optional[float]:
+            Classifica um erro da API e retorna o tempo de espera até a próxima tentativa.
+
+        close() ⇾ None / aclose() ⇾ None:
+            Encerram os pools de conexões dos clientes síncrono e assíncrono.
+
+        simplify_long_text(text: str, area_tecnica: str, estilo: str, summarize: bool, model: str) ⇾ str:
+            Simplifica documentos longos em blocos paralelos, com consolidação opcional do resumo.
+
+        simplify_variants(text: str, variants: List[dict], **options) ⇾ List[str]:
+            Gera simultaneamente várias variantes simplificadas do mesmo texto.
+
+        build_messages(text: str, area_tecnica: str, estilo: str, summarize: bool) ⇾ List[dict]:
+            Constrói as mensagens enviadas à API OpenAI para a simplificação.
+
+        count_tokens(text: str, model: str) ⇾ int:
+            Conta (ou estima) o número de tokens de um texto para o modelo informado.
+
+        needs_chunking(text: str, model: str, max_tokens: int, summarize: bool) ⇾ bool:
+            Indica se o texto excede o orçamento de tokens de uma única requisição.
     """
 
-    def __init__(self):
+    def __init__(self, use_response_cache: Optional[bool] = None, response_cache: Optional[CompletionCache] = None,
+                 cache_policy: Optional[str] = None, base_url: Optional[str] = None, timeout: Optional[float] = None,
+                 max_connections: Optional[int] = None, client: Optional[openai.OpenAI] = None,
+                 async_client: Optional[openai.AsyncOpenAI] = None, max_attempts: Optional[int] = None,
+                 retry_deadline: Optional[float] = None, circuit_breaker: Optional[CircuitBreaker] = None,
+                 quota_manager: Optional[QuotaManager] = None, lane: str = LANE_INTERACTIVE):
         """
         Inicializa a instância do OpenAIService.
 
@@ -63,14 +187,63 @@ class OpenAIService:
             1. Carrega as credenciais da OpenAI a partir do arquivo .env.
             2. Inicializa o cliente OpenAI com as credenciais carregadas.
 
+        Se um cliente for injetado por `client`, os dois passos são ignorados.
+
+        Parâmetros:
+            use_response_cache (bool, optional): Habilita o cache persistente de respostas. Por padrão, segue a
+                variável de ambiente OPENAI_RESPONSE_CACHE ('1' ou 'true'); na sua ausência, o cache fica desabilitado.
+            response_cache (CompletionCache, optional): Cache de respostas a ser utilizado. Se informado,
+                o cache é habilitado mesmo sem `use_response_cache`.
+            cache_policy (str, optional): Política de reutilização das respostas: 'deterministic' (apenas
+                requisições com temperature igual a 0) ou 'always' (qualquer requisição). Por padrão, segue a
+                variável de ambiente OPENAI_CACHE_POLICY, ou 'deterministic' na sua ausência.
+            base_url (str, optional): URL base da API. Por padrão, a variável OPENAI_BASE_URL ou a URL oficial.
+            timeout (float, optional): Tempo limite de cada requisição, em segundos. Por padrão, OPENAI_TIMEOUT.
+            max_connections (int, optional): Tamanho do pool de conexões. Por padrão, OPENAI_MAX_CONNECTIONS.
+            client (openai.OpenAI, optional): Cliente síncrono a ser utilizado.
+            async_client (openai.AsyncOpenAI, optional): Cliente assíncrono a ser utilizado. Por padrão, é
+                criado na primeira chamada assíncrona, com a mesma configuração do cliente síncrono.
+            max_attempts (int, optional): Número máximo de tentativas por requisição. Por padrão, OPENAI_MAX_ATTEMPTS.
+            retry_deadline (float, optional): Tempo total máximo, em segundos, das tentativas de uma requisição.
+                Por padrão, OPENAI_RETRY_DEADLINE.
+            circuit_breaker (CircuitBreaker, optional): Disjuntor utilizado nas chamadas. Por padrão, o
+                disjuntor compartilhado pelo processo para a URL base da API.
+            quota_manager (QuotaManager, optional): Gerenciador das cotas de requisições e tokens. Por padrão,
+                o gerenciador compartilhado pelo processo.
+            lane (str): Fila de prioridade das requisições no gerenciador de cotas: 'interactive' (padrão)
+                ou 'batch'.
+
         Exceções:
-            - ValueError: se a chave da API OpenAI estiver faltando no arquivo .env.
+            - ValueError: se a chave da API OpenAI estiver faltando no arquivo .env, ou se a política de
+              cache ou a fila de prioridade forem inválidas.
             - ConnectionError: se houver falha ao inicializar o cliente OpenAI.
         """
         self.OPENAI_API_KEY = None  # Chave da API OpenAI
-        self.client = None  # Instância do cliente OpenAI
-        self.load_credentials()  # Carrega as credenciais OpenAI
-        self.init_openai_client()  # Inicializa o cliente OpenAI
+        self.client = client  # Instância do cliente OpenAI síncrono
+        self.async_client = async_client  # Instância do cliente OpenAI assíncrono
+        self.base_url = base_url
+        self.timeout = timeout
+        self.max_connections = max_connections
+        if self.client is None:
+            self.load_credentials()  # Carrega as credenciais OpenAI
+            self.init_openai_client()  # Inicializa o cliente OpenAI
+
+        # Configura a política de retry e o disjuntor
+        self.max_attempts = max_attempts or int(os.getenv('OPENAI_MAX_ATTEMPTS', DEFAULT_MAX_ATTEMPTS))
+        self.retry_deadline = retry_deadline or float(os.getenv('OPENAI_RETRY_DEADLINE', DEFAULT_RETRY_DEADLINE))
+        self.circuit_breaker = circuit_breaker or CircuitBreaker.get_shared(self._base_url() or 'openai')
+        self.quota_manager = quota_manager or QuotaManager.get_shared()
+        if lane not in LANES:
+            raise ValueError(f"Fila de prioridade inválida: {lane}")
+        self.lane = lane
+
+        # Configura o cache de respostas (opcional)
+        if use_response_cache is None:
+            use_response_cache = os.getenv('OPENAI_RESPONSE_CACHE', '').lower() in ('1', 'true')
+        self.cache_policy = cache_policy or os.getenv('OPENAI_CACHE_POLICY', '') or CACHE_POLICY_DETERMINISTIC
+        if self.cache_policy not in CACHE_POLICIES:
+            raise ValueError(f"Política de cache inválida: {self.cache_policy}")
+        self.response_cache = response_cache or (CompletionCache() if use_response_cache else None)
 
     def load_credentials(self) -> None:
         """
@@ -98,8 +271,12 @@ class OpenAIService:
         """
         Inicializa o cliente OpenAI.
 
-        Este metodo utiliza a chave da API carregada para configurar a biblioteca OpenAI,
-        que será utilizada para realizar chamadas à API de simplificação de textos.
+        Este metodo utiliza a chave da API carregada para criar um cliente `openai.OpenAI` explícito,
+        com um pool de conexões httpx próprio (tamanho e tempos limite configuráveis), que será
+        utilizado para realizar chamadas à API de simplificação de textos. O cliente é seguro para
+        uso entre threads, de modo que os blocos simplificados em paralelo compartilham as conexões.
+        As tentativas automáticas da biblioteca são desabilitadas, pois o serviço aplica sua própria
+        política de retry.
 
         Exceções:
             - ConnectionError: se houver falha ao inicializar o cliente OpenAI devido a credenciais inválidas
@@ -110,11 +287,89 @@ class OpenAIService:
               tenha permissão para acessar os serviços da OpenAI.
         """
         try:
-            openai.api_key = self.OPENAI_API_KEY
-            self.client = openai
+            self.client = openai.OpenAI(
+                api_key=self.OPENAI_API_KEY,
+                base_url=self._base_url(),
+                max_retries=0,
+                http_client=httpx.Client(limits=self._http_limits(), timeout=self._http_timeout())
+            )
         except Exception as e:
             raise ConnectionError(f"Falha ao inicializar o cliente OpenAI: {str(e)}")
 
+    def _base_url(self) -> Optional[str]:
+        """
+        Retorna a URL base da API OpenAI configurada.
+
+        Retorna:
+            Optional[str]: A URL informada no construtor, a variável OPENAI_BASE_URL, ou `None` (URL oficial).
+        """
+        return self.base_url or os.getenv('OPENAI_BASE_URL', '') or None
+
+    def _http_limits(self) -> httpx.Limits:
+        """
+        Retorna os limites do pool de conexões HTTP dos clientes OpenAI.
+
+        Retorna:
+            httpx.Limits: Número máximo de conexões e de conexões ociosas mantidas abertas.
+        """
+        max_connections = self.max_connections or int(os.getenv('OPENAI_MAX_CONNECTIONS', DEFAULT_MAX_CONNECTIONS))
+        max_keepalive = int(os.getenv('OPENAI_MAX_KEEPALIVE_CONNECTIONS', DEFAULT_MAX_KEEPALIVE_CONNECTIONS))
+        return httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=min(max_keepalive, max_connections)
+        )
+
+    def _http_timeout(self) -> httpx.Timeout:
+        """
+        Retorna os tempos limite das requisições HTTP dos clientes OpenAI.
+
+        Retorna:
+            httpx.Timeout: Tempo limite geral e tempo limite de conexão.
+        """
+        timeout = self.timeout or float(os.getenv('OPENAI_TIMEOUT', DEFAULT_TIMEOUT))
+        connect_timeout = float(os.getenv('OPENAI_CONNECT_TIMEOUT', DEFAULT_CONNECT_TIMEOUT))
+        return httpx.Timeout(timeout, connect=connect_timeout)
+
+    def get_async_client(self) -> openai.AsyncOpenAI:
+        """
+        Retorna o cliente OpenAI assíncrono, criando-o na primeira chamada.
+
+        O cliente assíncrono utiliza um pool de conexões `httpx.AsyncClient` com a mesma configuração
+        do cliente síncrono. Deve ser utilizado sempre a partir do mesmo event loop.
+
+        Retorna:
+            openai.AsyncOpenAI: O cliente assíncrono.
+
+        Exceções:
+            - ConnectionError: se houver falha ao inicializar o cliente OpenAI assíncrono.
+        """
+        if self.async_client is None:
+            try:
+                self.async_client = openai.AsyncOpenAI(
+                    api_key=self.OPENAI_API_KEY or self.client.api_key,
+                    base_url=self._base_url(),
+                    max_retries=0,
+                    http_client=httpx.AsyncClient(limits=self._http_limits(), timeout=self._http_timeout())
+                )
+            except Exception as e:
+                raise ConnectionError(f"Falha ao inicializar o cliente OpenAI assíncrono: {str(e)}")
+        return self.async_client
+
+    def close(self) -> None:
+        """
+        Encerra o pool de conexões do cliente síncrono.
+        """
+        if hasattr(self.client, 'close'):
+            self.client.close()
+
+    async def aclose(self) -> None:
+        """
+        Encerra o pool de conexões do cliente assíncrono, se ele tiver sido criado.
+        """
+        if self.async_client is not None:
+            await self.async_client.close()
+            self.async_client = None
+
     def simplify_text(
             self,
             text: str,
@@ -136,7 +391,7 @@ class OpenAIService:
         Este metodo realiza os seguintes passos:
             1. Define o prompt com base nos parâmetros fornecidos.
             2. Faz uma chamada à API OpenAI ChatCompletion para obter o texto simplificado.
-            3. Implementa uma lógica de retry para lidar com possíveis falhas temporárias na API.
+            3. Repete a chamada apenas para falhas temporárias da API (ver `retry_delay`).
 
         Parâmetros:
             text (str): O texto a ser simplificado.
@@ -156,13 +411,121 @@ class OpenAIService:
             str: O texto simplificado (e opcionalmente resumido) retornado pela API da OpenAI.
 
         Exceções:
-            - Exception: Se ocorrer um erro durante a comunicação com a API OpenAI após várias tentativas.
+            - Exception: Se ocorrer um erro permanente, ou se as tentativas ou o prazo total se esgotarem.
+            - CircuitOpenError: Se o disjuntor estiver aberto devido a falhas recentes da API.
 
         Teoria:
             - A OpenAI utiliza modelos de linguagem avançados para gerar texto de forma contextualizada e adaptada às instruções fornecidas.
             - A simplificação de texto envolve reescrever o conteúdo de maneira mais acessível, mantendo a essência das informações.
             - A funcionalidade de sumarização reduz o texto mantendo os pontos-chave, facilitando a compreensão rápida do conteúdo.
         """
+        messages = self.build_messages(text, area_tecnica, estilo, summarize, complexity_level, focus_aspects)
+        params = self._request_params(max_tokens, temperature, top_p, frequency_penalty, presence_penalty)
+
+        cache_key = self._response_cache_key(messages, model, params)
+        if cache_key is not None:
+            cached = self.response_cache.get_completion(cache_key)
+            if cached is not None:
+                return cached
+
+        response = self._create_completion(model=model, messages=messages, **params)
+        content = response.choices[0].message.content.strip()
+        if cache_key is not None:
+            self.response_cache.set_completion(cache_key, content)
+        return content
+
+    async def simplify_text_async(
+            self,
+            text: str,
+            area_tecnica: str,
+            estilo: str,
+            summarize: bool,
+            model: str,
+            complexity_level: str = 'Intermediário',
+            focus_aspects: Optional[List[str]] = None,
+            temperature: float = 0.8,
+            max_tokens: int = 4096,
+            top_p: float = 1.0,
+            frequency_penalty: float = 0.0,
+            presence_penalty: float = 0.0
+    ) -> str:
+        """
+        Simplifica (e opcionalmente resume) o texto fornecido de forma assíncrona.
+
+        Este metodo recebe os mesmos parâmetros de `simplify_text` e utiliza o cliente assíncrono,
+        de modo que várias simplificações podem ser executadas simultaneamente em um único event
+        loop (por exemplo, com `asyncio.gather`), sem uma thread por requisição.
+
+        Retorna:
+            str: O texto simplificado (e opcionalmente resumido) retornado pela API da OpenAI.
+
+        Exceções:
+            - Exception: Se ocorrer um erro permanente, ou se as tentativas ou o prazo total se esgotarem.
+            - CircuitOpenError: Se o disjuntor estiver aberto devido a falhas recentes da API.
+        """
+        messages = self.build_messages(text, area_tecnica, estilo, summarize, complexity_level, focus_aspects)
+        params = self._request_params(max_tokens, temperature, top_p, frequency_penalty, presence_penalty)
+
+        # As consultas ao cache (SQLite) são síncronas e executadas fora do event loop
+        cache_key = self._response_cache_key(messages, model, params)
+        if cache_key is not None:
+            cached = await asyncio.to_thread(self.response_cache.get_completion, cache_key)
+            if cached is not None:
+                return cached
+
+        response = await self._acreate_completion(model=model, messages=messages, **params)
+        content = response.choices[0].message.content.strip()
+        if cache_key is not None:
+            await asyncio.to_thread(self.response_cache.set_completion, cache_key, content)
+        return content
+
+    @staticmethod
+    def _request_params(max_tokens: int = 4096, temperature: float = 0.8, top_p: float = 1.0,
+                        frequency_penalty: float = 0.0, presence_penalty: float = 0.0) -> dict:
+        """
+        Constrói os parâmetros de amostragem de uma requisição, com os tipos esperados pela API.
+
+        Parâmetros:
+            max_tokens (int): Define o tamanho máximo da resposta.
+            temperature (float): Controla a aleatoriedade da resposta.
+            top_p (float): Controla a aleatoriedade via probabilidade cumulativa.
+            frequency_penalty (float): Controla a repetição de palavras.
+            presence_penalty (float): Controla a diversidade da resposta.
+
+        Retorna:
+            dict: Os parâmetros da requisição (ver `REQUEST_PARAMS`).
+        """
+        return dict(
+            max_tokens=int(max_tokens),
+            temperature=float(temperature),
+            top_p=float(top_p),
+            frequency_penalty=float(frequency_penalty),
+            presence_penalty=float(presence_penalty)
+        )
+
+    @staticmethod
+    def build_messages(
+            text: str,
+            area_tecnica: str,
+            estilo: str,
+            summarize: bool,
+            complexity_level: str = 'Intermediário',
+            focus_aspects: Optional[List[str]] = None
+    ) -> List[dict]:
+        """
+        Constrói as mensagens (system e user) enviadas à API OpenAI para a simplificação.
+
+        Parâmetros:
+            text (str): O texto a ser simplificado.
+            area_tecnica (str): A área técnica do texto.
+            estilo (str): O estilo de escrita desejado.
+            summarize (bool): Indica se o texto deve ser resumido além de ser simplificado.
+            complexity_level (str): Nível de complexidade da simplificação.
+            focus_aspects (List[str], optional): Aspectos a serem priorizados na simplificação.
+
+        Retorna:
+            List[dict]: As mensagens no formato esperado pela API Chat Completions.
+        """
         complexity_description = ''
         if complexity_level == 'Básico':
             complexity_description = 'usando linguagem simples, adequada para iniciantes'
@@ -187,7 +550,7 @@ class OpenAIService:
             user_content += " Mantenha todas as ideias originais, evitando omitir ou resumir informações relevantes para o pleno entendimento do texto."
         user_content += f"\n\nTexto:\n\"\"\"\n{text}\n\"\"\""
 
-        messages = [
+        return [
             {
                 "role": "system",
                 "content": (
@@ -201,22 +564,595 @@ class OpenAIService:
             }
         ]
 
-        max_retries = 5
-        for attempt in range(max_retries):
+    def simplify_text_stream(
+            self,
+            text: str,
+            area_tecnica: str,
+            estilo: str,
+            summarize: bool,
+            model: str,
+            complexity_level: str = 'Intermediário',
+            focus_aspects: Optional[List[str]] = None,
+            temperature: float = 0.8,
+            max_tokens: int = 4096,
+            top_p: float = 1.0,
+            frequency_penalty: float = 0.0,
+            presence_penalty: float = 0.0
+    ) -> Iterator[str]:
+        """
+        Simplifica (e opcionalmente resume) o texto fornecido, produzindo o resultado à medida que é gerado.
+
+        Este metodo recebe os mesmos parâmetros de `simplify_text`, mas solicita a resposta em modo
+        streaming e produz cada trecho de texto assim que ele chega, permitindo que a interface exiba
+        o resultado progressivamente. A lógica de retry se aplica apenas ao estabelecimento do stream;
+        uma falha após o início da geração é propagada imediatamente. Se o gerador for fechado antes
+        do fim (`close`), a conexão do stream é encerrada e a geração é interrompida.
+
+        Retorna:
+            Iterator[str]: Os trechos do texto simplificado, na ordem em que são gerados.
+
+        Exceções:
+            - Exception: Se ocorrer um erro permanente, ou se as tentativas ou o prazo total se esgotarem.
+            - CircuitOpenError: Se o disjuntor estiver aberto devido a falhas recentes da API.
+        """
+        messages = self.build_messages(text, area_tecnica, estilo, summarize, complexity_level, focus_aspects)
+        params = self._request_params(max_tokens, temperature, top_p, frequency_penalty, presence_penalty)
+
+        cache_key = self._response_cache_key(messages, model, params)
+        if cache_key is not None:
+            cached = self.response_cache.get_completion(cache_key)
+            if cached is not None:
+                yield cached
+                return
+
+        stream = self._create_completion(model=model, messages=messages, stream=True, **params)
+        parts = []
+        try:
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    parts.append(chunk.choices[0].delta.content)
+                    yield chunk.choices[0].delta.content
+        finally:
+            # Encerra a conexão se o consumidor interromper a leitura (por exemplo, ao cancelar)
+            if hasattr(stream, 'close'):
+                stream.close()
+
+        # Apenas respostas completas são armazenadas no cache
+        if cache_key is not None:
+            self.response_cache.set_completion(cache_key, ''.join(parts).strip())
+
+    def _create_completion(self, **kwargs):
+        """
+        Executa `chat.completions.create` com a política de retry e o disjuntor.
+
+        Parâmetros:
+            **kwargs: Argumentos repassados a `chat.completions.create`.
+
+        Retorna:
+            A resposta (ou o stream) retornada pela biblioteca da OpenAI.
+
+        Exceções:
+            - Exception: Se ocorrer um erro permanente, ou se as tentativas ou o prazo total se esgotarem.
+            - CircuitOpenError: Se o disjuntor estiver aberto.
+        """
+        provider, costs = self._quota_costs(kwargs)
+        deadline = None
+        attempt = 0
+        while True:
+            self.circuit_breaker.before_call()
             try:
-                response = self.client.chat.completions.create(
-                    model=model,
-                    messages=messages,
-                    max_tokens=max_tokens,
-                    temperature=temperature,
-                    top_p=top_p,
-                    frequency_penalty=frequency_penalty,
-                    presence_penalty=presence_penalty
-                )
-                return response.choices[0].message.content.strip()
+                self.quota_manager.acquire(provider, costs, lane=self.lane)
+            except BaseException:
+                # Libera a chamada de teste do disjuntor, que não chegou a ser feita
+                self.circuit_breaker.record_neutral()
+                raise
+            # O prazo das tentativas não inclui a espera inicial pela cota
+            deadline = deadline or time.monotonic() + self.retry_deadline
+            try:
+                response = self.client.chat.completions.create(**kwargs)
             except Exception as e:
-                if attempt == max_retries - 1:
-                    raise Exception(f"Erro ao simplificar o texto após várias tentativas: {str(e)}")
-                else:
-                    wait_time = 2 ** attempt + random.uniform(0, 1)
-                    time.sleep(wait_time)
+                wait_time = self._handle_failure(e, attempt, deadline, provider)
+                attempt += 1
+                time.sleep(wait_time)
+                continue
+            self.circuit_breaker.record_success()
+            self._settle_usage(provider, costs, response)
+            return response
+
+    async def _acreate_completion(self, **kwargs):
+        """
+        Versão assíncrona de `_create_completion`, utilizando o cliente assíncrono.
+
+        Parâmetros:
+            **kwargs: Argumentos repassados a `chat.completions.create`.
+
+        Retorna:
+            A resposta retornada pela biblioteca da OpenAI.
+
+        Exceções:
+            - Exception: Se ocorrer um erro permanente, ou se as tentativas ou o prazo total se esgotarem.
+            - CircuitOpenError: Se o disjuntor estiver aberto.
+        """
+        client = self.get_async_client()
+        provider, costs = self._quota_costs(kwargs)
+        deadline = None
+        attempt = 0
+        while True:
+            self.circuit_breaker.before_call()
+            try:
+                await self.quota_manager.acquire_async(provider, costs, self.lane)
+            except BaseException:
+                # Inclui o cancelamento da tarefa durante a espera pela cota
+                self.circuit_breaker.record_neutral()
+                raise
+            deadline = deadline or time.monotonic() + self.retry_deadline
+            try:
+                response = await client.chat.completions.create(**kwargs)
+            except Exception as e:
+                # O descarte da cota após um erro 429 pode acessar o estado compartilhado entre processos
+                wait_time = await asyncio.to_thread(self._handle_failure, e, attempt, deadline, provider)
+                attempt += 1
+                await asyncio.sleep(wait_time)
+                continue
+            self.circuit_breaker.record_success()
+            await asyncio.to_thread(self._settle_usage, provider, costs, response)
+            return response
+
+    def _quota_costs(self, kwargs: dict) -> tuple:
+        """
+        Estima o custo de uma requisição para o gerenciador de cotas.
+
+        Os tokens são estimados como os tokens das mensagens (mais um pequeno acréscimo por mensagem)
+        somados ao máximo de tokens da resposta de cada uma das `n` opções, que é o valor considerado
+        pela OpenAI no controle de TPM.
+
+        Parâmetros:
+            kwargs (dict): Argumentos de `chat.completions.create`.
+
+        Retorna:
+            tuple: O provedor ('openai:<modelo>') e os custos por dimensão.
+        """
+        model = kwargs.get('model', '')
+        messages = kwargs.get('messages', [])
+        prompt_tokens = sum(self.count_tokens(message.get('content') or '', model) + 4 for message in messages)
+        completion_tokens = (kwargs.get('max_tokens') or 0) * (kwargs.get('n') or 1)
+        costs = {DIMENSION_REQUESTS: 1, DIMENSION_TOKENS: prompt_tokens + completion_tokens}
+        return f"{PROVIDER_OPENAI}:{model}", costs
+
+    def _settle_usage(self, provider: str, costs: dict, response) -> None:
+        """
+        Acerta no gerenciador de cotas o número de tokens efetivamente consumido pela requisição.
+
+        Respostas em streaming não informam o consumo; nesse caso, a estimativa é mantida.
+
+        Parâmetros:
+            provider (str): O provedor ('openai:<modelo>').
+            costs (dict): Os custos estimados da requisição.
+            response: A resposta retornada pela biblioteca da OpenAI.
+        """
+        usage = getattr(response, 'usage', None)
+        total_tokens = getattr(usage, 'total_tokens', None)
+        if isinstance(total_tokens, int):
+            self.quota_manager.settle(provider, DIMENSION_TOKENS, costs[DIMENSION_TOKENS], total_tokens)
+
+    def _handle_failure(self, error: Exception, attempt: int, deadline: float,
+                        provider: Optional[str] = None) -> float:
+        """
+        Registra a falha de uma chamada e decide se ela deve ser repetida.
+
+        Parâmetros:
+            error (Exception): O erro lançado pela chamada.
+            attempt (int): O número da tentativa que falhou (a partir de 0).
+            deadline (float): Instante (`time.monotonic`) a partir do qual não há novas tentativas.
+            provider (str, optional): O provedor no gerenciador de cotas, cuja capacidade é descartada
+                após um erro de limite de taxa.
+
+        Retorna:
+            float: O tempo de espera, em segundos, antes da próxima tentativa.
+
+        Exceções:
+            - Exception: Se o erro for permanente, ou se as tentativas ou o prazo total se esgotarem.
+            - CircuitOpenError: Se a falha abrir o disjuntor.
+        """
+        if self.is_server_failure(error):
+            self.circuit_breaker.record_failure()
+            if self.circuit_breaker.is_open():
+                # Não há novas tentativas enquanto o disjuntor estiver aberto
+                raise CircuitOpenError(self.circuit_breaker.name, self.circuit_breaker.reset_timeout) from error
+        else:
+            # A API respondeu com um erro do cliente: a falha não indica nem indisponibilidade nem recuperação
+            self.circuit_breaker.record_neutral()
+
+        if provider is not None and isinstance(error, openai.RateLimitError):
+            self.quota_manager.on_throttle(provider)
+
+        wait_time = self.retry_delay(error, attempt)
+        if wait_time is None:
+            raise Exception(f"Erro ao simplificar o texto: {str(error)}") from error
+        if attempt + 1 >= self.max_attempts or time.monotonic() + wait_time > deadline:
+            raise Exception(f"Erro ao simplificar o texto após várias tentativas: {str(error)}") from error
+        return wait_time
+
+    @staticmethod
+    def is_server_failure(error: Exception) -> bool:
+        """
+        Indica se o erro representa uma falha do servidor ou da conexão, contabilizada pelo disjuntor.
+
+        Parâmetros:
+            error (Exception): O erro lançado pela chamada.
+
+        Retorna:
+            bool: `True` para erros de conexão, tempo limite esgotado e respostas 5xx.
+        """
+        if isinstance(error, openai.APIConnectionError):  # Inclui APITimeoutError
+            return True
+        return isinstance(error, openai.APIStatusError) and error.status_code >= 500
+
+    @staticmethod
+    def retry_delay(error: Exception, attempt: int) -> Optional[float]:
+        """
+        Classifica um erro da API e retorna o tempo de espera até a próxima tentativa.
+
+        Erros de autenticação, permissão, requisição inválida (incluindo prompts maiores que a janela de
+        contexto), modelo inexistente e cota esgotada são permanentes. Erros de conexão, tempo limite,
+        limite de taxa e do servidor são temporários: o tempo de espera segue os cabeçalhos `retry-after-ms`
+        ou `Retry-After` da resposta, quando presentes, ou um backoff exponencial com jitter.
+
+        Parâmetros:
+            error (Exception): O erro lançado pela chamada.
+            attempt (int): O número da tentativa que falhou (a partir de 0).
+
+        Retorna:
+            Optional[float]: O tempo de espera, em segundos, ou `None` se o erro não deve ser repetido.
+        """
+        if isinstance(error, openai.APIStatusError):
+            if error.status_code not in RETRYABLE_STATUS_CODES and error.status_code < 500:
+                return None
+            if getattr(error, 'code', None) == 'insufficient_quota':
+                return None
+            retry_after = OpenAIService._parse_retry_after(error.response.headers)
+            if retry_after is not None:
+                return min(retry_after, BACKOFF_MAX)
+        elif not isinstance(error, openai.APIConnectionError):
+            return None
+        return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+
+    @staticmethod
+    def _parse_retry_after(headers) -> Optional[float]:
+        """
+        Interpreta os cabeçalhos `retry-after-ms` e `Retry-After` de uma resposta.
+
+        Parâmetros:
+            headers: Os cabeçalhos da resposta HTTP.
+
+        Retorna:
+            Optional[float]: O tempo de espera, em segundos, ou `None` se os cabeçalhos estiverem ausentes ou inválidos.
+        """
+        try:
+            if headers.get('retry-after-ms'):
+                return max(0.0, float(headers['retry-after-ms']) / 1000)
+            retry_after = headers.get('retry-after')
+            if not retry_after:
+                return None
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                retry_date = email.utils.parsedate_to_datetime(retry_after)
+                return max(0.0, retry_date.timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def _response_cache_key(self, messages: List[dict], model: str, params: dict) -> Optional[str]:
+        """
+        Retorna a chave de cache da requisição, se ela puder ser atendida pelo cache.
+
+        Parâmetros:
+            messages (List[dict]): As mensagens da requisição.
+            model (str): O modelo da OpenAI.
+            params (dict): Os parâmetros de amostragem da requisição.
+
+        Retorna:
+            Optional[str]: A chave de cache, ou `None` se o cache estiver desabilitado ou se a política
+            'deterministic' estiver ativa e a requisição tiver temperature diferente de 0.
+        """
+        if self.response_cache is None:
+            return None
+        if self.cache_policy == CACHE_POLICY_DETERMINISTIC and params.get('temperature') != 0:
+            return None
+        return self.response_cache.make_key(messages, model, params)
+
+    @staticmethod
+    def count_tokens(text: str, model: str) -> int:
+        """
+        Conta o número de tokens de um texto para o modelo informado.
+
+        Utiliza o tokenizador do `tiktoken` quando disponível. Caso contrário, estima o número de
+        tokens de forma conservadora (um token a cada três caracteres).
+
+        Parâmetros:
+            text (str): O texto a ser medido.
+            model (str): O modelo da OpenAI cujo tokenizador deve ser utilizado.
+
+        Retorna:
+            int: O número de tokens do texto.
+        """
+        if tiktoken is not None:
+            try:
+                encoding = tiktoken.encoding_for_model(model)
+            except KeyError:
+                encoding = tiktoken.get_encoding('cl100k_base')
+            return len(encoding.encode(text, disallowed_special=()))
+        return math.ceil(len(text) / 3)
+
+    @staticmethod
+    def chunk_token_budget(model: str, max_tokens: int, summarize: bool) -> int:
+        """
+        Calcula o número máximo de tokens de texto por requisição.
+
+        O orçamento é limitado pela janela de contexto do modelo, descontadas as instruções e a
+        resposta (`max_tokens`). Sem resumo, também é limitado por uma fração de `max_tokens`,
+        para que a resposta de cada bloco não seja truncada.
+
+        Parâmetros:
+            model (str): O modelo da OpenAI.
+            max_tokens (int): O tamanho máximo da resposta.
+            summarize (bool): Indica se o texto será resumido.
+
+        Retorna:
+            int: O número máximo de tokens de texto em cada bloco.
+        """
+        context_window = MODEL_CONTEXT_WINDOWS.get(model, DEFAULT_CONTEXT_WINDOW)
+        budget = context_window - PROMPT_OVERHEAD_TOKENS - max_tokens
+        if not summarize:
+            budget = min(budget, int(max_tokens * SIMPLIFICATION_INPUT_RATIO))
+        return max(1, budget)
+
+    def needs_chunking(self, text: str, model: str, max_tokens: int, summarize: bool) -> bool:
+        """
+        Indica se o texto excede o orçamento de tokens de uma única requisição.
+
+        Parâmetros:
+            text (str): O texto a ser simplificado.
+            model (str): O modelo da OpenAI.
+            max_tokens (int): O tamanho máximo da resposta.
+            summarize (bool): Indica se o texto será resumido.
+
+        Retorna:
+            bool: `True` se o texto deve ser simplificado com `simplify_long_text`.
+        """
+        return self.count_tokens(text, model) > self.chunk_token_budget(model, max_tokens, summarize)
+
+    def simplify_long_text(
+            self,
+            text: str,
+            area_tecnica: str,
+            estilo: str,
+            summarize: bool,
+            model: str,
+            complexity_level: str = 'Intermediário',
+            focus_aspects: Optional[List[str]] = None,
+            temperature: float = 0.8,
+            max_tokens: int = 4096,
+            top_p: float = 1.0,
+            frequency_penalty: float = 0.0,
+            presence_penalty: float = 0.0,
+            max_workers: int = DEFAULT_MAX_WORKERS,
+            on_chunk: Optional[Callable[[int, str], None]] = None,
+            completed_chunks: Optional[Dict[int, str]] = None
+    ) -> str:
+        """
+        Simplifica documentos longos em blocos paralelos, com consolidação opcional do resumo.
+
+        Este metodo realiza os seguintes passos:
+            1. Divide o texto em blocos nos limites de seções e parágrafos, respeitando o orçamento
+               de tokens do modelo (ver `chunk_token_budget`).
+            2. Simplifica os blocos simultaneamente, com no máximo `max_workers` requisições em paralelo (map).
+            3. Junta os blocos simplificados na ordem original.
+            4. Se `summarize` for verdadeiro e houver mais de um bloco, resume o texto consolidado (reduce).
+               Enquanto o texto consolidado exceder uma requisição, os resumos parciais são resumidos novamente,
+               em até `MAX_REDUCE_DEPTH` etapas; se ainda assim ele não couber, cada um dos seus blocos é
+               reduzido a uma fração igual do orçamento de tokens (com um aviso no log), de modo que o resumo
+               final abranja todo o documento sem exceder a janela de contexto.
+
+        Os demais parâmetros são os mesmos de `simplify_text`.
+
+        Parâmetros:
+            max_workers (int): Número máximo de blocos simplificados simultaneamente.
+            on_chunk (Callable[[int, str], None], optional): Função chamada, na ordem do documento,
+                com o índice e o texto de cada bloco simplificado.
+            completed_chunks (Dict[int, str], optional): Blocos já simplificados em uma execução anterior,
+                indexados pela posição do bloco. Esses blocos não são enviados novamente à API; a divisão
+                em blocos é determinística para o mesmo texto, modelo e `max_tokens`.
+
+        Retorna:
+            str: O texto simplificado (e opcionalmente resumido).
+
+        Exceções:
+            - Exception: Se ocorrer um erro durante a simplificação de algum dos blocos, ou se os resumos
+              parciais não convergirem e a fração do orçamento de cada bloco for menor que
+              `MIN_REDUCE_SHARE_TOKENS`.
+        """
+        options = dict(
+            area_tecnica=area_tecnica,
+            estilo=estilo,
+            model=model,
+            complexity_level=complexity_level,
+            focus_aspects=focus_aspects,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            top_p=top_p,
+            frequency_penalty=frequency_penalty,
+            presence_penalty=presence_penalty
+        )
+        simplified_chunks = self._map_chunks(text, summarize, options, max_workers, on_chunk, completed_chunks)
+        merged = '\n\n'.join(simplified_chunks)
+        if not summarize or len(simplified_chunks) == 1:
+            return merged
+
+        # Etapa de consolidação (reduce): os resumos parciais são resumidos em conjunto
+        for depth in range(MAX_REDUCE_DEPTH + 1):
+            if not self.needs_chunking(merged, model, max_tokens, summarize=True):
+                return self.simplify_text(text=merged, summarize=True, **options)
+            if depth < MAX_REDUCE_DEPTH:
+                merged = '\n\n'.join(self._map_chunks(merged, True, options, max_workers, None))
+
+        # Os resumos parciais não convergiram: cada bloco é reduzido a uma fração igual do orçamento (descontado
+        # o separador entre os blocos), para que o resumo final abranja todo o documento e caiba no modelo
+        budget = self.chunk_token_budget(model, max_tokens, summarize=True)
+        chunks = TextSegmentationService.split_text(merged, budget, lambda t: self.count_tokens(t, model))
+        share = budget // len(chunks) - 1
+        if share < MIN_REDUCE_SHARE_TOKENS:
+            raise Exception(
+                f"Erro ao resumir o documento: o resumo consolidado ainda excede {budget} tokens após "
+                f"{MAX_REDUCE_DEPTH} etapas de consolidação."
+            )
+        logger.warning(
+            "O resumo consolidado ainda excede %d tokens após %d etapas de consolidação; "
+            "cada um dos %d blocos será reduzido a %d tokens.", budget, MAX_REDUCE_DEPTH, len(chunks), share
+        )
+        excerpts = [
+            TextSegmentationService.split_text(chunk, share, lambda t: self.count_tokens(t, model))[0][0]
+            for chunk, _ in chunks
+        ]
+        return self.simplify_text(text='\n\n'.join(excerpts), summarize=True, **options)
+
+    def simplify_variants(
+            self,
+            text: str,
+            variants: List[dict],
+            max_workers: Optional[int] = None,
+            on_variant: Optional[Callable[[int, str], None]] = None,
+            **options
+    ) -> List[str]:
+        """
+        Gera simultaneamente várias variantes simplificadas do mesmo texto.
+
+        Cada variante é definida pelos parâmetros que a diferenciam das opções comuns (por exemplo,
+        `{'complexity_level': 'Básico'}` ou `{'estilo': 'Formal'}`). As variantes são simplificadas em
+        requisições simultâneas, de modo que o tempo total corresponde ao da variante mais lenta.
+        Variantes com parâmetros idênticos compartilham o mesmo prompt e são obtidas em uma única
+        requisição, com o parâmetro `n` da API; documentos longos são simplificados com `simplify_long_text`.
+
+        Parâmetros:
+            text (str): O texto a ser simplificado.
+            variants (List[dict]): Os parâmetros de `simplify_text` que diferenciam cada variante.
+            max_workers (int, optional): Número máximo de requisições simultâneas. Por padrão, todas as
+                variantes são solicitadas ao mesmo tempo.
+            on_variant (Callable[[int, str], None], optional): Função chamada com o índice e o texto de cada
+                variante, à medida que são concluídas. Se lançar uma exceção, as variantes ainda não
+                iniciadas são descartadas e a exceção é propagada.
+            **options: Os parâmetros de `simplify_text` comuns a todas as variantes, exceto `text`.
+
+        Retorna:
+            List[str]: O texto simplificado de cada variante, na ordem de `variants`.
+
+        Exceções:
+            - Exception: Se ocorrer um erro durante a simplificação de alguma das variantes.
+        """
+        settings = [dict(options, **variant) for variant in variants]
+        groups: Dict[str, List[int]] = {}
+        for index, setting in enumerate(settings):
+            key = json.dumps(setting, ensure_ascii=False, sort_keys=True, default=str)
+            groups.setdefault(key, []).append(index)
+
+        simplified: List[Optional[str]] = [None] * len(settings)
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers or len(groups), len(groups)))) as executor:
+            futures = {
+                executor.submit(self._simplify_group, text, settings[indices[0]], len(indices)): indices
+                for indices in groups.values()
+            }
+            try:
+                for future in as_completed(futures):
+                    for index, content in zip(futures[future], future.result()):
+                        simplified[index] = content
+                        if on_variant is not None:
+                            on_variant(index, content)
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
+        return simplified
+
+    def _simplify_group(self, text: str, setting: dict, n: int) -> List[str]:
+        """
+        Simplifica o texto `n` vezes com os mesmos parâmetros.
+
+        As `n` respostas de uma única requisição são consultadas e armazenadas no cache de respostas (conforme
+        a política de cache), sob uma chave que inclui `n`.
+
+        Parâmetros:
+            text (str): O texto a ser simplificado.
+            setting (dict): Os parâmetros de `simplify_text`, exceto `text`.
+            n (int): Número de respostas solicitadas.
+
+        Retorna:
+            List[str]: As `n` respostas obtidas.
+        """
+        if self.needs_chunking(text, setting['model'], setting.get('max_tokens', 4096), setting['summarize']):
+            return [self.simplify_long_text(text=text, **setting) for _ in range(n)]
+        if n == 1:
+            return [self.simplify_text(text=text, **setting)]
+
+        messages = self.build_messages(
+            text, setting['area_tecnica'], setting['estilo'], setting['summarize'],
+            setting.get('complexity_level', 'Intermediário'), setting.get('focus_aspects')
+        )
+        params = self._request_params(**{name: setting[name] for name in REQUEST_PARAMS if name in setting})
+        # As `n` respostas são armazenadas juntas, sob uma chave que inclui `n`
+        cache_key = self._response_cache_key(messages, setting['model'], dict(params, n=n))
+        if cache_key is not None:
+            cached = self.response_cache.get_completions(cache_key)
+            if cached is not None and len(cached) == n:
+                return cached
+
+        response = self._create_completion(model=setting['model'], messages=messages, n=n, **params)
+        contents = [choice.message.content.strip() for choice in response.choices]
+        if cache_key is not None:
+            self.response_cache.set_completions(cache_key, contents)
+        return contents
+
+    def _map_chunks(self, text: str, summarize: bool, options: dict, max_workers: int,
+                    on_chunk: Optional[Callable[[int, str], None]],
+                    completed_chunks: Optional[Dict[int, str]] = None) -> List[str]:
+        """
+        Divide o texto em blocos e os simplifica simultaneamente.
+
+        Parâmetros:
+            text (str): O texto a ser dividido e simplificado.
+            summarize (bool): Indica se cada bloco deve ser resumido.
+            options (dict): Demais parâmetros de `simplify_text`.
+            max_workers (int): Número máximo de blocos simplificados simultaneamente.
+            on_chunk (Callable[[int, str], None], optional): Função chamada, na ordem do documento,
+                com o índice e o texto de cada bloco simplificado. Se lançar uma exceção, os blocos
+                ainda não iniciados são descartados e a exceção é propagada.
+            completed_chunks (Dict[int, str], optional): Blocos já simplificados, que não são reenviados à API.
+
+        Retorna:
+            List[str]: Os blocos simplificados, na ordem original.
+        """
+        model = options['model']
+        budget = self.chunk_token_budget(model, options['max_tokens'], summarize)
+        chunks = TextSegmentationService.split_text(text, budget, lambda t: self.count_tokens(t, model))
+
+        completed_chunks = completed_chunks or {}
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(chunks)))) as executor:
+            futures = {
+                index: executor.submit(self.simplify_text, text=chunk, summarize=summarize, **options)
+                for index, (chunk, _) in enumerate(chunks) if index not in completed_chunks
+            }
+            simplified_chunks = []
+            try:
+                for index in range(len(chunks)):
+                    if index in completed_chunks:
+                        simplified_chunks.append(completed_chunks[index])
+                    else:
+                        simplified_chunks.append(futures[index].result())
+                    if on_chunk is not None:
+                        on_chunk(index, simplified_chunks[-1])
+            except Exception:
+                # Descarta os blocos ainda não iniciados (por exemplo, quando `on_chunk` cancela a operação)
+                for future in futures.values():
+                    future.cancel()
+                raise
+        return simplified_chunks
@@ -0,0 +1,814 @@
+# services/api/quota_manager.py
+
+"""
+Quota Manager Module
+====================
+
+Este módulo fornece um gerenciador de cotas compartilhado pelos serviços de API. Cada provedor
+possui um ou mais limites de consumo, como requisições por minuto (RPM) e tokens por minuto (TPM)
+para cada modelo da OpenAI, e caracteres por segundo para o AWS Translate. O custo de cada
+requisição é estimado antes do envio, e a requisição só é liberada quando todos os limites do
+provedor comportam esse custo. Assim, as chamadas simultâneas são distribuídas para manter o
+consumo logo abaixo dos limites (com uma margem de segurança), em vez de alternar entre
+ociosidade e rajadas de erros 429.
+
+Cada limite é um token bucket cuja capacidade corresponde à cota do período (descontada a
+margem) e que é reposto continuamente. Quando o custo real é conhecido após a resposta (por
+exemplo, o número de tokens informado pela OpenAI), a diferença em relação à estimativa é
+acertada no bucket. O consumo dos últimos períodos é registrado para a consulta da utilização.
+
+As requisições são atendidas em duas filas de prioridade: 'interactive', para as solicitações de
+uma pessoa na interface gráfica, e 'batch', para o processamento em lote. Uma fração da capacidade
+de cada limite é reservada para a fila interativa: as requisições em lote só consomem a cota
+enquanto essa reserva estiver disponível, e aguardam sempre que houver requisições interativas
+esperando pelo mesmo provedor. A profundidade e o tempo de espera de cada fila podem ser consultados.
+
+Com um `QuotaStore`, o saldo dos buckets e as requisições interativas em espera são compartilhados,
+em um banco SQLite, por todos os processos que utilizam as mesmas chaves (a interface gráfica, o
+processamento em lote e o servidor): o consumo de um processo é descontado dos demais, e um processo
+em lote cede a vez às requisições interativas de outro processo. O gerenciador compartilhado
+(`get_shared`) utiliza o banco padrão e, na ausência de limites configurados, limites conservadores.
+
+Classes:
+    QuotaBucket: Limite de consumo de um provedor em uma dimensão (requisições, tokens ou caracteres).
+    LaneStats: Estatísticas de espera de uma fila de prioridade.
+    QuotaManager: Classe responsável pelo controle das cotas de todos os provedores.
+
+Dependências:
+    - services.api.quota_store: Para o estado das cotas compartilhado entre processos.
+    - asyncio: biblioteca padrão para a espera assíncrona por cota.
+    - collections: biblioteca padrão para o histórico de consumo.
+    - os: biblioteca padrão para a leitura dos limites configurados no ambiente.
+    - threading: biblioteca padrão para sincronização entre threads.
+    - time: biblioteca padrão para manipulação de tempo.
+    - typing: biblioteca padrão para anotações de tipos.
+
+Exemplo de Uso:
+    >>> from services.api.quota_manager import QuotaManager
+    >>> quotas = QuotaManager()
+    >>> quotas.set_limit('openai', 'requests', 500, 60)
+    >>> quotas.set_limit('openai', 'tokens', 30000, 60)
+    >>> quotas.acquire('openai:gpt-4o', {'requests': 1, 'tokens': 1800})
+    True
+    >>> quotas.settle('openai:gpt-4o', 'tokens', 1800, 1250)
+    >>> quotas.utilization()['openai:gpt-4o']['tokens']['utilization']
+    0.04
+    >>> quotas.acquire('openai:gpt-4o', {'requests': 1, 'tokens': 900}, lane='batch')
+    True
+    >>> quotas.lane_stats()['batch']['waiting']
+    0
+
+Variáveis de Ambiente (opcionais):
+    - OPENAI_RPM: requisições por minuto permitidas para cada modelo da OpenAI (padrão: 500).
+    - OPENAI_TPM: tokens por minuto permitidos para cada modelo da OpenAI (padrão: 30000).
+    - AWS_TRANSLATE_CPS: caracteres por segundo permitidos para o AWS Translate (padrão: 1000).
+    - QUOTA_HEADROOM: fração de cada limite efetivamente utilizada (padrão: 0.9).
+    - QUOTA_INTERACTIVE_RESERVE: fração de cada limite reservada para a fila interativa (padrão: 0.2).
+    - QUOTA_SHARED: '0' para controlar as cotas apenas no processo atual, sem o banco compartilhado.
+    - TRADUZAI_CACHE_DIR: diretório do banco compartilhado (`quotas.sqlite3`).
+    Um limite igual a 0 não é aplicado, mas o consumo continua sendo registrado.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Optional, Tuple
+
+from services.api.quota_store import QuotaStore
+
+# Fração de cada limite efetivamente utilizada, como margem para imprecisões nas estimativas
+DEFAULT_HEADROOM = 0.9
+
+# Provedores
+PROVIDER_OPENAI = 'openai'
+PROVIDER_AWS_TRANSLATE = 'aws_translate'
+
+# Dimensões de consumo
+DIMENSION_REQUESTS = 'requests'
+DIMENSION_TOKENS = 'tokens'
+DIMENSION_CHARACTERS = 'characters'
+
+# Filas de prioridade
+LANE_INTERACTIVE = 'interactive'
+LANE_BATCH = 'batch'
+LANES = (LANE_INTERACTIVE, LANE_BATCH)
+
+# Fração de cada limite reservada para a fila interativa
+DEFAULT_INTERACTIVE_RESERVE = 0.2
+
+# Intervalo, em segundos, entre as verificações de uma requisição em lote preterida pela fila interativa
+PRIORITY_POLL_INTERVAL = 0.05
+
+# Número de esperas recentes consideradas no percentil das estatísticas de cada fila
+LANE_WAIT_HISTORY = 1000
+
+# Intervalo máximo, em segundos, entre as verificações de uma requisição em espera quando as cotas são
+# compartilhadas, já que o consumo dos demais processos não interrompe a espera
+SHARED_STATE_POLL_INTERVAL = 1.0
+
+# Limites aplicados quando as variáveis de ambiente não são definidas, compatíveis com as contas de
+# menor nível de uso: (variável, provedor, dimensão, limite, período em segundos)
+DEFAULT_LIMITS = (
+    ('OPENAI_RPM', PROVIDER_OPENAI, DIMENSION_REQUESTS, 500, 60.0),
+    ('OPENAI_TPM', PROVIDER_OPENAI, DIMENSION_TOKENS, 30000, 60.0),
+    ('AWS_TRANSLATE_CPS', PROVIDER_AWS_TRANSLATE, DIMENSION_CHARACTERS, 1000, 1.0)
+)
+
+
+class QuotaBucket:
+    """
+    Limite de consumo de um provedor em uma dimensão, implementado como token bucket.
+
+    Atributos:
+        limit (float): O limite de consumo por período.
+        period (float): A duração do período, em segundos.
+        capacity (float): A capacidade do bucket (o limite descontada a margem de segurança).
+
+    Métodos:
+        wait_time(cost: float, now: float, reserve: float = 0.0) ⇾ float:
+            Retorna o tempo de espera até que o custo possa ser consumido sem ocupar a fração reservada.
+
+        consume(cost: float, now: float) ⇾ None:
+            Consome o custo do bucket e o registra no histórico.
+
+        adjust(delta: float, now: float) ⇾ None:
+            Acerta a diferença entre o custo real e o estimado.
+
+        drain(now: float) ⇾ None:
+            Descarta a capacidade acumulada, após um erro de limite de taxa.
+
+        state() ⇾ Tuple[float, float]:
+            Retorna a capacidade disponível e o instante da última reposição.
+
+        restore(available: float, updated_at: float) ⇾ None:
+            Substitui a capacidade disponível pelo estado compartilhado com outros processos.
+
+        utilization(now: float) ⇾ dict:
+            Retorna o consumo do último período em relação ao limite.
+    """
+
+    def __init__(self, limit: float, period: float, headroom: float = DEFAULT_HEADROOM):
+        """
+        Inicializa a instância do QuotaBucket, com a capacidade completa.
+
+        Parâmetros:
+            limit (float): O limite de consumo por período.
+            period (float): A duração do período, em segundos.
+            headroom (float): Fração do limite efetivamente utilizada.
+
+        Exceções:
+            - ValueError: se o limite, o período ou a margem forem inválidos.
+        """
+        if limit <= 0 or period <= 0:
+            raise ValueError("O limite e o período da cota devem ser positivos.")
+        if not 0 < headroom <= 1:
+            raise ValueError("A margem da cota deve estar entre 0 e 1.")
+
+        self.limit = limit
+        self.period = period
+        self.capacity = limit * headroom
+        self._rate = self.capacity / period
+        self._available = self.capacity
+        self._updated_at = time.monotonic()
+        self._history: deque = deque()
+
+    def _refill(self, now: float) -> None:
+        """
+        Repõe a capacidade proporcionalmente ao tempo decorrido desde a última reposição.
+
+        Parâmetros:
+            now (float): O instante atual (`time.monotonic`).
+        """
+        self._available = min(self.capacity, self._available + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+
+    def wait_time(self, cost: float, now: float, reserve: float = 0.0) -> float:
+        """
+        Retorna o tempo de espera até que o custo possa ser consumido sem ocupar a fração reservada.
+
+        Custos maiores que a capacidade aguardam apenas o bucket cheio, em vez de aguardar indefinidamente;
+        o excedente é descontado por `consume` e pago com a reposição seguinte. Com uma reserva, a fração
+        reservada deve permanecer disponível após o consumo, e apenas o restante da capacidade pode ser
+        ocupado pelo custo; como o custo integral é descontado, uma requisição com reserva maior que esse
+        restante deixa o saldo negativo, e as requisições sem reserva são liberadas antes da seguinte.
+
+        Parâmetros:
+            cost (float): O custo da requisição.
+            now (float): O instante atual (`time.monotonic`).
+            reserve (float): Fração da capacidade que deve permanecer disponível após o consumo.
+
+        Retorna:
+            float: O tempo de espera, em segundos (0 se o custo pode ser consumido imediatamente).
+        """
+        self._refill(now)
+        needed = min(cost, self.capacity)
+        if reserve:
+            needed = min(needed, (1 - reserve) * self.capacity) + reserve * self.capacity
+        if self._available >= needed:
+            return 0.0
+        return (needed - self._available) / self._rate
+
+    def consume(self, cost: float, now: float) -> None:
+        """
+        Consome o custo do bucket e o registra no histórico.
+
+        O custo é descontado integralmente, mesmo que exceda a capacidade: o saldo fica negativo e as
+        requisições seguintes aguardam até que o excedente seja reposto, mantendo o consumo dentro do limite.
+
+        Parâmetros:
+            cost (float): O custo da requisição.
+            now (float): O instante atual (`time.monotonic`).
+        """
+        self._refill(now)
+        self._available -= cost
+        self._history.append((now, cost))
+
+    def adjust(self, delta: float, now: float) -> None:
+        """
+        Acerta a diferença entre o custo real e o estimado.
+
+        Parâmetros:
+            delta (float): O custo real menos o estimado (negativo se a estimativa foi excessiva).
+            now (float): O instante atual (`time.monotonic`).
+        """
+        self._refill(now)
+        self._available = min(self.capacity, self._available - delta)
+        self._history.append((now, delta))
+
+    def drain(self, now: float) -> None:
+        """
+        Descarta a capacidade acumulada, após um erro de limite de taxa do provedor.
+
+        Parâmetros:
+            now (float): O instante atual (`time.monotonic`).
+        """
+        self._refill(now)
+        self._available = min(self._available, 0.0)
+
+    def state(self) -> Tuple[float, float]:
+        """
+        Retorna a capacidade disponível e o instante da última reposição.
+
+        Retorna:
+            Tuple[float, float]: A capacidade disponível e o instante da última reposição (`time.monotonic`).
+        """
+        return self._available, self._updated_at
+
+    def restore(self, available: float, updated_at: float) -> None:
+        """
+        Substitui a capacidade disponível pelo estado compartilhado com outros processos.
+
+        Parâmetros:
+            available (float): A capacidade disponível.
+            updated_at (float): O instante da última reposição (`time.monotonic`).
+        """
+        self._available = min(self.capacity, available)
+        self._updated_at = updated_at
+
+    def utilization(self, now: float) -> dict:
+        """
+        Retorna o consumo do último período em relação ao limite.
+
+        Parâmetros:
+            now (float): O instante atual (`time.monotonic`).
+
+        Retorna:
+            dict: O limite ('limit'), o período ('period'), o consumo do último período ('used') e a
+            fração do limite consumida ('utilization').
+        """
+        while self._history and self._history[0][0] <= now - self.period:
+            self._history.popleft()
+        used = max(0.0, sum(cost for _, cost in self._history))
+        return {
+            'limit': self.limit,
+            'period': self.period,
+            'used': used,
+            'utilization': used / self.limit
+        }
+
+
+class LaneStats:
+    """
+    Estatísticas de espera de uma fila de prioridade.
+
+    Atributos:
+        waiting (int): Número de requisições aguardando cota.
+        acquired (int): Número de requisições atendidas.
+        total_wait (float): Soma dos tempos de espera das requisições atendidas, em segundos.
+        max_wait (float): Maior tempo de espera de uma requisição atendida, em segundos.
+        recent_waits (deque): Tempos de espera das últimas requisições atendidas.
+    """
+
+    def __init__(self):
+        """
+        Inicializa a instância do LaneStats, sem requisições registradas.
+        """
+        self.waiting = 0
+        self.acquired = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.recent_waits: deque = deque(maxlen=LANE_WAIT_HISTORY)
+
+    def record(self, wait: float) -> None:
+        """
+        Registra o tempo de espera de uma requisição atendida.
+
+        Parâmetros:
+            wait (float): O tempo de espera, em segundos.
+        """
+        self.acquired += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        self.recent_waits.append(wait)
+
+    def to_dict(self) -> dict:
+        """
+        Retorna as estatísticas da fila.
+
+        Retorna:
+            dict: A profundidade da fila ('waiting'), as requisições atendidas ('acquired') e os tempos de
+            espera médio ('mean_wait'), máximo ('max_wait') e o percentil 95 das esperas recentes ('p95_wait').
+        """
+        recent = sorted(self.recent_waits)
+        return {
+            'waiting': self.waiting,
+            'acquired': self.acquired,
+            'mean_wait': self.total_wait / self.acquired if self.acquired else 0.0,
+            'max_wait': self.max_wait,
+            'p95_wait': recent[min(len(recent) - 1, int(len(recent) * 0.95))] if recent else 0.0
+        }
+
+
+class QuotaManager:
+    """
+    Gerenciador das cotas de consumo dos provedores de API.
+
+    Os provedores são identificados por nome, opcionalmente qualificado pelo recurso (por exemplo,
+    'openai:gpt-4o'). Os limites definidos para o nome base ('openai') valem, separadamente, para
+    cada recurso; limites definidos para o nome qualificado têm precedência. Cada requisição pertence
+    a uma fila de prioridade ('interactive' ou 'batch'); a fila em lote não consome a fração da
+    capacidade reservada para a fila interativa e cede a vez às requisições interativas em espera.
+    Com um `QuotaStore`, os buckets e as requisições interativas em espera são compartilhados com os
+    demais processos; a utilização informada continua restrita ao consumo do processo atual.
+
+    Métodos:
+        set_limit(provider: str, dimension: str, limit: float, period: float) ⇾ None:
+            Define um limite de consumo de um provedor.
+
+        acquire(provider: str, costs: Dict[str, float], timeout: Optional[float] = None, lane: str = ...) ⇾ bool:
+            Aguarda até que todos os limites do provedor comportem os custos e os consome.
+
+        acquire_async(provider: str, costs: Dict[str, float], lane: str = ...) ⇾ None:
+            Versão assíncrona de `acquire`.
+
+        reserve(provider: str, costs: Dict[str, float], lane: str = ...) ⇾ float:
+            Consome os custos se houver cota disponível; caso contrário, retorna o tempo de espera.
+
+        settle(provider: str, dimension: str, estimated: float, actual: float) ⇾ None:
+            Acerta a diferença entre o custo real e o estimado de uma requisição.
+
+        on_throttle(provider: str) ⇾ None:
+            Descarta a capacidade acumulada do provedor após um erro de limite de taxa.
+
+        utilization() ⇾ Dict[str, Dict[str, dict]]:
+            Retorna a utilização atual de cada limite de cada provedor.
+
+        lane_stats() ⇾ Dict[str, dict]:
+            Retorna a profundidade e os tempos de espera de cada fila de prioridade.
+
+        get_shared() ⇾ QuotaManager:
+            Retorna o gerenciador compartilhado pelo processo, configurado pelas variáveis de ambiente.
+    """
+
+    _shared: Optional['QuotaManager'] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, headroom: float = DEFAULT_HEADROOM, interactive_reserve: float = DEFAULT_INTERACTIVE_RESERVE,
+                 store: Optional[QuotaStore] = None):
+        """
+        Inicializa a instância do QuotaManager, sem limites definidos.
+
+        Parâmetros:
+            headroom (float): Fração de cada limite efetivamente utilizada.
+            interactive_reserve (float): Fração de cada limite reservada para a fila interativa.
+            store (QuotaStore, optional): Estado das cotas compartilhado com outros processos. Por padrão,
+                as cotas são controladas apenas no processo atual.
+
+        Exceções:
+            - ValueError: se a fração reservada não estiver entre 0 e 1.
+        """
+        if not 0 <= interactive_reserve < 1:
+            raise ValueError("A fração reservada para a fila interativa deve estar entre 0 e 1.")
+
+        self.headroom = headroom
+        self.interactive_reserve = interactive_reserve
+        self.store = store
+        self._lanes = {lane: LaneStats() for lane in LANES}
+        self._interactive_waiting: Dict[str, int] = {}
+        self._limits: Dict[str, Dict[str, Tuple[float, float]]] = {}
+        self._buckets: Dict[str, Dict[str, QuotaBucket]] = {}
+        self._usage: Dict[str, Dict[str, float]] = {}
+        self._condition = threading.Condition()
+
+    def set_limit(self, provider: str, dimension: str, limit: float, period: float) -> None:
+        """
+        Define um limite de consumo de um provedor.
+
+        Parâmetros:
+            provider (str): O provedor ('openai', 'aws_translate') ou o provedor qualificado ('openai:gpt-4o').
+            dimension (str): A dimensão do consumo ('requests', 'tokens' ou 'characters').
+            limit (float): O consumo máximo por período.
+            period (float): A duração do período, em segundos.
+
+        Exceções:
+            - ValueError: se o limite ou o período não forem positivos.
+        """
+        QuotaBucket(limit, period, self.headroom)  # Valida os parâmetros
+        with self._condition:
+            self._limits.setdefault(provider, {})[dimension] = (limit, period)
+            # Os buckets já criados são recriados com o novo limite na próxima requisição
+            for name in list(self._buckets):
+                if name == provider or name.split(':', 1)[0] == provider:
+                    self._buckets[name].pop(dimension, None)
+            self._condition.notify_all()
+
+    def _provider_buckets(self, provider: str) -> Dict[str, QuotaBucket]:
+        """
+        Retorna os buckets de um provedor, criando os que ainda não existem. Deve ser chamado com o lock.
+
+        Parâmetros:
+            provider (str): O provedor, possivelmente qualificado.
+
+        Retorna:
+            Dict[str, QuotaBucket]: Os buckets do provedor, indexados pela dimensão.
+        """
+        buckets = self._buckets.setdefault(provider, {})
+        limits = dict(self._limits.get(provider.split(':', 1)[0], {}))
+        limits.update(self._limits.get(provider, {}))
+        for dimension, (limit, period) in limits.items():
+            if dimension not in buckets:
+                buckets[dimension] = QuotaBucket(limit, period, self.headroom)
+        return buckets
+
+    def reserve(self, provider: str, costs: Dict[str, float], lane: str = LANE_INTERACTIVE) -> float:
+        """
+        Consome os custos se todos os limites do provedor os comportarem; caso contrário, nada é consumido.
+
+        Parâmetros:
+            provider (str): O provedor, possivelmente qualificado.
+            costs (Dict[str, float]): O custo estimado da requisição em cada dimensão.
+            lane (str): A fila de prioridade da requisição ('interactive' ou 'batch').
+
+        Retorna:
+            float: 0 se os custos foram consumidos; caso contrário, o tempo de espera, em segundos,
+            até que os limites os comportem.
+
+        Exceções:
+            - ValueError: se a fila de prioridade for desconhecida.
+        """
+        with self._condition:
+            return self._reserve(provider, costs, self._check_lane(lane))
+
+    @staticmethod
+    def _check_lane(lane: str) -> str:
+        """
+        Valida a fila de prioridade informada.
+
+        Parâmetros:
+            lane (str): A fila de prioridade.
+
+        Retorna:
+            str: A própria fila.
+
+        Exceções:
+            - ValueError: se a fila de prioridade for desconhecida.
+        """
+        if lane not in LANES:
+            raise ValueError(f"Fila de prioridade inválida: {lane}")
+        return lane
+
+    def _reserve(self, provider: str, costs: Dict[str, float], lane: str) -> float:
+        """
+        Implementação de `reserve`. Deve ser chamado com o lock.
+        """
+        if lane == LANE_BATCH and (
+                self._interactive_waiting.get(provider) or (self.store and self.store.others_waiting(provider))):
+            # As requisições interativas em espera, deste ou de outro processo, têm precedência
+            return PRIORITY_POLL_INTERVAL
+
+        reserve = self.interactive_reserve if lane == LANE_BATCH else 0.0
+        buckets = self._provider_buckets(provider)
+
+        def consume() -> float:
+            now = time.monotonic()
+            wait_time = max(
+                (bucket.wait_time(costs.get(dimension, 0.0), now, reserve) for dimension, bucket in buckets.items()),
+                default=0.0
+            )
+            if wait_time > 0:
+                return wait_time
+            for dimension, bucket in buckets.items():
+                bucket.consume(costs.get(dimension, 0.0), now)
+            return 0.0
+
+        wait_time = self._shared_update(provider, buckets, consume)
+        if wait_time == 0:
+            usage = self._usage.setdefault(provider, {})
+            for dimension, cost in costs.items():
+                usage[dimension] = usage.get(dimension, 0.0) + cost
+        return wait_time
+
+    def _shared_update(self, provider: str, buckets: Dict[str, QuotaBucket],
+                       function: Callable[[], Optional[float]]) -> Optional[float]:
+        """
+        Executa uma operação sobre os buckets de um provedor, sincronizando-os com o estado compartilhado.
+        Deve ser chamado com o lock.
+
+        Sem um `QuotaStore`, a operação é executada apenas sobre os buckets locais. Com ele, os buckets
+        recebem o saldo gravado pelos demais processos, a operação é executada e o novo saldo é gravado,
+        dentro de uma mesma transação.
+
+        Parâmetros:
+            provider (str): O provedor, possivelmente qualificado.
+            buckets (Dict[str, QuotaBucket]): Os buckets do provedor, indexados pela dimensão.
+            function (Callable[[], Optional[float]]): A operação sobre os buckets.
+
+        Retorna:
+            Optional[float]: O resultado da operação.
+        """
+        if self.store is None or not buckets:
+            return function()
+
+        # A chave inclui o limite, de modo que processos com limites distintos não compartilhem o saldo
+        keys = {
+            dimension: f"{provider}|{dimension}|{bucket.limit:g}|{bucket.period:g}|{self.headroom:g}"
+            for dimension, bucket in buckets.items()
+        }
+
+        def apply(states):
+            # O saldo é gravado com o relógio do sistema, comum aos processos, e lido com o monotônico
+            offset = time.time() - time.monotonic()
+            for dimension, key in keys.items():
+                if states and key in states:
+                    available, updated_at = states[key]
+                    buckets[dimension].restore(available, min(updated_at - offset, time.monotonic()))
+            result = function()
+            states = {}
+            for dimension, key in keys.items():
+                available, updated_at = buckets[dimension].state()
+                states[key] = (available, updated_at + offset)
+            return result, states
+
+        return self.store.update(list(keys.values()), apply)
+
+    def acquire(self, provider: str, costs: Dict[str, float], timeout: Optional[float] = None,
+                lane: str = LANE_INTERACTIVE) -> bool:
+        """
+        Aguarda até que todos os limites do provedor comportem os custos e os consome.
+
+        Parâmetros:
+            provider (str): O provedor, possivelmente qualificado.
+            costs (Dict[str, float]): O custo estimado da requisição em cada dimensão.
+            timeout (float, optional): Tempo máximo de espera, em segundos. Por padrão, aguarda indefinidamente.
+            lane (str): A fila de prioridade da requisição ('interactive' ou 'batch').
+
+        Retorna:
+            bool: `True` se os custos foram consumidos, `False` se o tempo de espera se esgotou.
+
+        Exceções:
+            - ValueError: se a fila de prioridade for desconhecida.
+        """
+        self._check_lane(lane)
+        started_at = time.monotonic()
+        deadline = None if timeout is None else started_at + timeout
+        with self._condition:
+            wait_time = self._reserve(provider, costs, lane)
+            if wait_time == 0:
+                self._lanes[lane].record(0.0)
+                return True
+
+            self._enter_lane(provider, lane)
+            try:
+                while wait_time > 0:
+                    if deadline is not None:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            return False
+                        wait_time = min(wait_time, remaining)
+                    if self.store is not None:
+                        wait_time = min(wait_time, SHARED_STATE_POLL_INTERVAL)
+                        self._publish_waiting(provider, lane)
+                    self._condition.wait(wait_time)
+                    wait_time = self._reserve(provider, costs, lane)
+                self._lanes[lane].record(time.monotonic() - started_at)
+                return True
+            finally:
+                self._leave_lane(provider, lane)
+                self._publish_waiting(provider, lane)
+
+    async def acquire_async(self, provider: str, costs: Dict[str, float], lane: str = LANE_INTERACTIVE) -> None:
+        """
+        Aguarda, sem bloquear o event loop, até que os limites do provedor comportem os custos e os consome.
+
+        Parâmetros:
+            provider (str): O provedor, possivelmente qualificado.
+            costs (Dict[str, float]): O custo estimado da requisição em cada dimensão.
+            lane (str): A fila de prioridade da requisição ('interactive' ou 'batch').
+
+        Exceções:
+            - ValueError: se a fila de prioridade for desconhecida.
+        """
+        started_at = time.monotonic()
+        wait_time = await self._run_async(self.reserve, provider, costs, lane)
+        if wait_time == 0:
+            with self._condition:
+                self._lanes[lane].record(0.0)
+            return
+
+        with self._condition:
+            self._enter_lane(provider, lane)
+        try:
+            while wait_time > 0:
+                if self.store is not None:
+                    wait_time = min(wait_time, SHARED_STATE_POLL_INTERVAL)
+                    await self._run_async(self._publish_waiting, provider, lane)
+                await asyncio.sleep(wait_time)
+                wait_time = await self._run_async(self.reserve, provider, costs, lane)
+            with self._condition:
+                self._lanes[lane].record(time.monotonic() - started_at)
+        finally:
+            with self._condition:
+                self._leave_lane(provider, lane)
+            await self._run_async(self._publish_waiting, provider, lane)
+
+    async def _run_async(self, function: Callable, *args):
+        """
+        Executa uma operação síncrona do gerenciador a partir de uma corrotina.
+
+        Com o estado compartilhado, a operação acessa o banco e é executada em uma thread, sem bloquear
+        o event loop; sem ele, é executada diretamente, pois apenas atualiza o estado em memória.
+
+        Parâmetros:
+            function (Callable): A operação.
+            *args: Os argumentos da operação.
+
+        Retorna:
+            O resultado da operação.
+        """
+        if self.store is None:
+            return function(*args)
+        return await asyncio.to_thread(function, *args)
+
+    def _enter_lane(self, provider: str, lane: str) -> None:
+        """
+        Registra uma requisição em espera na fila. Deve ser chamado com o lock.
+
+        Parâmetros:
+            provider (str): O provedor, possivelmente qualificado.
+            lane (str): A fila de prioridade da requisição.
+        """
+        self._lanes[lane].waiting += 1
+        if lane == LANE_INTERACTIVE:
+            self._interactive_waiting[provider] = self._interactive_waiting.get(provider, 0) + 1
+
+    def _leave_lane(self, provider: str, lane: str) -> None:
+        """
+        Remove uma requisição da fila de espera. Deve ser chamado com o lock.
+
+        Parâmetros:
+            provider (str): O provedor, possivelmente qualificado.
+            lane (str): A fila de prioridade da requisição.
+        """
+        self._lanes[lane].waiting -= 1
+        if lane == LANE_INTERACTIVE:
+            self._interactive_waiting[provider] -= 1
+            if not self._interactive_waiting[provider]:
+                del self._interactive_waiting[provider]
+                # As requisições em lote preteridas podem voltar a disputar a cota
+                self._condition.notify_all()
+
+    def _publish_waiting(self, provider: str, lane: str) -> None:
+        """
+        Registra, no estado compartilhado, as requisições interativas deste processo em espera pelo provedor.
+
+        O registro é repetido a cada verificação da espera, de modo que os demais processos desconsiderem
+        os registros de um processo encerrado sem removê-los.
+
+        Parâmetros:
+            provider (str): O provedor, possivelmente qualificado.
+            lane (str): A fila de prioridade da requisição.
+        """
+        if self.store is not None and lane == LANE_INTERACTIVE:
+            self.store.set_waiting(provider, self._interactive_waiting.get(provider, 0))
+
+    def settle(self, provider: str, dimension: str, estimated: float, actual: float) -> None:
+        """
+        Acerta a diferença entre o custo real e o estimado de uma requisição.
+
+        Parâmetros:
+            provider (str): O provedor, possivelmente qualificado.
+            dimension (str): A dimensão do custo.
+            estimated (float): O custo estimado, consumido em `acquire`.
+            actual (float): O custo real informado pelo provedor.
+        """
+        delta = actual - estimated
+        if delta == 0:
+            return
+        with self._condition:
+            bucket = self._provider_buckets(provider).get(dimension)
+            if bucket is not None:
+                self._shared_update(provider, {dimension: bucket}, lambda: bucket.adjust(delta, time.monotonic()))
+            usage = self._usage.setdefault(provider, {})
+            usage[dimension] = usage.get(dimension, 0.0) + delta
+            self._condition.notify_all()
+
+    def on_throttle(self, provider: str) -> None:
+        """
+        Descarta a capacidade acumulada do provedor após um erro de limite de taxa (HTTP 429).
+
+        O erro indica que o consumo real (por exemplo, de outros processos com a mesma chave) excedeu
+        a estimativa local; as próximas requisições aguardam a reposição dos buckets.
+
+        Parâmetros:
+            provider (str): O provedor, possivelmente qualificado.
+        """
+        with self._condition:
+            buckets = self._provider_buckets(provider)
+
+            def drain() -> None:
+                now = time.monotonic()
+                for bucket in buckets.values():
+                    bucket.drain(now)
+
+            self._shared_update(provider, buckets, drain)
+
+    def utilization(self) -> Dict[str, Dict[str, dict]]:
+        """
+        Retorna a utilização atual de cada limite de cada provedor.
+
+        Retorna:
+            Dict[str, Dict[str, dict]]: Para cada provedor e dimensão, o limite, o período, o consumo do
+            último período e a fração do limite consumida (ver `QuotaBucket.utilization`). Dimensões sem
+            limite definido informam apenas o consumo total acumulado ('total').
+        """
+        with self._condition:
+            now = time.monotonic()
+            report: Dict[str, Dict[str, dict]] = {}
+            for provider in sorted(set(self._buckets) | set(self._usage)):
+                dimensions = report.setdefault(provider, {})
+                for dimension, bucket in self._buckets.get(provider, {}).items():
+                    dimensions[dimension] = bucket.utilization(now)
+                for dimension, total in self._usage.get(provider, {}).items():
+                    dimensions.setdefault(dimension, {})['total'] = total
+            return report
+
+    def lane_stats(self) -> Dict[str, dict]:
+        """
+        Retorna a profundidade e os tempos de espera de cada fila de prioridade.
+
+        Retorna:
+            Dict[str, dict]: Para cada fila ('interactive' e 'batch'), as estatísticas descritas em
+            `LaneStats.to_dict`.
+        """
+        with self._condition:
+            return {lane: stats.to_dict() for lane, stats in self._lanes.items()}
+
+    @classmethod
+    def from_environment(cls) -> 'QuotaManager':
+        """
+        Cria um gerenciador com os limites definidos pelas variáveis de ambiente.
+
+        Os limites não definidos recebem os valores conservadores de `DEFAULT_LIMITS`; um limite igual a 0
+        não é aplicado. Salvo com QUOTA_SHARED=0, o estado das cotas é compartilhado com os demais
+        processos pelo banco padrão do `QuotaStore`.
+
+        Retorna:
+            QuotaManager: O gerenciador configurado com OPENAI_RPM, OPENAI_TPM e AWS_TRANSLATE_CPS.
+        """
+        store = QuotaStore() if os.getenv('QUOTA_SHARED', '1') != '0' else None
+        manager = cls(
+            float(os.getenv('QUOTA_HEADROOM', DEFAULT_HEADROOM)),
+            float(os.getenv('QUOTA_INTERACTIVE_RESERVE', DEFAULT_INTERACTIVE_RESERVE)),
+            store if store is not None and store.enabled else None
+        )
+        for variable, provider, dimension, default, period in DEFAULT_LIMITS:
+            limit = float(os.getenv(variable) or default)
+            if limit > 0:
+                manager.set_limit(provider, dimension, limit, period)
+        return manager
+
+    @classmethod
+    def get_shared(cls) -> 'QuotaManager':
+        """
+        Retorna o gerenciador compartilhado pelo processo, criado na primeira chamada a partir das
+        variáveis de ambiente.
+
+        Retorna:
+            QuotaManager: O gerenciador compartilhado.
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls.from_environment()
+            return cls._shared
@@ -0,0 +1,225 @@
+# services/api/quota_store.py
+
+"""
+Quota Store Module
+==================
+
+Este módulo fornece o armazenamento, em SQLite, do estado das cotas compartilhado por todos os processos
+da aplicação que utilizam as mesmas chaves de API (a interface gráfica, o processamento em lote e o
+servidor). Cada processo mantém os seus token buckets em memória, mas, com um `QuotaStore`, o saldo de
+cada bucket é lido e gravado no banco, dentro de uma transação, a cada consumo: assim, o consumo de um
+processo é descontado da cota disponível para os demais.
+
+O banco também registra, por processo, o número de requisições interativas aguardando cota em cada
+provedor, de modo que um processo em lote ceda a vez às requisições interativas de outro processo. Os
+registros não atualizados há mais de `WAITING_TTL` segundos (por exemplo, de um processo encerrado
+abruptamente) são desconsiderados.
+
+Falhas no acesso ao banco nunca interrompem a aplicação: se o banco não puder ser criado ou estiver
+indisponível, as cotas passam a ser controladas apenas no processo atual.
+
+Classes:
+    QuotaStore: Classe responsável pelo armazenamento do estado compartilhado das cotas.
+
+Dependências:
+    - services.cache.sqlite_cache: Para o diretório padrão dos bancos da aplicação.
+    - sqlite3: biblioteca padrão para acesso a bancos de dados SQLite.
+    - threading: biblioteca padrão para conexões por thread.
+    - os: biblioteca padrão para o identificador do processo.
+    - time: biblioteca padrão para manipulação de tempo.
+    - typing: biblioteca padrão para anotações de tipos.
+
+Exemplo de Uso:
+    >>> from services.api.quota_manager import QuotaManager
+    >>> from services.api.quota_store import QuotaStore
+    >>> quotas = QuotaManager(store=QuotaStore())
+    >>> quotas.set_limit('openai', 'requests', 500, 60)
+    >>> quotas.acquire('openai:gpt-4o', {'requests': 1})  # Descontado também dos demais processos
+    True
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from services.cache.sqlite_cache import SqliteCache
+
+# Tempo, em segundos, após o qual o registro de requisições interativas em espera de um processo é
+# desconsiderado, se não for atualizado
+WAITING_TTL = 5.0
+
+
+class QuotaStore:
+    """
+    Estado das cotas compartilhado entre processos, em um banco SQLite em modo WAL.
+
+    Atributos:
+        enabled (bool): Indica se o banco foi inicializado e o estado está sendo compartilhado.
+
+    Métodos:
+        update(keys: List[str], function) ⇾ Any:
+            Executa uma função sobre o estado dos buckets informados, em uma transação exclusiva.
+
+        set_waiting(provider: str, count: int) ⇾ None:
+            Registra o número de requisições interativas do processo atual aguardando cota no provedor.
+
+        others_waiting(provider: str) ⇾ int:
+            Retorna o número de requisições interativas de outros processos aguardando cota no provedor.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, busy_timeout: float = 5.0):
+        """
+        Inicializa a instância do QuotaStore.
+
+        Parâmetros:
+            db_path (str, optional): Caminho do banco SQLite. Por padrão, `quotas.sqlite3` no diretório de
+                cache da aplicação.
+            busy_timeout (float): Tempo máximo de espera, em segundos, por um bloqueio do banco.
+        """
+        self.db_path = db_path or SqliteCache.default_path('quotas.sqlite3')
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+            self._init_schema()
+            self.enabled = True
+        except (sqlite3.Error, OSError):
+            self.enabled = False
+
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Retorna a conexão SQLite da thread atual, criando-a se necessário.
+
+        Retorna:
+            sqlite3.Connection: Conexão em modo autocommit, com WAL habilitado.
+        """
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.db_path, timeout=self.busy_timeout, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+        return connection
+
+    def _init_schema(self) -> None:
+        """
+        Cria as tabelas dos buckets e das requisições em espera, caso ainda não existam.
+        """
+        connection = self._connection()
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS buckets ('
+            ' key TEXT PRIMARY KEY,'
+            ' available REAL NOT NULL,'
+            ' updated_at REAL NOT NULL)'
+        )
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS waiting ('
+            ' provider TEXT NOT NULL,'
+            ' pid INTEGER NOT NULL,'
+            ' count INTEGER NOT NULL,'
+            ' updated_at REAL NOT NULL,'
+            ' PRIMARY KEY (provider, pid))'
+        )
+
+    def update(self, keys: List[str],
+               function: Callable[[Optional[Dict[str, Tuple[float, float]]]],
+                                  Tuple[Any, Dict[str, Tuple[float, float]]]]) -> Any:
+        """
+        Executa uma função sobre o estado dos buckets informados, em uma transação exclusiva.
+
+        A função recebe o estado armazenado de cada bucket (saldo e instante da última reposição, em
+        `time.time`), ou `None` se o banco estiver indisponível, e retorna o seu resultado e o novo estado
+        dos buckets, gravado antes do fim da transação. Enquanto a transação estiver aberta, os demais
+        processos aguardam para consumir as mesmas cotas.
+
+        Parâmetros:
+            keys (List[str]): As chaves dos buckets.
+            function (Callable): A função descrita acima.
+
+        Retorna:
+            Any: O resultado da função.
+        """
+        if not self.enabled:
+            return function(None)[0]
+        try:
+            connection = self._connection()
+            connection.execute('BEGIN IMMEDIATE')
+        except sqlite3.Error:
+            return function(None)[0]
+
+        try:
+            placeholders = ', '.join('?' * len(keys))
+            rows = connection.execute(
+                f'SELECT key, available, updated_at FROM buckets WHERE key IN ({placeholders})', keys
+            ).fetchall()
+        except sqlite3.Error:
+            self._rollback(connection)
+            return function(None)[0]
+
+        result, states = function({key: (available, updated_at) for key, available, updated_at in rows})
+        try:
+            connection.executemany(
+                'INSERT OR REPLACE INTO buckets (key, available, updated_at) VALUES (?, ?, ?)',
+                [(key, available, updated_at) for key, (available, updated_at) in states.items()]
+            )
+            connection.execute('COMMIT')
+        except sqlite3.Error:
+            # O consumo já foi aplicado localmente; apenas deixa de ser compartilhado
+            self._rollback(connection)
+        return result
+
+    @staticmethod
+    def _rollback(connection: sqlite3.Connection) -> None:
+        """
+        Desfaz a transação em andamento, ignorando erros.
+        """
+        try:
+            connection.execute('ROLLBACK')
+        except sqlite3.Error:
+            pass
+
+    def set_waiting(self, provider: str, count: int) -> None:
+        """
+        Registra o número de requisições interativas do processo atual aguardando cota no provedor.
+
+        Parâmetros:
+            provider (str): O provedor, possivelmente qualificado.
+            count (int): O número de requisições em espera (0 remove o registro).
+        """
+        if not self.enabled:
+            return
+        try:
+            connection = self._connection()
+            if count > 0:
+                connection.execute(
+                    'INSERT OR REPLACE INTO waiting (provider, pid, count, updated_at) VALUES (?, ?, ?, ?)',
+                    (provider, os.getpid(), count, time.time())
+                )
+            else:
+                connection.execute('DELETE FROM waiting WHERE provider = ? AND pid = ?', (provider, os.getpid()))
+        except sqlite3.Error:
+            pass
+
+    def others_waiting(self, provider: str) -> int:
+        """
+        Retorna o número de requisições interativas de outros processos aguardando cota no provedor.
+
+        Parâmetros:
+            provider (str): O provedor, possivelmente qualificado.
+
+        Retorna:
+            int: O total de requisições em espera registradas nos últimos `WAITING_TTL` segundos.
+        """
+        if not self.enabled:
+            return 0
+        try:
+            row = self._connection().execute(
+                'SELECT COALESCE(SUM(count), 0) FROM waiting WHERE provider = ? AND pid != ? AND updated_at > ?',
+                (provider, os.getpid(), time.time() - WAITING_TTL)
+            ).fetchone()
+            return int(row[0])
+        except sqlite3.Error:
+            return 0
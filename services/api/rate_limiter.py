@@ -0,0 +1,165 @@
+# services/api/rate_limiter.py
+
+"""
+Rate Limiter Module
+===================
+
+Este módulo fornece um limitador de taxa do lado do cliente, baseado em token bucket,
+cuja taxa se adapta às respostas da API segundo a política AIMD (Additive Increase,
+Multiplicative Decrease): cada chamada bem-sucedida aumenta a taxa de forma aditiva e
+cada erro de throttling a reduz de forma multiplicativa. Dessa forma, a vazão se
+mantém próxima da cota da conta, sem oscilar entre ociosidade e rajadas de erros.
+
+Várias chamadas simultâneas costumam receber o throttling ao mesmo tempo; para que elas
+não reduzam a taxa uma vez cada, no máximo uma redução é aplicada a cada janela de
+`decrease_cooldown` segundos.
+
+Classes:
+    AdaptiveRateLimiter: Classe responsável pelo controle adaptativo da taxa de requisições.
+
+Dependências:
+    - threading: biblioteca padrão para sincronização entre threads.
+    - time: biblioteca padrão para manipulação de tempo.
+    - typing: biblioteca padrão para anotações de tipos.
+
+Exemplo de Uso:
+    >>> from services.api.rate_limiter import AdaptiveRateLimiter
+    >>> limiter = AdaptiveRateLimiter(rate=5.0)
+    >>> if limiter.acquire(timeout=10):
+    ...     try:
+    ...         resposta = chamar_api()
+    ...         limiter.on_success()
+    ...     except ThrottlingException:
+    ...         limiter.on_throttle()
+"""
+
+import threading
+import time
+from typing import Optional
+
+
+class AdaptiveRateLimiter:
+    """
+    Limitador de taxa com token bucket e adaptação AIMD.
+
+    Os tokens são repostos continuamente à taxa atual (requisições por segundo), até o
+    limite de `burst` tokens acumulados. Cada requisição consome um token.
+
+    Métodos:
+        acquire(timeout: Optional[float] = None) ⇾ bool:
+            Aguarda até que um token esteja disponível e o consome.
+
+        on_success() ⇾ None:
+            Aumenta a taxa de forma aditiva após uma chamada bem-sucedida.
+
+        on_throttle() ⇾ None:
+            Reduz a taxa de forma multiplicativa após um erro de throttling.
+    """
+
+    def __init__(self, rate: float = 10.0, min_rate: float = 0.5, max_rate: float = 100.0,
+                 burst: Optional[float] = None, increase_step: float = 1.0, decrease_factor: float = 0.5,
+                 decrease_cooldown: float = 1.0):
+        """
+        Inicializa a instância do AdaptiveRateLimiter.
+
+        Parâmetros:
+            rate (float): Taxa inicial, em requisições por segundo.
+            min_rate (float): Taxa mínima, mesmo após sucessivos erros de throttling.
+            max_rate (float): Taxa máxima, mesmo após sucessivas chamadas bem-sucedidas.
+            burst (float, optional): Número máximo de tokens acumulados. Por padrão, igual à taxa atual.
+            increase_step (float): Aumento aproximado da taxa, em requisições por segundo, a cada
+                segundo de chamadas bem-sucedidas na taxa atual.
+            decrease_factor (float): Fator aplicado à taxa a cada erro de throttling (entre 0 e 1).
+            decrease_cooldown (float): Intervalo mínimo, em segundos, entre duas reduções da taxa. Erros de
+                throttling dentro da janela apenas descartam os tokens acumulados.
+
+        Exceções:
+            - ValueError: se os limites de taxa ou o fator de redução forem inválidos.
+        """
+        if not 0 < min_rate <= rate <= max_rate:
+            raise ValueError("As taxas devem satisfazer 0 < min_rate <= rate <= max_rate.")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("O fator de redução deve estar entre 0 e 1.")
+
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.decrease_cooldown = decrease_cooldown
+        self._last_decrease_at = None
+        self._tokens = self._capacity()
+        self._updated_at = time.monotonic()
+        self._condition = threading.Condition()
+
+    def _capacity(self) -> float:
+        """
+        Retorna o número máximo de tokens acumulados.
+
+        Retorna:
+            float: O valor de `burst`, ou a taxa atual (no mínimo 1) se `burst` não foi definido.
+        """
+        return self.burst if self.burst is not None else max(1.0, self.rate)
+
+    def _refill(self) -> None:
+        """
+        Repõe os tokens proporcionalmente ao tempo decorrido desde a última reposição.
+        """
+        now = time.monotonic()
+        self._tokens = min(self._capacity(), self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Aguarda até que um token esteja disponível e o consome.
+
+        Parâmetros:
+            timeout (float, optional): Tempo máximo de espera, em segundos. Por padrão, aguarda indefinidamente.
+
+        Retorna:
+            bool: `True` se o token foi obtido, `False` se o tempo de espera se esgotou.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+
+                wait_time = (1 - self._tokens) / self.rate
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    wait_time = min(wait_time, remaining)
+                self._condition.wait(wait_time)
+
+    def on_success(self) -> None:
+        """
+        Aumenta a taxa de forma aditiva após uma chamada bem-sucedida.
+
+        O incremento por chamada é `increase_step / rate`, de modo que a taxa cresce cerca de
+        `increase_step` requisições por segundo a cada segundo de operação sem throttling.
+        """
+        with self._condition:
+            self._refill()
+            self.rate = min(self.max_rate, self.rate + self.increase_step / self.rate)
+            self._condition.notify_all()
+
+    def on_throttle(self) -> None:
+        """
+        Reduz a taxa de forma multiplicativa após um erro de throttling.
+
+        A redução é aplicada no máximo uma vez a cada `decrease_cooldown` segundos, de modo que as
+        chamadas em andamento rejeitadas pela mesma sobrecarga reduzam a taxa uma única vez. Os tokens
+        acumulados são sempre descartados, evitando uma nova rajada imediata.
+        """
+        with self._condition:
+            self._refill()
+            now = time.monotonic()
+            if self._last_decrease_at is None or now - self._last_decrease_at >= self.decrease_cooldown:
+                self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+                self._last_decrease_at = now
+            self._tokens = min(self._tokens, 0.0)
@@ -0,0 +1,157 @@
+# services/cache/completion_cache.py
+
+"""
+Completion Cache Module
+=======================
+
+Este módulo fornece um cache persistente das respostas da API OpenAI. Cada resposta é
+indexada por um hash das mensagens enviadas, do modelo e de todos os parâmetros de
+amostragem, de modo que reprocessar um documento com as mesmas opções (após uma
+falha, ou para exportá-lo em outro formato) não consome tokens nem tempo de espera.
+
+Classes:
+    CompletionCache: Classe responsável pelo armazenamento das respostas da OpenAI.
+
+Dependências:
+    - services.cache.sqlite_cache: Para o armazenamento persistente em SQLite.
+    - hashlib: biblioteca padrão para geração das chaves.
+    - json: biblioteca padrão para a serialização canônica das requisições.
+    - typing: biblioteca padrão para anotações de tipos.
+
+Exemplo de Uso:
+    >>> from services.cache.completion_cache import CompletionCache
+    >>> cache = CompletionCache()
+    >>> key = cache.make_key(messages, 'gpt-4o', {'temperature': 0.0, 'max_tokens': 1500})
+    >>> cache.set_completion(key, 'Texto simplificado.')
+    >>> print(cache.get_completion(key))
+    'Texto simplificado.'
+"""
+
+import hashlib
+import json
+from typing import List, Optional
+
+from services.cache.sqlite_cache import SqliteCache
+
+# Política padrão do cache de respostas
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # 256 MB
+
+# Políticas de reutilização das respostas armazenadas
+CACHE_POLICY_DETERMINISTIC = 'deterministic'  # Apenas requisições com temperature igual a 0
+CACHE_POLICY_ALWAYS = 'always'  # Qualquer requisição, independentemente da temperatura
+CACHE_POLICIES = (CACHE_POLICY_DETERMINISTIC, CACHE_POLICY_ALWAYS)
+
+
+class CompletionCache(SqliteCache):
+    """
+    Cache persistente de respostas da API OpenAI, indexado pela requisição completa.
+
+    Métodos:
+        make_key(messages: List[dict], model: str, params: dict) ⇾ str:
+            Gera a chave de cache para uma requisição.
+
+        get_completion(key: str) ⇾ Optional[str]:
+            Retorna a resposta armazenada para a chave, se existir.
+
+        set_completion(key: str, content: str) ⇾ None:
+            Armazena uma resposta no cache.
+
+        get_completions(key: str) ⇾ Optional[List[str]]:
+            Retorna as respostas de uma requisição com várias opções (`n`), se existirem.
+
+        set_completions(key: str, contents: List[str]) ⇾ None:
+            Armazena as respostas de uma requisição com várias opções (`n`).
+    """
+
+    def __init__(self, db_path: Optional[str] = None, max_entries: Optional[int] = None,
+                 max_bytes: Optional[int] = DEFAULT_MAX_BYTES, ttl_seconds: Optional[float] = None):
+        """
+        Inicializa a instância do CompletionCache.
+
+        Parâmetros:
+            db_path (str, optional): Caminho do banco SQLite. Por padrão, `completions.sqlite3`
+                no diretório de cache da aplicação.
+            max_entries (int, optional): Número máximo de respostas mantidas.
+            max_bytes (int, optional): Tamanho máximo, em bytes, das respostas armazenadas.
+            ttl_seconds (float, optional): Tempo de vida de cada resposta, em segundos.
+        """
+        super().__init__(
+            db_path or self.default_path('completions.sqlite3'),
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            ttl_seconds=ttl_seconds
+        )
+
+    @staticmethod
+    def make_key(messages: List[dict], model: str, params: dict) -> str:
+        """
+        Gera a chave de cache para uma requisição.
+
+        A serialização é canônica (chaves ordenadas), de modo que requisições equivalentes
+        produzem sempre a mesma chave.
+
+        Parâmetros:
+            messages (List[dict]): As mensagens enviadas à API.
+            model (str): O modelo da OpenAI.
+            params (dict): Os parâmetros de amostragem (temperature, max_tokens, top_p, etc.).
+
+        Retorna:
+            str: O hash SHA-256 hexadecimal da requisição.
+        """
+        payload = json.dumps(
+            {'messages': messages, 'model': model, 'params': params},
+            ensure_ascii=False, sort_keys=True, separators=(',', ':')
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get_completion(self, key: str) -> Optional[str]:
+        """
+        Retorna a resposta armazenada para a chave.
+
+        Parâmetros:
+            key (str): A chave gerada por `make_key`.
+
+        Retorna:
+            Optional[str]: A resposta armazenada, ou `None` se ausente.
+        """
+        value = self.get(key)
+        return value.decode('utf-8') if value is not None else None
+
+    def set_completion(self, key: str, content: str) -> None:
+        """
+        Armazena uma resposta no cache.
+
+        Parâmetros:
+            key (str): A chave gerada por `make_key`.
+            content (str): O conteúdo da resposta.
+        """
+        self.set(key, content.encode('utf-8'))
+
+    def get_completions(self, key: str) -> Optional[List[str]]:
+        """
+        Retorna as respostas armazenadas de uma requisição com várias opções (`n`).
+
+        Parâmetros:
+            key (str): A chave gerada por `make_key`, com `n` entre os parâmetros.
+
+        Retorna:
+            Optional[List[str]]: As respostas, na ordem das opções, ou `None` se ausentes ou ilegíveis.
+        """
+        value = self.get(key)
+        if value is None:
+            return None
+        try:
+            contents = json.loads(value.decode('utf-8'))
+        except (UnicodeDecodeError, ValueError):
+            return None
+        return contents if isinstance(contents, list) else None
+
+    def set_completions(self, key: str, contents: List[str]) -> None:
+        """
+        Armazena as respostas de uma requisição com várias opções (`n`).
+
+        Parâmetros:
+            key (str): A chave gerada por `make_key`, com `n` entre os parâmetros.
+            contents (List[str]): As respostas, na ordem das opções.
+        """
+        self.set(key, json.dumps(contents, ensure_ascii=False).encode('utf-8'))
@@ -0,0 +1,248 @@
+# services/cache/extraction_cache.py
+
+"""
+Extraction Cache Module
+=======================
+
+Este módulo fornece um cache persistente dos textos extraídos dos documentos importados, compartilhado
+entre execuções e entre processos. Cada texto é indexado por um hash SHA-256 do conteúdo do arquivo e
+pela versão do extrator que o produziu, de modo que reimportar um documento (ao reprocessar um lote ou
+ao abri-lo novamente na interface) não repete a extração. O mesmo arquivo com outro nome ou caminho é
+reaproveitado, e uma nova versão do extrator invalida os textos extraídos pelas anteriores.
+
+Para que uma reimportação não precise nem mesmo ler o arquivo inteiro, o tamanho e o instante de
+modificação de cada caminho já visto são associados ao hash do seu conteúdo. Os metadados e o hash de um
+arquivo são obtidos uma única vez por importação (`FileFingerprint`) e reaproveitados na consulta e no
+armazenamento do texto. Os textos são armazenados comprimidos com zlib, e o tamanho total do cache é
+limitado com a remoção dos itens menos recentemente utilizados.
+
+Classes:
+    FileFingerprint: Identificação de um arquivo (caminho, tamanho, modificação e hash do conteúdo).
+    ExtractionCache: Classe responsável pelo armazenamento dos textos extraídos.
+
+Dependências:
+    - services.cache.sqlite_cache: Para o armazenamento persistente em SQLite.
+    - hashlib: biblioteca padrão para o hash do conteúdo dos arquivos.
+    - os: biblioteca padrão para os metadados dos arquivos.
+    - zlib: biblioteca padrão para a compressão dos textos.
+    - typing: biblioteca padrão para anotações de tipos.
+
+Exemplo de Uso:
+    >>> from services.cache.extraction_cache import ExtractionCache
+    >>> cache = ExtractionCache()
+    >>> arquivo = cache.fingerprint('artigo.pdf')
+    >>> print(cache.get_text(arquivo, 'pypdf2-3.0.1'))
+    None
+    >>> cache.set_text(arquivo, 'pypdf2-3.0.1', 'Texto extraído.')
+    >>> print(cache.get_text('artigo.pdf', 'pypdf2-3.0.1'))
+    'Texto extraído.'
+"""
+
+import hashlib
+import os
+import zlib
+from typing import Optional, Union
+
+from services.cache.sqlite_cache import SqliteCache
+
+# Política padrão do cache de extrações (tamanho dos textos comprimidos)
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024  # 512 MB
+
+# Nível de compressão dos textos (1 a 9)
+COMPRESSION_LEVEL = 6
+# Tamanho dos blocos lidos no cálculo do hash dos arquivos
+HASH_CHUNK_BYTES = 1024 * 1024
+
+
+class FileFingerprint:
+    """
+    Identificação de um arquivo no cache de extrações. O tamanho e o instante de modificação são obtidos na
+    criação; o hash do conteúdo é calculado apenas quando necessário, uma única vez.
+
+    Atributos:
+        path (str): O caminho absoluto do arquivo.
+        size (int): O tamanho do arquivo, em bytes.
+        mtime_ns (int): O instante de modificação do arquivo, em nanossegundos.
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Inicializa a instância do FileFingerprint com os metadados atuais do arquivo.
+
+        Parâmetros:
+            file_path (str): Caminho do arquivo.
+
+        Exceções:
+            - OSError: se os metadados do arquivo não puderem ser obtidos.
+        """
+        stat = os.stat(file_path)
+        self.path = os.path.abspath(file_path)
+        self.size = stat.st_size
+        self.mtime_ns = stat.st_mtime_ns
+        self._digest: Optional[str] = None
+
+    @property
+    def digest(self) -> str:
+        """
+        O hash SHA-256 do conteúdo do arquivo, calculado no primeiro acesso.
+
+        Exceções:
+            - OSError: se o arquivo não puder ser lido.
+        """
+        if self._digest is None:
+            self._digest = ExtractionCache.file_digest(self.path)
+        return self._digest
+
+
+class ExtractionCache(SqliteCache):
+    """
+    Cache persistente de textos extraídos, indexado por (hash do conteúdo do arquivo, versão do extrator).
+
+    Os métodos de consulta e armazenamento aceitam o caminho do arquivo ou um `FileFingerprint`; com o
+    `FileFingerprint`, os metadados e o hash do arquivo são obtidos uma única vez para as duas operações.
+
+    Métodos:
+        fingerprint(file_path: str) ⇾ Optional[FileFingerprint]:
+            Retorna a identificação do arquivo, ou `None` se ele não puder ser lido.
+
+        file_digest(file_path: str) ⇾ str:
+            Calcula o hash SHA-256 do conteúdo de um arquivo.
+
+        get_text(file: str | FileFingerprint, extractor_version: str) ⇾ Optional[str]:
+            Retorna o texto armazenado para o arquivo, se existir.
+
+        set_text(file: str | FileFingerprint, extractor_version: str, text: str) ⇾ None:
+            Armazena o texto extraído de um arquivo.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, max_entries: Optional[int] = None,
+                 max_bytes: Optional[int] = DEFAULT_MAX_BYTES, ttl_seconds: Optional[float] = None):
+        """
+        Inicializa a instância do ExtractionCache.
+
+        Parâmetros:
+            db_path (str, optional): Caminho do banco SQLite. Por padrão, `extractions.sqlite3`
+                no diretório de cache da aplicação.
+            max_entries (int, optional): Número máximo de itens mantidos.
+            max_bytes (int, optional): Tamanho máximo, em bytes, dos textos comprimidos armazenados.
+            ttl_seconds (float, optional): Tempo de vida de cada texto, em segundos.
+        """
+        super().__init__(
+            db_path or self.default_path('extractions.sqlite3'),
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            ttl_seconds=ttl_seconds
+        )
+
+    @staticmethod
+    def file_digest(file_path: str) -> str:
+        """
+        Calcula o hash SHA-256 do conteúdo de um arquivo, lendo-o em blocos.
+
+        Parâmetros:
+            file_path (str): Caminho do arquivo.
+
+        Retorna:
+            str: O hash SHA-256 hexadecimal do conteúdo.
+        """
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def fingerprint(file_path: str) -> Optional[FileFingerprint]:
+        """
+        Retorna a identificação do arquivo, com os seus metadados atuais.
+
+        Parâmetros:
+            file_path (str): Caminho do arquivo.
+
+        Retorna:
+            Optional[FileFingerprint]: A identificação do arquivo, ou `None` se os metadados não puderem
+            ser obtidos.
+        """
+        try:
+            return FileFingerprint(file_path)
+        except OSError:
+            return None
+
+    @staticmethod
+    def _stat_key(fingerprint: FileFingerprint, extractor_version: str) -> str:
+        """
+        Gera a chave que associa o caminho, o tamanho e o instante de modificação do arquivo ao hash do seu
+        conteúdo.
+        """
+        return f"stat:{extractor_version}:{fingerprint.size}:{fingerprint.mtime_ns}:{fingerprint.path}"
+
+    @staticmethod
+    def _text_key(digest: str, extractor_version: str) -> str:
+        """
+        Gera a chave do texto extraído de um conteúdo por uma versão do extrator.
+        """
+        return f"text:{extractor_version}:{digest}"
+
+    def get_text(self, file: Union[str, FileFingerprint], extractor_version: str) -> Optional[str]:
+        """
+        Retorna o texto armazenado para o arquivo.
+
+        Se o caminho já foi visto com o mesmo tamanho e instante de modificação, o hash do conteúdo é
+        obtido sem ler o arquivo; caso contrário, o arquivo é lido para o cálculo do hash, que fica
+        registrado no `FileFingerprint` para o armazenamento do texto extraído.
+
+        Parâmetros:
+            file (str | FileFingerprint): O caminho ou a identificação do arquivo.
+            extractor_version (str): A versão do extrator (por exemplo, 'pypdf2-3.0.1').
+
+        Retorna:
+            Optional[str]: O texto extraído, ou `None` se ausente ou ilegível.
+        """
+        fingerprint = self.fingerprint(file) if isinstance(file, str) else file
+        if fingerprint is None or not self.enabled:
+            return None
+
+        stat_key = self._stat_key(fingerprint, extractor_version)
+        digest = self.get(stat_key)
+        if digest is not None:
+            # O arquivo não mudou desde o registro do mapeamento: o hash registrado é o do conteúdo atual
+            fingerprint._digest = digest.decode('ascii')
+            value = self.get(self._text_key(fingerprint._digest, extractor_version))
+            if value is None:
+                # O texto foi removido do cache; o mapeamento também deixa de ser útil
+                self.delete(stat_key)
+        else:
+            try:
+                digest = fingerprint.digest
+            except OSError:
+                return None
+            value = self.get(self._text_key(digest, extractor_version))
+            if value is not None:
+                # O mesmo conteúdo foi extraído por outro caminho ou antes de uma modificação sem alterações
+                self.set(stat_key, digest.encode('ascii'))
+
+        if value is None:
+            return None
+        try:
+            return zlib.decompress(value).decode('utf-8')
+        except (zlib.error, UnicodeDecodeError):
+            return None
+
+    def set_text(self, file: Union[str, FileFingerprint], extractor_version: str, text: str) -> None:
+        """
+        Armazena o texto extraído de um arquivo.
+
+        Parâmetros:
+            file (str | FileFingerprint): O caminho ou a identificação do arquivo, obtida antes da extração.
+            extractor_version (str): A versão do extrator (por exemplo, 'pypdf2-3.0.1').
+            text (str): O texto extraído.
+        """
+        fingerprint = self.fingerprint(file) if isinstance(file, str) else file
+        if fingerprint is None or not self.enabled:
+            return
+        try:
+            digest = fingerprint.digest
+        except OSError:
+            return
+        self.set(self._text_key(digest, extractor_version), zlib.compress(text.encode('utf-8'), COMPRESSION_LEVEL))
+        self.set(self._stat_key(fingerprint, extractor_version), digest.encode('ascii'))
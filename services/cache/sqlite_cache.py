@@ -0,0 +1,249 @@
+# services/cache/sqlite_cache.py
+
+"""
+SQLite Cache Module
+===================
+
+Este módulo fornece um cache chave-valor persistente em disco baseado em SQLite.
+O cache suporta expiração por tempo de vida (TTL), remoção dos itens menos
+recentemente utilizados (LRU) quando os limites de quantidade ou de tamanho são
+atingidos, e acesso simultâneo por várias threads e vários processos.
+
+Classes:
+    SqliteCache: Classe base para caches persistentes em SQLite.
+
+Dependências:
+    - sqlite3: biblioteca padrão para acesso a bancos de dados SQLite.
+    - threading: biblioteca padrão para conexões por thread.
+    - os: biblioteca padrão para interagir com o sistema operacional.
+    - time: biblioteca padrão para manipulação de tempo.
+    - typing: biblioteca padrão para anotações de tipos.
+
+Exemplo de Uso:
+    >>> from services.cache.sqlite_cache import SqliteCache
+    >>> cache = SqliteCache('/tmp/exemplo.sqlite3', max_entries=1000, ttl_seconds=3600)
+    >>> cache.set('chave', b'valor')
+    >>> print(cache.get('chave'))
+    b'valor'
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+# Diretório padrão dos caches persistentes, configurável pela variável de ambiente TRADUZAI_CACHE_DIR
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'traduzai')
+
+
+class SqliteCache:
+    """
+    Cache chave-valor persistente em SQLite, com expiração e remoção LRU.
+
+    Cada thread utiliza sua própria conexão e o banco opera em modo WAL, permitindo
+    leituras simultâneas com uma escrita em andamento. Escritas concorrentes de
+    processos diferentes aguardam o bloqueio do banco até `busy_timeout` segundos.
+
+    Falhas no acesso ao banco nunca interrompem a aplicação: uma leitura com erro é
+    tratada como ausência no cache e uma escrita com erro é descartada. Se o banco não
+    puder ser criado (diretório sem permissão de escrita, banco bloqueado), o cache é
+    desabilitado: todas as leituras são ausências e as escritas são ignoradas.
+
+    Atributos:
+        enabled (bool): Indica se o banco foi inicializado e o cache está em uso.
+
+    Métodos:
+        get(key: str) ⇾ Optional[bytes]:
+            Retorna o valor armazenado para a chave, ou `None` se ausente ou expirado.
+
+        set(key: str, value: bytes) ⇾ None:
+            Armazena o valor para a chave e aplica a política de remoção.
+
+        delete(key: str) ⇾ None:
+            Remove a chave do cache.
+
+        clear() ⇾ None:
+            Remove todos os itens do cache.
+    """
+
+    def __init__(self, db_path: str, max_entries: Optional[int] = None, max_bytes: Optional[int] = None,
+                 ttl_seconds: Optional[float] = None, busy_timeout: float = 30.0):
+        """
+        Inicializa a instância do SqliteCache.
+
+        Parâmetros:
+            db_path (str): Caminho do arquivo do banco SQLite (os diretórios são criados se necessário).
+            max_entries (int, optional): Número máximo de itens mantidos no cache.
+            max_bytes (int, optional): Tamanho máximo, em bytes, da soma dos valores armazenados.
+            ttl_seconds (float, optional): Tempo de vida de cada item, em segundos.
+            busy_timeout (float): Tempo máximo de espera, em segundos, por um bloqueio do banco.
+        """
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+
+        try:
+            directory = os.path.dirname(os.path.abspath(db_path))
+            os.makedirs(directory, exist_ok=True)
+            self._init_schema()
+            self.enabled = True
+        except (sqlite3.Error, OSError):
+            self.enabled = False
+
+    @staticmethod
+    def default_path(file_name: str) -> str:
+        """
+        Retorna o caminho padrão de um arquivo de cache.
+
+        Parâmetros:
+            file_name (str): Nome do arquivo do banco SQLite.
+
+        Retorna:
+            str: Caminho completo dentro do diretório de cache configurado.
+        """
+        cache_dir = os.getenv('TRADUZAI_CACHE_DIR', '') or DEFAULT_CACHE_DIR
+        return os.path.join(cache_dir, file_name)
+
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Retorna a conexão SQLite da thread atual, criando-a se necessário.
+
+        Retorna:
+            sqlite3.Connection: Conexão em modo autocommit, com WAL habilitado.
+        """
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.db_path, timeout=self.busy_timeout, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+        return connection
+
+    def _init_schema(self) -> None:
+        """
+        Cria a tabela e o índice do cache, caso ainda não existam.
+        """
+        connection = self._connection()
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS cache ('
+            ' key TEXT PRIMARY KEY,'
+            ' value BLOB NOT NULL,'
+            ' size INTEGER NOT NULL,'
+            ' created_at REAL NOT NULL,'
+            ' accessed_at REAL NOT NULL)'
+        )
+        connection.execute('CREATE INDEX IF NOT EXISTS cache_accessed_at ON cache (accessed_at)')
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Retorna o valor armazenado para a chave.
+
+        Um acesso bem-sucedido atualiza o instante de último uso do item (LRU).
+
+        Parâmetros:
+            key (str): A chave a ser consultada.
+
+        Retorna:
+            Optional[bytes]: O valor armazenado, ou `None` se a chave estiver ausente ou expirada.
+        """
+        if not self.enabled:
+            return None
+        try:
+            connection = self._connection()
+            row = connection.execute('SELECT value, created_at FROM cache WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+
+            value, created_at = row
+            now = time.time()
+            if self.ttl_seconds is not None and now - created_at > self.ttl_seconds:
+                connection.execute('DELETE FROM cache WHERE key = ?', (key,))
+                return None
+
+            connection.execute('UPDATE cache SET accessed_at = ? WHERE key = ?', (now, key))
+            return bytes(value)
+        except sqlite3.Error:
+            return None
+
+    def set(self, key: str, value: bytes) -> None:
+        """
+        Armazena o valor para a chave e aplica a política de remoção.
+
+        Parâmetros:
+            key (str): A chave do item.
+            value (bytes): O valor a ser armazenado.
+        """
+        if not self.enabled:
+            return
+        try:
+            connection = self._connection()
+            now = time.time()
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                connection.execute(
+                    'INSERT OR REPLACE INTO cache (key, value, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)',
+                    (key, sqlite3.Binary(value), len(value), now, now)
+                )
+                self._evict(connection, now)
+                connection.execute('COMMIT')
+            except sqlite3.Error:
+                connection.execute('ROLLBACK')
+                raise
+        except sqlite3.Error:
+            pass
+
+    def delete(self, key: str) -> None:
+        """
+        Remove a chave do cache.
+
+        Parâmetros:
+            key (str): A chave a ser removida.
+        """
+        if not self.enabled:
+            return
+        try:
+            self._connection().execute('DELETE FROM cache WHERE key = ?', (key,))
+        except sqlite3.Error:
+            pass
+
+    def clear(self) -> None:
+        """
+        Remove todos os itens do cache.
+        """
+        if not self.enabled:
+            return
+        try:
+            self._connection().execute('DELETE FROM cache')
+        except sqlite3.Error:
+            pass
+
+    def _evict(self, connection: sqlite3.Connection, now: float) -> None:
+        """
+        Remove itens expirados e, em seguida, os menos recentemente utilizados até respeitar os limites.
+
+        Parâmetros:
+            connection (sqlite3.Connection): Conexão com uma transação de escrita aberta.
+            now (float): Instante atual, em segundos desde a época.
+        """
+        if self.ttl_seconds is not None:
+            connection.execute('DELETE FROM cache WHERE created_at < ?', (now - self.ttl_seconds,))
+
+        if self.max_entries is not None:
+            connection.execute(
+                'DELETE FROM cache WHERE key IN ('
+                ' SELECT key FROM cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)',
+                (self.max_entries,)
+            )
+
+        if self.max_bytes is not None:
+            connection.execute(
+                'DELETE FROM cache WHERE key IN ('
+                ' SELECT key FROM ('
+                '  SELECT key, SUM(size) OVER (ORDER BY accessed_at DESC, key) AS total FROM cache'
+                ' ) WHERE total > ?)',
+                (self.max_bytes,)
+            )
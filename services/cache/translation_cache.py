@@ -0,0 +1,123 @@
+# services/cache/translation_cache.py
+
+"""
+Translation Cache Module
+========================
+
+Este módulo fornece um cache persistente de traduções, compartilhado entre execuções
+e entre processos. Cada tradução é indexada por um hash do texto, do idioma de
+origem e do idioma de destino, de modo que textos repetidos (rótulos da interface,
+documentos reprocessados, back-translations) não geram novas chamadas à API.
+
+Classes:
+    TranslationCache: Classe responsável pelo armazenamento das traduções.
+
+Dependências:
+    - services.cache.sqlite_cache: Para o armazenamento persistente em SQLite.
+    - hashlib: biblioteca padrão para geração das chaves.
+    - json: biblioteca padrão para serialização dos valores.
+    - typing: biblioteca padrão para anotações de tipos.
+
+Exemplo de Uso:
+    >>> from services.cache.translation_cache import TranslationCache
+    >>> cache = TranslationCache()
+    >>> cache.set_translation('Hello', 'auto', 'pt', 'Olá', 'en')
+    >>> print(cache.get_translation('Hello', 'auto', 'pt'))
+    ('Olá', 'en')
+"""
+
+import hashlib
+import json
+from typing import Optional, Tuple
+
+from services.cache.sqlite_cache import SqliteCache
+
+# Política padrão do cache de traduções
+DEFAULT_MAX_ENTRIES = 100000
+DEFAULT_TTL_SECONDS = 30 * 24 * 60 * 60  # 30 dias
+
+
+class TranslationCache(SqliteCache):
+    """
+    Cache persistente de traduções, indexado por (texto, idioma de origem, idioma de destino).
+
+    Métodos:
+        make_key(text: str, source_language_code: str, target_language_code: str) ⇾ str:
+            Gera a chave de cache para uma tradução.
+
+        get_translation(text: str, source_language_code: str, target_language_code: str) ⇾ Optional[Tuple[str, str]]:
+            Retorna a tradução armazenada e o idioma de origem detectado, se existirem.
+
+        set_translation(text: str, source_language_code: str, target_language_code: str,
+                        translated_text: str, detected_language_code: str) ⇾ None:
+            Armazena uma tradução no cache.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, max_entries: Optional[int] = DEFAULT_MAX_ENTRIES,
+                 max_bytes: Optional[int] = None, ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS):
+        """
+        Inicializa a instância do TranslationCache.
+
+        Parâmetros:
+            db_path (str, optional): Caminho do banco SQLite. Por padrão, `translations.sqlite3`
+                no diretório de cache da aplicação.
+            max_entries (int, optional): Número máximo de traduções mantidas.
+            max_bytes (int, optional): Tamanho máximo, em bytes, das traduções armazenadas.
+            ttl_seconds (float, optional): Tempo de vida de cada tradução, em segundos.
+        """
+        super().__init__(
+            db_path or self.default_path('translations.sqlite3'),
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            ttl_seconds=ttl_seconds
+        )
+
+    @staticmethod
+    def make_key(text: str, source_language_code: str, target_language_code: str) -> str:
+        """
+        Gera a chave de cache para uma tradução.
+
+        Parâmetros:
+            text (str): O texto a ser traduzido.
+            source_language_code (str): Código do idioma de origem (ou 'auto').
+            target_language_code (str): Código do idioma de destino.
+
+        Retorna:
+            str: O hash SHA-256 hexadecimal de (texto, origem, destino).
+        """
+        payload = json.dumps([text, source_language_code, target_language_code], ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get_translation(self, text: str, source_language_code: str,
+                        target_language_code: str) -> Optional[Tuple[str, str]]:
+        """
+        Retorna a tradução armazenada e o idioma de origem detectado.
+
+        Parâmetros:
+            text (str): O texto original.
+            source_language_code (str): Código do idioma de origem (ou 'auto').
+            target_language_code (str): Código do idioma de destino.
+
+        Retorna:
+            Optional[Tuple[str, str]]: Tupla (texto traduzido, idioma de origem detectado), ou `None`.
+        """
+        value = self.get(self.make_key(text, source_language_code, target_language_code))
+        if value is None:
+            return None
+        translated_text, detected_language_code = json.loads(value.decode('utf-8'))
+        return translated_text, detected_language_code
+
+    def set_translation(self, text: str, source_language_code: str, target_language_code: str,
+                        translated_text: str, detected_language_code: str) -> None:
+        """
+        Armazena uma tradução no cache.
+
+        Parâmetros:
+            text (str): O texto original.
+            source_language_code (str): Código do idioma de origem (ou 'auto').
+            target_language_code (str): Código do idioma de destino.
+            translated_text (str): O texto traduzido.
+            detected_language_code (str): O idioma de origem detectado pelo AWS Translate.
+        """
+        value = json.dumps([translated_text, detected_language_code], ensure_ascii=False).encode('utf-8')
+        self.set(self.make_key(text, source_language_code, target_language_code), value)
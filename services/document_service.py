@@ -17,14 +17,52 @@ diferentes formatos de documentos. Suporta os seguintes formatos:
     - DOCX (`.docx`)
     - TXT (`.txt`)
 
+Documentos longos podem ser lidos de forma incremental com `iter_pages` (páginas de um PDF, com seleção
+de intervalo) e `iter_paragraphs` (parágrafos de qualquer formato suportado). Os geradores extraem cada
+página apenas quando ela é solicitada, de modo que o processamento das primeiras páginas pode começar
+enquanto as seguintes ainda não foram lidas, a memória utilizada não depende do tamanho do documento e
+a leitura é interrompida assim que o consumidor deixa de iterar.
+
+EPUBs são lidos na ordem de leitura definida pelo spine, um documento (capítulo) por vez, com `iter_chapters`.
+A marcação XHTML é removida por um parser incremental, que recebe cada documento em blocos e produz os
+parágrafos à medida que são concluídos; documentos de navegação, capas, sumários, índices e demais
+documentos sem conteúdo a ser traduzido são descartados.
+
+Na importação de PDFs grandes, as páginas são divididas em intervalos extraídos simultaneamente por um
+pool de processos. Cada processo abre o arquivo de forma independente, com leitura mapeada em memória
+(mmap), e os textos são reunidos na ordem das páginas. O pool é criado na primeira importação paralela e
+reutilizado pelas seguintes até `close`; os processos são iniciados com o método 'spawn' (um interpretador
+novo, sem copiar o processo atual), de modo que o pool pode ser criado com segurança a partir de qualquer
+thread, inclusive com a interface gráfica em execução. Ao cancelar uma importação, os intervalos ainda não
+iniciados são descartados e a chamada retorna sem aguardar os intervalos em extração.
+
+O texto dos PDFs é extraído por um dos motores de `services.pdf_engines` (PyPDF2 por padrão; pypdfium2 e
+pdfminer.six quando instalados), escolhido na criação do serviço, por chamada ou pela variável de ambiente
+TRADUZAI_PDF_ENGINE.
+
+Os textos importados de PDFs, DOCX e EPUBs são armazenados em um cache persistente (`ExtractionCache`),
+indexado pelo conteúdo do arquivo e pela versão do extrator: reimportar um documento não alterado retorna
+o texto já extraído, sem a análise do arquivo. O cache é aberto na primeira importação que o utiliza; se o
+banco não puder ser criado ou aberto, o serviço segue sem cache (e sem calcular o hash dos arquivos).
+
+A importação e a exportação podem ser interrompidas por um `CancellationToken`, verificado entre as páginas
+(ou intervalos de páginas), os capítulos e as linhas escritas; nenhum arquivo parcial é gravado.
+
 Classes:
     DocumentService: Classe responsável pela importação e exportação de documentos.
 
 Dependências:
-    - PyPDF2: biblioteca para manipulação de arquivos PDF.
+    - services.pdf_engines: motores de extração de texto de PDFs.
+    - services.cache.extraction_cache: Para o cache persistente dos textos extraídos.
+    - services.task_service: Para o cancelamento cooperativo da importação e da exportação.
     - python-docx: biblioteca para manipulação de arquivos DOCX.
-    - EbookLib: biblioteca para manipulação de arquivos EPUB.
+    - lxml: biblioteca para a leitura incremental dos documentos XHTML e dos arquivos de controle dos EPUBs.
     - reportlab: biblioteca para geração de PDFs.
+    - re: biblioteca padrão para a separação dos parágrafos.
+    - zipfile, posixpath, itertools, urllib.parse: bibliotecas padrão para a leitura dos EPUBs.
+    - concurrent.futures, multiprocessing, threading: bibliotecas padrão para o pool de processos da extração
+      paralela das páginas de PDFs grandes.
+    - importlib.metadata: biblioteca padrão para a versão das bibliotecas de extração.
     - typing: biblioteca padrão para anotações de tipos.
 
 Exemplo de Uso:
@@ -34,20 +72,166 @@ Exemplo de Uso:
     # Importar um documento
     >>> texto = doc_service.import_document('exemplo.pdf')
 
+    # Ler as páginas 3 a 5 de um PDF, uma por vez
+    >>> for pagina in doc_service.iter_pages('exemplo.pdf', first_page=3, last_page=5):
+    ...     print(len(pagina))
+
+    # Extrair um PDF com outro motor
+    >>> texto = doc_service.import_document('exemplo.pdf', engine='pdfium')
+
+    # Ler os capítulos de um EPUB, na ordem de leitura
+    >>> for capitulo in doc_service.iter_chapters('livro.epub'):
+    ...     print(capitulo[:80])
+
+    # Ler os parágrafos de um documento
+    >>> for paragrafo in doc_service.iter_paragraphs('exemplo.pdf'):
+    ...     print(paragrafo)
+
     # Exportar um documento
     >>> doc_service.export_document(texto, 'saida.docx', 'docx')
+
+    # Encerrar o pool de processos da extração paralela
+    >>> doc_service.close()
 """
 
-from typing import Optional
+from concurrent.futures import ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from importlib import metadata
+from itertools import groupby
+from typing import IO, Iterator, List, Optional, Tuple
+from urllib.parse import unquote
+import multiprocessing
 import os
+import posixpath
+import re
+import sqlite3
+import threading
+import zipfile
 
-import PyPDF2  # Para PDFs
 from docx import Document  # Para DOCX
-from ebooklib import epub  # Para EPUB
+from lxml import etree  # Para EPUB
 
 from reportlab.lib.pagesizes import letter  # Para exportar PDFs
 from reportlab.pdfgen import canvas
 
+from services.cache.extraction_cache import ExtractionCache, FileFingerprint
+from services.pdf_engines import PdfEngine, get_engine  # Para PDFs
+from services.task_service import CancellationToken, OperationCancelledError
+
+# Separador de parágrafos: uma ou mais linhas em branco
+PARAGRAPH_SEPARATOR = re.compile(r'\n\s*\n')
+
+# Caracteres que encerram um parágrafo; um parágrafo sem eles no fim de uma página continua na seguinte
+PARAGRAPH_TERMINATORS = ('.', '!', '?', ':', ';', '"', '”', ')')
+
+# Em PDFs, uma linha com pontuação final mais curta que esta fração da linha mais longa da página
+# encerra o parágrafo
+PDF_SHORT_LINE_RATIO = 0.8
+
+# Número mínimo de páginas de um PDF para que a extração seja dividida entre processos
+DEFAULT_PARALLEL_MIN_PAGES = 16
+# Número de intervalos de páginas por processo, para equilibrar páginas com custos de extração diferentes
+SHARDS_PER_PROCESS = 2
+# Intervalo, em segundos, entre as verificações de cancelamento enquanto um intervalo de páginas é extraído
+CANCELLATION_POLL_INTERVAL = 0.1
+
+# Versão da extração de texto; incrementada quando a extração de algum formato é alterada, para que os
+# textos armazenados no cache pelas versões anteriores deixem de ser utilizados
+EXTRACTION_VERSION = 2
+# Bibliotecas de extração dos formatos sem motores, cuja versão compõe a chave do cache
+EXTRACTION_PACKAGES = {'.docx': 'python-docx', '.epub': 'lxml'}
+
+# Namespaces dos arquivos de controle dos EPUBs
+EPUB_NAMESPACES = {
+    'container': 'urn:oasis:names:tc:opendocument:xmlns:container',
+    'opf': 'http://www.idpf.org/2007/opf'
+}
+# Tipos de documento (guide do EPUB 2) e de seção (epub:type do EPUB 3) sem conteúdo a ser traduzido
+EPUB_BOILERPLATE_TYPES = frozenset({
+    'cover', 'toc', 'landmarks', 'page-list', 'loi', 'lot', 'index', 'copyright-page', 'colophon'
+})
+# Tipos de mídia dos documentos de conteúdo do spine
+EPUB_DOCUMENT_TYPES = ('application/xhtml+xml', 'text/html')
+# Elementos XHTML cujo conteúdo é descartado
+XHTML_SKIPPED_TAGS = frozenset({'head', 'script', 'style', 'nav', 'svg', 'math', 'template'})
+# Elementos XHTML que encerram o parágrafo em andamento
+XHTML_BLOCK_TAGS = frozenset({
+    'address', 'article', 'aside', 'blockquote', 'body', 'caption', 'dd', 'div', 'dl', 'dt', 'figcaption',
+    'figure', 'footer', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'li', 'ol', 'p', 'pre', 'section',
+    'table', 'td', 'th', 'tr', 'ul'
+})
+# Marcador das quebras de linha (<br>) dentro de um parágrafo, preservadas na normalização dos espaços
+XHTML_LINE_BREAK = '\u2028'
+# Tamanho dos blocos de cada documento XHTML entregues ao parser
+EPUB_READ_CHUNK_BYTES = 64 * 1024
+
+
+def _extract_pdf_pages(file_path: str, first_page: int, last_page: int, engine_name: str) -> List[str]:
+    """
+    Extrai o texto de um intervalo de páginas de um PDF. Executada nos processos do pool de extração.
+
+    Parâmetros:
+        file_path (str): Caminho para o arquivo PDF.
+        first_page (int): A primeira página do intervalo (a partir de 1).
+        last_page (int): A última página do intervalo (inclusive).
+        engine_name (str): O nome do motor de extração.
+
+    Retorna:
+        List[str]: O texto de cada página do intervalo.
+    """
+    return list(DocumentService._iter_pdf_pages(file_path, first_page, last_page, get_engine(engine_name)))
+
+
+class _XhtmlTextTarget:
+    """
+    Alvo do parser incremental de XHTML: acumula o texto dos elementos e produz um parágrafo a cada
+    elemento de bloco, descartando a marcação, os elementos sem texto de leitura e as seções de navegação.
+    Quebras de linha (<br>) são mantidas dentro do parágrafo.
+    """
+
+    def __init__(self):
+        self.paragraphs = []
+        self._parts = []
+        self._skip_depth = 0
+
+    def start(self, tag, attrib) -> None:
+        tag = etree.QName(tag).localname.lower() if isinstance(tag, str) else ''
+        # O atributo epub:type aparece com o prefixo (parser HTML) ou com o namespace (parser XML)
+        types = set(' '.join(value for key, value in attrib.items() if key.endswith('type') and key != 'type').split())
+        if self._skip_depth or tag in XHTML_SKIPPED_TAGS or types & EPUB_BOILERPLATE_TYPES:
+            self._skip_depth += 1
+        elif tag in XHTML_BLOCK_TAGS:
+            self._flush()
+        elif tag == 'br':
+            self._parts.append(XHTML_LINE_BREAK)
+
+    def end(self, tag) -> None:
+        if self._skip_depth:
+            self._skip_depth -= 1
+        elif (etree.QName(tag).localname.lower() if isinstance(tag, str) else '') in XHTML_BLOCK_TAGS:
+            self._flush()
+
+    def data(self, text: str) -> None:
+        if not self._skip_depth:
+            self._parts.append(text)
+
+    def close(self) -> None:
+        self._flush()
+
+    def pop_paragraphs(self) -> List[str]:
+        """
+        Retorna e descarta os parágrafos concluídos até o momento.
+        """
+        paragraphs, self.paragraphs = self.paragraphs, []
+        return paragraphs
+
+    def _flush(self) -> None:
+        lines = (' '.join(line.split()) for line in ''.join(self._parts).split(XHTML_LINE_BREAK))
+        text = '\n'.join(line for line in lines if line)
+        if text:
+            self.paragraphs.append(text)
+        self._parts = []
+
 
 class DocumentService:
     """
@@ -58,29 +242,108 @@ class DocumentService:
     manipulação de diferentes formatos de arquivos.
 
     Métodos:
-        import_document(file_path: str) ⇾ Optional[str]:
+        import_document(file_path: str, engine: Optional[str] = None,
+                        cancellation_token: Optional[CancellationToken] = None) ⇾ Optional[str]:
             Importa texto de um arquivo de documento.
 
+        iter_pages(file_path: str, first_page: int = 1, last_page: Optional[int] = None,
+                   engine: Optional[str] = None) ⇾ Iterator[str]:
+            Produz o texto de cada página de um PDF, no intervalo informado.
+
+        iter_paragraphs(file_path: str, first_page: int = 1, last_page: Optional[int] = None,
+                        engine: Optional[str] = None) ⇾ Iterator[str]:
+            Produz os parágrafos de um documento, na ordem de leitura.
+
+        iter_chapters(file_path: str) ⇾ Iterator[str]:
+            Produz o texto de cada capítulo de um EPUB, na ordem de leitura.
+
         export_document(text: str, file_path: str, format: str, metrics_original: dict = None,
-                        metrics_simplified: dict = None, bleu_score: float = None) ⇾ None:
+                        metrics_simplified: dict = None, bleu_score: float = None,
+                        cancellation_token: Optional[CancellationToken] = None) ⇾ None:
             Exporta texto para um arquivo de documento, incluindo o BLEU Score.
+
+        close() ⇾ None:
+            Encerra o pool de processos da extração paralela, se ele tiver sido criado.
     """
 
-    def import_document(self, file_path: str) -> Optional[str]:
+    def __init__(self, processes: Optional[int] = None, parallel_min_pages: int = DEFAULT_PARALLEL_MIN_PAGES,
+                 pdf_engine: Optional[str] = None, cache: Optional[ExtractionCache] = None, use_cache: bool = True):
+        """
+        Inicializa a instância do DocumentService.
+
+        Parâmetros:
+            processes (int, optional): Número de processos da extração paralela de PDFs. Por padrão, o número
+                de núcleos da máquina; com 1, a extração é sempre feita no processo atual.
+            parallel_min_pages (int): Número mínimo de páginas de um PDF para que a extração seja paralela.
+            pdf_engine (str, optional): O motor de extração de PDFs utilizado quando nenhum é informado na
+                chamada. Por padrão, a variável de ambiente TRADUZAI_PDF_ENGINE, ou 'pypdf2' na sua ausência.
+            cache (ExtractionCache, optional): Cache de textos extraídos a ser utilizado. Por padrão, o cache
+                persistente da aplicação, aberto na primeira importação.
+            use_cache (bool): Indica se os textos importados devem ser consultados e armazenados no cache.
+
+        Exceções:
+            - ValueError: se o motor de extração for desconhecido ou não estiver instalado.
+        """
+        self.processes = max(1, processes or os.cpu_count() or 1)
+        self.parallel_min_pages = parallel_min_pages
+        self.pdf_engine = get_engine(pdf_engine)
+        self.use_cache = use_cache
+        self._cache = cache
+        self._cache_lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    @property
+    def cache(self) -> Optional[ExtractionCache]:
+        """
+        O cache de textos extraídos, criado no primeiro acesso. `None` se o cache estiver desativado ou se o
+        banco não puder ser utilizado; nesse caso, o serviço deixa de utilizá-lo.
+        """
+        if not self.use_cache:
+            return None
+        with self._cache_lock:
+            if self._cache is None:
+                try:
+                    self._cache = ExtractionCache()
+                except (sqlite3.Error, OSError):
+                    self._cache = None
+            if self._cache is None or not self._cache.enabled:
+                self.use_cache = False
+                self._cache = None
+            return self._cache
+
+    def close(self) -> None:
+        """
+        Encerra o pool de processos da extração paralela, se ele tiver sido criado, descartando os intervalos
+        ainda não iniciados. Uma nova importação paralela cria outro pool.
+        """
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def import_document(self, file_path: str, engine: Optional[str] = None,
+                        cancellation_token: Optional[CancellationToken] = None) -> Optional[str]:
         """
         Importa texto de um arquivo de documento.
 
         Este metodo determina o tipo de arquivo com base na extensão e utiliza o metodo
-        apropriado para extrair o texto.
+        apropriado para extrair o texto. Os textos de PDFs, DOCX e EPUBs são consultados e
+        armazenados no cache de extrações; arquivos TXT são sempre lidos diretamente.
 
         Parâmetros:
             file_path (str): Caminho para o arquivo de documento a ser importado.
+            engine (str, optional): O motor de extração de PDFs. Por padrão, o motor do serviço.
+            cancellation_token (CancellationToken, optional): Sinalizador verificado entre as páginas (ou
+                intervalos de páginas) de PDFs e entre os capítulos de EPUBs.
 
         Retorna:
             Optional[str]: O texto extraído do documento ou `None` se não for possível extrair.
 
         Exceções:
-            - ValueError: se o formato do arquivo não for suportado.
+            - ValueError: se o formato do arquivo não for suportado, ou se o motor de extração for
+              desconhecido ou não estiver instalado.
+            - OperationCancelledError: se o cancelamento for solicitado durante a importação.
             - Exception: Se ocorrer um erro durante a importação do documento.
 
         Exemplos de Uso:
@@ -91,19 +354,132 @@ class DocumentService:
         """
         _, ext = os.path.splitext(file_path)
         ext = ext.lower()
+        if ext == '.txt':
+            return self._import_txt(file_path)
+        if ext not in ('.pdf', '.docx', '.epub'):
+            raise ValueError(f"Formato de arquivo não suportado: {ext}")
+
+        pdf_engine = self._resolve_engine(engine) if ext == '.pdf' else None
+        extractor_version = self._extractor_version(ext, pdf_engine)
+        # Os metadados e o hash do arquivo são obtidos uma única vez, para a consulta e o armazenamento
+        cache = self.cache
+        fingerprint: Optional[FileFingerprint] = None
+        if cache is not None:
+            fingerprint = cache.fingerprint(file_path)
+            text = cache.get_text(fingerprint, extractor_version) if fingerprint is not None else None
+            if text is not None:
+                return text
+
         if ext == '.pdf':
-            return self._import_pdf(file_path)
+            text = self._import_pdf(file_path, pdf_engine, cancellation_token)
         elif ext == '.docx':
-            return self._import_docx(file_path)
-        elif ext == '.epub':
-            return self._import_epub(file_path)
-        elif ext == '.txt':
-            return self._import_txt(file_path)
+            text = self._import_docx(file_path)
         else:
-            raise ValueError(f"Formato de arquivo não suportado: {ext}")
+            text = self._import_epub(file_path, cancellation_token)
+        self._raise_if_cancelled(cancellation_token)
+
+        if fingerprint is not None and text:
+            cache.set_text(fingerprint, extractor_version, text)
+        return text
+
+    def iter_pages(self, file_path: str, first_page: int = 1, last_page: Optional[int] = None,
+                   engine: Optional[str] = None) -> Iterator[str]:
+        """
+        Produz o texto de cada página de um PDF, no intervalo informado.
+
+        Cada página é extraída apenas quando solicitada, e o arquivo é fechado assim que a iteração termina
+        ou é interrompida. Páginas sem texto extraível produzem uma string vazia, preservando a numeração.
+
+        Parâmetros:
+            file_path (str): Caminho para o arquivo PDF.
+            first_page (int): A primeira página a ser extraída (a partir de 1).
+            last_page (int, optional): A última página a ser extraída (inclusive). Por padrão, a última
+                página do documento. Valores além do número de páginas são limitados a ele.
+            engine (str, optional): O motor de extração. Por padrão, o motor do serviço.
+
+        Retorna:
+            Iterator[str]: O texto de cada página do intervalo.
+
+        Exceções:
+            - ValueError: se o arquivo não for um PDF, se o intervalo de páginas for inválido ou se o motor
+              de extração for desconhecido ou não estiver instalado.
+            - FileNotFoundError: se o arquivo PDF não for encontrado.
+            - Exception: Se ocorrer um erro durante a leitura do PDF.
+        """
+        if os.path.splitext(file_path)[1].lower() != '.pdf':
+            raise ValueError("A leitura por páginas está disponível apenas para arquivos PDF.")
+        self._check_page_range(first_page, last_page)
+        return self._iter_pdf_pages(file_path, first_page, last_page, self._resolve_engine(engine))
+
+    def iter_paragraphs(self, file_path: str, first_page: int = 1, last_page: Optional[int] = None,
+                        engine: Optional[str] = None) -> Iterator[str]:
+        """
+        Produz os parágrafos de um documento, na ordem de leitura.
+
+        Em PDFs, o texto extraído raramente contém linhas em branco; um parágrafo termina em uma linha em
+        branco ou em uma linha com pontuação final mais curta que as demais linhas da página. Um parágrafo
+        interrompido no fim de uma página (sem pontuação final) é unido ao início da página seguinte.
+        Em DOCX, cada parágrafo não vazio do documento é produzido; em EPUB, os parágrafos dos capítulos são
+        produzidos na ordem do spine (ver `iter_chapters`); em TXT, o arquivo é lido linha a linha e os
+        parágrafos são separados pelas linhas em branco.
+
+        Parâmetros:
+            file_path (str): Caminho para o arquivo do documento.
+            first_page (int): A primeira página a ser lida (apenas PDF).
+            last_page (int, optional): A última página a ser lida (apenas PDF).
+            engine (str, optional): O motor de extração (apenas PDF). Por padrão, o motor do serviço.
+
+        Retorna:
+            Iterator[str]: Os parágrafos do documento, sem espaços nas extremidades.
+
+        Exceções:
+            - ValueError: se o formato do arquivo não for suportado, ou se um intervalo de páginas for
+              informado para um formato sem páginas.
+            - FileNotFoundError: se o arquivo não for encontrado.
+            - Exception: Se ocorrer um erro durante a leitura do documento.
+        """
+        ext = os.path.splitext(file_path)[1].lower()
+        if ext == '.pdf':
+            return self._iter_pdf_paragraphs(self.iter_pages(file_path, first_page, last_page, engine))
+        if (first_page, last_page) != (1, None):
+            raise ValueError("O intervalo de páginas está disponível apenas para arquivos PDF.")
+        if ext == '.docx':
+            return self._iter_docx_paragraphs(file_path)
+        if ext == '.epub':
+            return (paragraph for _, paragraph in self._iter_epub_paragraphs(file_path))
+        if ext == '.txt':
+            return self._iter_txt_paragraphs(file_path)
+        # Demais formatos: o texto importado é dividido em parágrafos
+        return self._split_paragraphs(self.import_document(file_path))
+
+    def iter_chapters(self, file_path: str) -> Iterator[str]:
+        """
+        Produz o texto de cada capítulo de um EPUB, na ordem de leitura.
+
+        Cada documento de conteúdo do spine é um capítulo, lido apenas quando solicitado e sem a marcação
+        XHTML, com os parágrafos separados por linhas em branco. Documentos fora da leitura linear, de
+        navegação ou marcados como capa, sumário, índice ou página de direitos autorais são descartados,
+        assim como documentos sem texto.
+
+        Parâmetros:
+            file_path (str): Caminho para o arquivo EPUB.
+
+        Retorna:
+            Iterator[str]: O texto de cada capítulo.
+
+        Exceções:
+            - ValueError: se o arquivo não for um EPUB.
+            - FileNotFoundError: se o arquivo EPUB não for encontrado.
+            - Exception: Se ocorrer um erro durante a leitura do EPUB.
+        """
+        if os.path.splitext(file_path)[1].lower() != '.epub':
+            raise ValueError("A leitura por capítulos está disponível apenas para arquivos EPUB.")
+        for _, paragraphs in groupby(self._iter_epub_paragraphs(file_path), key=lambda item: item[0]):
+            yield '\n\n'.join(paragraph for _, paragraph in paragraphs)
 
     def export_document(self, text: str, file_path: str, format: str, metrics_original: dict = None,
-                        metrics_simplified: dict = None, bleu_score: float = None) -> None:
+                        metrics_simplified: dict = None, bleu_score: float = None,
+                        cancellation_token: Optional[CancellationToken] = None) -> None:
         """
         Exporta texto e métricas para um arquivo de documento, incluindo o BLEU Score.
 
@@ -117,55 +493,332 @@ class DocumentService:
             metrics_original (dict): Métricas do texto original.
             metrics_simplified (dict): Métricas do texto simplificado.
             bleu_score (float): O BLEU Score do texto simplificado e traduzido.
+            cancellation_token (CancellationToken, optional): Sinalizador verificado antes da gravação do
+                arquivo e, em PDFs, entre as linhas do texto. Após o cancelamento, nenhum arquivo é gravado.
 
         Retorna:
             None
 
         Exceções:
             - ValueError: se o formato de exportação não for suportado.
+            - OperationCancelledError: se o cancelamento for solicitado antes da gravação do arquivo.
             - Exception: Se ocorrer um erro durante a exportação do documento.
         """
         format = format.lower()
         if format == 'pdf':
-            self._export_pdf(text, file_path, metrics_original, metrics_simplified, bleu_score)
+            self._export_pdf(text, file_path, metrics_original, metrics_simplified, bleu_score, cancellation_token)
         elif format == 'docx':
-            self._export_docx(text, file_path, metrics_original, metrics_simplified, bleu_score)
+            self._export_docx(text, file_path, metrics_original, metrics_simplified, bleu_score, cancellation_token)
         elif format == 'txt':
-            self._export_txt(text, file_path, metrics_original, metrics_simplified, bleu_score)
+            self._export_txt(text, file_path, metrics_original, metrics_simplified, bleu_score, cancellation_token)
         else:
             raise ValueError(f"Formato de exportação não suportado: {format}")
 
     @staticmethod
-    def _import_pdf(file_path: str) -> str:
+    def _raise_if_cancelled(cancellation_token: Optional[CancellationToken]) -> None:
+        """
+        Lança OperationCancelledError se um sinalizador foi informado e o cancelamento foi solicitado.
+        """
+        if cancellation_token is not None:
+            cancellation_token.raise_if_cancelled()
+
+    @staticmethod
+    def _until_cancelled(items: Iterator, cancellation_token: Optional[CancellationToken]) -> Iterator:
+        """
+        Produz os itens informados, verificando o cancelamento antes de cada um.
+
+        Exceções:
+            - OperationCancelledError: se o cancelamento for solicitado durante a iteração.
+        """
+        for item in items:
+            DocumentService._raise_if_cancelled(cancellation_token)
+            yield item
+
+    @staticmethod
+    def _extractor_version(ext: str, pdf_engine: Optional[PdfEngine]) -> str:
+        """
+        Retorna a versão do extrator de um formato, que compõe a chave do cache de extrações.
+
+        Parâmetros:
+            ext (str): A extensão do arquivo.
+            pdf_engine (PdfEngine, optional): O motor de extração, para PDFs.
+
+        Retorna:
+            str: A versão da extração e a do motor ou da biblioteca do formato (por exemplo, '1:pypdf2-3.0.1').
+        """
+        if pdf_engine is not None:
+            return f"{EXTRACTION_VERSION}:{pdf_engine.version()}"
+        package = EXTRACTION_PACKAGES[ext]
+        try:
+            return f"{EXTRACTION_VERSION}:{package}-{metadata.version(package)}"
+        except metadata.PackageNotFoundError:
+            return f"{EXTRACTION_VERSION}:{package}"
+
+    def _resolve_engine(self, engine: Optional[str]) -> PdfEngine:
+        """
+        Retorna o motor de extração informado na chamada ou, na sua ausência, o motor do serviço.
+
+        Exceções:
+            - ValueError: se o motor de extração for desconhecido ou não estiver instalado.
+        """
+        return get_engine(engine) if engine else self.pdf_engine
+
+    def _import_pdf(self, file_path: str, engine: PdfEngine,
+                    cancellation_token: Optional[CancellationToken] = None) -> str:
         """
         Importa texto de um arquivo PDF.
 
-        Utiliza a biblioteca PyPDF2 para extrair o texto de cada página do PDF.
+        Utiliza o motor de extração para obter o texto de cada página do PDF. PDFs com pelo menos
+        `parallel_min_pages` páginas são divididos em intervalos contíguos, extraídos simultaneamente
+        pelo pool de processos e reunidos na ordem das páginas.
 
         Parâmetros:
             file_path (str): Caminho para o arquivo PDF a ser importado.
+            engine (PdfEngine): O motor de extração.
+            cancellation_token (CancellationToken, optional): Sinalizador verificado entre as páginas (ou
+                intervalos de páginas).
 
         Retorna:
             str: O texto extraído do PDF.
 
+        Exceções:
+            - FileNotFoundError: se o arquivo PDF não for encontrado.
+            - OperationCancelledError: se o cancelamento for solicitado durante a extração.
+            - Exception: Se ocorrer um erro durante a leitura do PDF.
+        """
+        total_pages = self._count_pdf_pages(file_path, engine) if self.processes > 1 else 0
+        if total_pages >= max(self.parallel_min_pages, 2):
+            pages = self._extract_pdf_pages_parallel(file_path, total_pages, engine, cancellation_token)
+        else:
+            pages = self._until_cancelled(self._iter_pdf_pages(file_path, 1, None, engine), cancellation_token)
+        # As páginas são unidas de uma só vez, sem cópias sucessivas do texto acumulado
+        return '\n'.join(page for page in pages if page).strip()
+
+    def _extract_pdf_pages_parallel(self, file_path: str, total_pages: int, engine: PdfEngine,
+                                    cancellation_token: Optional[CancellationToken] = None) -> Iterator[str]:
+        """
+        Extrai as páginas de um PDF em intervalos contíguos, distribuídos entre os processos do pool do serviço.
+
+        Parâmetros:
+            file_path (str): Caminho para o arquivo PDF.
+            total_pages (int): O número de páginas do PDF.
+            engine (PdfEngine): O motor de extração, informado aos processos pelo nome.
+            cancellation_token (CancellationToken, optional): Sinalizador verificado enquanto cada intervalo é
+                aguardado. Após o cancelamento, os intervalos ainda não iniciados são descartados.
+
+        Retorna:
+            Iterator[str]: O texto de cada página, na ordem do documento.
+
+        Exceções:
+            - OperationCancelledError: se o cancelamento for solicitado durante a extração.
+            - Exception: Se ocorrer um erro durante a leitura do PDF em algum dos processos.
+        """
+        shards = min(total_pages, min(self.processes, total_pages) * SHARDS_PER_PROCESS)
+        bounds = [round(total_pages * index / shards) for index in range(shards + 1)]
+        executor = self._get_executor()
+        futures = []
+        try:
+            for index in range(shards):
+                futures.append(executor.submit(
+                    _extract_pdf_pages, file_path, bounds[index] + 1, bounds[index + 1], engine.name
+                ))
+            for future in futures:
+                while not wait([future], timeout=CANCELLATION_POLL_INTERVAL).done:
+                    self._raise_if_cancelled(cancellation_token)
+                self._raise_if_cancelled(cancellation_token)
+                yield from future.result()
+        except BrokenProcessPool as e:
+            # Um processo do pool foi encerrado abruptamente: a próxima importação cria um novo pool
+            self._discard_executor(executor)
+            raise Exception(f"Erro ao importar PDF: {str(e)}")
+        finally:
+            # Após um erro ou cancelamento, os intervalos ainda não iniciados são descartados; os intervalos
+            # em extração terminam no pool, sem bloquear a chamada
+            for future in futures:
+                future.cancel()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """
+        Retorna o pool de processos da extração paralela, criando-o na primeira chamada.
+
+        Retorna:
+            ProcessPoolExecutor: O pool, com processos iniciados pelo método 'spawn'.
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.processes, mp_context=multiprocessing.get_context('spawn')
+                )
+            return self._executor
+
+    def _discard_executor(self, executor: ProcessPoolExecutor) -> None:
+        """
+        Descarta um pool de processos inutilizável, se ele ainda for o pool do serviço.
+
+        Parâmetros:
+            executor (ProcessPoolExecutor): O pool a ser descartado.
+        """
+        with self._executor_lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _count_pdf_pages(file_path: str, engine: PdfEngine) -> int:
+        """
+        Retorna o número de páginas de um PDF.
+
         Exceções:
             - FileNotFoundError: se o arquivo PDF não for encontrado.
             - Exception: Se ocorrer um erro durante a leitura do PDF.
         """
         try:
-            with open(file_path, 'rb') as f:
-                reader = PyPDF2.PdfReader(f)
-                text = ''
-                for page in reader.pages:
-                    extracted_text = page.extract_text()
-                    if extracted_text:
-                        text += extracted_text + '\n'
-                return text.strip()
+            return engine.page_count(file_path)
         except FileNotFoundError:
             raise FileNotFoundError(f"Arquivo PDF não encontrado: {file_path}")
         except Exception as e:
             raise Exception(f"Erro ao importar PDF: {str(e)}")
 
+    @staticmethod
+    def _check_page_range(first_page: int, last_page: Optional[int]) -> None:
+        """
+        Valida o intervalo de páginas.
+
+        Exceções:
+            - ValueError: se a primeira página for menor que 1 ou posterior à última.
+        """
+        if first_page < 1 or (last_page is not None and last_page < first_page):
+            raise ValueError(f"Intervalo de páginas inválido: {first_page} a {last_page}.")
+
+    @staticmethod
+    def _iter_pdf_pages(file_path: str, first_page: int, last_page: Optional[int],
+                        engine: PdfEngine) -> Iterator[str]:
+        """
+        Produz o texto de cada página de um PDF no intervalo informado (ver `iter_pages`), com o motor de
+        extração informado.
+
+        Exceções:
+            - FileNotFoundError: se o arquivo PDF não for encontrado.
+            - Exception: Se ocorrer um erro durante a leitura do PDF.
+        """
+        try:
+            yield from engine.iter_pages(file_path, first_page, last_page)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Arquivo PDF não encontrado: {file_path}")
+        except Exception as e:
+            raise Exception(f"Erro ao importar PDF: {str(e)}")
+
+    @staticmethod
+    def _iter_pdf_paragraphs(pages: Iterator[str]) -> Iterator[str]:
+        """
+        Produz os parágrafos das páginas de um PDF, unindo os parágrafos interrompidos na quebra de página.
+
+        Parâmetros:
+            pages (Iterator[str]): O texto de cada página.
+
+        Retorna:
+            Iterator[str]: Os parágrafos, na ordem do documento.
+        """
+        pending = None
+        for page in pages:
+            paragraphs = DocumentService._split_pdf_paragraphs(page)
+            if pending is not None:
+                if paragraphs:
+                    paragraphs[0] = pending + '\n' + paragraphs[0]
+                else:
+                    paragraphs = [pending]
+                pending = None
+            if not paragraphs:
+                continue
+            yield from paragraphs[:-1]
+            if paragraphs[-1].endswith(PARAGRAPH_TERMINATORS):
+                yield paragraphs[-1]
+            else:
+                pending = paragraphs[-1]
+        if pending is not None:
+            yield pending
+
+    @staticmethod
+    def _split_pdf_paragraphs(page: str) -> list:
+        """
+        Divide o texto de uma página de PDF em parágrafos, pelas linhas em branco e pelas linhas curtas com
+        pontuação final.
+
+        Parâmetros:
+            page (str): O texto da página.
+
+        Retorna:
+            list: Os parágrafos da página.
+        """
+        lines = [line.strip() for line in page.split('\n')]
+        width = max((len(line) for line in lines), default=0)
+        paragraphs = []
+        current = []
+        for line in lines:
+            if line:
+                current.append(line)
+            if current and (not line or (line.endswith(PARAGRAPH_TERMINATORS)
+                                         and len(line) < PDF_SHORT_LINE_RATIO * width)):
+                paragraphs.append('\n'.join(current))
+                current = []
+        if current:
+            paragraphs.append('\n'.join(current))
+        return paragraphs
+
+    @staticmethod
+    def _split_paragraphs(text: str) -> Iterator[str]:
+        """
+        Produz os parágrafos não vazios de um texto, separados por linhas em branco.
+        """
+        for paragraph in PARAGRAPH_SEPARATOR.split(text):
+            paragraph = paragraph.strip()
+            if paragraph:
+                yield paragraph
+
+    @staticmethod
+    def _iter_docx_paragraphs(file_path: str) -> Iterator[str]:
+        """
+        Produz os parágrafos não vazios de um arquivo DOCX.
+
+        Exceções:
+            - FileNotFoundError: se o arquivo DOCX não for encontrado.
+            - Exception: Se ocorrer um erro durante a leitura do DOCX.
+        """
+        try:
+            doc = Document(file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Arquivo DOCX não encontrado: {file_path}")
+        except Exception as e:
+            raise Exception(f"Erro ao importar DOCX: {str(e)}")
+        for para in doc.paragraphs:
+            if para.text.strip():
+                yield para.text.strip()
+
+    @staticmethod
+    def _iter_txt_paragraphs(file_path: str) -> Iterator[str]:
+        """
+        Produz os parágrafos de um arquivo TXT, lendo-o linha a linha.
+
+        Exceções:
+            - FileNotFoundError: se o arquivo TXT não for encontrado.
+            - Exception: Se ocorrer um erro durante a leitura do TXT.
+        """
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                lines = []
+                for line in f:
+                    if line.strip():
+                        lines.append(line.rstrip('\n'))
+                    elif lines:
+                        yield '\n'.join(lines).strip()
+                        lines = []
+                if lines:
+                    yield '\n'.join(lines).strip()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Arquivo TXT não encontrado: {file_path}")
+        except Exception as e:
+            raise Exception(f"Erro ao importar TXT: {str(e)}")
+
     @staticmethod
     def _import_docx(file_path: str) -> str:
         """
@@ -192,36 +845,116 @@ class DocumentService:
         except Exception as e:
             raise Exception(f"Erro ao importar DOCX: {str(e)}")
 
-    @staticmethod
-    def _import_epub(file_path: str) -> str:
+    def _import_epub(self, file_path: str, cancellation_token: Optional[CancellationToken] = None) -> str:
         """
         Importa texto de um arquivo EPUB.
 
-        Utiliza a biblioteca EbookLib para extrair o conteúdo textual dos documentos do EPUB.
+        Reúne os capítulos produzidos por `iter_chapters`, na ordem de leitura e sem a marcação XHTML.
 
         Parâmetros:
             file_path (str): Caminho para o arquivo EPUB a ser importado.
+            cancellation_token (CancellationToken, optional): Sinalizador verificado entre os capítulos.
 
         Retorna:
             str: O texto extraído do EPUB.
 
+        Exceções:
+            - FileNotFoundError: se o arquivo EPUB não for encontrado.
+            - OperationCancelledError: se o cancelamento for solicitado durante a leitura.
+            - Exception: Se ocorrer um erro durante a leitura do EPUB.
+        """
+        return '\n\n'.join(self._until_cancelled(self.iter_chapters(file_path), cancellation_token)).strip()
+
+    @staticmethod
+    def _iter_epub_paragraphs(file_path: str) -> Iterator[Tuple[str, str]]:
+        """
+        Produz os parágrafos dos documentos de conteúdo de um EPUB, na ordem do spine.
+
+        Retorna:
+            Iterator[Tuple[str, str]]: Tuplas (caminho do documento no EPUB, parágrafo).
+
         Exceções:
             - FileNotFoundError: se o arquivo EPUB não for encontrado.
             - Exception: Se ocorrer um erro durante a leitura do EPUB.
         """
         try:
-            book = epub.read_epub(file_path)
-            text = ''
-            for item in book.get_items():
-                if item.get_type() == epub.ITEM_DOCUMENT:
-                    content = item.get_content()
-                    text += content.decode('utf-8') + '\n'
-            return text.strip()
+            with zipfile.ZipFile(file_path) as archive:
+                for document_path in DocumentService._iter_epub_spine(archive):
+                    with archive.open(document_path) as stream:
+                        for paragraph in DocumentService._iter_xhtml_paragraphs(stream):
+                            yield document_path, paragraph
         except FileNotFoundError:
             raise FileNotFoundError(f"Arquivo EPUB não encontrado: {file_path}")
         except Exception as e:
             raise Exception(f"Erro ao importar EPUB: {str(e)}")
 
+    @staticmethod
+    def _iter_epub_spine(archive: zipfile.ZipFile) -> Iterator[str]:
+        """
+        Produz os caminhos, no arquivo EPUB, dos documentos de conteúdo do spine, na ordem de leitura.
+
+        São descartados os documentos fora da leitura linear (`linear="no"`), o documento de navegação do
+        EPUB 3, os documentos que não são XHTML e os referenciados no guide do EPUB 2 com um tipo de
+        `EPUB_BOILERPLATE_TYPES`.
+
+        Parâmetros:
+            archive (zipfile.ZipFile): O arquivo EPUB aberto.
+
+        Retorna:
+            Iterator[str]: Os caminhos dos documentos.
+
+        Exceções:
+            - ValueError: se o EPUB não indicar o seu arquivo de pacote (OPF).
+        """
+        container = etree.fromstring(archive.read('META-INF/container.xml'))
+        rootfile = container.find('.//container:rootfile', EPUB_NAMESPACES)
+        if rootfile is None or not rootfile.get('full-path'):
+            raise ValueError("O EPUB não indica o arquivo de pacote (OPF).")
+        package_path = rootfile.get('full-path')
+        package = etree.fromstring(archive.read(package_path))
+        base_path = posixpath.dirname(package_path)
+
+        def resolve(href: str) -> str:
+            return posixpath.normpath(posixpath.join(base_path, unquote(href.split('#')[0])))
+
+        manifest = {item.get('id'): item for item in package.iterfind('opf:manifest/opf:item', EPUB_NAMESPACES)}
+        references = package.iterfind('opf:guide/opf:reference', EPUB_NAMESPACES)
+        boilerplate = {
+            resolve(reference.get('href', '')) for reference in references
+            if reference.get('type', '').lower() in EPUB_BOILERPLATE_TYPES
+        }
+        for itemref in package.iterfind('opf:spine/opf:itemref', EPUB_NAMESPACES):
+            item = manifest.get(itemref.get('idref'))
+            if item is None or itemref.get('linear', 'yes').lower() == 'no':
+                continue
+            if 'nav' in (item.get('properties') or '').split() or item.get('media-type') not in EPUB_DOCUMENT_TYPES:
+                continue
+            document_path = resolve(item.get('href', ''))
+            if document_path not in boilerplate:
+                yield document_path
+
+    @staticmethod
+    def _iter_xhtml_paragraphs(stream: IO[bytes]) -> Iterator[str]:
+        """
+        Produz os parágrafos de um documento XHTML, sem a marcação, lendo-o em blocos.
+
+        O parser HTML do lxml tolera marcação malformada e reconhece as entidades do HTML (como `&nbsp;`),
+        frequentes em EPUBs e não declaradas em XML.
+
+        Parâmetros:
+            stream (IO[bytes]): O conteúdo do documento.
+
+        Retorna:
+            Iterator[str]: Os parágrafos, com os espaços normalizados.
+        """
+        target = _XhtmlTextTarget()
+        parser = etree.HTMLParser(target=target, encoding='utf-8')
+        for chunk in iter(lambda: stream.read(EPUB_READ_CHUNK_BYTES), b''):
+            parser.feed(chunk)
+            yield from target.pop_paragraphs()
+        parser.close()
+        yield from target.pop_paragraphs()
+
     @staticmethod
     def _import_txt(file_path: str) -> str:
         """
@@ -249,7 +982,7 @@ class DocumentService:
 
     @staticmethod
     def _export_pdf(text: str, file_path: str, metrics_original: dict = None, metrics_simplified: dict = None,
-                    bleu_score: float = None) -> None:
+                    bleu_score: float = None, cancellation_token: Optional[CancellationToken] = None) -> None:
         """
         Exporta texto e métricas para um arquivo PDF, incluindo o BLEU Score.
 
@@ -262,11 +995,13 @@ class DocumentService:
             metrics_original (dict): Métricas do texto original.
             metrics_simplified (dict): Métricas do texto simplificado.
             bleu_score (float): O BLEU Score do texto simplificado e traduzido.
+            cancellation_token (CancellationToken, optional): Sinalizador verificado entre as linhas do texto.
 
         Retorna:
             None
 
         Exceções:
+            - OperationCancelledError: se o cancelamento for solicitado antes da gravação do PDF.
             - Exception: Se ocorrer um erro durante a criação do PDF.
         """
         try:
@@ -281,7 +1016,7 @@ class DocumentService:
             text_object.textLine("")
 
             # Adicionar o texto
-            for line in text.split('\n'):
+            for line in DocumentService._until_cancelled(text.split('\n'), cancellation_token):
                 words = line.split(' ')
                 line_buffer = ""
 
@@ -368,13 +1103,16 @@ class DocumentService:
                     text_object.setFont("Helvetica", 12)
 
             c.drawText(text_object)
+            DocumentService._raise_if_cancelled(cancellation_token)
             c.save()
+        except OperationCancelledError:
+            raise
         except Exception as e:
             raise Exception(f"Erro ao exportar PDF: {str(e)}")
 
     @staticmethod
     def _export_docx(text: str, file_path: str, metrics_original: dict = None, metrics_simplified: dict = None,
-                     bleu_score: float = None) -> None:
+                     bleu_score: float = None, cancellation_token: Optional[CancellationToken] = None) -> None:
         """
         Exporta texto e métricas para um arquivo DOCX, incluindo o BLEU Score.
 
@@ -386,11 +1124,13 @@ class DocumentService:
             metrics_original (dict): Métricas do texto original.
             metrics_simplified (dict): Métricas do texto simplificado.
             bleu_score (float): O BLEU Score do texto simplificado e traduzido.
+            cancellation_token (CancellationToken, optional): Sinalizador verificado antes da gravação do DOCX.
 
         Retorna:
             None
 
         Exceções:
+            - OperationCancelledError: se o cancelamento for solicitado antes da gravação do DOCX.
             - Exception: Se ocorrer um erro durante a criação do DOCX.
         """
         try:
@@ -427,13 +1167,16 @@ class DocumentService:
                 doc.add_heading('BLEU Score:', level=2)
                 doc.add_paragraph(f"{bleu_score:.2f}")
 
+            DocumentService._raise_if_cancelled(cancellation_token)
             doc.save(file_path)
+        except OperationCancelledError:
+            raise
         except Exception as e:
             raise Exception(f"Erro ao exportar DOCX: {str(e)}")
 
     @staticmethod
     def _export_txt(text: str, file_path: str, metrics_original: dict = None, metrics_simplified: dict = None,
-                    bleu_score: float = None) -> None:
+                    bleu_score: float = None, cancellation_token: Optional[CancellationToken] = None) -> None:
         """
         Exporta texto e métricas para um arquivo TXT, incluindo o BLEU Score.
 
@@ -445,13 +1188,16 @@ class DocumentService:
             metrics_original (dict): Métricas do texto original.
             metrics_simplified (dict): Métricas do texto simplificado.
             bleu_score (float): O BLEU Score do texto simplificado e traduzido.
+            cancellation_token (CancellationToken, optional): Sinalizador verificado antes da gravação do TXT.
 
         Retorna:
             None
 
         Exceções:
+            - OperationCancelledError: se o cancelamento for solicitado antes da gravação do TXT.
             - Exception: Se ocorrer um erro durante a escrita no TXT.
         """
+        DocumentService._raise_if_cancelled(cancellation_token)
         try:
             with open(file_path, 'w', encoding='utf-8') as f:
                 f.write("Texto Simplificado e Traduzido:\n")
@@ -27,6 +27,7 @@ Exemplo de Uso:
 """
 
 import sacrebleu
+from typing import Optional
 from services.api.aws_translate_service import AwsTranslateService
 
 
@@ -39,11 +40,15 @@ class BleuScoreService:
             Traduz o texto traduzido de volta para o idioma original e calcula o BLEU Score entre o texto original e o texto back-translated.
     """
 
-    def __init__(self):
+    def __init__(self, aws_translate_service: Optional[AwsTranslateService] = None):
         """
         Inicializa a instância do BleuScoreService.
+
+        Parâmetros:
+            aws_translate_service (AwsTranslateService, optional): Serviço de tradução utilizado na
+                back-translation. Por padrão, uma nova instância, que reutiliza o cliente AWS compartilhado.
         """
-        self.aws_translate_service = AwsTranslateService()
+        self.aws_translate_service = aws_translate_service or AwsTranslateService()
 
     def compute_bleu_score(self, original_text: str, translated_text: str, source_language_code: str) -> float:
         """
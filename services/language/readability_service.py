@@ -20,6 +20,7 @@ Classes:
 Dependências:
     - textstat: biblioteca para calcular métricas de legibilidade.
     - langdetect: biblioteca para detecção de idioma de textos.
+    - threading: biblioteca padrão para sincronização entre threads.
 
 Exemplo de Uso:
     >>> from services.readability_service import ReadabilityService
@@ -39,6 +40,12 @@ Exemplo de Uso:
 import textstat
 from langdetect import detect
 import os
+import threading
+
+# O idioma e a lista de palavras fáceis do textstat são globais: as avaliações simultâneas
+# (por exemplo, das threads do pipeline) são serializadas, de modo que cada texto seja avaliado
+# com a configuração do seu próprio idioma. O lock garante resultados corretos, não paralelismo.
+_textstat_lock = threading.Lock()
 
 
 class ReadabilityService:
@@ -110,6 +117,10 @@ class ReadabilityService:
             - Nenhuma exceção explícita é lançada. Caso ocorra um erro na detecção do idioma,
               o idioma padrão será configurado como inglês ('en').
 
+        O metodo pode ser chamado simultaneamente por várias threads, mas as chamadas não são executadas
+        em paralelo: como a configuração de idioma do `textstat` é global, a detecção e o cálculo das
+        métricas são executados sob um lock, uma avaliação por vez.
+
         Teoria das Métricas:
             - **Índice de Flesch Reading Ease**:
                 - Mede a facilidade de leitura de um texto.
@@ -142,29 +153,30 @@ class ReadabilityService:
                 - Compara palavras com uma lista de palavras familiares.
                 - Valores mais baixos indicam textos mais fáceis de ler.
         """
-        # Detecta o idioma do texto
-        try:
-            language_code = detect(text)
-            # Lista de idiomas suportados pelo textstat
-            supported_languages = ['en', 'es', 'de', 'fr', 'it', 'nl', 'pt', 'ru']
-            if language_code in supported_languages:
-                textstat.set_lang(language_code)
-                ReadabilityService.load_easy_words(language_code)
-            else:
-                # Define inglês como padrão se o idioma não for suportado
+        with _textstat_lock:
+            # Detecta o idioma do texto
+            try:
+                language_code = detect(text)
+                # Lista de idiomas suportados pelo textstat
+                supported_languages = ['en', 'es', 'de', 'fr', 'it', 'nl', 'pt', 'ru']
+                if language_code in supported_languages:
+                    textstat.set_lang(language_code)
+                    ReadabilityService.load_easy_words(language_code)
+                else:
+                    # Define inglês como padrão se o idioma não for suportado
+                    textstat.set_lang('en')
+            except Exception:
+                # Em caso de erro na detecção do idioma, define inglês como padrão
                 textstat.set_lang('en')
-        except Exception:
-            # Em caso de erro na detecção do idioma, define inglês como padrão
-            textstat.set_lang('en')
-
-        # Calcula as métricas de legibilidade
-        metrics = {
-            'flesch_reading_ease': textstat.flesch_reading_ease(text),
-            'flesch_kincaid_grade': textstat.flesch_kincaid_grade(text),
-            'smog_index': textstat.smog_index(text),
-            'coleman_liau_index': textstat.coleman_liau_index(text),
-            'automated_readability_index': textstat.automated_readability_index(text),
-            'dale_chall_readability_score': textstat.dale_chall_readability_score(text)
-        }
+
+            # Calcula as métricas de legibilidade
+            metrics = {
+                'flesch_reading_ease': textstat.flesch_reading_ease(text),
+                'flesch_kincaid_grade': textstat.flesch_kincaid_grade(text),
+                'smog_index': textstat.smog_index(text),
+                'coleman_liau_index': textstat.coleman_liau_index(text),
+                'automated_readability_index': textstat.automated_readability_index(text),
+                'dale_chall_readability_score': textstat.dale_chall_readability_score(text)
+            }
 
         return metrics
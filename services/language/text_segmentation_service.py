@@ -0,0 +1,187 @@
+# services/language/text_segmentation_service.py
+
+"""
+Text Segmentation Service Module
+================================
+
+Este módulo fornece serviços para dividir textos longos em blocos menores,
+respeitando os limites naturais do texto (parágrafos, frases e palavras).
+É utilizado pelos serviços de API que possuem limites de tamanho por requisição.
+
+Classes:
+    TextSegmentationService: Classe responsável pela divisão de textos em blocos.
+
+Dependências:
+    - re: biblioteca padrão para expressões regulares.
+    - typing: biblioteca padrão para anotações de tipos.
+
+Exemplo de Uso:
+    >>> from services.language.text_segmentation_service import TextSegmentationService
+    >>> texto = "Primeiro parágrafo.\\n\\nSegundo parágrafo."
+    >>> blocos = TextSegmentationService.split_text(texto, 25, TextSegmentationService.utf8_length)
+    >>> print(blocos)
+    [('Primeiro parágrafo.', '\\n\\n'), ('Segundo parágrafo.', '')]
+"""
+
+import re
+from typing import Callable, List, Tuple
+
+
+class TextSegmentationService:
+    """
+    Serviço para dividir textos em blocos que respeitam um tamanho máximo.
+
+    A divisão é feita de forma hierárquica: primeiro por parágrafos, depois por frases,
+    depois por palavras e, em último caso, por caracteres. Cada bloco é retornado junto
+    com o separador que o seguia no texto original, de modo que o texto possa ser
+    remontado na ordem correta.
+
+    Métodos:
+        utf8_length(text: str) ⇾ int:
+            Retorna o tamanho do texto em bytes na codificação UTF-8.
+
+        split_text(text: str, max_size: int, size_function: Callable[[str], int]) ⇾ List[Tuple[str, str]]:
+            Divide o texto em blocos cujo tamanho não ultrapassa `max_size`.
+
+        join_chunks(chunks: List[Tuple[str, str]]) ⇾ str:
+            Remonta o texto a partir dos blocos e separadores.
+    """
+
+    # Padrões de separação, do limite mais natural ao menos natural
+    SEPARATOR_PATTERNS = [
+        re.compile(r'(\s*\n\s*\n\s*)'),  # Parágrafos
+        re.compile(r'(\s*\n\s*)'),  # Linhas
+        re.compile(r'(?<=[.!?;:])(\s+)'),  # Frases
+        re.compile(r'(\s+)'),  # Palavras
+    ]
+
+    @staticmethod
+    def utf8_length(text: str) -> int:
+        """
+        Retorna o tamanho do texto em bytes na codificação UTF-8.
+
+        Parâmetros:
+            text (str): O texto a ser medido.
+
+        Retorna:
+            int: Número de bytes ocupados pelo texto em UTF-8.
+        """
+        return len(text.encode('utf-8'))
+
+    @staticmethod
+    def split_text(text: str, max_size: int, size_function: Callable[[str], int]) -> List[Tuple[str, str]]:
+        """
+        Divide o texto em blocos cujo tamanho não ultrapassa `max_size`.
+
+        Este metodo realiza os seguintes passos:
+            1. Quebra o texto em unidades (parágrafos, frases, palavras) até que cada unidade caiba no limite.
+            2. Agrupa unidades consecutivas no mesmo bloco enquanto o limite permitir.
+            3. Retorna cada bloco acompanhado do separador que o seguia no texto original.
+
+        Parâmetros:
+            text (str): O texto a ser dividido.
+            max_size (int): Tamanho máximo de cada bloco, medido por `size_function`.
+            size_function (Callable[[str], int]): Função que mede o tamanho de um trecho (bytes, tokens, etc.).
+
+        Retorna:
+            List[Tuple[str, str]]: Lista de tuplas (bloco, separador seguinte).
+
+        Exceções:
+            - ValueError: se `max_size` não for positivo.
+        """
+        if max_size <= 0:
+            raise ValueError("O tamanho máximo dos blocos deve ser positivo.")
+
+        units = TextSegmentationService._split_units(text, max_size, size_function, 0)
+
+        chunks = []
+        current = ''
+        current_separator = ''
+        for unit, separator in units:
+            if not unit:
+                current_separator += separator
+                continue
+            candidate = current + current_separator + unit if current else unit
+            if current and size_function(candidate) > max_size:
+                chunks.append((current, current_separator))
+                current = unit
+            else:
+                current = candidate
+            current_separator = separator
+        if current:
+            chunks.append((current, current_separator))
+        return chunks
+
+    @staticmethod
+    def join_chunks(chunks: List[Tuple[str, str]]) -> str:
+        """
+        Remonta o texto a partir dos blocos e separadores.
+
+        Parâmetros:
+            chunks (List[Tuple[str, str]]): Lista de tuplas (bloco, separador seguinte).
+
+        Retorna:
+            str: O texto remontado, sem espaços nas extremidades.
+        """
+        return ''.join(chunk + separator for chunk, separator in chunks).strip()
+
+    @staticmethod
+    def _split_units(text: str, max_size: int, size_function: Callable[[str], int],
+                     level: int) -> List[Tuple[str, str]]:
+        """
+        Quebra recursivamente o texto em unidades que cabem no limite.
+
+        Parâmetros:
+            text (str): O trecho a ser quebrado.
+            max_size (int): Tamanho máximo de cada unidade.
+            size_function (Callable[[str], int]): Função que mede o tamanho de um trecho.
+            level (int): Índice do padrão de separação a ser utilizado.
+
+        Retorna:
+            List[Tuple[str, str]]: Lista de tuplas (unidade, separador seguinte).
+        """
+        if size_function(text) <= max_size:
+            return [(text, '')]
+
+        if level >= len(TextSegmentationService.SEPARATOR_PATTERNS):
+            return TextSegmentationService._hard_split(text, max_size, size_function)
+
+        parts = TextSegmentationService.SEPARATOR_PATTERNS[level].split(text)
+        units = []
+        # `split` com grupo de captura alterna entre trecho e separador
+        for i in range(0, len(parts), 2):
+            piece = parts[i]
+            separator = parts[i + 1] if i + 1 < len(parts) else ''
+            sub_units = TextSegmentationService._split_units(piece, max_size, size_function, level + 1)
+            last_unit, last_separator = sub_units[-1]
+            sub_units[-1] = (last_unit, last_separator + separator)
+            units.extend(sub_units)
+        return units
+
+    @staticmethod
+    def _hard_split(text: str, max_size: int, size_function: Callable[[str], int]) -> List[Tuple[str, str]]:
+        """
+        Divide um trecho sem separadores naturais em partes que cabem no limite.
+
+        Parâmetros:
+            text (str): O trecho a ser dividido.
+            max_size (int): Tamanho máximo de cada parte.
+            size_function (Callable[[str], int]): Função que mede o tamanho de um trecho.
+
+        Retorna:
+            List[Tuple[str, str]]: Lista de tuplas (parte, separador vazio).
+        """
+        units = []
+        start = 0
+        while start < len(text):
+            # Busca binária pelo maior prefixo que cabe no limite
+            low, high = start + 1, len(text)
+            while low < high:
+                middle = (low + high + 1) // 2
+                if size_function(text[start:middle]) <= max_size:
+                    low = middle
+                else:
+                    high = middle - 1
+            units.append((text[start:low], ''))
+            start = low
+        return units
@@ -0,0 +1,424 @@
+# services/pdf_engines.py
+
+"""
+PDF Engines Module
+==================
+
+Este módulo fornece os motores de extração de texto de PDFs utilizados pelo `DocumentService`. Cada
+motor encapsula uma biblioteca de extração e expõe a mesma interface (número de páginas e texto de cada
+página de um intervalo), de modo que o motor pode ser escolhido por chamada ou por configuração sem
+alterar o restante do pipeline. O PyPDF2 é o motor padrão, sempre disponível; o pypdfium2 (rápido,
+baseado no PDFium) e o pdfminer.six (mais lento, com análise de layout que preserva melhor a ordem de
+leitura de textos em várias colunas) são utilizados quando instalados.
+
+Os motores são registrados por nome em um registro global; novos motores podem ser adicionados com
+`register_engine`; cada motor deve implementar `page_count` e `iter_pages`. A função `benchmark_engine`
+mede a velocidade, o pico de memória e o volume de texto extraído por um motor, e é utilizada pelo comando
+`benchmark.py`.
+
+Classes:
+    PdfEngine: Classe base abstrata dos motores de extração.
+    PyPdf2Engine: Motor baseado no PyPDF2, com leitura mapeada em memória (mmap).
+    PdfiumEngine: Motor baseado no pypdfium2 (opcional).
+    PdfMinerEngine: Motor baseado no pdfminer.six (opcional).
+
+Dependências:
+    - PyPDF2: biblioteca para manipulação de arquivos PDF.
+    - pypdfium2 (opcional): biblioteca de acesso ao PDFium.
+    - pdfminer.six (opcional): biblioteca de extração de texto com análise de layout.
+    - abc: biblioteca padrão para a classe base abstrata dos motores.
+    - importlib.metadata: biblioteca padrão para a versão das bibliotecas dos motores.
+    - io, mmap, os, resource, sys, time: bibliotecas padrão utilizadas na leitura dos arquivos e no benchmark.
+    - typing: biblioteca padrão para anotações de tipos.
+
+Exemplo de Uso:
+    >>> from services.pdf_engines import available_engines, get_engine
+    >>> available_engines()
+    ['pdfminer', 'pdfium', 'pypdf2']
+    >>> engine = get_engine('pdfium')
+    >>> for pagina in engine.iter_pages('artigo.pdf', 1, 3):
+    ...     print(len(pagina))
+
+Variáveis de Ambiente (opcionais):
+    - TRADUZAI_PDF_ENGINE: motor utilizado quando nenhum é informado (padrão: 'pypdf2').
+"""
+
+import io
+import mmap
+import os
+import sys
+import time
+from abc import ABC, abstractmethod
+from importlib import metadata
+from typing import Dict, Iterator, List, Optional
+
+import PyPDF2
+
+try:
+    import pypdfium2
+except ImportError:  # Motor opcional
+    pypdfium2 = None
+
+try:
+    from pdfminer.converter import TextConverter
+    from pdfminer.layout import LAParams
+    from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+    from pdfminer.pdfpage import PDFPage
+except ImportError:  # Motor opcional
+    PDFPage = None
+
+try:
+    import resource
+except ImportError:  # Indisponível no Windows; o pico de memória não é informado
+    resource = None
+
+# Motor utilizado quando nenhum é informado nem configurado
+DEFAULT_ENGINE = 'pypdf2'
+
+
+class PdfEngine(ABC):
+    """
+    Classe base abstrata dos motores de extração de texto de PDFs. As subclasses implementam `page_count`
+    e `iter_pages`.
+
+    Atributos:
+        name (str): O nome do motor no registro.
+        package (str): O nome da distribuição da biblioteca utilizada, para a identificação da versão.
+
+    Métodos:
+        is_available() ⇾ bool:
+            Indica se a biblioteca do motor está instalada.
+
+        version() ⇾ str:
+            Retorna o nome e a versão da biblioteca (por exemplo, 'pypdf2-3.0.1').
+
+        page_count(file_path: str) ⇾ int:
+            Retorna o número de páginas do PDF.
+
+        iter_pages(file_path: str, first_page: int, last_page: Optional[int]) ⇾ Iterator[str]:
+            Produz o texto de cada página do intervalo (inclusive), a partir de 1; com `last_page` igual a
+            `None`, até a última página do documento.
+    """
+
+    name = ''
+    package = ''
+
+    def is_available(self) -> bool:
+        """
+        Indica se a biblioteca do motor está instalada.
+        """
+        return True
+
+    def version(self) -> str:
+        """
+        Retorna o nome e a versão da biblioteca do motor, utilizados para invalidar textos extraídos
+        por versões anteriores.
+
+        Retorna:
+            str: O nome do motor e a versão da biblioteca, separados por hífen.
+        """
+        try:
+            return f"{self.name}-{metadata.version(self.package)}"
+        except metadata.PackageNotFoundError:
+            return f"{self.name}-desconhecida"
+
+    @abstractmethod
+    def page_count(self, file_path: str) -> int:
+        """
+        Retorna o número de páginas do PDF.
+
+        Parâmetros:
+            file_path (str): Caminho para o arquivo PDF.
+
+        Retorna:
+            int: O número de páginas.
+        """
+
+    @abstractmethod
+    def iter_pages(self, file_path: str, first_page: int, last_page: Optional[int]) -> Iterator[str]:
+        """
+        Produz o texto de cada página do intervalo (inclusive), a partir de 1. Com `last_page` igual a `None`,
+        ou além do número de páginas, a extração segue até a última página do documento.
+
+        Parâmetros:
+            file_path (str): Caminho para o arquivo PDF.
+            first_page (int): A primeira página do intervalo.
+            last_page (int, optional): A última página do intervalo.
+
+        Retorna:
+            Iterator[str]: O texto de cada página do intervalo.
+        """
+
+
+class PyPdf2Engine(PdfEngine):
+    """
+    Motor baseado no PyPDF2. O arquivo é lido por mapeamento em memória (mmap), o que evita cópias e
+    permite que vários processos o leiam simultaneamente.
+    """
+
+    name = 'pypdf2'
+    package = 'PyPDF2'
+
+    def page_count(self, file_path: str) -> int:
+        """
+        Retorna o número de páginas do PDF, lido pelo índice de páginas do documento.
+
+        Parâmetros:
+            file_path (str): Caminho para o arquivo PDF.
+
+        Retorna:
+            int: O número de páginas.
+        """
+        with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return len(PyPDF2.PdfReader(data).pages)
+
+    def iter_pages(self, file_path: str, first_page: int, last_page: Optional[int]) -> Iterator[str]:
+        """
+        Produz o texto de cada página do intervalo, extraído pelo PyPDF2 a partir do arquivo mapeado em memória.
+
+        Parâmetros:
+            file_path (str): Caminho para o arquivo PDF.
+            first_page (int): A primeira página do intervalo (a partir de 1).
+            last_page (int, optional): A última página do intervalo (inclusive). Por padrão, a última página.
+
+        Retorna:
+            Iterator[str]: O texto de cada página; páginas sem texto extraível produzem uma string vazia.
+        """
+        with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            reader = PyPDF2.PdfReader(data)
+            total_pages = len(reader.pages)
+            for index in range(first_page - 1, min(last_page or total_pages, total_pages)):
+                yield reader.pages[index].extract_text() or ''
+
+
+class PdfiumEngine(PdfEngine):
+    """
+    Motor baseado no pypdfium2, várias vezes mais rápido que os extratores em Python puro.
+    """
+
+    name = 'pdfium'
+    package = 'pypdfium2'
+
+    def is_available(self) -> bool:
+        """
+        Indica se o pypdfium2 está instalado.
+        """
+        return pypdfium2 is not None
+
+    def page_count(self, file_path: str) -> int:
+        """
+        Retorna o número de páginas do PDF.
+
+        Parâmetros:
+            file_path (str): Caminho para o arquivo PDF.
+
+        Retorna:
+            int: O número de páginas.
+        """
+        document = pypdfium2.PdfDocument(file_path)
+        try:
+            return len(document)
+        finally:
+            document.close()
+
+    def iter_pages(self, file_path: str, first_page: int, last_page: Optional[int]) -> Iterator[str]:
+        """
+        Produz o texto de cada página do intervalo, com as quebras de linha do Windows e do Mac OS clássico
+        convertidas em quebras de linha Unix. Cada página é liberada assim que o seu texto é extraído.
+
+        Parâmetros:
+            file_path (str): Caminho para o arquivo PDF.
+            first_page (int): A primeira página do intervalo (a partir de 1).
+            last_page (int, optional): A última página do intervalo (inclusive). Por padrão, a última página.
+
+        Retorna:
+            Iterator[str]: O texto de cada página.
+        """
+        document = pypdfium2.PdfDocument(file_path)
+        try:
+            total_pages = len(document)
+            for index in range(first_page - 1, min(last_page or total_pages, total_pages)):
+                page = document[index]
+                text_page = page.get_textpage()
+                try:
+                    text = text_page.get_text_range()
+                finally:
+                    text_page.close()
+                    page.close()
+                yield text.replace('\r\n', '\n').replace('\r', '\n')
+        finally:
+            document.close()
+
+
+class PdfMinerEngine(PdfEngine):
+    """
+    Motor baseado no pdfminer.six. A análise de layout agrupa o texto em blocos, preservando melhor a ordem
+    de leitura de artigos em várias colunas, ao custo de uma extração mais lenta.
+    """
+
+    name = 'pdfminer'
+    package = 'pdfminer.six'
+
+    def is_available(self) -> bool:
+        """
+        Indica se o pdfminer.six está instalado.
+        """
+        return PDFPage is not None
+
+    def page_count(self, file_path: str) -> int:
+        """
+        Retorna o número de páginas do PDF, percorrendo a árvore de páginas do documento.
+
+        Parâmetros:
+            file_path (str): Caminho para o arquivo PDF.
+
+        Retorna:
+            int: O número de páginas.
+        """
+        with open(file_path, 'rb') as f:
+            return sum(1 for _ in PDFPage.get_pages(f))
+
+    def iter_pages(self, file_path: str, first_page: int, last_page: Optional[int]) -> Iterator[str]:
+        """
+        Produz o texto de cada página do intervalo, com a análise de layout do pdfminer.six. As páginas
+        anteriores ao intervalo são percorridas sem a extração do texto.
+
+        Parâmetros:
+            file_path (str): Caminho para o arquivo PDF.
+            first_page (int): A primeira página do intervalo (a partir de 1).
+            last_page (int, optional): A última página do intervalo (inclusive). Por padrão, a última página.
+
+        Retorna:
+            Iterator[str]: O texto de cada página.
+        """
+        resource_manager = PDFResourceManager()
+        with open(file_path, 'rb') as f:
+            for index, page in enumerate(PDFPage.get_pages(f), start=1):
+                if index < first_page:
+                    continue
+                if last_page is not None and index > last_page:
+                    break
+                output = io.StringIO()
+                device = TextConverter(resource_manager, output, laparams=LAParams())
+                try:
+                    PDFPageInterpreter(resource_manager, device).process_page(page)
+                finally:
+                    device.close()
+                # O TextConverter encerra cada página com um caractere de quebra de página
+                yield output.getvalue().replace('\x0c', '')
+
+
+# Registro dos motores, indexados pelo nome
+_ENGINES: Dict[str, PdfEngine] = {}
+
+
+def register_engine(engine: PdfEngine) -> None:
+    """
+    Registra um motor de extração, substituindo um motor registrado com o mesmo nome.
+
+    Parâmetros:
+        engine (PdfEngine): O motor.
+    """
+    _ENGINES[engine.name] = engine
+
+
+def available_engines() -> List[str]:
+    """
+    Retorna os nomes dos motores registrados cujas bibliotecas estão instaladas.
+
+    Retorna:
+        List[str]: Os nomes dos motores, em ordem alfabética.
+    """
+    return sorted(name for name, engine in _ENGINES.items() if engine.is_available())
+
+
+def get_engine(name: Optional[str] = None) -> PdfEngine:
+    """
+    Retorna um motor de extração.
+
+    Parâmetros:
+        name (str, optional): O nome do motor. Por padrão, a variável de ambiente TRADUZAI_PDF_ENGINE, ou
+            'pypdf2' na sua ausência.
+
+    Retorna:
+        PdfEngine: O motor.
+
+    Exceções:
+        - ValueError: se o motor não estiver registrado ou se a sua biblioteca não estiver instalada.
+    """
+    name = (name or os.getenv('TRADUZAI_PDF_ENGINE') or DEFAULT_ENGINE).lower()
+    engine = _ENGINES.get(name)
+    if engine is None:
+        raise ValueError(f"Motor de extração de PDF desconhecido: {name}")
+    if not engine.is_available():
+        raise ValueError(f"O motor de extração de PDF '{name}' requer o pacote {engine.package}.")
+    return engine
+
+
+def benchmark_engine(name: str, file_paths: List[str]) -> dict:
+    """
+    Extrai o texto de todos os arquivos com um motor e mede a velocidade, a memória e o volume de texto.
+
+    Deve ser executada em um interpretador próprio, para que o pico de memória corresponda apenas ao motor
+    (ver `benchmark.py`).
+
+    Parâmetros:
+        name (str): O nome do motor.
+        file_paths (List[str]): Os arquivos PDF.
+
+    Retorna:
+        dict: O motor e a sua versão, o número de arquivos e de páginas extraídos, os arquivos com erro,
+        o tempo total, as páginas por segundo, o total de caracteres extraídos e o pico de memória
+        residente do processo, em MB (`None` se indisponível).
+    """
+    engine = get_engine(name)
+    pages = characters = 0
+    failed = []
+    start_time = time.perf_counter()
+    for file_path in file_paths:
+        try:
+            for text in engine.iter_pages(file_path, 1, None):
+                pages += 1
+                characters += len(text)
+        except Exception as e:
+            failed.append({'file': file_path, 'error': str(e)})
+    elapsed = time.perf_counter() - start_time
+    return {
+        'engine': name,
+        'version': engine.version(),
+        'files': len(file_paths) - len(failed),
+        'failed': failed,
+        'pages': pages,
+        'elapsed': round(elapsed, 3),
+        'pages_per_second': round(pages / elapsed, 2) if elapsed else 0.0,
+        'characters': characters,
+        'peak_rss_mb': _peak_rss_mb()
+    }
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """
+    Retorna o pico de memória residente do processo atual, em MB.
+
+    No Linux, utiliza o VmHWM de /proc/self/status, que corresponde apenas ao programa em execução: o
+    ru_maxrss de um processo iniciado por fork e exec também considera a memória do processo que o iniciou.
+    Nos demais sistemas, utiliza o ru_maxrss (em bytes no macOS e em KB nos demais).
+
+    Retorna:
+        Optional[float]: O pico de memória, ou `None` se indisponível.
+    """
+    try:
+        with open('/proc/self/status', encoding='ascii') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(max_rss / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+for _engine in (PyPdf2Engine(), PdfiumEngine(), PdfMinerEngine()):
+    register_engine(_engine)
@@ -0,0 +1,622 @@
+# services/pipeline/batch_service.py
+
+"""
+Batch Service Module
+====================
+
+Este módulo fornece o processamento em lote de documentos, sem interface gráfica. Cada documento
+passa pelas etapas importação → simplificação → métricas → tradução → BLEU Score → exportação,
+para um ou mais idiomas de destino, e vários documentos são processados simultaneamente:
+
+- As etapas que consomem CPU (extração do texto e métricas de legibilidade) são executadas em um
+  pool de processos, aproveitando todos os núcleos da máquina.
+- As etapas que dependem das APIs (simplificação, tradução e back-translation) são executadas em
+  threads, com um número limitado de documentos em andamento, de acordo com a cota disponível.
+
+As etapas de cada documento são organizadas em um grafo de dependências (`StageGraph`), de modo que
+as traduções para idiomas diferentes e as métricas são calculadas em paralelo. O resultado de cada
+documento (arquivos gerados, métricas, BLEU Scores, duração das etapas ou erro) é registrado em um
+arquivo de manifesto JSON, atualizado a cada documento concluído.
+
+Com um `StreamingPipelineService` e sem a opção de resumo, cada documento é lido parágrafo a parágrafo
+(`DocumentService.iter_paragraphs`) e a simplificação de cada segmento começa enquanto as páginas
+seguintes ainda estão sendo extraídas; nesse caso, a extração é feita na thread do documento, e não no
+pool de processos.
+
+Os documentos gerados são nomeados `<nome>.<idioma>.<formato>`. Quando documentos de diretórios diferentes
+têm o mesmo nome, a estrutura de diretórios a partir do diretório comum é reproduzida no diretório de
+saída, e documentos de formatos diferentes com o mesmo nome mantêm a extensão original no nome gerado.
+
+Opcionalmente, o progresso de cada documento é registrado em um `JobStore`: ao executar novamente
+o lote após uma interrupção, uma falha ou o esgotamento da cota, as etapas concluídas e os blocos
+já simplificados são reaproveitados, sem repetir as chamadas às APIs.
+
+Classes:
+    BatchService: Classe responsável pelo processamento em lote de documentos.
+
+Dependências:
+    - concurrent.futures: biblioteca padrão para os pools de processos e threads.
+    - glob: biblioteca padrão para a expansão dos padrões de arquivos.
+    - json: biblioteca padrão para a escrita do manifesto.
+    - os: biblioteca padrão para interagir com o sistema de arquivos.
+    - threading: biblioteca padrão para a sincronização da escrita do manifesto.
+    - time: biblioteca padrão para a medição da duração do processamento.
+    - typing: biblioteca padrão para anotações de tipos.
+    - services.document_service: Para a importação e exportação dos documentos.
+    - services.language.readability_service: Para o cálculo das métricas de legibilidade.
+    - services.pipeline.pipeline_service: Para a simplificação e o grafo de etapas.
+    - services.pipeline.streaming_pipeline: Para a simplificação à medida que o documento é lido (opcional).
+    - services.pipeline.job_store: Para o registro persistente do progresso (opcional).
+
+Exemplo de Uso:
+    >>> from services.pipeline.batch_service import BatchService
+    >>> batch = BatchService(pipeline_service)
+    >>> arquivos = BatchService.collect_inputs(['test/scientific-papers/*.pdf'])
+    >>> manifesto = batch.run(arquivos, ['en', 'es'], opcoes, 'saida', 'txt', 'saida/manifest.json')
+    >>> print(manifesto['summary'])
+    {'total': 52, 'succeeded': 52, 'failed': 0, 'elapsed': 412.8}
+"""
+
+import glob
+import json
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from services.document_service import DocumentService
+from services.language.readability_service import ReadabilityService
+from services.pipeline.job_store import JobStore
+from services.pipeline.pipeline_service import (
+    STAGE_BLEU_SCORE, STAGE_TRANSLATE, PipelineService, StageGraph, language_stage
+)
+from services.pipeline.streaming_pipeline import StreamingPipelineService
+
+# Extensões de documentos aceitas na entrada
+SUPPORTED_EXTENSIONS = ('.pdf', '.docx', '.epub', '.txt')
+# Formatos de exportação aceitos
+EXPORT_FORMATS = ('txt', 'pdf', 'docx')
+# Número padrão de documentos processados simultaneamente nas etapas que dependem das APIs
+DEFAULT_MAX_DOCUMENTS = 4
+
+# Nomes das etapas do lote
+STAGE_IMPORT = 'import'
+STAGE_READABILITY_ORIGINAL = 'readability_original'
+STAGE_SIMPLIFY = 'simplify'
+STAGE_READABILITY_SIMPLIFIED = 'readability_simplified'
+STAGE_EXPORT = 'export'
+
+# Serviço de documentos do processo de trabalho atual, com o identificador do processo que o criou (um
+# processo criado por fork não reutiliza a conexão com o cache herdada do processo principal)
+_worker_document_service: Optional[Tuple[int, DocumentService]] = None
+
+
+def _import_document(file_path: str) -> str:
+    """
+    Extrai o texto de um documento. Executada nos processos de trabalho.
+
+    Parâmetros:
+        file_path (str): Caminho do documento.
+
+    Retorna:
+        str: O texto extraído.
+
+    Exceções:
+        - ValueError: se o documento não contiver texto extraível.
+    """
+    # Os documentos já são distribuídos entre os processos; cada um é extraído em um único processo, com o
+    # serviço (e o cache de extrações) do processo atual, criado na sua primeira importação
+    global _worker_document_service
+    if _worker_document_service is None or _worker_document_service[0] != os.getpid():
+        _worker_document_service = (os.getpid(), DocumentService(processes=1))
+    text = _worker_document_service[1].import_document(file_path)
+    if not text or not text.strip():
+        raise ValueError(f"Nenhum texto extraído de {file_path}")
+    return text
+
+
+def _calculate_readability(text: str) -> dict:
+    """
+    Calcula as métricas de legibilidade de um texto. Executada nos processos de trabalho.
+
+    Parâmetros:
+        text (str): O texto a ser analisado.
+
+    Retorna:
+        dict: As métricas de legibilidade.
+    """
+    return ReadabilityService.calculate_readability(text)
+
+
+class BatchService:
+    """
+    Serviço de processamento em lote de documentos.
+
+    Métodos:
+        collect_inputs(patterns: Iterable[str]) ⇾ List[str]:
+            Expande caminhos, diretórios e padrões glob na lista de documentos a processar.
+
+        output_names(files: List[str]) ⇾ Dict[str, str]:
+            Retorna o nome, sem idioma e formato, dos documentos gerados a partir de cada documento.
+
+        output_path(file_path, output_dir, output_name, language, export_format) ⇾ str:
+            Retorna o caminho do documento gerado para um idioma de destino.
+
+        run(files, target_languages, options, output_dir, export_format, manifest_path) ⇾ dict:
+            Processa os documentos e retorna o manifesto.
+
+        process_document(file_path, target_languages, options, output_dir, export_format, output_name) ⇾ dict:
+            Processa um único documento e retorna a sua entrada no manifesto.
+    """
+
+    def __init__(self, pipeline_service: PipelineService, document_service: Optional[DocumentService] = None,
+                 processes: Optional[int] = None, max_documents: int = DEFAULT_MAX_DOCUMENTS,
+                 on_document: Optional[Callable[[dict], None]] = None, job_store: Optional[JobStore] = None,
+                 streaming_pipeline_service: Optional[StreamingPipelineService] = None):
+        """
+        Inicializa a instância do BatchService.
+
+        Parâmetros:
+            pipeline_service (PipelineService): Serviço com os clientes de simplificação, tradução e BLEU Score.
+            document_service (DocumentService, optional): Serviço de exportação dos documentos.
+            processes (int, optional): Número de processos das etapas de CPU. Por padrão, o número de núcleos.
+            max_documents (int): Número máximo de documentos em processamento simultâneo.
+            on_document (Callable[[dict], None], optional): Função chamada com a entrada do manifesto
+                de cada documento concluído.
+            job_store (JobStore, optional): Armazenamento do progresso. Se informado, as etapas e os blocos
+                concluídos em execuções anteriores são reaproveitados.
+            streaming_pipeline_service (StreamingPipelineService, optional): Pipeline em streaming. Se informado,
+                os documentos que não serão resumidos são simplificados à medida que são lidos.
+        """
+        self.pipeline_service = pipeline_service
+        self.document_service = document_service or DocumentService()
+        self.processes = processes or os.cpu_count() or 1
+        self.max_documents = max(1, max_documents)
+        self.on_document = on_document
+        self.job_store = job_store
+        self.streaming_pipeline_service = streaming_pipeline_service
+        self.cpu_executor: Optional[Executor] = None
+        self._manifest_lock = threading.Lock()
+
+    @staticmethod
+    def collect_inputs(patterns: Iterable[str]) -> List[str]:
+        """
+        Expande caminhos, diretórios e padrões glob na lista de documentos a processar.
+
+        Diretórios são percorridos recursivamente. Apenas arquivos com extensões suportadas
+        (PDF, DOCX, EPUB e TXT) são incluídos, sem repetições e em ordem alfabética.
+
+        Parâmetros:
+            patterns (Iterable[str]): Caminhos de arquivos, diretórios ou padrões glob.
+
+        Retorna:
+            List[str]: Os caminhos dos documentos encontrados.
+        """
+        files = set()
+        for pattern in patterns:
+            for path in glob.glob(pattern, recursive=True) or [pattern]:
+                if os.path.isdir(path):
+                    for directory, _, names in os.walk(path):
+                        files.update(os.path.join(directory, name) for name in names)
+                elif os.path.isfile(path):
+                    files.add(path)
+        return sorted(path for path in files if os.path.splitext(path)[1].lower() in SUPPORTED_EXTENSIONS)
+
+    @staticmethod
+    def output_names(files: List[str]) -> Dict[str, str]:
+        """
+        Retorna o nome, sem idioma e formato, dos documentos gerados a partir de cada documento.
+
+        O nome é o do documento sem a extensão. Documentos com o mesmo nome (sem distinção entre maiúsculas
+        e minúsculas) recebem o caminho relativo ao diretório comum entre eles, reproduzindo os
+        subdiretórios no diretório de saída; se ainda assim coincidirem (o mesmo nome em formatos
+        diferentes), a extensão original é mantida no nome.
+
+        Parâmetros:
+            files (List[str]): Os documentos a processar.
+
+        Retorna:
+            Dict[str, str]: O nome de cada documento, relativo ao diretório de saída.
+
+        Exemplos de Uso:
+            >>> BatchService.output_names(['a/artigo.pdf', 'b/artigo.pdf', 'b/artigo.docx', 'resumo.txt'])
+            {'a/artigo.pdf': 'a/artigo', 'b/artigo.pdf': 'b/artigo.pdf', 'b/artigo.docx': 'b/artigo.docx',
+             'resumo.txt': 'resumo'}
+        """
+        groups: Dict[str, List[str]] = {}
+        for file_path in files:
+            groups.setdefault(os.path.splitext(os.path.basename(file_path))[0].lower(), []).append(file_path)
+
+        names = {}
+        for group in groups.values():
+            if len(group) == 1:
+                names[group[0]] = os.path.splitext(os.path.basename(group[0]))[0]
+                continue
+            common_dir = os.path.commonpath([os.path.dirname(os.path.abspath(path)) for path in group])
+            relative = {path: os.path.relpath(os.path.abspath(path), common_dir) for path in group}
+            stems = [os.path.splitext(path)[0].lower() for path in relative.values()]
+            for path, relative_path in relative.items():
+                stem = os.path.splitext(relative_path)[0]
+                names[path] = relative_path if stems.count(stem.lower()) > 1 else stem
+        return names
+
+    def run(self, files: List[str], target_languages: List[str], options: dict, output_dir: str,
+            export_format: str = 'txt', manifest_path: Optional[str] = None) -> dict:
+        """
+        Processa os documentos e retorna o manifesto.
+
+        Parâmetros:
+            files (List[str]): Os documentos a processar.
+            target_languages (List[str]): Os códigos dos idiomas de destino.
+            options (dict): Os parâmetros de simplificação (ver `PipelineService.simplify`).
+            output_dir (str): Diretório dos documentos exportados.
+            export_format (str): Formato de exportação ('txt', 'pdf' ou 'docx').
+            manifest_path (str, optional): Caminho do manifesto. Por padrão, `manifest.json` em `output_dir`.
+
+        Retorna:
+            dict: O manifesto, com as opções utilizadas, a entrada de cada documento e um resumo.
+
+        Exceções:
+            - ValueError: se não houver idiomas de destino ou se o formato de exportação não for suportado.
+        """
+        if not target_languages:
+            raise ValueError("Informe ao menos um idioma de destino.")
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError(f"Formato de exportação não suportado: {export_format}")
+
+        os.makedirs(output_dir, exist_ok=True)
+        manifest_path = manifest_path or os.path.join(output_dir, 'manifest.json')
+        manifest = {
+            'options': dict(options, target_languages=list(target_languages), export_format=export_format),
+            'documents': [],
+            'summary': {}
+        }
+
+        output_names = self.output_names(files)
+        start_time = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=self.processes) as cpu_executor, \
+                ThreadPoolExecutor(max_workers=self.max_documents) as document_executor:
+            self.cpu_executor = cpu_executor
+            futures = [
+                document_executor.submit(
+                    self.process_document, file_path, target_languages, options, output_dir, export_format,
+                    output_names[file_path]
+                )
+                for file_path in files
+            ]
+            for future in as_completed(futures):
+                entry = future.result()
+                with self._manifest_lock:
+                    manifest['documents'].append(entry)
+                    self._update_summary(manifest, time.perf_counter() - start_time)
+                    self.write_manifest(manifest, manifest_path)
+                if self.on_document is not None:
+                    self.on_document(entry)
+            self.cpu_executor = None
+
+        self._update_summary(manifest, time.perf_counter() - start_time)
+        self.write_manifest(manifest, manifest_path)
+        return manifest
+
+    def process_document(self, file_path: str, target_languages: List[str], options: dict, output_dir: str,
+                         export_format: str, output_name: Optional[str] = None) -> dict:
+        """
+        Processa um único documento.
+
+        As etapas formam o grafo: importação → (métricas do original, simplificação); simplificação →
+        (métricas do texto simplificado, tradução para cada idioma); tradução → BLEU Score → exportação.
+
+        Parâmetros:
+            file_path (str): O documento a processar.
+            target_languages (List[str]): Os códigos dos idiomas de destino.
+            options (dict): Os parâmetros de simplificação.
+            output_dir (str): Diretório dos documentos exportados.
+            export_format (str): Formato de exportação.
+            output_name (str, optional): O nome dos documentos gerados, sem idioma e formato (ver
+                `output_names`). Por padrão, o nome do documento sem a extensão.
+
+        Com um `JobStore`, cada etapa concluída é registrada assim que termina, e as etapas registradas
+        em execuções anteriores são reaproveitadas (ver `resumed_stages` no manifesto).
+
+        Retorna:
+            dict: A entrada do manifesto, com o status ('succeeded' ou 'failed'), os arquivos gerados, as
+            métricas, os BLEU Scores e a duração de cada etapa, ou a mensagem de erro.
+        """
+        entry: Dict[str, Any] = {'input': file_path}
+        start_time = time.perf_counter()
+        try:
+            job_key = None
+            if self.job_store is not None:
+                # Os blocos simplificados em streaming são divididos de outra forma e têm uma chave própria
+                job_options = options
+                if self._streams(options):
+                    segment_tokens = self.streaming_pipeline_service.segment_tokens
+                    job_options = dict(options, streaming_segment_tokens=segment_tokens)
+                job_key = self.job_store.job_key(file_path, job_options)
+            graph = self.build_graph(file_path, target_languages, options, output_dir, export_format, job_key,
+                                     output_name)
+            resumed_stages: List[str] = []
+            if job_key is not None:
+                outputs = {
+                    language_stage(STAGE_EXPORT, language):
+                        self.output_path(file_path, output_dir, output_name, language, export_format)
+                    for language in target_languages
+                }
+                self._add_checkpoints(graph, job_key, resumed_stages, outputs)
+            results, timings = graph.run()
+
+            def by_language(stage: str) -> Dict[str, Any]:
+                return {language: results[language_stage(stage, language)] for language in target_languages}
+
+            entry.update(
+                resumed_stages=sorted(resumed_stages),
+                status='succeeded',
+                outputs=by_language(STAGE_EXPORT),
+                source_language={
+                    language: translation[1] for language, translation in by_language(STAGE_TRANSLATE).items()
+                },
+                metrics_original=results[STAGE_READABILITY_ORIGINAL],
+                metrics_simplified=results[STAGE_READABILITY_SIMPLIFIED],
+                bleu_scores=by_language(STAGE_BLEU_SCORE),
+                timings={name: round(duration, 3) for name, duration in timings.items()}
+            )
+        except Exception as e:
+            entry.update(status='failed', error=str(e))
+        entry['elapsed'] = round(time.perf_counter() - start_time, 3)
+        return entry
+
+    def build_graph(self, file_path: str, target_languages: List[str], options: dict, output_dir: str,
+                    export_format: str, job_key: Optional[str] = None,
+                    output_name: Optional[str] = None) -> StageGraph:
+        """
+        Constrói o grafo de etapas de um documento.
+
+        Parâmetros:
+            file_path (str): O documento a processar.
+            target_languages (List[str]): Os códigos dos idiomas de destino.
+            options (dict): Os parâmetros de simplificação.
+            output_dir (str): Diretório dos documentos exportados.
+            export_format (str): Formato de exportação.
+            job_key (str, optional): Chave do documento no `JobStore`, utilizada para registrar e reaproveitar
+                os blocos simplificados de documentos longos.
+            output_name (str, optional): O nome dos documentos gerados, sem idioma e formato. Por padrão, o
+                nome do documento sem a extensão.
+
+        Retorna:
+            StageGraph: O grafo de etapas, pronto para execução.
+        """
+        def simplify(results: Dict[str, Any]) -> str:
+            if job_key is None:
+                return self.pipeline_service.simplify(results[STAGE_IMPORT], options)
+            return self.pipeline_service.simplify(
+                results[STAGE_IMPORT],
+                options,
+                on_chunk=lambda index, chunk: self.job_store.set_chunk(job_key, index, chunk),
+                completed_chunks=self.job_store.get_chunks(job_key)
+            )
+
+        graph = StageGraph()
+        if self._streams(options):
+            self._add_streaming_stages(graph, file_path, options, job_key)
+        else:
+            graph.add_stage(STAGE_IMPORT, lambda results: self._run_cpu(_import_document, file_path))
+            graph.add_stage(
+                STAGE_SIMPLIFY,
+                simplify,
+                dependencies=[STAGE_IMPORT]
+            )
+        graph.add_stage(
+            STAGE_READABILITY_ORIGINAL,
+            lambda results: self._run_cpu(_calculate_readability, results[STAGE_IMPORT]),
+            dependencies=[STAGE_IMPORT]
+        )
+        graph.add_stage(
+            STAGE_READABILITY_SIMPLIFIED,
+            lambda results: self._run_cpu(_calculate_readability, results[STAGE_SIMPLIFY]),
+            dependencies=[STAGE_SIMPLIFY]
+        )
+
+        for language in target_languages:
+            output_path = self.output_path(file_path, output_dir, output_name, language, export_format)
+            self._add_language_stages(graph, language, output_path, export_format)
+        return graph
+
+    def _streams(self, options: dict) -> bool:
+        """
+        Indica se os documentos são simplificados à medida que são lidos.
+
+        Parâmetros:
+            options (dict): Os parâmetros de simplificação.
+
+        Retorna:
+            bool: `True` se há um pipeline em streaming e o texto não será resumido (o resumo precisa do
+            documento completo para a consolidação).
+        """
+        return self.streaming_pipeline_service is not None and not options.get('summarize')
+
+    def _add_streaming_stages(self, graph: StageGraph, file_path: str, options: dict,
+                              job_key: Optional[str]) -> None:
+        """
+        Adiciona ao grafo as etapas de importação e simplificação de um documento lido parágrafo a parágrafo.
+
+        A simplificação lê o documento e simplifica os segmentos à medida que os parágrafos são extraídos; a
+        importação apenas reúne os parágrafos lidos. Se a simplificação for reaproveitada de uma execução
+        anterior, a importação extrai o documento novamente no pool de processos.
+
+        Parâmetros:
+            graph (StageGraph): O grafo do documento.
+            file_path (str): O documento a processar.
+            options (dict): Os parâmetros de simplificação.
+            job_key (str, optional): Chave do documento no `JobStore`, utilizada para registrar e reaproveitar
+                os segmentos simplificados.
+        """
+        paragraphs_read: List[str] = []
+
+        def paragraphs() -> Iterable[str]:
+            for paragraph in self.document_service.iter_paragraphs(file_path):
+                paragraphs_read.append(paragraph)
+                yield paragraph
+
+        def simplify(results: Dict[str, Any]) -> str:
+            completed = self.job_store.get_chunks(job_key) if job_key is not None else {}
+            simplified = []
+            for segment in self.streaming_pipeline_service.simplify_stream(paragraphs(), options,
+                                                                           completed_segments=completed):
+                if job_key is not None and segment.index not in completed:
+                    self.job_store.set_chunk(job_key, segment.index, segment.simplified_text)
+                simplified.append(segment.simplified_text)
+            if not simplified:
+                raise ValueError(f"Nenhum texto extraído de {file_path}")
+            return '\n\n'.join(simplified)
+
+        def import_document(results: Dict[str, Any]) -> str:
+            if paragraphs_read:
+                return '\n\n'.join(paragraphs_read)
+            return self._run_cpu(_import_document, file_path)
+
+        graph.add_stage(STAGE_SIMPLIFY, simplify)
+        graph.add_stage(STAGE_IMPORT, import_document, dependencies=[STAGE_SIMPLIFY])
+
+    @staticmethod
+    def output_path(file_path: str, output_dir: str, output_name: Optional[str], language: str,
+                    export_format: str) -> str:
+        """
+        Retorna o caminho do documento gerado para um idioma de destino.
+
+        Parâmetros:
+            file_path (str): O documento de entrada.
+            output_dir (str): Diretório dos documentos exportados.
+            output_name (str, optional): O nome dos documentos gerados, sem idioma e formato. Por padrão, o
+                nome do documento sem a extensão.
+            language (str): O código do idioma de destino.
+            export_format (str): Formato de exportação.
+
+        Retorna:
+            str: O caminho `<output_dir>/<nome>.<idioma>.<formato>`.
+        """
+        output_name = output_name or os.path.splitext(os.path.basename(file_path))[0]
+        return os.path.join(output_dir, f'{output_name}.{language}.{export_format}')
+
+    def _add_language_stages(self, graph: StageGraph, language: str, output_path: str, export_format: str) -> None:
+        """
+        Adiciona ao grafo as etapas de tradução, BLEU Score e exportação de um idioma de destino.
+
+        Parâmetros:
+            graph (StageGraph): O grafo do documento.
+            language (str): O código do idioma de destino.
+            output_path (str): O caminho do documento exportado.
+            export_format (str): Formato de exportação.
+        """
+        translate = language_stage(STAGE_TRANSLATE, language)
+        bleu_score = language_stage(STAGE_BLEU_SCORE, language)
+        self.pipeline_service.add_language_stages(graph, language)
+
+        def export_document(results: Dict[str, Any]) -> str:
+            # Nomes desambiguados reproduzem os subdiretórios dos documentos de entrada
+            os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+            self.document_service.export_document(
+                results[translate][0],
+                output_path,
+                export_format,
+                results[STAGE_READABILITY_ORIGINAL],
+                results[STAGE_READABILITY_SIMPLIFIED],
+                results[bleu_score]
+            )
+            return output_path
+
+        graph.add_stage(
+            language_stage(STAGE_EXPORT, language),
+            export_document,
+            dependencies=[translate, bleu_score, STAGE_READABILITY_ORIGINAL, STAGE_READABILITY_SIMPLIFIED]
+        )
+
+    def _add_checkpoints(self, graph: StageGraph, job_key: str, resumed_stages: List[str],
+                         outputs: Optional[Dict[str, str]] = None) -> None:
+        """
+        Envolve as etapas do grafo com o registro e o reaproveitamento dos artefatos no `JobStore`.
+
+        Uma etapa com artefato registrado não é executada novamente. A chave do documento não inclui o
+        formato nem o diretório de saída, de modo que uma nova execução com outro formato reaproveita a
+        simplificação e as traduções; as etapas de exportação, porém, são executadas novamente se o
+        arquivo registrado não for o caminho esperado nesta execução ou se não existir mais.
+
+        Parâmetros:
+            graph (StageGraph): O grafo do documento.
+            job_key (str): A chave do documento no `JobStore`.
+            resumed_stages (List[str]): Lista que recebe os nomes das etapas reaproveitadas.
+            outputs (Dict[str, str], optional): O caminho esperado do documento gerado por cada etapa de
+                exportação (ver `output_path`).
+        """
+        outputs = outputs or {}
+
+        def reusable(name: str, value: Any) -> bool:
+            if value is None:
+                return False
+            if not name.startswith(f'{STAGE_EXPORT}:'):
+                return True
+            expected = outputs.get(name)
+            if expected is not None and os.path.abspath(value) != os.path.abspath(expected):
+                return False
+            return os.path.exists(value)
+
+        def checkpoint(name: str, function: Callable[[Dict[str, Any]], Any]) -> Callable[[Dict[str, Any]], Any]:
+            def run(results: Dict[str, Any]) -> Any:
+                value = self.job_store.get_artifact(job_key, name)
+                if reusable(name, value):
+                    resumed_stages.append(name)
+                    return value
+                value = function(results)
+                self.job_store.set_artifact(job_key, name, value)
+                return value
+            return run
+
+        for name, (function, dependencies) in list(graph.stages.items()):
+            graph.stages[name] = (checkpoint(name, function), dependencies)
+
+    def _run_cpu(self, function: Callable, *args):
+        """
+        Executa uma etapa de CPU no pool de processos (ou na thread atual, fora de `run`).
+
+        Parâmetros:
+            function (Callable): Função de nível de módulo a ser executada.
+            *args: Argumentos da função.
+
+        Retorna:
+            O valor retornado pela função.
+        """
+        if self.cpu_executor is None:
+            return function(*args)
+        return self.cpu_executor.submit(function, *args).result()
+
+    @staticmethod
+    def _update_summary(manifest: dict, elapsed: float) -> None:
+        """
+        Atualiza o resumo do manifesto.
+
+        Parâmetros:
+            manifest (dict): O manifesto.
+            elapsed (float): Tempo decorrido desde o início do lote, em segundos.
+        """
+        documents = manifest['documents']
+        succeeded = sum(1 for entry in documents if entry['status'] == 'succeeded')
+        manifest['summary'] = {
+            'total': len(documents),
+            'succeeded': succeeded,
+            'failed': len(documents) - succeeded,
+            'elapsed': round(elapsed, 3)
+        }
+
+    @staticmethod
+    def write_manifest(manifest: dict, manifest_path: str) -> None:
+        """
+        Grava o manifesto de forma atômica, de modo que uma interrupção nunca deixe o arquivo incompleto.
+
+        Parâmetros:
+            manifest (dict): O manifesto.
+            manifest_path (str): O caminho do arquivo.
+        """
+        temporary_path = f'{manifest_path}.tmp'
+        with open(temporary_path, 'w', encoding='utf-8') as file:
+            json.dump(manifest, file, ensure_ascii=False, indent=2)
+        os.replace(temporary_path, manifest_path)
@@ -0,0 +1,716 @@
+# services/pipeline/job_queue.py
+
+"""
+Job Queue Module
+================
+
+Este módulo fornece uma fila assíncrona de trabalhos do pipeline de simplificação e tradução, utilizada
+pelo servidor HTTP (`server.py`). Os trabalhos são submetidos a uma fila limitada e executados por um
+conjunto fixo de workers: cada worker retira um trabalho da fila e executa o pipeline em uma thread,
+sem bloquear o event loop. Um trabalho cancelado enquanto aguarda é retirado da fila, liberando a sua
+vaga imediatamente. Como todos os trabalhos são executados no mesmo processo, os clientes das
+APIs (com os seus pools de conexões), os caches e o gerenciador de cotas são compartilhados.
+
+O progresso de cada trabalho (início e fim das etapas, trechos simplificados e segmentos traduzidos
+de documentos longos) é registrado como uma sequência de eventos, que pode ser acompanhada em tempo
+real por vários clientes. Apenas os eventos mais recentes de cada trabalho são mantidos em memória, e os
+trabalhos concluídos também são mantidos até um limite, descartando os mais antigos.
+
+Além de um texto, um trabalho pode indicar um documento do diretório de documentos do serviço (opcionalmente,
+um intervalo de páginas de um PDF). O documento é lido parágrafo a parágrafo (`DocumentService.iter_paragraphs`)
+na thread do trabalho: com um único idioma de destino e sem resumo, a simplificação em streaming começa enquanto
+as páginas seguintes ainda estão sendo extraídas.
+
+Classes:
+    QueueFullError: Exceção lançada quando a fila de trabalhos está cheia.
+    Job: Trabalho submetido à fila, com o seu estado, eventos e resultado.
+    JobQueueService: Classe responsável pela fila e pelos workers.
+
+Dependências:
+    - asyncio: biblioteca padrão para a fila e os workers assíncronos.
+    - collections: biblioteca padrão para a fila, os eventos e a ordem de descarte dos trabalhos concluídos.
+    - numbers: biblioteca padrão para a validação dos parâmetros numéricos.
+    - concurrent.futures: biblioteca padrão para a execução do pipeline em threads.
+    - os: biblioteca padrão para a validação dos caminhos dos documentos.
+    - time: biblioteca padrão para o registro dos horários dos trabalhos.
+    - uuid: biblioteca padrão para a geração dos identificadores dos trabalhos.
+    - typing: biblioteca padrão para anotações de tipos.
+    - services.document_service: Para a leitura dos documentos submetidos (opcional).
+    - services.pipeline.batch_service: Para as extensões de documentos aceitas.
+    - services.pipeline.pipeline_service: Para a execução do pipeline.
+    - services.pipeline.streaming_pipeline: Para a execução em streaming de documentos longos (opcional).
+    - services.task_service: Para o cancelamento cooperativo dos trabalhos.
+
+Exemplo de Uso:
+    >>> from services.pipeline.job_queue import JobQueueService
+    >>> jobs = JobQueueService(pipeline_service, streaming_pipeline_service, max_workers=4, max_queue_size=100)
+    >>> await jobs.start()
+    >>> job = jobs.submit(texto, ['en', 'es'], {'area_tecnica': 'Geral', 'estilo': 'Formal'})
+    >>> job = jobs.submit_document('artigo.pdf', ['en'], first_page=1, last_page=10)
+    >>> async for evento in jobs.events(job):
+    ...     print(evento)
+    {'type': 'stage', 'stage': 'simplify', 'event': 'started'}
+    ...
+    >>> print(job.to_dict()['status'])
+    'succeeded'
+"""
+
+import asyncio
+import os
+import time
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from numbers import Real
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Union
+
+from services.document_service import DocumentService
+from services.pipeline.batch_service import SUPPORTED_EXTENSIONS
+from services.pipeline.pipeline_service import MultiPipelineResult, PipelineResult, PipelineService
+from services.pipeline.streaming_pipeline import StreamingPipelineService
+from services.task_service import CancellationToken, OperationCancelledError
+
+# Valores padrão da fila
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_MAX_QUEUE_SIZE = 100
+DEFAULT_MAX_FINISHED_JOBS = 1000
+
+# Número de eventos mantidos em memória por trabalho; os mais antigos são descartados
+DEFAULT_MAX_JOB_EVENTS = 10000
+
+# Estados dos trabalhos
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_SUCCEEDED = 'succeeded'
+JOB_FAILED = 'failed'
+JOB_CANCELLED = 'cancelled'
+FINISHED_STATUSES = (JOB_SUCCEEDED, JOB_FAILED, JOB_CANCELLED)
+
+# Parâmetros de simplificação aceitos e os seus valores padrão, como no processamento em lote
+DEFAULT_OPTIONS = {
+    'area_tecnica': 'Ciência da Computação',
+    'estilo': 'Informal',
+    'summarize': False,
+    'model': 'gpt-3.5-turbo-0125',
+    'complexity_level': 'Intermediário',
+    'focus_aspects': [],
+    'temperature': 0.8,
+    'max_tokens': 1500
+}
+
+# Limites dos parâmetros numéricos de simplificação
+TEMPERATURE_RANGE = (0.0, 2.0)
+MAX_TOKENS_RANGE = (1, 16384)
+
+
+class QueueFullError(Exception):
+    """
+    Exceção lançada quando a fila de trabalhos atinge o seu tamanho máximo.
+    """
+
+    def __init__(self, max_queue_size: int):
+        super().__init__(f"A fila de trabalhos está cheia ({max_queue_size} trabalhos aguardando).")
+        self.max_queue_size = max_queue_size
+
+
+class Job:
+    """
+    Trabalho submetido à fila, com o seu estado, eventos e resultado.
+
+    Os eventos são dicionários com a chave 'type': 'stage' (início ou fim de uma etapa), 'token' (trecho
+    simplificado), 'segment' (segmento traduzido de um documento longo) e, ao final, 'status'. Apenas os
+    `max_events` eventos mais recentes são mantidos. Os métodos que alteram o trabalho devem ser chamados
+    na thread do event loop.
+
+    Atributos:
+        job_id (str): O identificador do trabalho.
+        text (str): O texto original, ou `None` se o trabalho indicar um documento.
+        document (str): O caminho do documento, ou `None` se o trabalho indicar um texto.
+        pages (Tuple[int, Optional[int]]): A primeira e a última página lidas do documento.
+        target_language_codes (List[str]): Os códigos dos idiomas de destino.
+        options (dict): Os parâmetros de simplificação.
+        status (str): O estado do trabalho ('queued', 'running', 'succeeded', 'failed' ou 'cancelled').
+        events (deque): Os eventos mais recentes, em ordem.
+        published (int): O número total de eventos publicados, incluindo os descartados.
+        result (dict): O resultado serializado, após a conclusão.
+        error (str): A mensagem de erro, se o trabalho falhar.
+        cancellation_token (CancellationToken): Sinalizador de cancelamento do pipeline.
+    """
+
+    def __init__(self, text: Optional[str], target_language_codes: List[str], options: dict,
+                 max_events: int = DEFAULT_MAX_JOB_EVENTS, document: Optional[str] = None,
+                 first_page: int = 1, last_page: Optional[int] = None):
+        """
+        Inicializa a instância do Job, na fila.
+
+        Parâmetros:
+            text (str, optional): O texto original.
+            target_language_codes (List[str]): Os códigos dos idiomas de destino.
+            options (dict): Os parâmetros de simplificação.
+            max_events (int): Número de eventos mantidos em memória.
+            document (str, optional): O caminho do documento, no lugar do texto.
+            first_page (int): A primeira página lida do documento.
+            last_page (int, optional): A última página lida do documento.
+        """
+        self.job_id = uuid.uuid4().hex
+        self.text = text
+        self.document = document
+        self.pages = (first_page, last_page)
+        self.target_language_codes = target_language_codes
+        self.options = options
+        self.status = JOB_QUEUED
+        self.events: deque = deque(maxlen=max_events)
+        self.published = 0
+        self.result: Optional[dict] = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.running_stages: List[str] = []
+        self.completed_stages: List[str] = []
+        self.cancellation_token = CancellationToken()
+        self._changed = asyncio.Event()
+
+    @property
+    def finished(self) -> bool:
+        """
+        Indica se o trabalho foi concluído, com sucesso ou não.
+        """
+        return self.status in FINISHED_STATUSES
+
+    def publish(self, event: dict) -> None:
+        """
+        Registra um evento do trabalho e acorda os clientes que o acompanham.
+
+        Parâmetros:
+            event (dict): O evento.
+        """
+        if event['type'] == 'stage':
+            if event['event'] == 'started':
+                self.running_stages.append(event['stage'])
+            elif event['stage'] in self.running_stages:
+                self.running_stages.remove(event['stage'])
+                self.completed_stages.append(event['stage'])
+        self.events.append(event)
+        self.published += 1
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def start(self) -> None:
+        """
+        Marca o início da execução do trabalho.
+        """
+        self.status = JOB_RUNNING
+        self.started_at = time.time()
+        self.publish({'type': 'status', 'status': self.status})
+
+    def finish(self, status: str, result: Optional[dict] = None, error: Optional[str] = None) -> None:
+        """
+        Marca a conclusão do trabalho.
+
+        Parâmetros:
+            status (str): O estado final ('succeeded', 'failed' ou 'cancelled').
+            result (dict, optional): O resultado serializado.
+            error (str, optional): A mensagem de erro.
+        """
+        self.status = status
+        self.result = result
+        self.error = error
+        self.finished_at = time.time()
+        self.running_stages = []
+        event = {'type': 'status', 'status': status}
+        if error is not None:
+            event['error'] = error
+        self.publish(event)
+
+    async def wait_for_events(self, position: int) -> None:
+        """
+        Aguarda até que existam eventos a partir da posição informada ou que o trabalho seja concluído.
+
+        Parâmetros:
+            position (int): O número de eventos já lidos (incluindo os descartados).
+        """
+        while self.published <= position and not self.finished:
+            await self._changed.wait()
+
+    def to_dict(self) -> dict:
+        """
+        Retorna o estado do trabalho, sem o resultado.
+
+        Retorna:
+            dict: O identificador, o estado, os idiomas de destino, as etapas em andamento e concluídas,
+            os horários de criação, início e conclusão e, se houver, a mensagem de erro.
+        """
+        return {
+            'job_id': self.job_id,
+            'status': self.status,
+            'target_language_codes': self.target_language_codes,
+            'running_stages': list(self.running_stages),
+            'completed_stages': list(self.completed_stages),
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'error': self.error
+        }
+
+
+class JobQueueService:
+    """
+    Fila limitada de trabalhos do pipeline, executados por um conjunto fixo de workers.
+
+    Métodos:
+        start() ⇾ None:
+            Inicia os workers.
+
+        stop() ⇾ None:
+            Cancela os trabalhos pendentes e encerra os workers.
+
+        submit(text: str, target_language_codes: List[str], options: Optional[dict] = None) ⇾ Job:
+            Valida e enfileira um trabalho.
+
+        submit_document(document: str, target_language_codes: List[str], options, first_page, last_page) ⇾ Job:
+            Valida e enfileira um trabalho sobre um documento do diretório de documentos.
+
+        validate_options(options: dict) ⇾ None:
+            Valida os tipos e os intervalos dos parâmetros de simplificação.
+
+        get(job_id: str) ⇾ Optional[Job]:
+            Retorna o trabalho com o identificador informado.
+
+        cancel(job_id: str) ⇾ Optional[Job]:
+            Solicita o cancelamento de um trabalho.
+
+        events(job: Job) ⇾ AsyncIterator[dict]:
+            Percorre os eventos do trabalho, aguardando os novos até a sua conclusão.
+
+        stats() ⇾ dict:
+            Retorna o número de trabalhos em cada estado e a configuração da fila.
+
+        serialize_result(result: PipelineResult | MultiPipelineResult, target_language_codes: List[str]) ⇾ dict:
+            Converte o resultado do pipeline em um dicionário serializável em JSON.
+    """
+
+    def __init__(self, pipeline_service: PipelineService,
+                 streaming_pipeline_service: Optional[StreamingPipelineService] = None,
+                 max_workers: int = DEFAULT_MAX_WORKERS, max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+                 max_finished_jobs: int = DEFAULT_MAX_FINISHED_JOBS, max_job_events: int = DEFAULT_MAX_JOB_EVENTS,
+                 documents_dir: Optional[str] = None, document_service: Optional[DocumentService] = None):
+        """
+        Inicializa a instância do JobQueueService.
+
+        Parâmetros:
+            pipeline_service (PipelineService): O pipeline de simplificação e tradução.
+            streaming_pipeline_service (StreamingPipelineService, optional): O pipeline em streaming,
+                utilizado para documentos longos com um único idioma de destino.
+            max_workers (int): Número de trabalhos executados simultaneamente.
+            max_queue_size (int): Número máximo de trabalhos aguardando na fila.
+            max_finished_jobs (int): Número de trabalhos concluídos mantidos em memória.
+            max_job_events (int): Número de eventos mantidos em memória por trabalho.
+            documents_dir (str, optional): Diretório dos documentos que podem ser submetidos. Se omitido, apenas
+                textos são aceitos.
+            document_service (DocumentService, optional): Serviço de leitura dos documentos. Por padrão, um
+                `DocumentService` com as configurações padrão.
+
+        Exceções:
+            - ValueError: se algum dos limites não for positivo.
+        """
+        if max_workers < 1 or max_queue_size < 1 or max_finished_jobs < 1 or max_job_events < 1:
+            raise ValueError("O número de workers e os tamanhos da fila devem ser positivos.")
+
+        self.pipeline_service = pipeline_service
+        self.streaming_pipeline_service = streaming_pipeline_service
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self.max_finished_jobs = max_finished_jobs
+        self.max_job_events = max_job_events
+        self.documents_dir = os.path.realpath(documents_dir) if documents_dir else None
+        self.document_service = document_service
+        # O serviço de documentos criado pela fila tem o seu pool de processos encerrado em `stop`
+        self._owns_document_service = self.documents_dir is not None and document_service is None
+        if self._owns_document_service:
+            self.document_service = DocumentService()
+        self._jobs: Dict[str, Job] = {}
+        self._finished: OrderedDict = OrderedDict()
+        # Trabalhos aguardando, em ordem; os cancelados são retirados, liberando a vaga
+        self._pending: deque = deque()
+        self._pending_changed: Optional[asyncio.Event] = None
+        self._workers: List[asyncio.Task] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    async def start(self) -> None:
+        """
+        Inicia os workers no event loop atual.
+        """
+        self._pending_changed = asyncio.Event()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='traduzai-job')
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.max_workers)]
+
+    async def stop(self) -> None:
+        """
+        Cancela os trabalhos pendentes e em andamento e encerra os workers.
+        """
+        for job in list(self._jobs.values()):
+            if not job.finished:
+                self.cancel(job.job_id)
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        if self._executor is not None:
+            # Aguarda, sem bloquear o event loop, as execuções em andamento observarem o cancelamento
+            executor, self._executor = self._executor, None
+            await asyncio.to_thread(executor.shutdown, wait=True)
+        if self._owns_document_service:
+            await asyncio.to_thread(self.document_service.close)
+
+    def submit(self, text: str, target_language_codes: List[str], options: Optional[dict] = None) -> Job:
+        """
+        Valida e enfileira um trabalho.
+
+        Parâmetros:
+            text (str): O texto original.
+            target_language_codes (List[str]): Os códigos dos idiomas de destino.
+            options (dict, optional): Os parâmetros de simplificação. Os parâmetros omitidos recebem os
+                valores padrão de `DEFAULT_OPTIONS`.
+
+        Retorna:
+            Job: O trabalho enfileirado.
+
+        Exceções:
+            - ValueError: se o texto, os idiomas ou os parâmetros forem inválidos.
+            - QueueFullError: se a fila estiver cheia.
+        """
+        if not isinstance(text, str) or not text.strip():
+            raise ValueError("Informe o texto a ser processado.")
+        return self._enqueue(target_language_codes, options, text=text)
+
+    def submit_document(self, document: str, target_language_codes: List[str], options: Optional[dict] = None,
+                        first_page: int = 1, last_page: Optional[int] = None) -> Job:
+        """
+        Valida e enfileira um trabalho sobre um documento do diretório de documentos.
+
+        Parâmetros:
+            document (str): O caminho do documento, relativo ao diretório de documentos.
+            target_language_codes (List[str]): Os códigos dos idiomas de destino.
+            options (dict, optional): Os parâmetros de simplificação (ver `submit`).
+            first_page (int): A primeira página a ser lida (apenas PDF).
+            last_page (int, optional): A última página a ser lida (apenas PDF).
+
+        Retorna:
+            Job: O trabalho enfileirado.
+
+        Exceções:
+            - ValueError: se os documentos não forem aceitos, se o documento estiver fora do diretório de
+              documentos, não existir ou tiver um formato não suportado, ou se as páginas, os idiomas ou os
+              parâmetros forem inválidos.
+            - QueueFullError: se a fila estiver cheia.
+        """
+        if self.documents_dir is None:
+            raise ValueError("O envio de documentos não está habilitado: informe o diretório de documentos.")
+        if not isinstance(document, str) or not document.strip():
+            raise ValueError("Informe o caminho do documento.")
+        path = os.path.realpath(os.path.join(self.documents_dir, document))
+        if os.path.commonpath([path, self.documents_dir]) != self.documents_dir:
+            raise ValueError("O documento deve estar no diretório de documentos.")
+        ext = os.path.splitext(path)[1].lower()
+        if ext not in SUPPORTED_EXTENSIONS:
+            raise ValueError(f"Formato de documento não suportado: {ext or document}")
+        if not os.path.isfile(path):
+            raise ValueError(f"Documento não encontrado: {document}")
+        for page in (first_page, last_page):
+            if page is not None and (isinstance(page, bool) or not isinstance(page, int) or page < 1):
+                raise ValueError("As páginas devem ser inteiros positivos.")
+        if first_page is None or (last_page is not None and last_page < first_page):
+            raise ValueError("A última página deve ser maior ou igual à primeira.")
+        if ext != '.pdf' and (first_page, last_page) != (1, None):
+            raise ValueError("O intervalo de páginas está disponível apenas para arquivos PDF.")
+        return self._enqueue(target_language_codes, options, document=path, first_page=first_page,
+                             last_page=last_page)
+
+    def _enqueue(self, target_language_codes: List[str], options: Optional[dict], **job_arguments) -> Job:
+        """
+        Valida os idiomas e os parâmetros e enfileira um trabalho.
+
+        Parâmetros:
+            target_language_codes (List[str]): Os códigos dos idiomas de destino.
+            options (dict, optional): Os parâmetros de simplificação.
+            **job_arguments: O texto ou o documento do trabalho (ver `Job`).
+
+        Retorna:
+            Job: O trabalho enfileirado.
+
+        Exceções:
+            - ValueError: se os idiomas ou os parâmetros forem inválidos.
+            - QueueFullError: se a fila estiver cheia.
+        """
+        if self._pending_changed is None:
+            raise Exception("Erro ao submeter o trabalho: a fila não foi iniciada.")
+        if (not isinstance(target_language_codes, list) or not target_language_codes
+                or not all(isinstance(code, str) and code for code in target_language_codes)):
+            raise ValueError("Informe ao menos um idioma de destino.")
+        options = options or {}
+        if not isinstance(options, dict):
+            raise ValueError("Os parâmetros de simplificação devem ser um objeto.")
+        unknown = sorted(set(options) - set(DEFAULT_OPTIONS))
+        if unknown:
+            raise ValueError(f"Parâmetros de simplificação desconhecidos: {', '.join(unknown)}")
+        self.validate_options(options)
+        if len(self._pending) >= self.max_queue_size:
+            raise QueueFullError(self.max_queue_size)
+
+        job = Job(job_arguments.pop('text', None), list(dict.fromkeys(target_language_codes)),
+                  {**DEFAULT_OPTIONS, **options}, self.max_job_events, **job_arguments)
+        self._pending.append(job)
+        self._pending_changed.set()
+        self._jobs[job.job_id] = job
+        return job
+
+    @staticmethod
+    def validate_options(options: dict) -> None:
+        """
+        Valida os tipos e os intervalos dos parâmetros de simplificação informados.
+
+        Parâmetros:
+            options (dict): Os parâmetros de simplificação (apenas os de `DEFAULT_OPTIONS`).
+
+        Exceções:
+            - ValueError: se algum parâmetro tiver o tipo ou o valor inválido.
+        """
+        for name in ('area_tecnica', 'estilo', 'model', 'complexity_level'):
+            if name in options and (not isinstance(options[name], str) or not options[name].strip()):
+                raise ValueError(f"O parâmetro '{name}' deve ser um texto não vazio.")
+        if 'summarize' in options and not isinstance(options['summarize'], bool):
+            raise ValueError("O parâmetro 'summarize' deve ser verdadeiro ou falso.")
+        if 'focus_aspects' in options and (not isinstance(options['focus_aspects'], list) or not all(
+                isinstance(aspect, str) and aspect for aspect in options['focus_aspects'])):
+            raise ValueError("O parâmetro 'focus_aspects' deve ser uma lista de textos.")
+        if 'temperature' in options:
+            temperature = options['temperature']
+            minimum, maximum = TEMPERATURE_RANGE
+            if isinstance(temperature, bool) or not isinstance(temperature, Real) or \
+                    not minimum <= temperature <= maximum:
+                raise ValueError(f"O parâmetro 'temperature' deve ser um número entre {minimum:g} e {maximum:g}.")
+        if 'max_tokens' in options:
+            max_tokens = options['max_tokens']
+            minimum, maximum = MAX_TOKENS_RANGE
+            if isinstance(max_tokens, bool) or not isinstance(max_tokens, int) or \
+                    not minimum <= max_tokens <= maximum:
+                raise ValueError(f"O parâmetro 'max_tokens' deve ser um inteiro entre {minimum} e {maximum}.")
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """
+        Retorna o trabalho com o identificador informado.
+
+        Parâmetros:
+            job_id (str): O identificador do trabalho.
+
+        Retorna:
+            Optional[Job]: O trabalho, ou `None` se ele não existir ou já tiver sido descartado.
+        """
+        return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """
+        Solicita o cancelamento de um trabalho. Um trabalho na fila é cancelado imediatamente e retirado
+        dela, liberando a sua vaga; um trabalho em andamento é interrompido na próxima verificação do pipeline.
+
+        Parâmetros:
+            job_id (str): O identificador do trabalho.
+
+        Retorna:
+            Optional[Job]: O trabalho, ou `None` se ele não existir.
+        """
+        job = self._jobs.get(job_id)
+        if job is None or job.finished:
+            return job
+        job.cancellation_token.cancel()
+        if job.status == JOB_QUEUED:
+            self._pending.remove(job)
+            self._finish(job, JOB_CANCELLED, error="Trabalho cancelado antes do início.")
+        return job
+
+    async def events(self, job: Job) -> AsyncIterator[dict]:
+        """
+        Percorre os eventos do trabalho, desde o primeiro, aguardando os novos até a sua conclusão.
+
+        Se eventos ainda não lidos tiverem sido descartados, por excederem o limite do trabalho, um evento
+        `{'type': 'skipped', 'count': n}` informa quantos foram perdidos, e a leitura continua a partir do
+        evento mais antigo mantido.
+
+        Parâmetros:
+            job (Job): O trabalho.
+
+        Retorna:
+            AsyncIterator[dict]: Os eventos do trabalho, em ordem.
+        """
+        position = 0
+        while True:
+            await job.wait_for_events(position)
+            while position < job.published:
+                # Novos eventos podem ser publicados, e os antigos descartados, a cada evento enviado
+                first = job.published - len(job.events)
+                if position < first:
+                    skipped, position = first - position, first
+                    yield {'type': 'skipped', 'count': skipped}
+                    continue
+                event = job.events[position - first]
+                position += 1
+                yield event
+            if job.finished:
+                return
+
+    def stats(self) -> dict:
+        """
+        Retorna o número de trabalhos em cada estado e a configuração da fila.
+
+        Retorna:
+            dict: O número de trabalhos em cada estado ('jobs'), os workers e o tamanho máximo da fila.
+        """
+        counts = {status: 0 for status in (JOB_QUEUED, JOB_RUNNING, *FINISHED_STATUSES)}
+        for job in self._jobs.values():
+            counts[job.status] += 1
+        return {'jobs': counts, 'workers': self.max_workers, 'max_queue_size': self.max_queue_size}
+
+    async def _worker(self) -> None:
+        """
+        Retira os trabalhos da fila e executa o pipeline em uma thread, até ser cancelado.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            while not self._pending:
+                self._pending_changed.clear()
+                await self._pending_changed.wait()
+            job = self._pending.popleft()
+            job.start()
+            try:
+                result = await loop.run_in_executor(self._executor, self._run_pipeline, job, loop)
+            except OperationCancelledError as e:
+                self._finish(job, JOB_CANCELLED, error=str(e))
+            except Exception as e:
+                self._finish(job, JOB_FAILED, error=str(e))
+            else:
+                self._finish(job, JOB_SUCCEEDED, result=self.serialize_result(result, job.target_language_codes))
+
+    def _run_pipeline(self, job: Job, loop: asyncio.AbstractEventLoop):
+        """
+        Executa o pipeline de um trabalho. Chamado em uma thread do pool; os eventos são publicados
+        na thread do event loop.
+
+        Parâmetros:
+            job (Job): O trabalho.
+            loop (asyncio.AbstractEventLoop): O event loop dos workers.
+
+        Retorna:
+            PipelineResult | MultiPipelineResult: O resultado do pipeline.
+        """
+        def publish(event: dict) -> None:
+            loop.call_soon_threadsafe(job.publish, event)
+
+        on_token = lambda trecho: publish({'type': 'token', 'text': trecho})
+        on_stage = lambda etapa, evento: publish({'type': 'stage', 'stage': etapa, 'event': evento})
+
+        text = job.text
+        streams = False
+        if job.document is not None:
+            # Documentos são lidos em streaming, exceto quando a simplificação precisa do texto completo
+            text = self._read_paragraphs(job)
+            streams = (self.streaming_pipeline_service is not None and len(job.target_language_codes) == 1
+                       and not job.options['summarize'])
+            if not streams:
+                text = '\n\n'.join(text)
+
+        if len(job.target_language_codes) > 1:
+            return self.pipeline_service.run_multi(
+                text, job.target_language_codes, job.options,
+                on_token=on_token, on_stage=on_stage, cancellation_token=job.cancellation_token
+            )
+        target_language_code = job.target_language_codes[0]
+        if streams or (self.streaming_pipeline_service is not None and self.streaming_pipeline_service.is_suitable(
+                text, job.options)):
+            return self.streaming_pipeline_service.run(
+                text, target_language_code, job.options,
+                on_segment=lambda segmento: publish({
+                    'type': 'segment',
+                    'index': segmento.index,
+                    'text': segmento.translated_text + segmento.separator
+                }),
+                on_stage=on_stage,
+                cancellation_token=job.cancellation_token
+            )
+        return self.pipeline_service.run(
+            text, target_language_code, job.options,
+            on_token=on_token, on_stage=on_stage, cancellation_token=job.cancellation_token
+        )
+
+    def _read_paragraphs(self, job: Job) -> Iterator[str]:
+        """
+        Lê os parágrafos do documento de um trabalho, verificando o cancelamento a cada parágrafo.
+
+        Parâmetros:
+            job (Job): O trabalho.
+
+        Retorna:
+            Iterator[str]: Os parágrafos do documento, na ordem de leitura.
+
+        Exceções:
+            - ValueError: se nenhum texto for extraído do documento.
+            - OperationCancelledError: se o cancelamento for solicitado.
+        """
+        first_page, last_page = job.pages
+        empty = True
+        for paragraph in self.document_service.iter_paragraphs(job.document, first_page, last_page):
+            job.cancellation_token.raise_if_cancelled()
+            empty = False
+            yield paragraph
+        if empty:
+            raise ValueError("Nenhum texto extraído do documento.")
+
+    def _finish(self, job: Job, status: str, result: Optional[dict] = None, error: Optional[str] = None) -> None:
+        """
+        Conclui um trabalho e descarta os trabalhos concluídos mais antigos além do limite.
+
+        Parâmetros:
+            job (Job): O trabalho.
+            status (str): O estado final.
+            result (dict, optional): O resultado serializado.
+            error (str, optional): A mensagem de erro.
+        """
+        job.finish(status, result, error)
+        self._finished[job.job_id] = job
+        while len(self._finished) > self.max_finished_jobs:
+            expired_id, _ = self._finished.popitem(last=False)
+            self._jobs.pop(expired_id, None)
+
+    @staticmethod
+    def serialize_result(result: Union[PipelineResult, MultiPipelineResult], target_language_codes: List[str]) -> dict:
+        """
+        Converte o resultado do pipeline em um dicionário serializável em JSON.
+
+        Parâmetros:
+            result (PipelineResult | MultiPipelineResult): O resultado do pipeline.
+            target_language_codes (List[str]): Os códigos dos idiomas de destino.
+
+        Retorna:
+            dict: O texto simplificado, as métricas, a duração das etapas e, para cada idioma de destino,
+            a tradução, o idioma de origem detectado e o BLEU Score.
+        """
+        if isinstance(result, MultiPipelineResult):
+            results = {language: result.result_for(language) for language in result.target_language_codes}
+        else:
+            results = {target_language_codes[0]: result}
+        translations = {
+            language: {
+                'translated_text': language_result.translated_text,
+                'source_language_code': language_result.source_language_code,
+                'bleu_score': language_result.bleu_score
+            }
+            for language, language_result in results.items()
+        }
+        return {
+            'simplified_text': result.simplified_text,
+            'metrics_original': result.metrics_original,
+            'metrics_simplified': result.metrics_simplified,
+            'translations': translations,
+            'timings': {name: round(duration, 3) for name, duration in result.timings.items()},
+            'total_time': round(result.total_time, 3)
+        }
@@ -0,0 +1,232 @@
+# services/pipeline/job_store.py
+
+"""
+Job Store Module
+================
+
+Este módulo fornece um armazenamento persistente (SQLite) do progresso do processamento em lote.
+Para cada documento, são registrados os artefatos de cada etapa concluída (texto extraído, texto
+simplificado, métricas, traduções, BLEU Scores e arquivos exportados) e cada bloco simplificado
+dos documentos longos. Ao executar novamente o mesmo lote, as etapas concluídas são reaproveitadas
+e a simplificação continua a partir do último bloco concluído, sem repetir chamadas pagas às APIs.
+
+Um documento é identificado pelo seu caminho absoluto, tamanho e data de modificação, combinados
+com as opções de simplificação: alterar o arquivo ou as opções inicia um novo processamento.
+
+Classes:
+    JobStore: Classe responsável pelo armazenamento dos artefatos e blocos de cada documento.
+
+Dependências:
+    - hashlib: biblioteca padrão para a geração das chaves dos documentos.
+    - json: biblioteca padrão para a serialização dos artefatos.
+    - os: biblioteca padrão para interagir com o sistema de arquivos.
+    - sqlite3: biblioteca padrão para acesso a bancos de dados SQLite.
+    - threading: biblioteca padrão para conexões por thread.
+    - time: biblioteca padrão para o registro dos instantes de atualização.
+    - typing: biblioteca padrão para anotações de tipos.
+
+Exemplo de Uso:
+    >>> from services.pipeline.job_store import JobStore
+    >>> store = JobStore('saida/jobs.sqlite3')
+    >>> key = store.job_key('artigo.pdf', opcoes)
+    >>> store.set_artifact(key, 'import', texto)
+    >>> store.get_artifact(key, 'import') == texto
+    True
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+
+class JobStore:
+    """
+    Armazenamento persistente dos artefatos e blocos simplificados de cada documento.
+
+    Cada thread utiliza sua própria conexão e o banco opera em modo WAL, de modo que vários
+    documentos podem registrar o seu progresso simultaneamente.
+
+    Métodos:
+        job_key(file_path: str, options: dict) ⇾ str:
+            Gera a chave de um documento para as opções de simplificação informadas.
+
+        get_artifact(job_key: str, stage: str) ⇾ Optional[Any]:
+            Retorna o artefato de uma etapa concluída.
+
+        set_artifact(job_key: str, stage: str, value: Any) ⇾ None:
+            Registra a conclusão de uma etapa e o seu artefato.
+
+        get_chunks(job_key: str) ⇾ Dict[int, str]:
+            Retorna os blocos simplificados já concluídos.
+
+        set_chunk(job_key: str, index: int, content: str) ⇾ None:
+            Registra um bloco simplificado.
+
+        completed_stages(job_key: str) ⇾ List[str]:
+            Retorna os nomes das etapas concluídas.
+
+        delete_job(job_key: str) ⇾ None:
+            Remove todo o progresso registrado de um documento.
+    """
+
+    def __init__(self, db_path: str, busy_timeout: float = 30.0):
+        """
+        Inicializa a instância do JobStore.
+
+        Parâmetros:
+            db_path (str): Caminho do arquivo do banco SQLite (os diretórios são criados se necessário).
+            busy_timeout (float): Tempo máximo de espera, em segundos, por um bloqueio do banco.
+        """
+        self.db_path = db_path
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+        self._init_schema()
+
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Retorna a conexão SQLite da thread atual, criando-a se necessário.
+
+        Retorna:
+            sqlite3.Connection: Conexão em modo autocommit, com WAL habilitado.
+        """
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.db_path, timeout=self.busy_timeout, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+        return connection
+
+    def _init_schema(self) -> None:
+        """
+        Cria as tabelas de artefatos e blocos, caso ainda não existam.
+        """
+        connection = self._connection()
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS artifacts ('
+            ' job_key TEXT NOT NULL,'
+            ' stage TEXT NOT NULL,'
+            ' value TEXT NOT NULL,'
+            ' updated_at REAL NOT NULL,'
+            ' PRIMARY KEY (job_key, stage))'
+        )
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS chunks ('
+            ' job_key TEXT NOT NULL,'
+            ' chunk_index INTEGER NOT NULL,'
+            ' content TEXT NOT NULL,'
+            ' updated_at REAL NOT NULL,'
+            ' PRIMARY KEY (job_key, chunk_index))'
+        )
+
+    @staticmethod
+    def job_key(file_path: str, options: dict) -> str:
+        """
+        Gera a chave de um documento para as opções de simplificação informadas.
+
+        Parâmetros:
+            file_path (str): Caminho do documento.
+            options (dict): Opções de simplificação (modelo, estilo, temperatura etc.).
+
+        Retorna:
+            str: O hash SHA-256 hexadecimal do caminho absoluto, do tamanho, da data de modificação
+            e das opções.
+        """
+        stat = os.stat(file_path)
+        payload = json.dumps(
+            [os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns, options],
+            ensure_ascii=False, sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get_artifact(self, job_key: str, stage: str) -> Optional[Any]:
+        """
+        Retorna o artefato de uma etapa concluída.
+
+        Parâmetros:
+            job_key (str): A chave do documento.
+            stage (str): O nome da etapa.
+
+        Retorna:
+            Optional[Any]: O artefato (desserializado de JSON), ou `None` se a etapa não foi concluída.
+        """
+        row = self._connection().execute(
+            'SELECT value FROM artifacts WHERE job_key = ? AND stage = ?', (job_key, stage)
+        ).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def set_artifact(self, job_key: str, stage: str, value: Any) -> None:
+        """
+        Registra a conclusão de uma etapa e o seu artefato.
+
+        Parâmetros:
+            job_key (str): A chave do documento.
+            stage (str): O nome da etapa.
+            value (Any): O artefato da etapa, serializável em JSON.
+        """
+        self._connection().execute(
+            'INSERT OR REPLACE INTO artifacts (job_key, stage, value, updated_at) VALUES (?, ?, ?, ?)',
+            (job_key, stage, json.dumps(value, ensure_ascii=False), time.time())
+        )
+
+    def get_chunks(self, job_key: str) -> Dict[int, str]:
+        """
+        Retorna os blocos simplificados já concluídos de um documento.
+
+        Parâmetros:
+            job_key (str): A chave do documento.
+
+        Retorna:
+            Dict[int, str]: O texto simplificado de cada bloco concluído, indexado pela posição do bloco.
+        """
+        rows = self._connection().execute(
+            'SELECT chunk_index, content FROM chunks WHERE job_key = ?', (job_key,)
+        ).fetchall()
+        return {index: content for index, content in rows}
+
+    def set_chunk(self, job_key: str, index: int, content: str) -> None:
+        """
+        Registra um bloco simplificado.
+
+        Parâmetros:
+            job_key (str): A chave do documento.
+            index (int): A posição do bloco no documento.
+            content (str): O texto simplificado do bloco.
+        """
+        self._connection().execute(
+            'INSERT OR REPLACE INTO chunks (job_key, chunk_index, content, updated_at) VALUES (?, ?, ?, ?)',
+            (job_key, index, content, time.time())
+        )
+
+    def completed_stages(self, job_key: str) -> List[str]:
+        """
+        Retorna os nomes das etapas concluídas de um documento.
+
+        Parâmetros:
+            job_key (str): A chave do documento.
+
+        Retorna:
+            List[str]: Os nomes das etapas, na ordem em que foram concluídas.
+        """
+        rows = self._connection().execute(
+            'SELECT stage FROM artifacts WHERE job_key = ? ORDER BY updated_at', (job_key,)
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def delete_job(self, job_key: str) -> None:
+        """
+        Remove todo o progresso registrado de um documento.
+
+        Parâmetros:
+            job_key (str): A chave do documento.
+        """
+        connection = self._connection()
+        connection.execute('DELETE FROM artifacts WHERE job_key = ?', (job_key,))
+        connection.execute('DELETE FROM chunks WHERE job_key = ?', (job_key,))
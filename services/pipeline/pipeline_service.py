@@ -0,0 +1,659 @@
+# services/pipeline/pipeline_service.py
+
+"""
+Pipeline Service Module
+=======================
+
+Este módulo fornece o pipeline de processamento do TraduzAI, independente da interface gráfica.
+As etapas (simplificação, métricas de legibilidade, tradução e BLEU Score) são modeladas como um
+grafo de dependências: cada etapa é iniciada assim que as etapas das quais depende terminam, e
+etapas independentes são executadas simultaneamente. Assim, a latência total corresponde ao
+caminho crítico (simplificação → tradução → back-translation), e não à soma de todas as etapas:
+
+    readability_original ─────────────────────────────┐
+    simplify ─┬─ readability_simplified ──────────────┼─→ PipelineResult
+              └─ translate ─── bleu_score ────────────┘
+
+Para publicar o mesmo texto em vários idiomas, `run_multi` simplifica o texto uma única vez e
+traduz o texto simplificado para todos os idiomas de destino simultaneamente, cada um com o seu
+BLEU Score (etapas `translate:<idioma>` e `bleu_score:<idioma>`). O custo passa de N simplificações
+e N traduções para uma simplificação e N traduções, e a latência, para uma simplificação seguida
+da tradução mais lenta.
+
+Classes:
+    StageGraph: Motor genérico de execução de etapas com dependências.
+    PipelineResult: Resultado estruturado do pipeline, com a duração de cada etapa.
+    MultiPipelineResult: Resultado do pipeline para vários idiomas de destino.
+    SimplificationVariant: Variante simplificada de um texto, com as suas métricas de legibilidade.
+    PipelineService: Classe responsável pela execução do pipeline de simplificação e tradução.
+
+Dependências:
+    - concurrent.futures: biblioteca padrão para a execução concorrente das etapas.
+    - time: biblioteca padrão para a medição da duração das etapas.
+    - typing: biblioteca padrão para anotações de tipos.
+    - services.api.openai_service: Para a simplificação do texto.
+    - services.api.aws_translate_service: Para a tradução do texto simplificado.
+    - services.language.readability_service: Para o cálculo das métricas de legibilidade.
+    - services.language.bleu_score_service: Para o cálculo do BLEU Score.
+    - services.task_service: Para o cancelamento cooperativo do pipeline.
+
+Exemplo de Uso:
+    >>> from services.pipeline.pipeline_service import PipelineService
+    >>> pipeline = PipelineService(openai_service, aws_translate_service, readability_service, bleu_score_service)
+    >>> resultado = pipeline.run(texto, 'en', {
+    ...     'area_tecnica': 'Geral', 'estilo': 'Formal', 'summarize': False, 'model': 'gpt-4o'
+    ... })
+    >>> print(resultado.translated_text)
+    >>> print(resultado.timings)
+    {'readability_original': 0.02, 'simplify': 4.81, 'readability_simplified': 0.01, 'translate': 0.62, ...}
+    >>> resultados = pipeline.run_multi(texto, ['en', 'es', 'fr'], opcoes)
+    >>> print(resultados.bleu_scores)
+    {'en': 0.61, 'es': 0.57, 'fr': 0.55}
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from services.api.aws_translate_service import AwsTranslateService
+from services.api.openai_service import OpenAIService
+from services.language.bleu_score_service import BleuScoreService
+from services.language.readability_service import ReadabilityService
+from services.task_service import CancellationToken
+
+# Nomes das etapas do pipeline
+STAGE_READABILITY_ORIGINAL = 'readability_original'
+STAGE_SIMPLIFY = 'simplify'
+STAGE_READABILITY_SIMPLIFIED = 'readability_simplified'
+STAGE_TRANSLATE = 'translate'
+STAGE_BLEU_SCORE = 'bleu_score'
+
+
+def language_stage(stage: str, language: str) -> str:
+    """
+    Retorna o nome de uma etapa específica de um idioma de destino (por exemplo, 'translate:en').
+
+    Parâmetros:
+        stage (str): O nome da etapa (`STAGE_TRANSLATE` ou `STAGE_BLEU_SCORE`).
+        language (str): O código do idioma de destino.
+
+    Retorna:
+        str: O nome da etapa para o idioma.
+    """
+    return f'{stage}:{language}'
+
+
+class StageGraph:
+    """
+    Motor de execução de etapas organizadas em um grafo de dependências (DAG).
+
+    Cada etapa é uma função que recebe um dicionário com os resultados das etapas já concluídas.
+    As etapas são executadas em um pool de threads, assim que todas as suas dependências terminam.
+
+    Métodos:
+        add_stage(name: str, function: Callable, dependencies: Iterable[str]) ⇾ None:
+            Adiciona uma etapa ao grafo.
+
+        run(on_stage, cancellation_token) ⇾ Tuple[Dict[str, Any], Dict[str, float]]:
+            Executa todas as etapas e retorna os resultados e a duração de cada uma.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Inicializa a instância do StageGraph.
+
+        Parâmetros:
+            max_workers (int, optional): Número máximo de etapas executadas simultaneamente.
+                Por padrão, o número de etapas do grafo.
+        """
+        self.max_workers = max_workers
+        self.stages: Dict[str, Tuple[Callable[[Dict[str, Any]], Any], Tuple[str, ...]]] = {}
+
+    def add_stage(self, name: str, function: Callable[[Dict[str, Any]], Any], dependencies: Iterable[str] = ()) -> None:
+        """
+        Adiciona uma etapa ao grafo.
+
+        Parâmetros:
+            name (str): Nome único da etapa.
+            function (Callable[[Dict[str, Any]], Any]): Função executada pela etapa. Recebe os resultados
+                das etapas já concluídas, indexados pelo nome da etapa.
+            dependencies (Iterable[str]): Nomes das etapas que devem terminar antes desta.
+
+        Exceções:
+            - ValueError: se o nome já existir ou se alguma dependência não tiver sido adicionada.
+        """
+        dependencies = tuple(dependencies)
+        if name in self.stages:
+            raise ValueError(f"Etapa duplicada: {name}")
+        missing = [dependency for dependency in dependencies if dependency not in self.stages]
+        if missing:
+            raise ValueError(f"Dependências desconhecidas da etapa '{name}': {', '.join(missing)}")
+        self.stages[name] = (function, dependencies)
+
+    def run(self, on_stage: Optional[Callable[[str, str], None]] = None,
+            cancellation_token: Optional[CancellationToken] = None) -> Tuple[Dict[str, Any], Dict[str, float]]:
+        """
+        Executa todas as etapas, respeitando as dependências.
+
+        Como as dependências precisam ser adicionadas antes das etapas que as utilizam, o grafo
+        não possui ciclos. Se alguma etapa falhar, nenhuma nova etapa é iniciada e o erro original é
+        propagado assim que as etapas em andamento terminam.
+
+        Parâmetros:
+            on_stage (Callable[[str, str], None], optional): Função chamada com o nome da etapa e o evento
+                ('started' ou 'finished'), a partir da thread que executa a etapa.
+            cancellation_token (CancellationToken, optional): Sinalizador verificado antes de iniciar
+                cada etapa; após o cancelamento, nenhuma nova etapa é iniciada.
+
+        Retorna:
+            Tuple[Dict[str, Any], Dict[str, float]]: Os resultados e a duração, em segundos, de cada etapa.
+
+        Exceções:
+            - Exception: Se alguma etapa falhar.
+            - OperationCancelledError: Se o cancelamento for solicitado.
+        """
+        results: Dict[str, Any] = {}
+        timings: Dict[str, float] = {}
+        pending = dict(self.stages)
+        running = {}
+
+        def execute(name: str, function: Callable[[Dict[str, Any]], Any], inputs: Dict[str, Any]):
+            if cancellation_token is not None:
+                cancellation_token.raise_if_cancelled()
+            if on_stage is not None:
+                on_stage(name, 'started')
+            start_time = time.perf_counter()
+            result = function(inputs)
+            timings[name] = time.perf_counter() - start_time
+            if on_stage is not None:
+                on_stage(name, 'finished')
+            return result
+
+        with ThreadPoolExecutor(max_workers=self.max_workers or max(1, len(self.stages))) as executor:
+            while pending or running:
+                # Inicia as etapas cujas dependências já foram concluídas
+                for name, (function, dependencies) in list(pending.items()):
+                    if all(dependency in results for dependency in dependencies):
+                        del pending[name]
+                        running[executor.submit(execute, name, function, dict(results))] = name
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                    except Exception:
+                        # Aguarda as etapas em andamento e descarta as que ainda não foram iniciadas
+                        pending.clear()
+                        wait(running)
+                        raise
+        return results, timings
+
+
+class PipelineResult:
+    """
+    Resultado do pipeline de simplificação e tradução.
+
+    Atributos:
+        simplified_text (str): O texto simplificado (e opcionalmente resumido).
+        translated_text (str): O texto simplificado, traduzido para o idioma de destino.
+        source_language_code (str): O idioma de origem detectado pela tradução.
+        metrics_original (dict): As métricas de legibilidade do texto original.
+        metrics_simplified (dict): As métricas de legibilidade do texto simplificado.
+        bleu_score (float): O BLEU Score obtido por back-translation.
+        timings (Dict[str, float]): A duração, em segundos, de cada etapa.
+        total_time (float): A duração total do pipeline, em segundos.
+    """
+
+    def __init__(self, results: Dict[str, Any], timings: Dict[str, float], total_time: float):
+        """
+        Inicializa a instância do PipelineResult a partir dos resultados das etapas.
+
+        Parâmetros:
+            results (Dict[str, Any]): Os resultados de cada etapa, indexados pelo nome da etapa.
+            timings (Dict[str, float]): A duração, em segundos, de cada etapa.
+            total_time (float): A duração total do pipeline, em segundos.
+        """
+        self.simplified_text = results[STAGE_SIMPLIFY]
+        self.translated_text, self.source_language_code = results[STAGE_TRANSLATE]
+        self.metrics_original = results[STAGE_READABILITY_ORIGINAL]
+        self.metrics_simplified = results[STAGE_READABILITY_SIMPLIFIED]
+        self.bleu_score = results[STAGE_BLEU_SCORE]
+        self.timings = timings
+        self.total_time = total_time
+
+
+class MultiPipelineResult:
+    """
+    Resultado do pipeline para vários idiomas de destino, a partir de uma única simplificação.
+
+    Atributos:
+        target_language_codes (List[str]): Os idiomas de destino, na ordem solicitada.
+        simplified_text (str): O texto simplificado (e opcionalmente resumido).
+        metrics_original (dict): As métricas de legibilidade do texto original.
+        metrics_simplified (dict): As métricas de legibilidade do texto simplificado.
+        translations (Dict[str, Tuple[str, str]]): O texto traduzido e o idioma de origem detectado, por idioma.
+        bleu_scores (Dict[str, float]): O BLEU Score obtido por back-translation, por idioma.
+        timings (Dict[str, float]): A duração, em segundos, de cada etapa.
+        total_time (float): A duração total do pipeline, em segundos.
+
+    Métodos:
+        result_for(language: str) ⇾ PipelineResult:
+            Retorna o resultado de um idioma de destino no formato de `PipelineService.run`.
+    """
+
+    def __init__(self, target_language_codes: List[str], results: Dict[str, Any], timings: Dict[str, float],
+                 total_time: float):
+        """
+        Inicializa a instância do MultiPipelineResult a partir dos resultados das etapas.
+
+        Parâmetros:
+            target_language_codes (List[str]): Os idiomas de destino.
+            results (Dict[str, Any]): Os resultados de cada etapa, indexados pelo nome da etapa.
+            timings (Dict[str, float]): A duração, em segundos, de cada etapa.
+            total_time (float): A duração total do pipeline, em segundos.
+        """
+        self.target_language_codes = list(target_language_codes)
+        self.simplified_text = results[STAGE_SIMPLIFY]
+        self.metrics_original = results[STAGE_READABILITY_ORIGINAL]
+        self.metrics_simplified = results[STAGE_READABILITY_SIMPLIFIED]
+        self.translations = {
+            language: results[language_stage(STAGE_TRANSLATE, language)] for language in self.target_language_codes
+        }
+        self.bleu_scores = {
+            language: results[language_stage(STAGE_BLEU_SCORE, language)] for language in self.target_language_codes
+        }
+        self.timings = timings
+        self.total_time = total_time
+
+    def result_for(self, language: str) -> PipelineResult:
+        """
+        Retorna o resultado de um idioma de destino no formato de `PipelineService.run`.
+
+        Parâmetros:
+            language (str): O código do idioma de destino.
+
+        Retorna:
+            PipelineResult: O resultado do idioma, com as etapas comuns e as etapas do idioma.
+        """
+        results = {
+            STAGE_SIMPLIFY: self.simplified_text,
+            STAGE_READABILITY_ORIGINAL: self.metrics_original,
+            STAGE_READABILITY_SIMPLIFIED: self.metrics_simplified,
+            STAGE_TRANSLATE: self.translations[language],
+            STAGE_BLEU_SCORE: self.bleu_scores[language]
+        }
+        timings = {
+            stage: self.timings[name]
+            for stage, name in (
+                (STAGE_READABILITY_ORIGINAL, STAGE_READABILITY_ORIGINAL),
+                (STAGE_SIMPLIFY, STAGE_SIMPLIFY),
+                (STAGE_READABILITY_SIMPLIFIED, STAGE_READABILITY_SIMPLIFIED),
+                (STAGE_TRANSLATE, language_stage(STAGE_TRANSLATE, language)),
+                (STAGE_BLEU_SCORE, language_stage(STAGE_BLEU_SCORE, language))
+            )
+            if name in self.timings
+        }
+        return PipelineResult(results, timings, self.total_time)
+
+
+class SimplificationVariant:
+    """
+    Variante simplificada de um texto, com as suas métricas de legibilidade.
+
+    Atributos:
+        index (int): A posição da variante na lista solicitada.
+        variant (dict): Os parâmetros que diferenciam a variante (por exemplo, `{'complexity_level': 'Básico'}`).
+        options (dict): Os parâmetros de simplificação completos da variante.
+        simplified_text (str): O texto simplificado.
+        metrics (dict): As métricas de legibilidade do texto simplificado.
+    """
+
+    def __init__(self, index: int, variant: dict, options: dict, simplified_text: str, metrics: dict):
+        """
+        Inicializa a instância do SimplificationVariant.
+
+        Parâmetros:
+            index (int): A posição da variante na lista solicitada.
+            variant (dict): Os parâmetros que diferenciam a variante.
+            options (dict): Os parâmetros de simplificação completos da variante.
+            simplified_text (str): O texto simplificado.
+            metrics (dict): As métricas de legibilidade do texto simplificado.
+        """
+        self.index = index
+        self.variant = variant
+        self.options = options
+        self.simplified_text = simplified_text
+        self.metrics = metrics
+
+
+class PipelineService:
+    """
+    Serviço que executa o pipeline de simplificação, tradução e avaliação de um texto.
+
+    Métodos:
+        run(text: str, target_language_code: str, options: dict, on_token, on_stage) ⇾ PipelineResult:
+            Executa o pipeline completo e retorna o resultado estruturado.
+
+        run_multi(text: str, target_language_codes: List[str], options: dict, on_token, on_stage) ⇾ MultiPipelineResult:
+            Simplifica o texto uma vez e o traduz para vários idiomas simultaneamente.
+
+        add_language_stages(graph: StageGraph, language: str) ⇾ None:
+            Adiciona ao grafo as etapas de tradução e BLEU Score de um idioma de destino.
+
+        compare_variants(text: str, variants: List[dict], options: dict, on_variant, cancellation_token) ⇾ List[SimplificationVariant]:
+            Gera simultaneamente várias variantes simplificadas, com as métricas de legibilidade de cada uma.
+
+        simplify(text: str, options: dict, on_token, cancellation_token, on_chunk, completed_chunks) ⇾ str:
+            Simplifica o texto, em streaming ou em blocos paralelos, conforme o seu tamanho.
+    """
+
+    def __init__(self, openai_service: OpenAIService, aws_translate_service: AwsTranslateService,
+                 readability_service: ReadabilityService, bleu_score_service: BleuScoreService):
+        """
+        Inicializa a instância do PipelineService.
+
+        Parâmetros:
+            openai_service (OpenAIService): Serviço de simplificação.
+            aws_translate_service (AwsTranslateService): Serviço de tradução.
+            readability_service (ReadabilityService): Serviço de métricas de legibilidade.
+            bleu_score_service (BleuScoreService): Serviço de cálculo do BLEU Score.
+        """
+        self.openai_service = openai_service
+        self.aws_translate_service = aws_translate_service
+        self.readability_service = readability_service
+        self.bleu_score_service = bleu_score_service
+
+    def build_graph(self, text: str, target_language_code: str, options: dict,
+                    on_token: Optional[Callable[[str], None]] = None,
+                    cancellation_token: Optional[CancellationToken] = None,
+                    simplified_text: Optional[str] = None) -> StageGraph:
+        """
+        Constrói o grafo de etapas do pipeline para um texto.
+
+        Parâmetros:
+            text (str): O texto original.
+            target_language_code (str): O código do idioma de destino.
+            options (dict): Os parâmetros de simplificação (ver `simplify`).
+            on_token (Callable[[str], None], optional): Função chamada com cada trecho simplificado.
+            cancellation_token (CancellationToken, optional): Sinalizador que interrompe a simplificação.
+            simplified_text (str, optional): Texto já simplificado; se informado, a etapa de simplificação
+                apenas o reutiliza, sem chamar a API.
+
+        Retorna:
+            StageGraph: O grafo de etapas, pronto para execução.
+        """
+        graph = self._build_text_graph(text, options, on_token, cancellation_token, simplified_text)
+        graph.add_stage(
+            STAGE_TRANSLATE,
+            lambda results: self.aws_translate_service.translate_text(results[STAGE_SIMPLIFY], target_language_code),
+            dependencies=[STAGE_SIMPLIFY]
+        )
+        graph.add_stage(
+            STAGE_BLEU_SCORE,
+            lambda results: self.bleu_score_service.compute_bleu_score(
+                results[STAGE_SIMPLIFY], results[STAGE_TRANSLATE][0], results[STAGE_TRANSLATE][1]
+            ),
+            dependencies=[STAGE_SIMPLIFY, STAGE_TRANSLATE]
+        )
+        return graph
+
+    def build_multi_graph(self, text: str, target_language_codes: List[str], options: dict,
+                          on_token: Optional[Callable[[str], None]] = None,
+                          cancellation_token: Optional[CancellationToken] = None,
+                          simplified_text: Optional[str] = None) -> StageGraph:
+        """
+        Constrói o grafo de etapas do pipeline para vários idiomas de destino.
+
+        A simplificação e as métricas são etapas únicas; as etapas de tradução e BLEU Score de cada
+        idioma dependem apenas da simplificação e são executadas simultaneamente.
+
+        Parâmetros:
+            text (str): O texto original.
+            target_language_codes (List[str]): Os códigos dos idiomas de destino.
+            options (dict): Os parâmetros de simplificação (ver `simplify`).
+            on_token (Callable[[str], None], optional): Função chamada com cada trecho simplificado.
+            cancellation_token (CancellationToken, optional): Sinalizador que interrompe a simplificação.
+            simplified_text (str, optional): Texto já simplificado; se informado, a etapa de simplificação
+                apenas o reutiliza, sem chamar a API.
+
+        Retorna:
+            StageGraph: O grafo de etapas, pronto para execução.
+        """
+        graph = self._build_text_graph(text, options, on_token, cancellation_token, simplified_text)
+        for language in target_language_codes:
+            self.add_language_stages(graph, language)
+        return graph
+
+    def add_language_stages(self, graph: StageGraph, language: str) -> None:
+        """
+        Adiciona ao grafo as etapas de tradução e BLEU Score de um idioma de destino.
+
+        As etapas são nomeadas com `language_stage` e dependem da etapa `simplify` do grafo.
+
+        Parâmetros:
+            graph (StageGraph): O grafo, que já contém a etapa de simplificação.
+            language (str): O código do idioma de destino.
+        """
+        translate = language_stage(STAGE_TRANSLATE, language)
+        graph.add_stage(
+            translate,
+            lambda results: self.aws_translate_service.translate_text(results[STAGE_SIMPLIFY], language),
+            dependencies=[STAGE_SIMPLIFY]
+        )
+        graph.add_stage(
+            language_stage(STAGE_BLEU_SCORE, language),
+            lambda results: self.bleu_score_service.compute_bleu_score(
+                results[STAGE_SIMPLIFY], results[translate][0], results[translate][1]
+            ),
+            dependencies=[STAGE_SIMPLIFY, translate]
+        )
+
+    def _build_text_graph(self, text: str, options: dict, on_token: Optional[Callable[[str], None]],
+                          cancellation_token: Optional[CancellationToken],
+                          simplified_text: Optional[str] = None) -> StageGraph:
+        """
+        Constrói o grafo com as etapas independentes do idioma de destino: simplificação e métricas.
+
+        Parâmetros:
+            text (str): O texto original.
+            options (dict): Os parâmetros de simplificação (ver `simplify`).
+            on_token (Callable[[str], None], optional): Função chamada com cada trecho simplificado.
+            cancellation_token (CancellationToken, optional): Sinalizador que interrompe a simplificação.
+            simplified_text (str, optional): Texto já simplificado, reutilizado pela etapa de simplificação.
+
+        Retorna:
+            StageGraph: O grafo com as etapas de simplificação e de métricas de legibilidade.
+        """
+        graph = StageGraph()
+        graph.add_stage(
+            STAGE_READABILITY_ORIGINAL,
+            lambda results: self.readability_service.calculate_readability(text)
+        )
+        if simplified_text is not None:
+            graph.add_stage(STAGE_SIMPLIFY, lambda results: simplified_text)
+        else:
+            graph.add_stage(
+                STAGE_SIMPLIFY,
+                lambda results: self.simplify(text, options, on_token, cancellation_token)
+            )
+        graph.add_stage(
+            STAGE_READABILITY_SIMPLIFIED,
+            lambda results: self.readability_service.calculate_readability(results[STAGE_SIMPLIFY]),
+            dependencies=[STAGE_SIMPLIFY]
+        )
+        return graph
+
+    def run(self, text: str, target_language_code: str, options: dict,
+            on_token: Optional[Callable[[str], None]] = None,
+            on_stage: Optional[Callable[[str, str], None]] = None,
+            cancellation_token: Optional[CancellationToken] = None,
+            simplified_text: Optional[str] = None) -> PipelineResult:
+        """
+        Executa o pipeline completo para um texto.
+
+        Parâmetros:
+            text (str): O texto original.
+            target_language_code (str): O código do idioma de destino.
+            options (dict): Os parâmetros de simplificação (ver `simplify`).
+            on_token (Callable[[str], None], optional): Função chamada com cada trecho simplificado, na ordem
+                do documento, assim que ele é gerado.
+            on_stage (Callable[[str, str], None], optional): Função chamada no início e no fim de cada etapa.
+            cancellation_token (CancellationToken, optional): Sinalizador de cancelamento. É verificado antes
+                de cada etapa e a cada trecho simplificado; a simplificação em andamento é interrompida.
+            simplified_text (str, optional): Texto já simplificado (por exemplo, a variante escolhida em
+                `compare_variants`); se informado, apenas as demais etapas são executadas.
+
+        Retorna:
+            PipelineResult: Os textos, as métricas, o BLEU Score e a duração de cada etapa.
+
+        Exceções:
+            - Exception: Se alguma etapa falhar.
+            - OperationCancelledError: Se o cancelamento for solicitado.
+        """
+        start_time = time.perf_counter()
+        graph = self.build_graph(text, target_language_code, options, on_token, cancellation_token, simplified_text)
+        results, timings = graph.run(on_stage, cancellation_token)
+        return PipelineResult(results, timings, time.perf_counter() - start_time)
+
+    def run_multi(self, text: str, target_language_codes: List[str], options: dict,
+                  on_token: Optional[Callable[[str], None]] = None,
+                  on_stage: Optional[Callable[[str, str], None]] = None,
+                  cancellation_token: Optional[CancellationToken] = None,
+                  simplified_text: Optional[str] = None) -> MultiPipelineResult:
+        """
+        Simplifica o texto uma única vez e o traduz para vários idiomas de destino simultaneamente.
+
+        Parâmetros:
+            text (str): O texto original.
+            target_language_codes (List[str]): Os códigos dos idiomas de destino. Códigos repetidos são ignorados.
+            options (dict): Os parâmetros de simplificação (ver `simplify`).
+            on_token (Callable[[str], None], optional): Função chamada com cada trecho simplificado.
+            on_stage (Callable[[str, str], None], optional): Função chamada no início e no fim de cada etapa;
+                as etapas de cada idioma são nomeadas com `language_stage` (por exemplo, 'translate:en').
+            cancellation_token (CancellationToken, optional): Sinalizador de cancelamento.
+            simplified_text (str, optional): Texto já simplificado (ver `run`).
+
+        Retorna:
+            MultiPipelineResult: O texto simplificado, as métricas e, para cada idioma, a tradução e o BLEU Score.
+
+        Exceções:
+            - ValueError: Se nenhum idioma de destino for informado.
+            - Exception: Se alguma etapa falhar.
+            - OperationCancelledError: Se o cancelamento for solicitado.
+        """
+        target_language_codes = list(dict.fromkeys(target_language_codes))
+        if not target_language_codes:
+            raise ValueError("Informe ao menos um idioma de destino.")
+
+        start_time = time.perf_counter()
+        graph = self.build_multi_graph(
+            text, target_language_codes, options, on_token, cancellation_token, simplified_text
+        )
+        results, timings = graph.run(on_stage, cancellation_token)
+        return MultiPipelineResult(target_language_codes, results, timings, time.perf_counter() - start_time)
+
+    def compare_variants(self, text: str, variants: List[dict], options: dict,
+                         on_variant: Optional[Callable[[SimplificationVariant], None]] = None,
+                         cancellation_token: Optional[CancellationToken] = None) -> List[SimplificationVariant]:
+        """
+        Gera simultaneamente várias variantes simplificadas do texto, com as métricas de cada uma.
+
+        As variantes (por exemplo, os níveis de complexidade ou os estilos de escrita) são simplificadas
+        em paralelo por `OpenAIService.simplify_variants`, e as métricas de legibilidade de cada variante
+        são calculadas assim que ela é concluída, para que as variantes possam ser comparadas lado a lado.
+
+        Parâmetros:
+            text (str): O texto original.
+            variants (List[dict]): Os parâmetros que diferenciam cada variante.
+            options (dict): Os parâmetros de simplificação comuns a todas as variantes (ver `simplify`).
+            on_variant (Callable[[SimplificationVariant], None], optional): Função chamada com cada variante
+                concluída, na ordem de conclusão.
+            cancellation_token (CancellationToken, optional): Sinalizador verificado a cada variante concluída;
+                após o cancelamento, as variantes ainda não iniciadas são descartadas.
+
+        Retorna:
+            List[SimplificationVariant]: As variantes, na ordem de `variants`.
+
+        Exceções:
+            - Exception: Se a simplificação de alguma variante falhar.
+            - OperationCancelledError: Se o cancelamento for solicitado.
+        """
+        results: List[Optional[SimplificationVariant]] = [None] * len(variants)
+
+        def collect(index: int, simplified_text: str) -> None:
+            if cancellation_token is not None:
+                cancellation_token.raise_if_cancelled()
+            variant = SimplificationVariant(
+                index,
+                variants[index],
+                dict(options, **variants[index]),
+                simplified_text,
+                self.readability_service.calculate_readability(simplified_text)
+            )
+            results[index] = variant
+            if on_variant is not None:
+                on_variant(variant)
+
+        self.openai_service.simplify_variants(text, variants, on_variant=collect, **options)
+        return results
+
+    def simplify(self, text: str, options: dict, on_token: Optional[Callable[[str], None]] = None,
+                 cancellation_token: Optional[CancellationToken] = None,
+                 on_chunk: Optional[Callable[[int, str], None]] = None,
+                 completed_chunks: Optional[Dict[int, str]] = None) -> str:
+        """
+        Simplifica o texto, em streaming ou em blocos paralelos, conforme o seu tamanho.
+
+        Textos que excedem o orçamento de tokens do modelo são simplificados em blocos paralelos
+        (`simplify_long_text`); os demais são simplificados em modo streaming.
+
+        Parâmetros:
+            text (str): O texto a ser simplificado.
+            options (dict): Os parâmetros de `OpenAIService.simplify_text`, exceto `text`
+                (area_tecnica, estilo, summarize, model, complexity_level, focus_aspects, temperature, max_tokens...).
+            on_token (Callable[[str], None], optional): Função chamada com cada trecho simplificado.
+            cancellation_token (CancellationToken, optional): Sinalizador verificado a cada trecho recebido;
+                após o cancelamento, o stream é encerrado e os blocos ainda não iniciados são descartados.
+            on_chunk (Callable[[int, str], None], optional): Função chamada com o índice e o texto de cada
+                bloco simplificado de um documento longo (por exemplo, para registrar o progresso).
+            completed_chunks (Dict[int, str], optional): Blocos de um documento longo já simplificados em
+                uma execução anterior, que não são reenviados à API.
+
+        Retorna:
+            str: O texto simplificado.
+
+        Exceções:
+            - OperationCancelledError: Se o cancelamento for solicitado.
+        """
+        def publish(part: str) -> None:
+            if cancellation_token is not None:
+                cancellation_token.raise_if_cancelled()
+            if on_token is not None:
+                on_token(part)
+
+        summarize = options['summarize']
+        max_tokens = options.get('max_tokens', 4096)
+        if self.openai_service.needs_chunking(text, options['model'], max_tokens, summarize):
+            # Documentos longos são simplificados em blocos paralelos, publicados na ordem do documento
+            def publish_chunk(index: int, chunk: str) -> None:
+                if on_chunk is not None:
+                    on_chunk(index, chunk)
+                publish(chunk + '\n\n')
+
+            return self.openai_service.simplify_long_text(
+                text=text,
+                **options,
+                on_chunk=publish_chunk,
+                completed_chunks=completed_chunks
+            )
+
+        parts: List[str] = []
+        stream = self.openai_service.simplify_text_stream(text=text, **options)
+        try:
+            for part in stream:
+                parts.append(part)
+                publish(part)
+        finally:
+            stream.close()
+        return ''.join(parts).strip()
@@ -0,0 +1,542 @@
+# services/pipeline/streaming_pipeline.py
+
+"""
+Streaming Pipeline Module
+=========================
+
+Este módulo fornece o modo streaming do pipeline do TraduzAI, voltado a documentos longos. Em vez
+de simplificar todo o texto antes de iniciar a tradução, o texto é dividido em segmentos nos limites
+de parágrafos, e cada segmento simplificado segue imediatamente para a tradução e para o cálculo das
+métricas de legibilidade. Assim, a tradução do segmento N acontece enquanto o segmento N+1 ainda está
+sendo simplificado, sobrepondo as duas etapas que dependem de rede:
+
+    segmentos ─→ [simplificação] ─→ fila limitada ─→ [tradução + métricas] ─→ fila limitada ─→ saída
+
+Cada etapa é alimentada por uma thread que envia os segmentos a um pool de threads próprio e publica
+os futures, na ordem do documento, em uma fila de tamanho limitado. Quando a etapa seguinte (ou o
+consumidor) fica para trás, a fila enche e a etapa anterior aguarda (backpressure), de modo que a
+memória utilizada não depende do tamanho do documento. Os segmentos são entregues na ordem original.
+
+Além de um texto completo, o pipeline aceita um iterador de parágrafos, como o produzido por
+`DocumentService.iter_paragraphs`. Nesse caso, os parágrafos são agrupados em segmentos à medida que
+são lidos, e a simplificação da primeira página começa enquanto as páginas seguintes ainda estão
+sendo extraídas do documento. O processamento em lote e o servidor importam os documentos dessa forma;
+`simplify_stream` executa apenas a simplificação, quando a tradução é feita sobre o documento completo.
+
+Classes:
+    StreamSegment: Um segmento do documento, com o texto simplificado, traduzido e as suas métricas.
+    StreamingPipelineService: Classe responsável pela execução do pipeline em streaming.
+
+Dependências:
+    - concurrent.futures: biblioteca padrão para os pools de threads das etapas.
+    - queue: biblioteca padrão para as filas limitadas entre as etapas.
+    - threading: biblioteca padrão para as threads que alimentam as etapas.
+    - time: biblioteca padrão para a medição da duração das etapas.
+    - typing: biblioteca padrão para anotações de tipos.
+    - services.api.openai_service: Para a simplificação dos segmentos.
+    - services.api.aws_translate_service: Para a tradução dos segmentos.
+    - services.language.readability_service: Para o cálculo das métricas de legibilidade.
+    - services.language.bleu_score_service: Para o cálculo do BLEU Score do documento.
+    - services.language.text_segmentation_service: Para a divisão do texto em segmentos.
+    - services.pipeline.pipeline_service: Para os nomes das etapas e o `PipelineResult`.
+    - services.task_service: Para o cancelamento cooperativo.
+
+Exemplo de Uso:
+    >>> from services.pipeline.streaming_pipeline import StreamingPipelineService
+    >>> streaming = StreamingPipelineService(openai_service, aws_translate_service, readability_service,
+    ...                                      bleu_score_service)
+    >>> for segmento in streaming.stream(texto, 'en', opcoes):
+    ...     print(segmento.translated_text)
+    >>> resultado = streaming.run(texto, 'en', opcoes, on_segment=lambda s: print(s.index))
+    >>> print(resultado.timings)
+    >>> paragrafos = DocumentService().iter_paragraphs('artigo.pdf', first_page=1, last_page=40)
+    >>> resultado = streaming.run(paragrafos, 'en', opcoes)
+    >>> paragrafos = DocumentService().iter_paragraphs('artigo.pdf')
+    >>> simplificado = '\n\n'.join(s.simplified_text for s in streaming.simplify_stream(paragrafos, opcoes))
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from services.api.aws_translate_service import AwsTranslateService
+from services.api.openai_service import OpenAIService
+from services.language.bleu_score_service import BleuScoreService
+from services.language.readability_service import ReadabilityService
+from services.language.text_segmentation_service import TextSegmentationService
+from services.pipeline.pipeline_service import (
+    STAGE_BLEU_SCORE, STAGE_READABILITY_ORIGINAL, STAGE_READABILITY_SIMPLIFIED, STAGE_SIMPLIFY, STAGE_TRANSLATE,
+    PipelineResult
+)
+from services.task_service import CancellationToken
+
+# Tamanho máximo, em tokens, de cada segmento enviado à simplificação
+DEFAULT_SEGMENT_TOKENS = 800
+# Número máximo de segmentos processados simultaneamente em cada etapa
+DEFAULT_STAGE_WORKERS = 4
+# Número máximo de segmentos aguardando entre duas etapas
+DEFAULT_BUFFER_SIZE = 4
+# Intervalo, em segundos, entre as verificações de interrupção das threads das etapas
+POLL_INTERVAL = 0.1
+
+# Separador entre os parágrafos agrupados em um mesmo segmento
+PARAGRAPH_SEPARATOR = '\n\n'
+
+# Marcador de fim das filas entre as etapas
+_END = object()
+
+
+class StreamSegment:
+    """
+    Segmento do documento processado pelo pipeline em streaming.
+
+    Atributos:
+        index (int): A posição do segmento no documento.
+        original_text (str): O texto original do segmento.
+        separator (str): O separador que seguia o segmento no texto original.
+        simplified_text (str): O texto simplificado do segmento.
+        translated_text (str): O texto simplificado, traduzido para o idioma de destino.
+        source_language_code (str): O idioma de origem detectado na tradução do segmento.
+        metrics_simplified (dict): As métricas de legibilidade do segmento simplificado.
+    """
+
+    def __init__(self, index: int, original_text: str, separator: str):
+        """
+        Inicializa a instância do StreamSegment, ainda sem os resultados das etapas.
+
+        Parâmetros:
+            index (int): A posição do segmento no documento.
+            original_text (str): O texto original do segmento.
+            separator (str): O separador que seguia o segmento no texto original.
+        """
+        self.index = index
+        self.original_text = original_text
+        self.separator = separator
+        self.simplified_text: Optional[str] = None
+        self.translated_text: Optional[str] = None
+        self.source_language_code: Optional[str] = None
+        self.metrics_simplified: Optional[dict] = None
+
+
+class StreamingPipelineService:
+    """
+    Serviço que executa o pipeline de simplificação e tradução em streaming, segmento a segmento.
+
+    Cada segmento é simplificado independentemente: com `summarize`, cada segmento é resumido, sem a
+    consolidação final de `OpenAIService.simplify_long_text`. Por isso, o modo streaming é indicado
+    para a simplificação de documentos longos (ver `is_suitable`).
+
+    Métodos:
+        is_suitable(text: str, options: dict) ⇾ bool:
+            Indica se o texto deve ser processado em streaming.
+
+        segment(text: str, options: dict) ⇾ List[Tuple[str, str]]:
+            Divide o texto em segmentos nos limites de parágrafos.
+
+        stream(text: str, target_language_code: str, options: dict, cancellation_token) ⇾ Iterator[StreamSegment]:
+            Processa o texto e produz cada segmento concluído, na ordem do documento.
+
+        simplify_stream(paragraphs: Iterable[str], options: dict, ...) ⇾ Iterator[StreamSegment]:
+            Simplifica os parágrafos à medida que são lidos, sem traduzi-los.
+
+        run(text: str, target_language_code: str, options: dict, on_segment, on_stage, cancellation_token) ⇾ PipelineResult:
+            Processa o texto em streaming e retorna o resultado consolidado do documento.
+    """
+
+    def __init__(self, openai_service: OpenAIService, aws_translate_service: AwsTranslateService,
+                 readability_service: ReadabilityService, bleu_score_service: BleuScoreService,
+                 segment_tokens: int = DEFAULT_SEGMENT_TOKENS, max_workers: int = DEFAULT_STAGE_WORKERS,
+                 buffer_size: int = DEFAULT_BUFFER_SIZE):
+        """
+        Inicializa a instância do StreamingPipelineService.
+
+        Parâmetros:
+            openai_service (OpenAIService): Serviço de simplificação.
+            aws_translate_service (AwsTranslateService): Serviço de tradução.
+            readability_service (ReadabilityService): Serviço de métricas de legibilidade.
+            bleu_score_service (BleuScoreService): Serviço de cálculo do BLEU Score.
+            segment_tokens (int): Tamanho máximo, em tokens, de cada segmento (limitado também pelo
+                orçamento de tokens do modelo).
+            max_workers (int): Número máximo de segmentos processados simultaneamente em cada etapa.
+            buffer_size (int): Número máximo de segmentos aguardando entre duas etapas.
+        """
+        self.openai_service = openai_service
+        self.aws_translate_service = aws_translate_service
+        self.readability_service = readability_service
+        self.bleu_score_service = bleu_score_service
+        self.segment_tokens = segment_tokens
+        self.max_workers = max_workers
+        self.buffer_size = buffer_size
+
+    def is_suitable(self, text: str, options: dict) -> bool:
+        """
+        Indica se o texto deve ser processado em streaming.
+
+        Textos que cabem em uma única requisição são simplificados de uma vez pelo `PipelineService`;
+        resumos de documentos longos precisam da consolidação de `simplify_long_text`.
+
+        Parâmetros:
+            text (str): O texto original.
+            options (dict): Os parâmetros de simplificação.
+
+        Retorna:
+            bool: `True` se o texto é longo e não será resumido.
+        """
+        if options['summarize']:
+            return False
+        return self.openai_service.needs_chunking(text, options['model'], options.get('max_tokens', 4096), False)
+
+    def segment(self, text: str, options: dict) -> List[Tuple[str, str]]:
+        """
+        Divide o texto em segmentos nos limites de parágrafos.
+
+        Parâmetros:
+            text (str): O texto original.
+            options (dict): Os parâmetros de simplificação (utiliza `model`, `max_tokens` e `summarize`).
+
+        Retorna:
+            List[Tuple[str, str]]: Lista de tuplas (segmento, separador seguinte).
+        """
+        model = options['model']
+        budget = self.openai_service.chunk_token_budget(model, options.get('max_tokens', 4096), options['summarize'])
+        return TextSegmentationService.split_text(
+            text, min(budget, self.segment_tokens), lambda t: self.openai_service.count_tokens(t, model)
+        )
+
+    def segment_paragraphs(self, paragraphs: Iterable[str], options: dict) -> Iterator[Tuple[str, str]]:
+        """
+        Agrupa os parágrafos em segmentos à medida que são lidos.
+
+        Parágrafos consecutivos são reunidos no mesmo segmento enquanto o orçamento de tokens permitir;
+        parágrafos maiores que o orçamento são divididos como em `segment`.
+
+        Parâmetros:
+            paragraphs (Iterable[str]): Os parágrafos do documento, na ordem de leitura.
+            options (dict): Os parâmetros de simplificação (utiliza `model`, `max_tokens` e `summarize`).
+
+        Retorna:
+            Iterator[Tuple[str, str]]: Tuplas (segmento, separador seguinte).
+        """
+        model = options['model']
+        budget = self.openai_service.chunk_token_budget(model, options.get('max_tokens', 4096), options['summarize'])
+        max_tokens = min(budget, self.segment_tokens)
+
+        def size(t: str) -> int:
+            return self.openai_service.count_tokens(t, model)
+
+        current = ''
+        current_size = 0
+        separator_size = size(PARAGRAPH_SEPARATOR)
+        for paragraph in paragraphs:
+            for unit, _ in TextSegmentationService.split_text(paragraph, max_tokens, size):
+                unit_size = size(unit)
+                if current and current_size + separator_size + unit_size > max_tokens:
+                    yield current, PARAGRAPH_SEPARATOR
+                    current, current_size = '', 0
+                if current:
+                    current += PARAGRAPH_SEPARATOR + unit
+                    current_size += separator_size + unit_size
+                else:
+                    current, current_size = unit, unit_size
+        if current:
+            yield current, ''
+
+    def stream(self, text: Union[str, Iterable[str]], target_language_code: str, options: dict,
+               cancellation_token: Optional[CancellationToken] = None,
+               timings: Optional[Dict[str, float]] = None) -> Iterator[StreamSegment]:
+        """
+        Processa o texto e produz cada segmento concluído, na ordem do documento.
+
+        A simplificação dos segmentos seguintes continua enquanto os anteriores são traduzidos, até
+        o limite das filas entre as etapas. Se o consumidor interromper a iteração, ou se alguma
+        etapa falhar, os segmentos ainda não iniciados são descartados.
+
+        Parâmetros:
+            text (str | Iterable[str]): O texto original, ou um iterador dos seus parágrafos (ver
+                `segment_paragraphs`), consumido à medida que os segmentos são simplificados.
+            target_language_code (str): O código do idioma de destino.
+            options (dict): Os parâmetros de `OpenAIService.simplify_text`, exceto `text`.
+            cancellation_token (CancellationToken, optional): Sinalizador verificado antes de cada segmento.
+            timings (Dict[str, float], optional): Dicionário que acumula o tempo gasto em cada etapa.
+
+        Retorna:
+            Iterator[StreamSegment]: Os segmentos concluídos.
+
+        Exceções:
+            - Exception: Se a simplificação ou a tradução de algum segmento falhar.
+            - OperationCancelledError: Se o cancelamento for solicitado.
+        """
+        timings = timings if timings is not None else {}
+        timings_lock = threading.Lock()
+
+        def timed(stage: str, function: Callable[[StreamSegment], StreamSegment]):
+            def run(segment: StreamSegment) -> StreamSegment:
+                start_time = time.perf_counter()
+                result = function(segment)
+                with timings_lock:
+                    timings[stage] = timings.get(stage, 0.0) + time.perf_counter() - start_time
+                return result
+            return run
+
+        def simplify(segment: StreamSegment) -> StreamSegment:
+            segment.simplified_text = self.openai_service.simplify_text(text=segment.original_text, **options)
+            return segment
+
+        def translate(segment: StreamSegment) -> StreamSegment:
+            segment.translated_text, segment.source_language_code = self.aws_translate_service.translate_text(
+                segment.simplified_text, target_language_code
+            )
+            segment.metrics_simplified = self.readability_service.calculate_readability(segment.simplified_text)
+            return segment
+
+        chunks = self.segment(text, options) if isinstance(text, str) else self.segment_paragraphs(text, options)
+        segments = (StreamSegment(index, chunk, separator) for index, (chunk, separator) in enumerate(chunks))
+        yield from self._run_stages(
+            segments, [timed(STAGE_SIMPLIFY, simplify), timed(STAGE_TRANSLATE, translate)], cancellation_token
+        )
+
+    def simplify_stream(self, paragraphs: Iterable[str], options: dict,
+                        cancellation_token: Optional[CancellationToken] = None,
+                        completed_segments: Optional[Dict[int, str]] = None) -> Iterator[StreamSegment]:
+        """
+        Simplifica os parágrafos à medida que são lidos e produz cada segmento simplificado, sem traduzi-lo.
+
+        Os parágrafos são agrupados por `segment_paragraphs`, e a simplificação de um segmento começa
+        enquanto os parágrafos seguintes ainda estão sendo extraídos do documento (por exemplo, por
+        `DocumentService.iter_paragraphs`). Utilizado quando a tradução é feita sobre o documento
+        simplificado completo, como no processamento em lote para vários idiomas.
+
+        Parâmetros:
+            paragraphs (Iterable[str]): Os parágrafos do documento, na ordem de leitura.
+            options (dict): Os parâmetros de `OpenAIService.simplify_text`, exceto `text`.
+            cancellation_token (CancellationToken, optional): Sinalizador verificado antes de cada segmento.
+            completed_segments (Dict[int, str], optional): Segmentos já simplificados em uma execução
+                anterior, indexados pela posição, que não são reenviados à API. A divisão em segmentos é
+                determinística para os mesmos parágrafos e opções.
+
+        Retorna:
+            Iterator[StreamSegment]: Os segmentos simplificados, na ordem do documento.
+
+        Exceções:
+            - Exception: Se a simplificação de algum segmento, ou a leitura dos parágrafos, falhar.
+            - OperationCancelledError: Se o cancelamento for solicitado.
+        """
+        completed_segments = completed_segments or {}
+
+        def simplify(segment: StreamSegment) -> StreamSegment:
+            segment.simplified_text = completed_segments.get(segment.index)
+            if segment.simplified_text is None:
+                segment.simplified_text = self.openai_service.simplify_text(text=segment.original_text, **options)
+            return segment
+
+        chunks = self.segment_paragraphs(paragraphs, options)
+        segments = (StreamSegment(index, chunk, separator) for index, (chunk, separator) in enumerate(chunks))
+        yield from self._run_stages(segments, [simplify], cancellation_token)
+
+    def _run_stages(self, segments: Iterable[StreamSegment],
+                    stages: List[Callable[[StreamSegment], StreamSegment]],
+                    cancellation_token: Optional[CancellationToken]) -> Iterator[StreamSegment]:
+        """
+        Encadeia as etapas, cada uma com o seu pool de threads e uma fila limitada de saída, e produz os
+        segmentos concluídos pela última etapa, na ordem do documento.
+
+        Parâmetros:
+            segments (Iterable[StreamSegment]): Os segmentos de entrada, consumidos à medida que a primeira
+                etapa os aceita.
+            stages (List[Callable[[StreamSegment], StreamSegment]]): As funções das etapas, em ordem.
+            cancellation_token (CancellationToken, optional): Sinalizador verificado antes de cada segmento.
+
+        Retorna:
+            Iterator[StreamSegment]: Os segmentos concluídos.
+        """
+        stop = threading.Event()
+        executors = [ThreadPoolExecutor(max_workers=self.max_workers) for _ in stages]
+        feeders = []
+        source: Iterable[StreamSegment] = segments
+        for executor, function in zip(executors, stages):
+            output = queue.Queue(maxsize=self.buffer_size)
+            feeders.append(threading.Thread(
+                target=self._feed, args=(executor, function, source, output, stop, cancellation_token), daemon=True
+            ))
+            source = self._drain(output, stop)
+        for feeder in feeders:
+            feeder.start()
+        try:
+            for segment in source:
+                if cancellation_token is not None:
+                    cancellation_token.raise_if_cancelled()
+                yield segment
+        finally:
+            # Interrompe as etapas e descarta os segmentos ainda não iniciados
+            stop.set()
+            for executor in executors:
+                executor.shutdown(wait=False, cancel_futures=True)
+            for feeder in feeders:
+                feeder.join()
+            for executor in executors:
+                executor.shutdown(wait=True)
+
+    def run(self, text: Union[str, Iterable[str]], target_language_code: str, options: dict,
+            on_segment: Optional[Callable[[StreamSegment], None]] = None,
+            on_stage: Optional[Callable[[str, str], None]] = None,
+            cancellation_token: Optional[CancellationToken] = None) -> PipelineResult:
+        """
+        Processa o texto em streaming e retorna o resultado consolidado do documento.
+
+        As métricas do texto original são calculadas enquanto os segmentos são processados; as métricas
+        do texto simplificado e o BLEU Score são calculados sobre o documento completo, ao final. Se o
+        texto for um iterador de parágrafos, as métricas do texto original são calculadas ao final, sobre
+        os parágrafos lidos.
+
+        Parâmetros:
+            text (str | Iterable[str]): O texto original, ou um iterador dos seus parágrafos.
+            target_language_code (str): O código do idioma de destino.
+            options (dict): Os parâmetros de simplificação (ver `stream`).
+            on_segment (Callable[[StreamSegment], None], optional): Função chamada com cada segmento
+                concluído, na ordem do documento.
+            on_stage (Callable[[str, str], None], optional): Função chamada no início e no fim de cada etapa.
+            cancellation_token (CancellationToken, optional): Sinalizador de cancelamento.
+
+        Retorna:
+            PipelineResult: Os textos, as métricas, o BLEU Score e o tempo gasto em cada etapa. Nas etapas de
+            simplificação e tradução, o tempo corresponde à soma do tempo de todos os segmentos.
+
+        Exceções:
+            - Exception: Se alguma etapa falhar.
+            - OperationCancelledError: Se o cancelamento for solicitado.
+        """
+        def notify(stage: str, event: str) -> None:
+            if on_stage is not None:
+                on_stage(stage, event)
+
+        start_time = time.perf_counter()
+        timings: Dict[str, float] = {}
+        results = {}
+
+        def readability_original(original_text: str) -> None:
+            notify(STAGE_READABILITY_ORIGINAL, 'started')
+            stage_start = time.perf_counter()
+            results[STAGE_READABILITY_ORIGINAL] = self.readability_service.calculate_readability(original_text)
+            timings[STAGE_READABILITY_ORIGINAL] = time.perf_counter() - stage_start
+            notify(STAGE_READABILITY_ORIGINAL, 'finished')
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            metrics_original = executor.submit(readability_original, text) if isinstance(text, str) else None
+
+            notify(STAGE_SIMPLIFY, 'started')
+            notify(STAGE_TRANSLATE, 'started')
+            segments: List[StreamSegment] = []
+            for segment in self.stream(text, target_language_code, options, cancellation_token, timings):
+                segments.append(segment)
+                if on_segment is not None:
+                    on_segment(segment)
+            notify(STAGE_SIMPLIFY, 'finished')
+            notify(STAGE_TRANSLATE, 'finished')
+            if metrics_original is None:
+                original_text = TextSegmentationService.join_chunks(
+                    [(segment.original_text, segment.separator) for segment in segments]
+                )
+                metrics_original = executor.submit(readability_original, original_text)
+            metrics_original.result()
+
+        simplified_text = '\n\n'.join(segment.simplified_text for segment in segments)
+        translated_text = TextSegmentationService.join_chunks(
+            [(segment.translated_text, segment.separator) for segment in segments]
+        )
+        source_language_code = self.aws_translate_service.reconcile_source_language(
+            [segment.simplified_text for segment in segments],
+            [segment.source_language_code for segment in segments]
+        )
+        results[STAGE_SIMPLIFY] = simplified_text
+        results[STAGE_TRANSLATE] = (translated_text, source_language_code)
+
+        for stage, function in (
+                (STAGE_READABILITY_SIMPLIFIED, lambda: self.readability_service.calculate_readability(simplified_text)),
+                (STAGE_BLEU_SCORE, lambda: self.bleu_score_service.compute_bleu_score(
+                    simplified_text, translated_text, source_language_code
+                ))
+        ):
+            if cancellation_token is not None:
+                cancellation_token.raise_if_cancelled()
+            notify(stage, 'started')
+            stage_start = time.perf_counter()
+            results[stage] = function()
+            timings[stage] = time.perf_counter() - stage_start
+            notify(stage, 'finished')
+
+        return PipelineResult(results, timings, time.perf_counter() - start_time)
+
+    @staticmethod
+    def _feed(executor: ThreadPoolExecutor, function: Callable[[StreamSegment], StreamSegment],
+              segments: Iterable[StreamSegment], output: queue.Queue, stop: threading.Event,
+              cancellation_token: Optional[CancellationToken]) -> None:
+        """
+        Envia os segmentos a uma etapa e publica os futures, na ordem do documento, na fila de saída.
+
+        Um erro ao obter os segmentos (por exemplo, a falha de uma etapa anterior) ou o cancelamento é
+        publicado como um future com a exceção, propagada ao consumidor da fila.
+
+        Parâmetros:
+            executor (ThreadPoolExecutor): Pool de threads da etapa.
+            function (Callable[[StreamSegment], StreamSegment]): Função executada pela etapa.
+            segments (Iterable[StreamSegment]): Os segmentos de entrada.
+            output (queue.Queue): Fila limitada de saída da etapa.
+            stop (threading.Event): Sinalizador de interrupção do pipeline.
+            cancellation_token (CancellationToken, optional): Sinalizador verificado antes de cada segmento.
+        """
+        try:
+            for segment in segments:
+                if stop.is_set():
+                    return
+                if cancellation_token is not None:
+                    cancellation_token.raise_if_cancelled()
+                StreamingPipelineService._put(output, executor.submit(function, segment), stop)
+        except Exception as e:
+            failed = Future()
+            failed.set_exception(e)
+            StreamingPipelineService._put(output, failed, stop)
+        finally:
+            StreamingPipelineService._put(output, _END, stop)
+
+    @staticmethod
+    def _drain(source: queue.Queue, stop: threading.Event) -> Iterator[StreamSegment]:
+        """
+        Produz os resultados dos futures de uma fila, na ordem em que foram publicados.
+
+        Parâmetros:
+            source (queue.Queue): Fila de futures de uma etapa.
+            stop (threading.Event): Sinalizador de interrupção do pipeline.
+
+        Retorna:
+            Iterator[StreamSegment]: Os segmentos concluídos pela etapa.
+
+        Exceções:
+            - Exception: A exceção da etapa, se algum segmento falhar.
+        """
+        while not stop.is_set():
+            try:
+                item = source.get(timeout=POLL_INTERVAL)
+            except queue.Empty:
+                continue
+            if item is _END:
+                return
+            yield item.result()
+
+    @staticmethod
+    def _put(output: queue.Queue, item, stop: threading.Event) -> None:
+        """
+        Publica um item na fila, aguardando espaço enquanto o pipeline não for interrompido.
+
+        Parâmetros:
+            output (queue.Queue): Fila limitada de saída.
+            item: O item a ser publicado.
+            stop (threading.Event): Sinalizador de interrupção do pipeline.
+        """
+        while not stop.is_set():
+            try:
+                output.put(item, timeout=POLL_INTERVAL)
+                return
+            except queue.Full:
+                continue
@@ -0,0 +1,301 @@
+# services/task_service.py
+
+"""
+Task Service Module
+===================
+
+Este módulo fornece a execução de tarefas em threads de trabalho, com cancelamento cooperativo
+e publicação de progresso. As tarefas nunca acessam a interface gráfica: o progresso, o resultado
+e os erros são publicados em uma fila de eventos, consumida pela thread da interface (por exemplo,
+a partir de `root.after` no Tkinter) com `process_events`, que respeita um orçamento de tempo por
+chamada para não atrasar a renderização da janela. O cancelamento é notificado imediatamente, mas a
+thread só termina na próxima verificação do sinalizador; o término efetivo é notificado à parte, para que
+a interface não inicie outra operação enquanto a cancelada ainda estiver em execução.
+
+Classes:
+    OperationCancelledError: Exceção lançada quando uma operação é cancelada.
+    CancellationToken: Sinalizador de cancelamento compartilhado entre a interface e a tarefa.
+    BackgroundTask: Representa uma tarefa em execução em uma thread de trabalho.
+    BackgroundTaskService: Classe responsável pela execução das tarefas e pela entrega dos eventos.
+
+Dependências:
+    - queue: biblioteca padrão para a fila de eventos entre threads.
+    - threading: biblioteca padrão para as threads de trabalho e o sinalizador de cancelamento.
+    - time: biblioteca padrão para o orçamento de tempo do processamento dos eventos.
+    - typing: biblioteca padrão para anotações de tipos.
+
+Exemplo de Uso:
+    >>> from services.task_service import BackgroundTaskService
+    >>> tasks = BackgroundTaskService()
+    >>> def importar(task):
+    ...     task.report('Lendo arquivo...')
+    ...     return document_service.import_document('exemplo.pdf')
+    >>> task = tasks.submit(importar, on_result=mostrar_texto, on_progress=mostrar_status)
+    >>> tasks.process_events()  # Chamado periodicamente pela thread da interface
+    >>> task.cancel()
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Optional
+
+# Orçamento de tempo padrão (em segundos) de cada chamada a `process_events`
+DEFAULT_EVENT_BUDGET = 0.008
+
+# Tipos de eventos publicados pelas tarefas
+EVENT_PROGRESS = 'progress'
+EVENT_RESULT = 'result'
+EVENT_ERROR = 'error'
+EVENT_CANCELLED = 'cancelled'
+EVENT_FINISHED = 'finished'
+
+
+class OperationCancelledError(Exception):
+    """
+    Exceção lançada quando uma operação é interrompida por um pedido de cancelamento.
+    """
+
+    def __init__(self, message: str = "Operação cancelada pelo usuário."):
+        super().__init__(message)
+
+
+class CancellationToken:
+    """
+    Sinalizador de cancelamento cooperativo.
+
+    A interface chama `cancel`; a tarefa verifica o sinalizador entre as etapas do seu trabalho
+    com `raise_if_cancelled`, interrompendo-se o mais cedo possível.
+
+    Métodos:
+        cancel() ⇾ None:
+            Solicita o cancelamento da operação.
+
+        is_cancelled() ⇾ bool:
+            Indica se o cancelamento foi solicitado.
+
+        raise_if_cancelled() ⇾ None:
+            Lança OperationCancelledError se o cancelamento foi solicitado.
+    """
+
+    def __init__(self):
+        """
+        Inicializa a instância do CancellationToken, sem cancelamento solicitado.
+        """
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        """
+        Solicita o cancelamento da operação.
+        """
+        self._event.set()
+
+    def is_cancelled(self) -> bool:
+        """
+        Indica se o cancelamento foi solicitado.
+
+        Retorna:
+            bool: `True` se `cancel` já foi chamado.
+        """
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        """
+        Lança OperationCancelledError se o cancelamento foi solicitado.
+
+        Exceções:
+            - OperationCancelledError: se `cancel` já foi chamado.
+        """
+        if self._event.is_set():
+            raise OperationCancelledError()
+
+
+class BackgroundTask:
+    """
+    Tarefa executada em uma thread de trabalho.
+
+    Atributos:
+        name (str): Nome da tarefa, utilizado no nome da thread.
+        token (CancellationToken): Sinalizador de cancelamento da tarefa.
+
+    Métodos:
+        report(payload: Any) ⇾ None:
+            Publica um evento de progresso, entregue ao callback `on_progress` na thread da interface.
+
+        cancel() ⇾ None:
+            Solicita o cancelamento da tarefa.
+
+        is_alive() ⇾ bool:
+            Indica se a thread da tarefa ainda está em execução.
+    """
+
+    def __init__(self, name: str, events: queue.Queue, on_result: Optional[Callable[[Any], None]],
+                 on_error: Optional[Callable[[Exception], None]], on_progress: Optional[Callable[[Any], None]],
+                 on_cancelled: Optional[Callable[[], None]], on_finished: Optional[Callable[[], None]] = None):
+        """
+        Inicializa a instância do BackgroundTask.
+
+        Parâmetros:
+            name (str): Nome da tarefa.
+            events (queue.Queue): Fila de eventos do BackgroundTaskService.
+            on_result (Callable[[Any], None], optional): Callback do resultado.
+            on_error (Callable[[Exception], None], optional): Callback de erro.
+            on_progress (Callable[[Any], None], optional): Callback de progresso.
+            on_cancelled (Callable[[], None], optional): Callback de cancelamento.
+            on_finished (Callable[[], None], optional): Callback do término da thread.
+        """
+        self.name = name
+        self.token = CancellationToken()
+        self.thread: Optional[threading.Thread] = None
+        self.on_result = on_result
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.on_cancelled = on_cancelled
+        self.on_finished = on_finished
+        self._events = events
+
+    def report(self, payload: Any) -> None:
+        """
+        Publica um evento de progresso.
+
+        Os eventos de uma tarefa cancelada são descartados.
+
+        Parâmetros:
+            payload (Any): Dados do progresso, repassados ao callback `on_progress`.
+        """
+        if not self.token.is_cancelled():
+            self._events.put((self, EVENT_PROGRESS, payload))
+
+    def cancel(self) -> None:
+        """
+        Solicita o cancelamento da tarefa.
+
+        O callback `on_cancelled` é chamado na thread da interface assim que o evento for processado,
+        sem aguardar o término da thread; o resultado produzido depois disso é descartado, e o término
+        da thread é notificado por `on_finished`.
+        """
+        if not self.token.is_cancelled():
+            self.token.cancel()
+            self._events.put((self, EVENT_CANCELLED, None))
+
+    def is_alive(self) -> bool:
+        """
+        Indica se a thread da tarefa ainda está em execução.
+
+        Retorna:
+            bool: `True` enquanto a função da tarefa não tiver terminado.
+        """
+        return self.thread is not None and self.thread.is_alive()
+
+
+class BackgroundTaskService:
+    """
+    Serviço de execução de tarefas em threads de trabalho.
+
+    Métodos:
+        submit(function, name, on_result, on_error, on_progress, on_cancelled, on_finished) ⇾ BackgroundTask:
+            Executa a função em uma nova thread de trabalho.
+
+        process_events(budget: float) ⇾ None:
+            Entrega os eventos pendentes aos callbacks, na thread que chama o metodo.
+
+        has_pending_work() ⇾ bool:
+            Indica se há tarefas em execução ou eventos ainda não entregues.
+    """
+
+    def __init__(self):
+        """
+        Inicializa a instância do BackgroundTaskService.
+        """
+        self.events = queue.Queue()
+        self.tasks = []
+
+    def submit(self, function: Callable[[BackgroundTask], Any], name: str = 'tarefa',
+               on_result: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[Exception], None]] = None,
+               on_progress: Optional[Callable[[Any], None]] = None,
+               on_cancelled: Optional[Callable[[], None]] = None,
+               on_finished: Optional[Callable[[], None]] = None) -> BackgroundTask:
+        """
+        Executa a função em uma nova thread de trabalho.
+
+        A função recebe a própria tarefa, com a qual publica o progresso (`task.report`) e verifica
+        o cancelamento (`task.token`). Os callbacks são sempre chamados pela thread que executa
+        `process_events`, nunca pela thread de trabalho.
+
+        Parâmetros:
+            function (Callable[[BackgroundTask], Any]): Função executada pela tarefa.
+            name (str): Nome da tarefa.
+            on_result (Callable[[Any], None], optional): Chamado com o valor retornado pela função.
+            on_error (Callable[[Exception], None], optional): Chamado com a exceção lançada pela função.
+            on_progress (Callable[[Any], None], optional): Chamado com cada evento de progresso.
+            on_cancelled (Callable[[], None], optional): Chamado quando a tarefa é cancelada, sem aguardar o
+                término da thread.
+            on_finished (Callable[[], None], optional): Chamado depois que a thread termina, inclusive após o
+                cancelamento; é sempre o último evento da tarefa.
+
+        Retorna:
+            BackgroundTask: A tarefa iniciada.
+        """
+        task = BackgroundTask(name, self.events, on_result, on_error, on_progress, on_cancelled, on_finished)
+
+        def run():
+            try:
+                result = function(task)
+                if not task.token.is_cancelled():
+                    self.events.put((task, EVENT_RESULT, result))
+            except OperationCancelledError:
+                pass
+            except Exception as e:
+                if not task.token.is_cancelled():
+                    self.events.put((task, EVENT_ERROR, e))
+            finally:
+                self.events.put((task, EVENT_FINISHED, None))
+
+        task.thread = threading.Thread(target=run, name=name, daemon=True)
+        self.tasks.append(task)
+        task.thread.start()
+        return task
+
+    def process_events(self, budget: float = DEFAULT_EVENT_BUDGET) -> None:
+        """
+        Entrega os eventos pendentes aos callbacks correspondentes.
+
+        O processamento é interrompido quando o orçamento de tempo se esgota, de modo que uma
+        rajada de eventos não bloqueie a thread da interface; os eventos restantes são entregues
+        na chamada seguinte.
+
+        Parâmetros:
+            budget (float): Tempo máximo, em segundos, gasto nesta chamada.
+        """
+        deadline = time.perf_counter() + budget
+        while time.perf_counter() < deadline:
+            try:
+                task, kind, payload = self.events.get_nowait()
+            except queue.Empty:
+                break
+
+            # Após o cancelamento, apenas os eventos de cancelamento e de término são entregues
+            if task.token.is_cancelled() and kind not in (EVENT_CANCELLED, EVENT_FINISHED):
+                continue
+            if kind == EVENT_PROGRESS and task.on_progress is not None:
+                task.on_progress(payload)
+            elif kind == EVENT_RESULT and task.on_result is not None:
+                task.on_result(payload)
+            elif kind == EVENT_ERROR and task.on_error is not None:
+                task.on_error(payload)
+            elif kind == EVENT_CANCELLED and task.on_cancelled is not None:
+                task.on_cancelled()
+            elif kind == EVENT_FINISHED and task.on_finished is not None:
+                task.on_finished()
+
+        self.tasks = [task for task in self.tasks if task.is_alive()]
+
+    def has_pending_work(self) -> bool:
+        """
+        Indica se há tarefas em execução ou eventos ainda não entregues.
+
+        Retorna:
+            bool: `True` se for necessário continuar chamando `process_events`.
+        """
+        return any(task.is_alive() for task in self.tasks) or not self.events.empty()
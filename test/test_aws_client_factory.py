@@ -0,0 +1,42 @@
+# test/test_aws_client_factory.py
+
+"""
+Testes da fábrica de clientes AWS (`AwsClientFactory`): os clientes são criados localmente, sem acesso à AWS.
+"""
+
+import pytest
+
+from services.api.aws_client_factory import AwsClientFactory
+
+CREDENTIALS = ('AKIATESTE', 'segredo', 'us-east-1')
+
+
+@pytest.fixture(autouse=True)
+def factory(monkeypatch):
+    """
+    Descarta os clientes compartilhados antes e depois de cada teste.
+    """
+    monkeypatch.delenv('AWS_TRANSLATE_ENDPOINT_URL', raising=False)
+    AwsClientFactory.clear()
+    yield
+    AwsClientFactory.clear()
+
+
+def test_clients_are_shared_per_credentials_and_configuration():
+    client = AwsClientFactory.get_translate_client(*CREDENTIALS)
+
+    assert AwsClientFactory.get_translate_client(*CREDENTIALS) is client
+    assert AwsClientFactory.get_translate_client(*CREDENTIALS, config=AwsClientFactory.build_config()) is client
+    assert AwsClientFactory.get_translate_client('AKIAOUTRA', 'segredo', 'us-east-1') is not client
+
+
+def test_different_configuration_gets_its_own_client():
+    client = AwsClientFactory.get_translate_client(*CREDENTIALS)
+    config = AwsClientFactory.build_config(read_timeout=5)
+
+    other = AwsClientFactory.get_translate_client(*CREDENTIALS, config=config)
+
+    assert other is not client
+    assert other.meta.config.read_timeout == 5
+    same_config = AwsClientFactory.build_config(read_timeout=5)
+    assert AwsClientFactory.get_translate_client(*CREDENTIALS, config=same_config) is other
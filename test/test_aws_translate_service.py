@@ -0,0 +1,105 @@
+# test/test_aws_translate_service.py
+
+"""
+Testes do `AwsTranslateService` sem acesso à AWS: o cliente boto3 é substituído por um cliente local que
+traduz os textos para maiúsculas, inclusive a tradução em lotes de `translate_many`.
+"""
+
+import re
+import threading
+
+import pytest
+from botocore.exceptions import ClientError
+
+from services.api.aws_translate_service import MAX_REQUEST_BYTES, AwsTranslateService
+from services.api.quota_manager import QuotaManager
+from services.api.rate_limiter import AdaptiveRateLimiter
+
+
+class FakeTranslateClient:
+    """
+    Cliente AWS Translate local: traduz os textos para maiúsculas, rejeita as requisições TranslateText
+    acima do limite do serviço e registra as requisições. Os segmentos de `dropped` são omitidos dos
+    documentos traduzidos.
+    """
+
+    def __init__(self, dropped=()):
+        self.dropped = set(dropped)
+        self.texts = []
+        self.documents = []
+        self._lock = threading.Lock()
+
+    def translate_text(self, Text, SourceLanguageCode, TargetLanguageCode):
+        if len(Text.encode('utf-8')) > MAX_REQUEST_BYTES:
+            raise ClientError({'Error': {'Code': 'ValidationException', 'Message': 'Texto longo'}}, 'TranslateText')
+        with self._lock:
+            self.texts.append(Text)
+        return {'TranslatedText': Text.upper(), 'SourceLanguageCode': 'en'}
+
+    def translate_document(self, Document, SourceLanguageCode, TargetLanguageCode):
+        content = Document['Content'].decode('utf-8')
+        with self._lock:
+            self.documents.append(content)
+
+        def translate(match):
+            text = '' if match.group(2) in self.dropped else match.group(2).upper()
+            return f'<p id="s{match.group(1)}">{text}</p>'
+
+        translated = re.sub(r'<p id="s(\d+)">(.*?)</p>', translate, content)
+        return {'TranslatedDocument': {'Content': translated.encode('utf-8')}, 'SourceLanguageCode': 'en'}
+
+
+def make_service(client=None, **kwargs) -> AwsTranslateService:
+    return AwsTranslateService(translate_client=client or FakeTranslateClient(), use_cache=False,
+                               rate_limiter=AdaptiveRateLimiter(), quota_manager=QuotaManager(), **kwargs)
+
+
+def test_invalid_lane_is_rejected():
+    assert make_service(lane='batch').lane == 'batch'
+    with pytest.raises(ValueError):
+        make_service(lane='urgente')
+
+
+def test_translate_many_translates_each_distinct_text_once_in_the_input_order():
+    client = FakeTranslateClient()
+    texts = ['hello', 'goodbye', 'hello', '  ', 'thank you']
+
+    assert make_service(client).translate_many(texts, 'pt') == ['HELLO', 'GOODBYE', 'HELLO', '  ', 'THANK YOU']
+    assert len(client.documents) == 1
+    assert client.documents[0].count('hello') == 1
+    assert client.texts == []
+
+
+def test_translate_many_translates_texts_with_line_breaks_individually():
+    client = FakeTranslateClient()
+
+    assert make_service(client).translate_many(['hello', 'first\nsecond'], 'pt') == ['HELLO', 'FIRST\nSECOND']
+    assert client.texts == ['first\nsecond']
+    assert 'first' not in client.documents[0]
+
+
+def test_translate_many_retries_segments_missing_from_the_batch():
+    client = FakeTranslateClient(dropped={'goodbye'})
+
+    assert make_service(client).translate_many(['hello', 'goodbye'], 'pt') == ['HELLO', 'GOODBYE']
+    assert client.texts == ['goodbye']
+
+
+def test_translate_many_splits_individual_texts_larger_than_a_request():
+    client = FakeTranslateClient()
+    paragraph = ('This sentence is part of a long paragraph. ' * 50).strip()
+    text = '\n\n'.join([paragraph] * 8)
+
+    assert make_service(client).translate_many([text, 'hello'], 'pt') == [text.upper(), 'HELLO']
+    assert len(client.texts) > 1
+    assert all(len(request.encode('utf-8')) <= MAX_REQUEST_BYTES for request in client.texts)
+
+
+def test_translate_many_splits_missing_segments_larger_than_a_request():
+    client = FakeTranslateClient()
+    text = ('This sentence is part of a long paragraph. ' * 400).strip()
+    client.dropped.add(text)
+
+    assert make_service(client).translate_many([text], 'pt') == [text.upper()]
+    assert len(client.documents) == 1
+    assert len(client.texts) > 1
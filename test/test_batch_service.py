@@ -0,0 +1,166 @@
+# test/test_batch_service.py
+
+"""
+Testes do processamento em lote (`BatchService`): coleta dos documentos, nomes dos documentos gerados e
+reaproveitamento das etapas registradas no `JobStore` e simplificação em streaming dos parágrafos, com um
+pipeline local no lugar das APIs.
+"""
+
+import os
+
+from services.document_service import DocumentService
+from services.pipeline.batch_service import STAGE_EXPORT, STAGE_SIMPLIFY, BatchService
+from services.pipeline.job_store import JobStore
+from services.pipeline.pipeline_service import STAGE_BLEU_SCORE, STAGE_TRANSLATE, language_stage
+from test_streaming_pipeline import FakeOpenAIService, make_streaming
+
+OPTIONS = dict(area_tecnica='Medicina', estilo='Informal', summarize=False, model='gpt-4o-mini')
+
+
+def test_unique_names_keep_only_the_stem():
+    assert BatchService.output_names(['a/artigo.pdf', 'b/resumo.docx']) == {
+        'a/artigo.pdf': 'artigo', 'b/resumo.docx': 'resumo'
+    }
+
+
+def test_same_name_in_different_directories_mirrors_the_relative_path(tmp_path):
+    first, second = str(tmp_path / 'a' / 'artigo.pdf'), str(tmp_path / 'b' / 'c' / 'artigo.pdf')
+
+    names = BatchService.output_names([first, second])
+
+    assert names == {first: os.path.join('a', 'artigo'), second: os.path.join('b', 'c', 'artigo')}
+
+
+def test_same_name_in_different_formats_keeps_the_extension():
+    names = BatchService.output_names(['artigo.pdf', 'artigo.docx', 'Artigo.txt'])
+
+    assert names == {'artigo.pdf': 'artigo.pdf', 'artigo.docx': 'artigo.docx', 'Artigo.txt': 'Artigo.txt'}
+
+
+def test_collect_inputs_filters_extensions_and_walks_directories(tmp_path):
+    (tmp_path / 'sub').mkdir()
+    for name in ('a.pdf', 'b.txt', 'c.png', os.path.join('sub', 'd.epub')):
+        (tmp_path / name).write_text('conteúdo')
+
+    files = BatchService.collect_inputs([str(tmp_path)])
+
+    assert [os.path.relpath(path, tmp_path) for path in files] == ['a.pdf', 'b.txt', os.path.join('sub', 'd.epub')]
+
+
+class FakePipelineService:
+    """
+    Pipeline local: "simplifica" convertendo o texto para maiúsculas e "traduz" acrescentando o idioma,
+    registrando as chamadas.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def simplify(self, text, options, **kwargs):
+        self.calls.append('simplify')
+        return text.upper()
+
+    def add_language_stages(self, graph, language):
+        def translate(results):
+            self.calls.append(f'translate:{language}')
+            return f"{results[STAGE_SIMPLIFY]} [{language}]", 'pt'
+
+        graph.add_stage(language_stage(STAGE_TRANSLATE, language), translate, dependencies=[STAGE_SIMPLIFY])
+        graph.add_stage(language_stage(STAGE_BLEU_SCORE, language), lambda results: 1.0,
+                        dependencies=[language_stage(STAGE_TRANSLATE, language)])
+
+
+def run_document(tmp_path, pipeline, export_format, output_dir='saida'):
+    input_path = tmp_path / 'artigo.txt'
+    if not input_path.exists():
+        input_path.write_text('O comitê aprovou a proposta. O orçamento foi discutido.', encoding='utf-8')
+    batch = BatchService(pipeline, DocumentService(processes=1, use_cache=False), processes=1,
+                         job_store=JobStore(str(tmp_path / 'jobs.sqlite3')))
+    return batch.process_document(str(input_path), ['en'], OPTIONS, str(tmp_path / output_dir), export_format)
+
+
+def test_resumed_job_reuses_completed_stages(tmp_path):
+    pipeline = FakePipelineService()
+    first = run_document(tmp_path, pipeline, 'txt')
+    second = run_document(tmp_path, pipeline, 'txt')
+
+    assert first['status'] == second['status'] == 'succeeded'
+    assert pipeline.calls == ['simplify', 'translate:en']
+    assert f"{STAGE_EXPORT}:en" in second['resumed_stages']
+
+
+def test_resumed_job_exports_again_in_a_new_format_or_directory(tmp_path):
+    pipeline = FakePipelineService()
+    run_document(tmp_path, pipeline, 'txt')
+    in_docx = run_document(tmp_path, pipeline, 'docx')
+    elsewhere = run_document(tmp_path, pipeline, 'docx', output_dir='outra')
+
+    assert pipeline.calls == ['simplify', 'translate:en']
+    assert in_docx['outputs']['en'].endswith('artigo.en.docx') and os.path.exists(in_docx['outputs']['en'])
+    assert f"{STAGE_EXPORT}:en" not in in_docx['resumed_stages']
+    assert os.path.dirname(elsewhere['outputs']['en']) == str(tmp_path / 'outra')
+    assert f"{STAGE_EXPORT}:en" not in elsewhere['resumed_stages']
+
+
+class FailingOpenAIService(FakeOpenAIService):
+    """
+    Simplificação local que falha ao receber o texto informado.
+    """
+
+    def __init__(self, failing_text=None):
+        super().__init__()
+        self.failing_text = failing_text
+
+    def simplify_text(self, text, **options):
+        if text == self.failing_text:
+            raise Exception("Erro ao simplificar o texto: falha simulada.")
+        return super().simplify_text(text, **options)
+
+
+def run_streaming_document(tmp_path, openai_service):
+    input_path = tmp_path / 'artigo.txt'
+    if not input_path.exists():
+        input_path.write_text('Primeiro parágrafo.\n\nSegundo parágrafo.\n\nTerceiro parágrafo.', encoding='utf-8')
+    pipeline = FakePipelineService()
+    batch = BatchService(pipeline, DocumentService(processes=1, use_cache=False), processes=1,
+                         job_store=JobStore(str(tmp_path / 'jobs.sqlite3')),
+                         streaming_pipeline_service=make_streaming(openai_service, segment_tokens=2))
+    entry = batch.process_document(str(input_path), ['en'], OPTIONS, str(tmp_path / 'saida'), 'txt')
+    return entry, pipeline
+
+
+def test_streaming_mode_simplifies_the_paragraphs_as_they_are_read(tmp_path):
+    openai_service = FakeOpenAIService()
+    entry, pipeline = run_streaming_document(tmp_path, openai_service)
+
+    assert entry['status'] == 'succeeded'
+    assert pipeline.calls == ['translate:en']
+    assert openai_service.calls == ['Primeiro parágrafo.', 'Segundo parágrafo.', 'Terceiro parágrafo.']
+    with open(entry['outputs']['en'], encoding='utf-8') as file:
+        assert 'PRIMEIRO PARÁGRAFO.\n\nSEGUNDO PARÁGRAFO.\n\nTERCEIRO PARÁGRAFO. [en]' in file.read()
+
+
+def test_streaming_mode_resumes_the_simplified_segments(tmp_path):
+    entry, _ = run_streaming_document(tmp_path, FailingOpenAIService('Terceiro parágrafo.'))
+    assert entry['status'] == 'failed'
+
+    openai_service = FakeOpenAIService()
+    entry, _ = run_streaming_document(tmp_path, openai_service)
+
+    assert entry['status'] == 'succeeded'
+    assert openai_service.calls == ['Terceiro parágrafo.']
+
+
+def test_streaming_mode_is_not_used_for_summaries(tmp_path):
+    openai_service = FakeOpenAIService()
+    input_path = tmp_path / 'artigo.txt'
+    input_path.write_text('Primeiro parágrafo.\n\nSegundo parágrafo.', encoding='utf-8')
+    pipeline = FakePipelineService()
+    batch = BatchService(pipeline, DocumentService(processes=1, use_cache=False), processes=1,
+                         streaming_pipeline_service=make_streaming(openai_service))
+
+    entry = batch.process_document(str(input_path), ['en'], dict(OPTIONS, summarize=True), str(tmp_path), 'txt')
+
+    assert entry['status'] == 'succeeded'
+    assert pipeline.calls == ['simplify', 'translate:en']
+    assert openai_service.calls == []
@@ -0,0 +1,120 @@
+# test/test_circuit_breaker.py
+
+"""
+Testes do disjuntor (`CircuitBreaker`) e do registro dos erros da API OpenAI no disjuntor.
+"""
+
+import time
+
+import httpx
+import openai
+import pytest
+
+from services.api.circuit_breaker import (
+    STATE_CLOSED, STATE_HALF_OPEN, STATE_OPEN, CircuitBreaker, CircuitOpenError
+)
+from services.api.openai_service import OpenAIService
+from services.api.quota_manager import QuotaManager
+
+
+class Clock:
+    """
+    Relógio controlado pelo teste, no lugar de `time.monotonic`.
+    """
+
+    def __init__(self):
+        self.now = time.monotonic()
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr('services.api.circuit_breaker.time.monotonic', clock)
+    return clock
+
+
+def open_breaker(clock, **kwargs) -> CircuitBreaker:
+    breaker = CircuitBreaker('teste', failure_threshold=2, reset_timeout=10, **kwargs)
+    breaker.record_failure()
+    breaker.record_failure()
+    return breaker
+
+
+def test_consecutive_failures_open_the_breaker(clock):
+    breaker = open_breaker(clock)
+
+    assert breaker.is_open()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_a_success_resets_the_failure_count(clock):
+    breaker = CircuitBreaker('teste', failure_threshold=2, reset_timeout=10)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == STATE_CLOSED
+
+
+def test_only_one_probe_is_allowed_after_the_reset_timeout(clock):
+    breaker = open_breaker(clock)
+    clock.now += 10
+
+    breaker.before_call()
+    assert breaker.state == STATE_HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_probe_result_closes_or_reopens_the_breaker(clock):
+    breaker = open_breaker(clock)
+    clock.now += 10
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == STATE_OPEN and breaker.is_open()
+
+    clock.now += 10
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == STATE_CLOSED
+    breaker.before_call()
+
+
+def test_neutral_result_releases_the_probe_without_closing(clock):
+    breaker = open_breaker(clock)
+    clock.now += 10
+    breaker.before_call()
+
+    breaker.record_neutral()
+
+    assert breaker.state == STATE_HALF_OPEN
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_neutral_result_keeps_the_failure_count(clock):
+    breaker = CircuitBreaker('teste', failure_threshold=2, reset_timeout=10)
+    breaker.record_failure()
+    breaker.record_neutral()
+    breaker.record_failure()
+
+    assert breaker.state == STATE_OPEN
+
+
+def test_client_errors_do_not_close_a_half_open_breaker(clock):
+    request = httpx.Request('POST', 'https://api.openai.com/v1/chat/completions')
+    error = openai.BadRequestError('requisição inválida', response=httpx.Response(400, request=request), body=None)
+    breaker = open_breaker(clock)
+    clock.now += 10
+    breaker.before_call()
+    service = OpenAIService(client=object(), circuit_breaker=breaker, quota_manager=QuotaManager())
+
+    with pytest.raises(Exception):
+        service._handle_failure(error, attempt=0, deadline=clock.now + 60)
+
+    assert breaker.state == STATE_HALF_OPEN
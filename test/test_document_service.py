@@ -0,0 +1,184 @@
+# test/test_document_service.py
+
+"""
+Testes da importação e da exportação de documentos (`DocumentService`), incluindo a extração paralela de
+PDFs pelo pool de processos do serviço e a leitura de EPUBs na ordem do spine, sem as seções de navegação,
+capa e notas.
+"""
+
+import time
+import zipfile
+
+import pytest
+
+from services.document_service import DocumentService
+from services.task_service import CancellationToken, OperationCancelledError
+
+TEXT = '\n\n'.join(f"Parágrafo número {index} do documento de teste." for index in range(40))
+EPUB_CONTAINER = (
+    '<?xml version="1.0"?>'
+    '<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">'
+    '<rootfiles><rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/></rootfiles>'
+    '</container>'
+)
+EPUB_PACKAGE = (
+    '<?xml version="1.0"?>'
+    '<package version="3.0" xmlns="http://www.idpf.org/2007/opf">'
+    '<manifest>'
+    '<item id="capa" href="capa.xhtml" media-type="application/xhtml+xml"/>'
+    '<item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>'
+    '<item id="cap1" href="texto/cap%201.xhtml" media-type="application/xhtml+xml"/>'
+    '<item id="cap2" href="texto/cap2.xhtml" media-type="application/xhtml+xml"/>'
+    '<item id="notas" href="notas.xhtml" media-type="application/xhtml+xml"/>'
+    '<item id="imagem" href="imagem.svg" media-type="image/svg+xml"/>'
+    '</manifest>'
+    '<spine>'
+    '<itemref idref="capa"/><itemref idref="nav"/><itemref idref="cap2"/><itemref idref="imagem"/>'
+    '<itemref idref="notas" linear="no"/><itemref idref="cap1"/>'
+    '</spine>'
+    '<guide><reference type="cover" href="capa.xhtml#inicio" title="Capa"/></guide>'
+    '</package>'
+)
+EPUB_DOCUMENTS = {
+    'OEBPS/capa.xhtml': '<p>Texto da capa.</p>',
+    'OEBPS/nav.xhtml': '<p>Sumário do livro.</p>',
+    'OEBPS/notas.xhtml': '<p>Nota fora da leitura linear.</p>',
+    'OEBPS/imagem.svg': '<p>Legenda da imagem.</p>',
+    'OEBPS/texto/cap2.xhtml': '<h1>Capítulo dois</h1><p>Segundo   capítulo,\n primeiro parágrafo.</p>',
+    'OEBPS/texto/cap 1.xhtml': (
+        '<h1>Capítulo um</h1><p>Primeira linha&nbsp;do poema<br/>segunda linha do poema</p>'
+        '<script>var ignorado = 1;</script><style>p { color: red; }</style>'
+        '<section epub:type="landmarks"><p>Nota de referência.</p></section><p>Último parágrafo.</p>'
+    )
+}
+LONG_TEXT = '\n\n'.join(f"Parágrafo número {index} do documento de teste." for index in range(200))
+
+
+def make_service(**kwargs) -> DocumentService:
+    kwargs.setdefault('processes', 1)
+    kwargs.setdefault('use_cache', False)
+    return DocumentService(**kwargs)
+
+
+def make_epub(tmp_path) -> str:
+    file_path = str(tmp_path / 'livro.epub')
+    with zipfile.ZipFile(file_path, 'w') as archive:
+        archive.writestr('mimetype', 'application/epub+zip')
+        archive.writestr('META-INF/container.xml', EPUB_CONTAINER)
+        archive.writestr('OEBPS/content.opf', EPUB_PACKAGE)
+        for name, body in EPUB_DOCUMENTS.items():
+            archive.writestr(name, (
+                '<?xml version="1.0" encoding="utf-8"?>'
+                '<html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops">'
+                f'<head><title>{name}</title></head><body>{body}</body></html>'
+            ))
+    return file_path
+
+
+def cancelled_token() -> CancellationToken:
+    token = CancellationToken()
+    token.cancel()
+    return token
+
+
+def test_pdf_export_and_import_roundtrip(tmp_path):
+    service = make_service()
+    file_path = str(tmp_path / 'documento.pdf')
+    service.export_document(TEXT, file_path, 'pdf')
+
+    text = service.import_document(file_path)
+
+    assert 'Parágrafo número 0 do documento de teste.' in text
+    assert 'Parágrafo número 39 do documento de teste.' in text
+
+
+@pytest.mark.parametrize('format', ['pdf', 'docx', 'txt'])
+def test_cancelled_export_writes_no_file(tmp_path, format):
+    file_path = tmp_path / f'documento.{format}'
+
+    with pytest.raises(OperationCancelledError):
+        make_service().export_document(TEXT, str(file_path), format, cancellation_token=cancelled_token())
+
+    assert not file_path.exists()
+
+
+def test_cancelled_pdf_import_stops_between_pages(tmp_path):
+    service = make_service()
+    file_path = str(tmp_path / 'documento.pdf')
+    service.export_document(TEXT, file_path, 'pdf')
+
+    with pytest.raises(OperationCancelledError):
+        service.import_document(file_path, cancellation_token=cancelled_token())
+
+
+def test_parallel_pdf_import_reuses_one_spawn_pool(tmp_path):
+    file_path = str(tmp_path / 'documento.pdf')
+    make_service().export_document(LONG_TEXT, file_path, 'pdf')
+    expected = make_service().import_document(file_path)
+    service = make_service(processes=2, parallel_min_pages=2)
+
+    try:
+        first = service.import_document(file_path)
+        executor = service._executor
+        second = service.import_document(file_path)
+
+        assert first == second == expected
+        assert service._executor is executor
+        assert executor._mp_context.get_start_method() == 'spawn'
+    finally:
+        service.close()
+    assert service._executor is None
+
+
+def test_cancelled_parallel_pdf_import_returns_without_waiting_for_the_pool(tmp_path):
+    file_path = str(tmp_path / 'documento.pdf')
+    make_service().export_document(LONG_TEXT, file_path, 'pdf')
+    service = make_service(processes=2, parallel_min_pages=2)
+
+    try:
+        start_time = time.perf_counter()
+        with pytest.raises(OperationCancelledError):
+            service.import_document(file_path, cancellation_token=cancelled_token())
+        # A chamada retorna na primeira verificação, antes que os processos do pool concluam a extração
+        assert time.perf_counter() - start_time < 1.0
+
+        # O pool continua disponível para as importações seguintes
+        assert 'Parágrafo número 199' in service.import_document(file_path)
+    finally:
+        service.close()
+
+
+def test_epub_chapters_follow_the_spine_without_boilerplate(tmp_path):
+    chapters = list(make_service().iter_chapters(make_epub(tmp_path)))
+
+    assert chapters == [
+        'Capítulo dois\n\nSegundo capítulo, primeiro parágrafo.',
+        'Capítulo um\n\nPrimeira linha do poema\nsegunda linha do poema\n\nÚltimo parágrafo.'
+    ]
+
+
+def test_epub_import_and_paragraphs_skip_navigation_cover_and_notes(tmp_path):
+    service = make_service()
+    file_path = make_epub(tmp_path)
+
+    text = service.import_document(file_path)
+    paragraphs = list(service.iter_paragraphs(file_path))
+
+    assert text == '\n\n'.join(service.iter_chapters(file_path))
+    assert paragraphs == [
+        'Capítulo dois', 'Segundo capítulo, primeiro parágrafo.', 'Capítulo um',
+        'Primeira linha do poema\nsegunda linha do poema', 'Último parágrafo.'
+    ]
+    for skipped in ('capa', 'Sumário', 'Nota', 'Legenda', 'ignorado', 'color'):
+        assert skipped not in text
+
+
+def test_epub_page_range_and_chapters_of_other_formats_are_rejected(tmp_path):
+    service = make_service()
+    txt_path = tmp_path / 'documento.txt'
+    txt_path.write_text(TEXT, encoding='utf-8')
+
+    with pytest.raises(ValueError):
+        list(service.iter_paragraphs(make_epub(tmp_path), first_page=2))
+    with pytest.raises(ValueError):
+        list(service.iter_chapters(str(txt_path)))
@@ -0,0 +1,150 @@
+# test/test_extraction_cache.py
+
+"""
+Testes do cache de textos extraídos (`ExtractionCache`) e da sua utilização pelo `DocumentService`: acertos,
+falhas, invalidação por conteúdo e versão do extrator, cálculo único do hash por importação e funcionamento
+sem cache quando o banco não pode ser criado.
+"""
+
+import os
+
+import pytest
+
+from services.cache.extraction_cache import ExtractionCache
+from services.document_service import DocumentService
+from services.pipeline import batch_service
+
+TEXT = '\n\n'.join(f"Parágrafo número {index} do documento de teste." for index in range(10))
+VERSION = '2:pypdf2-3.0.1'
+
+
+@pytest.fixture
+def digests(monkeypatch):
+    """
+    Registra os arquivos cujo hash é calculado.
+    """
+    calls = []
+    original = ExtractionCache.file_digest
+
+    def file_digest(file_path):
+        calls.append(file_path)
+        return original(file_path)
+
+    monkeypatch.setattr(ExtractionCache, 'file_digest', staticmethod(file_digest))
+    return calls
+
+
+@pytest.fixture
+def extractions(monkeypatch):
+    """
+    Registra as extrações de PDFs efetivamente executadas.
+    """
+    calls = []
+    original = DocumentService._import_pdf
+
+    def import_pdf(self, file_path, *args, **kwargs):
+        calls.append(file_path)
+        return original(self, file_path, *args, **kwargs)
+
+    monkeypatch.setattr(DocumentService, '_import_pdf', import_pdf)
+    return calls
+
+
+def make_pdf(tmp_path, name='documento.pdf', text=TEXT) -> str:
+    file_path = str(tmp_path / name)
+    DocumentService(processes=1, use_cache=False).export_document(text, file_path, 'pdf')
+    return file_path
+
+
+def test_text_is_stored_per_content_and_extractor_version(tmp_path):
+    cache = ExtractionCache(str(tmp_path / 'extractions.sqlite3'))
+    first = tmp_path / 'a.txt'
+    first.write_text('conteúdo')
+    copy = tmp_path / 'b.txt'
+    copy.write_text('conteúdo')
+
+    assert cache.get_text(str(first), VERSION) is None
+    cache.set_text(str(first), VERSION, 'Texto extraído.')
+
+    assert cache.get_text(str(first), VERSION) == 'Texto extraído.'
+    assert cache.get_text(str(copy), VERSION) == 'Texto extraído.'
+    assert cache.get_text(str(first), '3:pypdf2-3.0.1') is None
+    assert cache.get_text(str(tmp_path / 'inexistente.txt'), VERSION) is None
+
+
+def test_import_hashes_the_file_once_and_reimport_reads_neither_the_file_nor_the_pdf(tmp_path, digests,
+                                                                                     extractions):
+    file_path = make_pdf(tmp_path)
+    service = DocumentService(processes=1, cache=ExtractionCache(str(tmp_path / 'extractions.sqlite3')))
+
+    first = service.import_document(file_path)
+    assert digests == [os.path.abspath(file_path)]
+    assert extractions == [file_path]
+
+    assert service.import_document(file_path) == first
+    assert digests == [os.path.abspath(file_path)]
+    assert extractions == [file_path]
+
+
+def test_modified_file_is_extracted_again(tmp_path, extractions):
+    file_path = make_pdf(tmp_path)
+    service = DocumentService(processes=1, cache=ExtractionCache(str(tmp_path / 'extractions.sqlite3')))
+    service.import_document(file_path)
+
+    make_pdf(tmp_path, text='Outro conteúdo do documento.')
+    stat = os.stat(file_path)
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert 'Outro conteúdo' in service.import_document(file_path)
+    assert len(extractions) == 2
+
+
+def test_touched_file_with_the_same_content_reuses_the_text(tmp_path, digests, extractions):
+    file_path = make_pdf(tmp_path)
+    service = DocumentService(processes=1, cache=ExtractionCache(str(tmp_path / 'extractions.sqlite3')))
+    service.import_document(file_path)
+
+    stat = os.stat(file_path)
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    service.import_document(file_path)
+    service.import_document(file_path)
+
+    # O novo instante de modificação exige um novo hash, mas não uma nova extração
+    assert len(digests) == 2
+    assert len(extractions) == 1
+
+
+def test_cache_is_created_on_first_import(tmp_path, monkeypatch):
+    monkeypatch.setenv('TRADUZAI_CACHE_DIR', str(tmp_path / 'cache'))
+    file_path = make_pdf(tmp_path)
+
+    service = DocumentService(processes=1)
+    assert not os.path.exists(tmp_path / 'cache')
+
+    service.import_document(file_path)
+    assert os.path.exists(tmp_path / 'cache' / 'extractions.sqlite3')
+    assert service.cache is service.cache
+
+
+def test_unavailable_cache_is_skipped_without_hashing(tmp_path, monkeypatch, digests):
+    blocker = tmp_path / 'arquivo'
+    blocker.write_text('')
+    monkeypatch.setenv('TRADUZAI_CACHE_DIR', str(blocker / 'cache'))
+    file_path = make_pdf(tmp_path)
+    service = DocumentService(processes=1)
+
+    assert 'Parágrafo número 9' in service.import_document(file_path)
+    assert service.cache is None
+    assert digests == []
+
+
+def test_batch_workers_reuse_one_document_service(tmp_path, monkeypatch):
+    monkeypatch.setenv('TRADUZAI_CACHE_DIR', str(tmp_path / 'cache'))
+    monkeypatch.setattr(batch_service, '_worker_document_service', None)
+    first, second = make_pdf(tmp_path, 'a.pdf'), make_pdf(tmp_path, 'b.pdf')
+
+    batch_service._import_document(first)
+    _, service = batch_service._worker_document_service
+    batch_service._import_document(second)
+
+    assert batch_service._worker_document_service == (os.getpid(), service)
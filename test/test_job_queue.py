@@ -0,0 +1,284 @@
+# test/test_job_queue.py
+
+"""
+Testes da fila de trabalhos do servidor (`JobQueueService`), com um pipeline local no lugar das APIs:
+validação dos parâmetros, liberação das vagas dos trabalhos cancelados, limite de eventos, encerramento e
+trabalhos sobre documentos do diretório de documentos.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from services.document_service import DocumentService
+from services.pipeline.job_queue import (
+    JOB_CANCELLED, JOB_QUEUED, JOB_RUNNING, JOB_SUCCEEDED, JobQueueService, QueueFullError
+)
+from services.pipeline.pipeline_service import (
+    STAGE_BLEU_SCORE, STAGE_READABILITY_ORIGINAL, STAGE_READABILITY_SIMPLIFIED, STAGE_SIMPLIFY, STAGE_TRANSLATE,
+    MultiPipelineResult, PipelineResult, language_stage
+)
+from test_streaming_pipeline import FakeOpenAIService, make_streaming
+
+
+class FakePipelineService:
+    """
+    Pipeline local: publica cada palavra do texto como um trecho simplificado e "traduz" acrescentando o
+    idioma. Com `gate`, a execução aguarda o evento (ou o cancelamento) antes de terminar.
+    """
+
+    def __init__(self, gate: threading.Event = None):
+        self.gate = gate
+
+    def _simplify(self, text, on_token, on_stage, cancellation_token):
+        on_stage(STAGE_SIMPLIFY, 'started')
+        while self.gate is not None and not self.gate.wait(0.05):
+            cancellation_token.raise_if_cancelled()
+        for word in text.split():
+            on_token(word)
+        on_stage(STAGE_SIMPLIFY, 'finished')
+        return {
+            STAGE_SIMPLIFY: text.upper(),
+            STAGE_READABILITY_ORIGINAL: {'flesch': 10.0},
+            STAGE_READABILITY_SIMPLIFIED: {'flesch': 60.0}
+        }
+
+    def run(self, text, target_language_code, options, on_token=None, on_stage=None, cancellation_token=None):
+        results = self._simplify(text, on_token, on_stage, cancellation_token)
+        results[STAGE_TRANSLATE] = (f"{text} [{target_language_code}]", 'pt')
+        results[STAGE_BLEU_SCORE] = 0.5
+        return PipelineResult(results, {STAGE_SIMPLIFY: 0.1}, 0.2)
+
+    def run_multi(self, text, target_language_codes, options, on_token=None, on_stage=None,
+                  cancellation_token=None):
+        results = self._simplify(text, on_token, on_stage, cancellation_token)
+        for language in target_language_codes:
+            results[language_stage(STAGE_TRANSLATE, language)] = (f"{text} [{language}]", 'pt')
+            results[language_stage(STAGE_BLEU_SCORE, language)] = 0.5
+        return MultiPipelineResult(target_language_codes, results, {STAGE_SIMPLIFY: 0.1}, 0.2)
+
+
+def run(coroutine_function):
+    """
+    Executa a função assíncrona do teste em um novo event loop.
+    """
+    return asyncio.run(coroutine_function())
+
+
+async def wait_until(condition, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "A condição não foi satisfeita a tempo."
+        await asyncio.sleep(0.01)
+
+
+async def collect(jobs: JobQueueService, job) -> list:
+    return [event async for event in jobs.events(job)]
+
+
+def test_job_runs_and_streams_events():
+    async def scenario():
+        jobs = JobQueueService(FakePipelineService(), max_workers=1)
+        await jobs.start()
+        try:
+            job = jobs.submit('o comitê aprovou', ['en', 'es'])
+            events = await collect(jobs, job)
+        finally:
+            await jobs.stop()
+
+        assert job.status == JOB_SUCCEEDED
+        assert [event['text'] for event in events if event['type'] == 'token'] == ['o', 'comitê', 'aprovou']
+        assert events[-1] == {'type': 'status', 'status': JOB_SUCCEEDED}
+        assert set(job.result['translations']) == {'en', 'es'}
+        assert job.to_dict()['completed_stages'] == [STAGE_SIMPLIFY]
+
+    run(scenario)
+
+
+@pytest.mark.parametrize('options', [
+    {'temperature': 'quente'},
+    {'temperature': 3},
+    {'temperature': True},
+    {'max_tokens': 0},
+    {'max_tokens': 2.5},
+    {'max_tokens': 10 ** 6},
+    {'summarize': 'sim'},
+    {'focus_aspects': 'clareza'},
+    {'focus_aspects': [1]},
+    {'model': ''},
+    {'area_tecnica': None},
+    {'desconhecido': 1}
+])
+def test_invalid_options_are_rejected(options):
+    async def scenario():
+        jobs = JobQueueService(FakePipelineService())
+        await jobs.start()
+        try:
+            with pytest.raises(ValueError):
+                jobs.submit('texto', ['en'], options)
+            assert jobs.stats()['jobs'][JOB_QUEUED] == 0
+        finally:
+            await jobs.stop()
+
+    run(scenario)
+
+
+def test_valid_options_are_accepted():
+    async def scenario():
+        jobs = JobQueueService(FakePipelineService())
+        await jobs.start()
+        try:
+            job = jobs.submit('texto', ['en'], {'temperature': 0, 'max_tokens': 500, 'summarize': True,
+                                                'focus_aspects': ['clareza']})
+            await collect(jobs, job)
+        finally:
+            await jobs.stop()
+
+        assert job.status == JOB_SUCCEEDED
+        assert job.options['max_tokens'] == 500
+
+    run(scenario)
+
+
+def test_cancelling_a_queued_job_frees_its_slot():
+    async def scenario():
+        gate = threading.Event()
+        jobs = JobQueueService(FakePipelineService(gate), max_workers=1, max_queue_size=1)
+        await jobs.start()
+        try:
+            running = jobs.submit('primeiro', ['en'])
+            await wait_until(lambda: running.status == JOB_RUNNING)
+            queued = jobs.submit('segundo', ['en'])
+            with pytest.raises(QueueFullError):
+                jobs.submit('terceiro', ['en'])
+
+            jobs.cancel(queued.job_id)
+            assert queued.status == JOB_CANCELLED
+            replacement = jobs.submit('terceiro', ['en'])
+
+            gate.set()
+            await collect(jobs, replacement)
+        finally:
+            await jobs.stop()
+
+        assert running.status == JOB_SUCCEEDED
+        assert replacement.status == JOB_SUCCEEDED
+
+    run(scenario)
+
+
+def test_events_are_bounded_and_readers_are_told_about_dropped_events():
+    async def scenario():
+        jobs = JobQueueService(FakePipelineService(), max_job_events=5)
+        await jobs.start()
+        try:
+            job = jobs.submit(' '.join(f'p{i}' for i in range(20)), ['en'])
+            await wait_until(lambda: job.finished)
+            events = await collect(jobs, job)
+        finally:
+            await jobs.stop()
+
+        assert len(job.events) == 5
+        assert events[0] == {'type': 'skipped', 'count': job.published - 5}
+        assert events[1:] == list(job.events)
+
+    run(scenario)
+
+
+def test_stop_cancels_running_jobs_without_blocking_the_event_loop():
+    async def scenario():
+        gate = threading.Event()
+        jobs = JobQueueService(FakePipelineService(gate), max_workers=1)
+        await jobs.start()
+        job = jobs.submit('texto', ['en'], {})
+        await wait_until(lambda: job.status == JOB_RUNNING)
+
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.005)
+
+        ticking = asyncio.create_task(ticker())
+        await jobs.stop()
+        ticking.cancel()
+
+        assert job.cancellation_token.is_cancelled()
+        assert len(ticks) > 1
+
+    run(scenario)
+
+
+def test_document_jobs_stream_the_paragraphs_into_the_streaming_pipeline(tmp_path):
+    (tmp_path / 'artigo.txt').write_text('Primeiro parágrafo.\n\nSegundo parágrafo.', encoding='utf-8')
+    openai_service = FakeOpenAIService()
+
+    async def scenario():
+        jobs = JobQueueService(FakePipelineService(), make_streaming(openai_service, segment_tokens=2),
+                               documents_dir=str(tmp_path),
+                               document_service=DocumentService(processes=1, use_cache=False))
+        await jobs.start()
+        try:
+            single = jobs.submit_document('artigo.txt', ['en'])
+            events = await collect(jobs, single)
+            multi = jobs.submit_document('artigo.txt', ['en', 'es'])
+            await collect(jobs, multi)
+        finally:
+            await jobs.stop()
+
+        assert single.status == JOB_SUCCEEDED
+        assert openai_service.calls == ['Primeiro parágrafo.', 'Segundo parágrafo.']
+        assert [event['index'] for event in events if event['type'] == 'segment'] == [0, 1]
+        assert single.result['simplified_text'] == 'PRIMEIRO PARÁGRAFO.\n\nSEGUNDO PARÁGRAFO.'
+        # Com vários idiomas, o documento completo é simplificado pelo pipeline
+        assert multi.status == JOB_SUCCEEDED
+        assert multi.result['simplified_text'] == 'PRIMEIRO PARÁGRAFO.\n\nSEGUNDO PARÁGRAFO.'
+
+    run(scenario)
+
+
+@pytest.mark.parametrize('document, pages', [
+    ('../fora.txt', {}),
+    ('inexistente.txt', {}),
+    ('imagem.png', {}),
+    ('artigo.txt', {'first_page': 2}),
+    ('artigo.pdf', {'first_page': 0}),
+    ('artigo.pdf', {'first_page': 3, 'last_page': 2}),
+    ('artigo.pdf', {'last_page': '2'}),
+    ('', {})
+])
+def test_invalid_documents_are_rejected(tmp_path, document, pages):
+    documents_dir = tmp_path / 'documentos'
+    documents_dir.mkdir()
+    for name in ('artigo.txt', 'artigo.pdf', 'imagem.png'):
+        (documents_dir / name).write_text('conteúdo')
+    (tmp_path / 'fora.txt').write_text('conteúdo')
+
+    async def scenario():
+        jobs = JobQueueService(FakePipelineService(), documents_dir=str(documents_dir))
+        await jobs.start()
+        try:
+            with pytest.raises(ValueError):
+                jobs.submit_document(document, ['en'], **pages)
+        finally:
+            await jobs.stop()
+
+    run(scenario)
+
+
+def test_documents_are_rejected_without_a_documents_dir(tmp_path):
+    (tmp_path / 'artigo.txt').write_text('conteúdo')
+
+    async def scenario():
+        jobs = JobQueueService(FakePipelineService())
+        await jobs.start()
+        try:
+            with pytest.raises(ValueError):
+                jobs.submit_document(str(tmp_path / 'artigo.txt'), ['en'])
+        finally:
+            await jobs.stop()
+
+    run(scenario)
@@ -0,0 +1,220 @@
+# test/test_openai_service.py
+
+"""
+Testes do `OpenAIService` sem acesso à API: o cliente é substituído por um cliente local e as chamadas
+de simplificação são interceptadas.
+"""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from services.api.circuit_breaker import STATE_HALF_OPEN, CircuitBreaker
+from services.api.openai_service import MAX_REDUCE_DEPTH, OpenAIService
+from services.api.quota_manager import QuotaManager
+from services.cache.completion_cache import CompletionCache
+
+OPTIONS = dict(area_tecnica='Medicina', estilo='Informal', model='gpt-3.5-turbo-0125', max_tokens=4096)
+
+
+class FakeCompletions:
+    """
+    Endpoint `chat.completions` local: responde "resposta <i>" a cada opção e registra as requisições.
+    """
+
+    def __init__(self):
+        self.requests = []
+
+    def create(self, **kwargs):
+        self.requests.append(kwargs)
+        choices = [SimpleNamespace(message=SimpleNamespace(content=f"resposta {index} ")) for index in
+                   range(kwargs.get('n', 1))]
+        return SimpleNamespace(choices=choices, usage=None)
+
+
+class FakeAsyncCompletions(FakeCompletions):
+    async def create(self, **kwargs):
+        return FakeCompletions.create(self, **kwargs)
+
+
+class FakeClient:
+    def __init__(self, completions):
+        self.chat = SimpleNamespace(completions=completions)
+
+
+class InterruptedQuotaManager(QuotaManager):
+    """
+    Gerenciador de cotas cuja primeira espera é interrompida: com um erro, na versão síncrona, ou
+    aguardando até o cancelamento da tarefa, na versão assíncrona.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.interrupted = False
+
+    def acquire(self, provider, costs, timeout=None, lane='interactive'):
+        if not self.interrupted:
+            self.interrupted = True
+            raise KeyboardInterrupt
+        return super().acquire(provider, costs, timeout, lane)
+
+    async def acquire_async(self, provider, costs, lane='interactive'):
+        if not self.interrupted:
+            self.interrupted = True
+            await asyncio.Event().wait()
+        await super().acquire_async(provider, costs, lane)
+
+
+class ThreadRecordingCache(CompletionCache):
+    """
+    Cache de respostas que registra a thread de cada consulta e gravação.
+    """
+
+    def __init__(self, db_path):
+        super().__init__(db_path)
+        self.threads = []
+
+    def get_completion(self, key):
+        self.threads.append(threading.get_ident())
+        return super().get_completion(key)
+
+    def set_completion(self, key, content):
+        self.threads.append(threading.get_ident())
+        super().set_completion(key, content)
+
+
+def make_service(**kwargs) -> OpenAIService:
+    kwargs.setdefault('client', FakeClient(FakeCompletions()))
+    kwargs.setdefault('use_response_cache', False)
+    kwargs.setdefault('quota_manager', QuotaManager())
+    kwargs.setdefault('circuit_breaker', CircuitBreaker('teste'))
+    return OpenAIService(**kwargs)
+
+
+def half_open_breaker() -> CircuitBreaker:
+    breaker = CircuitBreaker('teste')
+    breaker.state = STATE_HALF_OPEN
+    return breaker
+
+
+def test_reduce_fits_every_summary_in_the_context_budget_when_summaries_do_not_converge(monkeypatch, caplog):
+    service = make_service()
+    map_calls = []
+    simplified_inputs = []
+
+    def fake_map_chunks(text, summarize, options, max_workers, on_chunk, completed_chunks=None):
+        map_calls.append(text)
+        return ['início ' * 20000, 'meio ' * 20000, 'fim ' * 20000]
+
+    def fake_simplify_text(text, **options):
+        simplified_inputs.append(text)
+        return 'resumo'
+
+    monkeypatch.setattr(service, '_map_chunks', fake_map_chunks)
+    monkeypatch.setattr(service, 'simplify_text', fake_simplify_text)
+
+    result = service.simplify_long_text(text='texto longo', summarize=True, **OPTIONS)
+
+    assert result == 'resumo'
+    assert len(map_calls) == 1 + MAX_REDUCE_DEPTH
+    budget = service.chunk_token_budget(OPTIONS['model'], OPTIONS['max_tokens'], summarize=True)
+    assert service.count_tokens(simplified_inputs[0], OPTIONS['model']) <= budget
+    # O resumo final inclui todas as partes do documento, e não apenas a primeira
+    assert all(word in simplified_inputs[0] for word in ('início', 'meio', 'fim'))
+    assert 'excede' in caplog.text
+
+
+def test_reduce_fails_when_summaries_do_not_converge_and_cannot_share_the_budget(monkeypatch):
+    service = make_service()
+    monkeypatch.setattr(service, 'chunk_token_budget', lambda model, max_tokens, summarize: 1000)
+    monkeypatch.setattr(service, '_map_chunks', lambda *args, **kwargs: ['palavra ' * 2000] * 20)
+    monkeypatch.setattr(service, 'simplify_text', lambda text, **options: 'resumo')
+
+    with pytest.raises(Exception, match='resumo consolidado'):
+        service.simplify_long_text(text='texto longo', summarize=True, **OPTIONS)
+
+
+def test_reduce_summarizes_the_merged_text_when_it_fits(monkeypatch):
+    service = make_service()
+    monkeypatch.setattr(service, '_map_chunks', lambda *args, **kwargs: ['parte um', 'parte dois'])
+    monkeypatch.setattr(service, 'simplify_text', lambda text, **options: f'resumo de: {text}')
+
+    result = service.simplify_long_text(text='texto', summarize=True, **OPTIONS)
+
+    assert result == 'resumo de: parte um\n\nparte dois'
+
+
+def test_request_params_are_normalized():
+    assert OpenAIService._request_params(max_tokens='100', temperature=0) == dict(
+        max_tokens=100, temperature=0.0, top_p=1.0, frequency_penalty=0.0, presence_penalty=0.0
+    )
+
+
+def test_async_simplification_reads_and_writes_the_cache_outside_the_event_loop(tmp_path):
+    completions = FakeAsyncCompletions()
+    cache = ThreadRecordingCache(str(tmp_path / 'completions.sqlite3'))
+    service = make_service(async_client=FakeClient(completions), response_cache=cache)
+    options = dict(OPTIONS, temperature=0)
+
+    async def simplify_twice():
+        first = await service.simplify_text_async(text='texto', summarize=False, **options)
+        second = await service.simplify_text_async(text='texto', summarize=False, **options)
+        return first, second
+
+    assert asyncio.run(simplify_twice()) == ('resposta 0', 'resposta 0')
+    assert len(completions.requests) == 1
+    assert len(cache.threads) == 3
+    assert threading.get_ident() not in cache.threads
+
+
+def test_identical_variants_are_cached_with_their_number_of_choices(tmp_path):
+    completions = FakeCompletions()
+    service = make_service(client=FakeClient(completions), cache_policy='always',
+                           response_cache=CompletionCache(str(tmp_path / 'completions.sqlite3')))
+    options = dict(OPTIONS, summarize=False)
+
+    first = service.simplify_variants('texto', [{}, {}], **options)
+    second = service.simplify_variants('texto', [{}, {}], **options)
+    three = service.simplify_variants('texto', [{}, {}, {}], **options)
+
+    assert first == second == ['resposta 0', 'resposta 1']
+    assert three == ['resposta 0', 'resposta 1', 'resposta 2']
+    assert [request['n'] for request in completions.requests] == [2, 3]
+
+
+def test_interrupted_quota_wait_releases_the_probe_of_the_circuit_breaker():
+    breaker = half_open_breaker()
+    service = make_service(quota_manager=InterruptedQuotaManager(), circuit_breaker=breaker)
+    messages = [{'role': 'user', 'content': 'texto'}]
+
+    with pytest.raises(KeyboardInterrupt):
+        service._create_completion(model=OPTIONS['model'], messages=messages)
+
+    # A chamada seguinte é o novo teste do disjuntor semiaberto, que o fecha ao ser bem-sucedida
+    assert service._create_completion(model=OPTIONS['model'], messages=messages).choices
+    assert not breaker.is_open()
+
+
+def test_cancelled_async_quota_wait_releases_the_probe_of_the_circuit_breaker():
+    breaker = half_open_breaker()
+    service = make_service(async_client=FakeClient(FakeAsyncCompletions()), circuit_breaker=breaker,
+                           quota_manager=InterruptedQuotaManager())
+    messages = [{'role': 'user', 'content': 'texto'}]
+
+    async def cancel_then_retry():
+        task = asyncio.create_task(service._acreate_completion(model=OPTIONS['model'], messages=messages))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return await service._acreate_completion(model=OPTIONS['model'], messages=messages)
+
+    assert asyncio.run(cancel_then_retry()).choices
+    assert not breaker.is_open()
+
+
+def test_invalid_lane_is_rejected():
+    with pytest.raises(ValueError):
+        make_service(lane='urgente')
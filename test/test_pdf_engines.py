@@ -0,0 +1,62 @@
+# test/test_pdf_engines.py
+
+"""
+Testes dos motores de extração de PDFs (`services.pdf_engines`) e do comando `benchmark.py`, cujos motores
+são medidos em interpretadores novos, sem o pipeline.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import benchmark
+from services.document_service import DocumentService
+from services.pdf_engines import PdfEngine, _peak_rss_mb
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_pdf_engine_is_abstract():
+    class IncompleteEngine(PdfEngine):
+        name = 'incompleto'
+
+        def page_count(self, file_path):
+            return 0
+
+    with pytest.raises(TypeError):
+        PdfEngine()
+    with pytest.raises(TypeError):
+        IncompleteEngine()
+
+
+def test_benchmark_does_not_import_the_pipeline(tmp_path):
+    (tmp_path / 'a.pdf').write_bytes(b'%PDF')
+    (tmp_path / 'b.txt').write_text('texto')
+    script = (
+        "import sys\n"
+        "import benchmark\n"
+        "print(benchmark.collect_pdfs([sys.argv[1]]))\n"
+        "assert not any(name.startswith('services.pipeline') for name in sys.modules), 'pipeline importado'\n"
+    )
+
+    process = subprocess.run([sys.executable, '-c', script, str(tmp_path)], cwd=ROOT, capture_output=True,
+                             text=True)
+
+    assert process.returncode == 0, process.stderr
+    assert process.stdout.strip() == repr([str(tmp_path / 'a.pdf')])
+
+
+def test_benchmark_reports_each_engine_run_in_a_new_interpreter(tmp_path):
+    file_path = str(tmp_path / 'documento.pdf')
+    DocumentService(processes=1, use_cache=False).export_document('Texto do documento de teste.', file_path, 'pdf')
+
+    result, = benchmark.run_benchmark(['pypdf2'], [file_path])
+
+    assert result['engine'] == 'pypdf2'
+    assert result['files'] == 1 and result['failed'] == []
+    assert result['pages'] >= 1 and result['characters'] > 0
+    if sys.platform.startswith('linux'):
+        # O pico do motor não inclui a memória do processo que o iniciou (aqui, com o pipeline carregado)
+        assert 0 < result['peak_rss_mb'] < _peak_rss_mb()
@@ -0,0 +1,207 @@
+# test/test_quota_manager.py
+
+"""
+Testes do gerenciador de cotas (`QuotaManager`), incluindo o estado compartilhado entre processos pelo
+`QuotaStore` e os limites padrão configurados pelo ambiente.
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from services.api.quota_manager import (
+    LANE_BATCH, LANE_INTERACTIVE, PRIORITY_POLL_INTERVAL, QuotaBucket, QuotaManager
+)
+from services.api.quota_store import QuotaStore
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Provedor e custo utilizados nos testes: cada requisição consome 6 das 10 requisições por minuto
+PROVIDER = 'openai:teste'
+COSTS = {'requests': 6}
+
+
+def make_manager(store=None, **kwargs) -> QuotaManager:
+    manager = QuotaManager(headroom=1.0, store=store, **kwargs)
+    manager.set_limit('openai', 'requests', 10, 60)
+    return manager
+
+
+def test_managers_sharing_a_store_consume_the_same_bucket(tmp_path):
+    path = str(tmp_path / 'quotas.sqlite3')
+    first = make_manager(QuotaStore(path))
+    second = make_manager(QuotaStore(path))
+
+    assert first.reserve(PROVIDER, COSTS) == 0
+    assert second.reserve(PROVIDER, COSTS) > 0
+    assert second.reserve(PROVIDER, {'requests': 4}) == 0
+
+
+def test_requests_larger_than_the_capacity_keep_the_throughput_within_the_limit():
+    # Capacidade de 900 caracteres (1000 por segundo, com margem de 0.9) e requisições de 9000 caracteres
+    bucket = QuotaBucket(1000, 1.0, headroom=0.9)
+    cost, start, requests = 9000, time.monotonic(), 0
+    now = start
+    while now < start + 100:
+        now += bucket.wait_time(cost, now)
+        bucket.consume(cost, now)
+        requests += 1
+
+    # O custo integral é descontado: cada requisição aguarda a reposição do excedente da anterior
+    assert requests > 1
+    assert (requests - 1) * cost / (now - start) <= bucket.limit
+
+
+def test_batch_requests_keep_the_interactive_reserve():
+    manager = make_manager(interactive_reserve=0.2)
+
+    # Com 9 das 10 requisições disponíveis, o lote não pode ocupar a reserva de 2, mas a fila interativa pode
+    assert manager.reserve(PROVIDER, {'requests': 1}) == 0
+    assert manager.reserve(PROVIDER, {'requests': 8}, lane=LANE_BATCH) > 0
+    assert manager.reserve(PROVIDER, {'requests': 8}, lane=LANE_INTERACTIVE) == 0
+
+
+def test_batch_requests_larger_than_the_capacity_are_released_after_interactive_requests():
+    manager = make_manager(interactive_reserve=0.2)
+
+    # O custo de 30 requisições excede a capacidade de 10: o lote aguarda o bucket cheio e deixa o saldo negativo
+    assert manager.reserve(PROVIDER, {'requests': 30}, lane=LANE_BATCH) == 0
+    batch_wait = manager.reserve(PROVIDER, {'requests': 30}, lane=LANE_BATCH)
+    interactive_wait = manager.reserve(PROVIDER, {'requests': 5}, lane=LANE_INTERACTIVE)
+
+    # O excedente de 20 é reposto em 120 s; o lote aguarda ainda o bucket cheio (60 s), com a reserva, e a
+    # requisição interativa apenas o seu custo (30 s)
+    assert batch_wait == pytest.approx(180, abs=1)
+    assert interactive_wait == pytest.approx(150, abs=1)
+    assert interactive_wait < batch_wait
+
+
+def test_managers_without_a_store_have_independent_buckets():
+    assert make_manager().reserve(PROVIDER, COSTS) == 0
+    assert make_manager().reserve(PROVIDER, COSTS) == 0
+
+
+def test_consumption_of_another_process_is_shared(tmp_path):
+    path = str(tmp_path / 'quotas.sqlite3')
+    script = (
+        "import sys\n"
+        "from services.api.quota_manager import QuotaManager\n"
+        "from services.api.quota_store import QuotaStore\n"
+        "manager = QuotaManager(headroom=1.0, store=QuotaStore(sys.argv[1]))\n"
+        "manager.set_limit('openai', 'requests', 10, 60)\n"
+        "assert manager.reserve('openai:teste', {'requests': 6}) == 0\n"
+    )
+    subprocess.run([sys.executable, '-c', script, path], cwd=ROOT, check=True)
+
+    assert make_manager(QuotaStore(path)).reserve(PROVIDER, COSTS) > 0
+
+
+def test_settle_and_throttle_are_shared(tmp_path):
+    path = str(tmp_path / 'quotas.sqlite3')
+    first = make_manager(QuotaStore(path))
+    second = make_manager(QuotaStore(path))
+
+    assert first.reserve(PROVIDER, COSTS) == 0
+    first.settle(PROVIDER, 'requests', 6, 1)  # Devolve 5 requisições à cota compartilhada
+    assert second.reserve(PROVIDER, COSTS) == 0
+
+    second.on_throttle(PROVIDER)
+    assert first.reserve(PROVIDER, {'requests': 1}) > 0
+
+
+def test_batch_yields_to_interactive_requests_of_another_process(tmp_path, monkeypatch):
+    path = str(tmp_path / 'quotas.sqlite3')
+    other = QuotaStore(path)
+    batch = make_manager(QuotaStore(path))
+
+    # Outro processo registra uma requisição interativa em espera
+    monkeypatch.setattr('services.api.quota_store.os.getpid', lambda: -1)
+    other.set_waiting(PROVIDER, 1)
+    monkeypatch.undo()
+    assert batch.reserve(PROVIDER, {'requests': 1}, lane=LANE_BATCH) == PRIORITY_POLL_INTERVAL
+    assert batch.reserve(PROVIDER, {'requests': 1}, lane=LANE_INTERACTIVE) == 0
+
+    # Registros não atualizados (por exemplo, de um processo encerrado) são desconsiderados
+    later = time.time() + 60
+    monkeypatch.setattr('services.api.quota_store.time.time', lambda: later)
+    assert batch.reserve(PROVIDER, {'requests': 1}, lane=LANE_BATCH) == 0
+
+
+def test_waiting_interactive_request_is_published_and_removed(tmp_path):
+    path = str(tmp_path / 'quotas.sqlite3')
+    manager = make_manager(QuotaStore(path))
+    assert manager.reserve(PROVIDER, {'requests': 10}) == 0
+
+    # Para os demais processos, a requisição em espera é visível enquanto aguarda
+    observed = []
+    store = manager.store
+    original = store.set_waiting
+
+    def set_waiting(provider, count):
+        observed.append(count)
+        original(provider, count)
+
+    store.set_waiting = set_waiting
+    assert not manager.acquire(PROVIDER, {'requests': 1}, timeout=0.1)
+    assert observed[0] == 1 and observed[-1] == 0
+    assert store.others_waiting(PROVIDER) == 0
+
+
+def test_acquire_async_with_shared_store(tmp_path):
+    manager = make_manager(QuotaStore(str(tmp_path / 'quotas.sqlite3')))
+
+    asyncio.run(manager.acquire_async(PROVIDER, COSTS))
+
+    assert manager.lane_stats()[LANE_INTERACTIVE]['acquired'] == 1
+    assert manager.reserve(PROVIDER, COSTS) > 0
+
+
+def test_unavailable_store_falls_back_to_local_quotas(tmp_path):
+    blocker = tmp_path / 'arquivo'
+    blocker.write_text('')
+    store = QuotaStore(str(blocker / 'quotas.sqlite3'))
+
+    assert not store.enabled
+    manager = make_manager(store)
+    assert manager.reserve(PROVIDER, COSTS) == 0
+    assert manager.reserve(PROVIDER, COSTS) > 0
+
+
+@pytest.fixture
+def environment(tmp_path, monkeypatch):
+    for variable in ('OPENAI_RPM', 'OPENAI_TPM', 'AWS_TRANSLATE_CPS', 'QUOTA_HEADROOM',
+                     'QUOTA_INTERACTIVE_RESERVE', 'QUOTA_SHARED'):
+        monkeypatch.delenv(variable, raising=False)
+    monkeypatch.setenv('TRADUZAI_CACHE_DIR', str(tmp_path))
+    return monkeypatch
+
+
+def test_from_environment_applies_conservative_defaults(environment, tmp_path):
+    manager = QuotaManager.from_environment()
+    manager.reserve(PROVIDER, {'requests': 1, 'tokens': 100})
+    manager.reserve('aws_translate', {'characters': 100})
+
+    report = manager.utilization()
+    assert report[PROVIDER]['requests']['limit'] == 500
+    assert report[PROVIDER]['tokens']['limit'] == 30000
+    assert report['aws_translate']['characters']['limit'] == 1000
+    assert manager.store is not None
+    assert os.path.exists(tmp_path / 'quotas.sqlite3')
+
+
+def test_from_environment_overrides_and_disables_limits(environment):
+    environment.setenv('OPENAI_RPM', '60')
+    environment.setenv('OPENAI_TPM', '0')
+    environment.setenv('QUOTA_SHARED', '0')
+
+    manager = QuotaManager.from_environment()
+    manager.reserve(PROVIDER, {'requests': 1, 'tokens': 100})
+
+    report = manager.utilization()
+    assert report[PROVIDER]['requests']['limit'] == 60
+    assert 'limit' not in report[PROVIDER]['tokens']
+    assert manager.store is None
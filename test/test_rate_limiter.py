@@ -0,0 +1,72 @@
+# test/test_rate_limiter.py
+
+"""
+Testes do limitador de taxa adaptativo (`AdaptiveRateLimiter`).
+"""
+
+import time
+
+import pytest
+
+from services.api.rate_limiter import AdaptiveRateLimiter
+
+
+def test_success_increases_the_rate_additively():
+    limiter = AdaptiveRateLimiter(rate=10.0, max_rate=20.0)
+    limiter.on_success()
+
+    assert limiter.rate == pytest.approx(10.1)
+
+
+def test_rate_never_exceeds_the_maximum():
+    limiter = AdaptiveRateLimiter(rate=10.0, max_rate=10.5)
+    for _ in range(100):
+        limiter.on_success()
+
+    assert limiter.rate == 10.5
+
+
+def test_throttle_halves_the_rate():
+    limiter = AdaptiveRateLimiter(rate=8.0)
+    limiter.on_throttle()
+
+    assert limiter.rate == 4.0
+
+
+def test_simultaneous_throttles_decrease_the_rate_once():
+    limiter = AdaptiveRateLimiter(rate=8.0, min_rate=0.5, decrease_cooldown=60.0)
+    for _ in range(10):
+        limiter.on_throttle()
+
+    assert limiter.rate == 4.0
+
+
+def test_throttle_after_the_cooldown_decreases_again():
+    limiter = AdaptiveRateLimiter(rate=8.0, decrease_cooldown=0.01)
+    limiter.on_throttle()
+    time.sleep(0.02)
+    limiter.on_throttle()
+
+    assert limiter.rate == 2.0
+
+
+def test_rate_never_falls_below_the_minimum():
+    limiter = AdaptiveRateLimiter(rate=1.0, min_rate=0.5, decrease_cooldown=0.0)
+    for _ in range(10):
+        limiter.on_throttle()
+
+    assert limiter.rate == 0.5
+
+
+def test_acquire_times_out_when_no_token_is_available():
+    limiter = AdaptiveRateLimiter(rate=1.0, min_rate=0.5, burst=1.0)
+
+    assert limiter.acquire(timeout=0.1) is True
+    assert limiter.acquire(timeout=0.1) is False
+
+
+def test_invalid_limits_are_rejected():
+    with pytest.raises(ValueError):
+        AdaptiveRateLimiter(rate=0.1, min_rate=0.5)
+    with pytest.raises(ValueError):
+        AdaptiveRateLimiter(decrease_factor=1.0)
@@ -0,0 +1,25 @@
+# test/test_readability_service.py
+
+"""
+Testes das avaliações simultâneas de legibilidade (`ReadabilityService`), em idiomas diferentes.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from services.language.readability_service import ReadabilityService
+
+TEXTS = [
+    "The committee reviewed the proposal carefully. It approved the budget after a long discussion "
+    "about the expected costs and the benefits for the local community.",
+    "O comitê analisou a proposta com cuidado. Ele aprovou o orçamento depois de uma longa discussão "
+    "sobre os custos previstos e os benefícios para a comunidade local.",
+]
+
+
+def test_concurrent_evaluations_match_sequential_ones():
+    expected = [ReadabilityService.calculate_readability(text) for text in TEXTS]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(ReadabilityService.calculate_readability, TEXTS * 10))
+
+    assert results == expected * 10
@@ -0,0 +1,193 @@
+# test/test_server.py
+
+"""
+Testes do servidor HTTP (`TraduzAIServer`), com a fila de trabalhos executando um pipeline local no lugar
+das APIs e requisições enviadas por conexões TCP reais.
+"""
+
+import asyncio
+import json
+import threading
+
+from server import TraduzAIServer
+from services.document_service import DocumentService
+from services.api.quota_manager import QuotaManager
+from services.pipeline.job_queue import JobQueueService
+from test_job_queue import FakePipelineService
+
+
+async def request(port: int, method: str, path: str, payload=None, raw_body: bytes = None,
+                  content_length: int = None):
+    """
+    Envia uma requisição HTTP/1.0 e retorna o status, os cabeçalhos e o corpo da resposta. Por padrão, o
+    cabeçalho Content-Length corresponde ao tamanho do corpo.
+    """
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    body = raw_body if raw_body is not None else (b'' if payload is None else json.dumps(payload).encode('utf-8'))
+    length = len(body) if content_length is None else content_length
+    writer.write(f"{method} {path} HTTP/1.0\r\nContent-Length: {length}\r\n\r\n".encode('ascii') + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+
+    head, _, content = response.partition(b'\r\n\r\n')
+    lines = head.decode('iso-8859-1').split('\r\n')
+    headers = dict(line.split(': ', 1) for line in lines[1:])
+    return int(lines[0].split(' ')[1]), headers, content
+
+
+def decode_chunks(content: bytes) -> list:
+    """
+    Decodifica um corpo com transferência chunked em NDJSON.
+    """
+    data = b''
+    while True:
+        size, _, content = content.partition(b'\r\n')
+        size = int(size, 16)
+        if size == 0:
+            break
+        data += content[:size]
+        content = content[size + 2:]
+    return [json.loads(line) for line in data.decode('utf-8').splitlines()]
+
+
+def serve(scenario, pipeline=None, **kwargs):
+    """
+    Inicia o servidor em uma porta livre, executa o cenário com a porta e encerra o servidor.
+    """
+    async def main():
+        jobs = JobQueueService(pipeline or FakePipelineService(), **kwargs)
+        server = TraduzAIServer(jobs, port=0, quota_manager=QuotaManager())
+        ready = asyncio.get_running_loop().create_future()
+        serving = asyncio.create_task(server.serve_forever(on_ready=ready.set_result))
+        try:
+            await scenario(await ready)
+        finally:
+            serving.cancel()
+            await asyncio.gather(serving, return_exceptions=True)
+
+    asyncio.run(main())
+
+
+def test_submit_stream_and_fetch_result():
+    async def scenario(port):
+        status, headers, content = await request(port, 'POST', '/jobs', {'text': 'o comitê', 'targets': ['en']})
+        assert status == 202
+        job_id = json.loads(content)['job_id']
+        assert headers['Location'] == f"/jobs/{job_id}"
+
+        status, headers, content = await request(port, 'GET', f"/jobs/{job_id}/stream")
+        events = decode_chunks(content)
+        assert headers['Transfer-Encoding'] == 'chunked'
+        assert [event['text'] for event in events if event['type'] == 'token'] == ['o', 'comitê']
+        assert events[-1]['type'] == 'result'
+        assert events[-1]['result']['translations']['en']['translated_text'] == 'o comitê [en]'
+
+        status, _, content = await request(port, 'GET', f"/jobs/{job_id}/result")
+        assert status == 200
+        assert json.loads(content)['result']['simplified_text'] == 'O COMITÊ'
+
+    serve(scenario)
+
+
+def test_invalid_requests_return_400():
+    async def scenario(port):
+        for payload in ({'text': 'texto', 'targets': ['en'], 'options': {'temperature': 'alta'}},
+                        {'text': 'texto', 'targets': ['en'], 'options': {'max_tokens': -1}},
+                        {'text': '', 'targets': ['en']},
+                        {'text': 'texto', 'targets': []},
+                        ['lista']):
+            status, _, content = await request(port, 'POST', '/jobs', payload)
+            assert status == 400, payload
+            assert 'error' in json.loads(content)
+
+        status, _, _ = await request(port, 'POST', '/jobs', raw_body=b'{invalido')
+        assert status == 400
+
+        status, _, content = await request(port, 'POST', '/jobs', raw_body=b'{}', content_length=-1)
+        assert status == 400
+        assert 'error' in json.loads(content)
+
+    serve(scenario)
+
+
+def test_full_queue_returns_503_and_cancel_frees_the_slot():
+    gate = threading.Event()
+
+    async def scenario(port):
+        payload = {'text': 'texto', 'targets': ['en']}
+        _, _, content = await request(port, 'POST', '/jobs', payload)
+        running_id = json.loads(content)['job_id']
+        while json.loads((await request(port, 'GET', f"/jobs/{running_id}"))[2])['status'] != 'running':
+            await asyncio.sleep(0.01)
+
+        _, _, content = await request(port, 'POST', '/jobs', payload)
+        queued_id = json.loads(content)['job_id']
+        status, headers, _ = await request(port, 'POST', '/jobs', payload)
+        assert status == 503
+        assert headers['Retry-After'] == '1'
+
+        status, _, content = await request(port, 'DELETE', f"/jobs/{queued_id}")
+        assert status == 200
+        assert json.loads(content)['status'] == 'cancelled'
+        status, _, _ = await request(port, 'POST', '/jobs', payload)
+        assert status == 202
+
+        status, _, _ = await request(port, 'GET', f"/jobs/{running_id}/result")
+        assert status == 409
+        gate.set()
+
+    serve(scenario, FakePipelineService(gate), max_workers=1, max_queue_size=1)
+
+
+def test_unknown_endpoints_methods_and_jobs():
+    async def scenario(port):
+        assert (await request(port, 'GET', '/desconhecido'))[0] == 404
+        assert (await request(port, 'GET', '/jobs/inexistente'))[0] == 404
+        status, headers, _ = await request(port, 'PUT', '/jobs')
+        assert status == 405
+        assert headers['Allow'] == 'POST'
+
+        status, _, content = await request(port, 'GET', '/health')
+        health = json.loads(content)
+        assert status == 200
+        assert health['status'] == 'ok'
+        assert set(health['lanes']) == {'interactive', 'batch'}
+
+    serve(scenario)
+
+
+def test_documents_are_accepted_only_inside_the_documents_dir(tmp_path):
+    documents_dir = tmp_path / 'documentos'
+    documents_dir.mkdir()
+    (documents_dir / 'artigo.txt').write_text('o comitê\n\naprovou', encoding='utf-8')
+    (tmp_path / 'segredo.txt').write_text('segredo', encoding='utf-8')
+
+    async def scenario(port):
+        status, _, content = await request(port, 'POST', '/jobs', {'document': 'artigo.txt', 'targets': ['en']})
+        assert status == 202
+        job_id = json.loads(content)['job_id']
+        decode_chunks((await request(port, 'GET', f"/jobs/{job_id}/stream"))[2])
+        result = json.loads((await request(port, 'GET', f"/jobs/{job_id}/result"))[2])['result']
+        assert result['simplified_text'] == 'O COMITÊ\n\nAPROVOU'
+
+        for payload in ({'document': '../segredo.txt', 'targets': ['en']},
+                        {'document': str(tmp_path / 'segredo.txt'), 'targets': ['en']},
+                        {'document': 'artigo.txt', 'targets': ['en'], 'last_page': 2},
+                        {'document': 'artigo.txt', 'text': 'texto', 'targets': ['en']}):
+            status, _, content = await request(port, 'POST', '/jobs', payload)
+            assert status == 400, payload
+            assert 'error' in json.loads(content)
+
+    serve(scenario, documents_dir=str(documents_dir), document_service=DocumentService(processes=1, use_cache=False))
+
+
+def test_documents_are_rejected_without_a_documents_dir(tmp_path):
+    (tmp_path / 'artigo.txt').write_text('texto', encoding='utf-8')
+
+    async def scenario(port):
+        status, _, _ = await request(port, 'POST', '/jobs', {'document': str(tmp_path / 'artigo.txt'),
+                                                             'targets': ['en']})
+        assert status == 400
+
+    serve(scenario)
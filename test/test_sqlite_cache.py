@@ -0,0 +1,90 @@
+# test/test_sqlite_cache.py
+
+"""
+Testes do cache persistente em SQLite (`SqliteCache`) e do cache de traduções (`TranslationCache`).
+"""
+
+import os
+import threading
+import time
+
+from services.cache.sqlite_cache import SqliteCache
+from services.cache.translation_cache import TranslationCache
+
+
+def test_values_persist_across_instances(tmp_path):
+    db_path = str(tmp_path / 'cache.sqlite3')
+    SqliteCache(db_path).set('chave', b'valor')
+
+    assert SqliteCache(db_path).get('chave') == b'valor'
+
+
+def test_missing_key_returns_none(tmp_path):
+    assert SqliteCache(str(tmp_path / 'cache.sqlite3')).get('ausente') is None
+
+
+def test_expired_items_are_ignored(tmp_path, monkeypatch):
+    cache = SqliteCache(str(tmp_path / 'cache.sqlite3'), ttl_seconds=10)
+    cache.set('chave', b'valor')
+
+    now = time.time()
+    monkeypatch.setattr('services.cache.sqlite_cache.time.time', lambda: now + 11)
+    assert cache.get('chave') is None
+
+
+def test_least_recently_used_items_are_evicted(tmp_path):
+    cache = SqliteCache(str(tmp_path / 'cache.sqlite3'), max_entries=2)
+    cache.set('a', b'1')
+    cache.set('b', b'2')
+    cache.get('a')
+    cache.set('c', b'3')
+
+    assert cache.get('a') == b'1'
+    assert cache.get('b') is None
+    assert cache.get('c') == b'3'
+
+
+def test_size_limit_is_respected(tmp_path):
+    cache = SqliteCache(str(tmp_path / 'cache.sqlite3'), max_bytes=10)
+    cache.set('a', b'12345')
+    cache.set('b', b'12345')
+    cache.set('c', b'12345')
+
+    assert cache.get('a') is None
+    assert cache.get('c') == b'12345'
+
+
+def test_concurrent_writes_from_threads(tmp_path):
+    cache = SqliteCache(str(tmp_path / 'cache.sqlite3'))
+
+    def write(index):
+        for item in range(20):
+            cache.set(f'{index}-{item}', str(item).encode())
+
+    threads = [threading.Thread(target=write, args=(index,)) for index in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(cache.get(f'{index}-19') == b'19' for index in range(4))
+
+
+def test_unwritable_directory_disables_the_cache(tmp_path):
+    blocker = tmp_path / 'arquivo'
+    blocker.write_text('não é um diretório')
+    cache = SqliteCache(os.path.join(str(blocker), 'cache.sqlite3'))
+
+    assert cache.enabled is False
+    cache.set('chave', b'valor')
+    assert cache.get('chave') is None
+    cache.delete('chave')
+    cache.clear()
+
+
+def test_translation_roundtrip(tmp_path):
+    cache = TranslationCache(str(tmp_path / 'translations.sqlite3'))
+    cache.set_translation('Hello', 'auto', 'pt', 'Olá', 'en')
+
+    assert cache.get_translation('Hello', 'auto', 'pt') == ('Olá', 'en')
+    assert cache.get_translation('Hello', 'auto', 'es') is None
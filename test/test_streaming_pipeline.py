@@ -0,0 +1,99 @@
+# test/test_streaming_pipeline.py
+
+"""
+Testes do pipeline em streaming (`StreamingPipelineService`) alimentado por parágrafos, como os produzidos por
+`DocumentService.iter_paragraphs`, com serviços locais no lugar das APIs.
+"""
+
+import threading
+
+from services.pipeline.pipeline_service import STAGE_SIMPLIFY, STAGE_TRANSLATE
+from services.pipeline.streaming_pipeline import StreamingPipelineService
+
+OPTIONS = dict(area_tecnica='Medicina', estilo='Informal', summarize=False, model='gpt-4o-mini', max_tokens=500)
+
+
+class FakeOpenAIService:
+    """
+    Simplificação local: converte o texto para maiúsculas e registra os textos enviados. Cada palavra conta
+    como um token.
+    """
+
+    def __init__(self, on_simplify=None):
+        self.calls = []
+        self.on_simplify = on_simplify
+
+    def chunk_token_budget(self, model, max_tokens, summarize):
+        return 1000
+
+    def count_tokens(self, text, model):
+        return len(text.split())
+
+    def simplify_text(self, text, **options):
+        self.calls.append(text)
+        if self.on_simplify is not None:
+            self.on_simplify(text)
+        return text.upper()
+
+
+class FakeAwsTranslateService:
+    def translate_text(self, text, target_language_code):
+        return f"{text} [{target_language_code}]", 'pt'
+
+    def reconcile_source_language(self, texts, source_language_codes):
+        return source_language_codes[0]
+
+
+class FakeReadabilityService:
+    def calculate_readability(self, text):
+        return {'words': len(text.split())}
+
+
+class FakeBleuScoreService:
+    def compute_bleu_score(self, original_text, translated_text, source_language_code):
+        return 0.5
+
+
+def make_streaming(openai_service=None, segment_tokens=4) -> StreamingPipelineService:
+    return StreamingPipelineService(openai_service or FakeOpenAIService(), FakeAwsTranslateService(),
+                                    FakeReadabilityService(), FakeBleuScoreService(), segment_tokens=segment_tokens)
+
+
+def test_paragraphs_are_grouped_into_segments():
+    streaming = make_streaming()
+    paragraphs = ['um dois', 'três', 'quatro cinco seis', 'sete']
+
+    assert list(streaming.segment_paragraphs(paragraphs, OPTIONS)) == [
+        ('um dois\n\ntrês', '\n\n'), ('quatro cinco seis\n\nsete', '')
+    ]
+
+
+def test_simplify_stream_yields_segments_in_order_and_skips_completed_ones():
+    openai_service = FakeOpenAIService()
+    streaming = make_streaming(openai_service, segment_tokens=1)
+    paragraphs = [f'p{index}' for index in range(10)]
+
+    segments = list(streaming.simplify_stream(iter(paragraphs), OPTIONS, completed_segments={0: 'PRONTO', 5: 'X'}))
+
+    assert [segment.index for segment in segments] == list(range(10))
+    assert [segment.simplified_text for segment in segments][:2] == ['PRONTO', 'P1']
+    assert segments[5].simplified_text == 'X'
+    assert sorted(openai_service.calls) == sorted(set(paragraphs) - {'p0', 'p5'})
+
+
+def test_simplification_starts_before_the_document_is_read():
+    simplified = threading.Event()
+    streaming = make_streaming(FakeOpenAIService(on_simplify=lambda text: simplified.set()), segment_tokens=1)
+
+    def paragraphs():
+        for index in range(6):
+            if index == 3:
+                # Sem streaming, a primeira simplificação só aconteceria após a leitura de todo o documento
+                assert simplified.wait(5), "A simplificação não começou durante a leitura."
+            yield f'p{index}'
+
+    result = streaming.run(paragraphs(), 'en', OPTIONS)
+
+    assert result.simplified_text == '\n\n'.join(f'P{index}' for index in range(6))
+    assert result.translated_text.startswith('P0 [en]')
+    assert {STAGE_SIMPLIFY, STAGE_TRANSLATE} <= set(result.timings)
@@ -0,0 +1,63 @@
+# test/test_task_service.py
+
+"""
+Testes da execução de tarefas em threads de trabalho (`BackgroundTaskService`) e do seu cancelamento.
+"""
+
+import threading
+import time
+
+from services.task_service import BackgroundTaskService
+
+
+def process_until_idle(tasks: BackgroundTaskService, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while tasks.has_pending_work() and time.monotonic() < deadline:
+        tasks.process_events()
+        time.sleep(0.001)
+
+
+def test_result_is_delivered_before_the_end_of_the_task():
+    tasks = BackgroundTaskService()
+    events = []
+
+    tasks.submit(lambda task: 42, on_result=lambda value: events.append(('result', value)),
+                 on_finished=lambda: events.append(('finished', None)))
+    process_until_idle(tasks)
+
+    assert events == [('result', 42), ('finished', None)]
+
+
+def test_cancelled_task_notifies_its_end_only_after_the_thread_exits():
+    tasks = BackgroundTaskService()
+    release = threading.Event()
+    events = []
+
+    def work(task):
+        release.wait(5)
+        task.token.raise_if_cancelled()
+        return 'descartado'
+
+    task = tasks.submit(work, on_result=events.append, on_cancelled=lambda: events.append('cancelled'),
+                        on_finished=lambda: events.append('finished'))
+    task.cancel()
+    tasks.process_events()
+    assert events == ['cancelled']
+    assert task.is_alive()
+
+    release.set()
+    process_until_idle(tasks)
+    assert events == ['cancelled', 'finished']
+
+
+def test_errors_are_delivered_to_the_error_callback():
+    tasks = BackgroundTaskService()
+    errors = []
+
+    def fail(task):
+        raise ValueError('falha')
+
+    tasks.submit(fail, on_error=errors.append)
+    process_until_idle(tasks)
+
+    assert [str(error) for error in errors] == ['falha']
@@ -0,0 +1,81 @@
+# test/test_text_segmentation_service.py
+
+"""
+Testes da divisão de textos em blocos (`TextSegmentationService`) e da tradução em blocos paralelos do
+`AwsTranslateService`, com um cliente AWS Translate local no lugar da API.
+"""
+
+import threading
+
+import pytest
+
+from services.api.aws_translate_service import AwsTranslateService
+from services.api.quota_manager import QuotaManager
+from services.api.rate_limiter import AdaptiveRateLimiter
+from services.language.text_segmentation_service import TextSegmentationService
+
+
+class FakeTranslateClient:
+    """
+    Cliente AWS Translate local: "traduz" convertendo o texto para maiúsculas e registra as requisições.
+    """
+
+    def __init__(self):
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def translate_text(self, Text, SourceLanguageCode, TargetLanguageCode):
+        with self._lock:
+            self.requests.append(Text)
+        return {'TranslatedText': Text.upper(), 'SourceLanguageCode': 'pt'}
+
+
+def test_short_text_is_a_single_chunk():
+    assert TextSegmentationService.split_text('Texto curto.', 100, len) == [('Texto curto.', '')]
+
+
+def test_chunks_respect_the_limit_and_rebuild_the_text():
+    text = '\n\n'.join(f"Parágrafo número {i}. Tem duas frases curtas." for i in range(50))
+    chunks = TextSegmentationService.split_text(text, 200, TextSegmentationService.utf8_length)
+
+    assert len(chunks) > 1
+    assert all(TextSegmentationService.utf8_length(chunk) <= 200 for chunk, _ in chunks)
+    assert TextSegmentationService.join_chunks(chunks) == text
+
+
+def test_paragraph_boundaries_are_preferred_over_sentences():
+    text = 'Primeira frase. Segunda frase.\n\nTerceira frase. Quarta frase.'
+    chunks = TextSegmentationService.split_text(text, 35, len)
+
+    assert chunks == [('Primeira frase. Segunda frase.', '\n\n'), ('Terceira frase. Quarta frase.', '')]
+
+
+def test_utf8_length_counts_bytes():
+    assert TextSegmentationService.utf8_length('ação') == 6
+
+
+def test_text_without_separators_is_split_hard():
+    chunks = TextSegmentationService.split_text('é' * 25, 10, TextSegmentationService.utf8_length)
+
+    assert [chunk for chunk, _ in chunks] == ['é' * 5] * 5
+
+
+def test_invalid_limit_is_rejected():
+    with pytest.raises(ValueError):
+        TextSegmentationService.split_text('texto', 0, len)
+
+
+def test_long_text_is_translated_in_ordered_chunks():
+    client = FakeTranslateClient()
+    service = AwsTranslateService(
+        max_chunk_bytes=100, use_cache=False, translate_client=client,
+        rate_limiter=AdaptiveRateLimiter(rate=1000, max_rate=1000), quota_manager=QuotaManager()
+    )
+    text = '\n\n'.join(f"Parágrafo {i} com algumas palavras." for i in range(20))
+
+    translated, language = service.translate_text(text, 'en')
+
+    assert len(client.requests) > 1
+    assert all(TextSegmentationService.utf8_length(request) <= 100 for request in client.requests)
+    assert translated == text.upper()
+    assert language == 'pt'